@@ -0,0 +1 @@
+"""성능 마이크로 벤치마크 스크립트 모음."""
@@ -0,0 +1,129 @@
+"""추론 요청 준비(검증/라우팅/옵션 병합) 경로 마이크로 벤치마크.
+
+엔진 호출 직전까지 요청마다 만드는 값(어댑터 호출 인자 dict, 의미 캐시 키)을 기준으로 비교한다.
+
+비교 대상:
+- legacy: 라우팅 후 `kwargs.get(key, default)`로 옵션 dict 생성 (기존 경로, 프롬프트 검증 없음.
+  명시적 `None` 인자가 모델 기본값을 덮어쓰는 문제도 그대로 재현한다)
+- legacy(+validate/merge): 같은 dict 경로에 도메인과 동일한 검증/`merge_options` 병합을 요청마다 수행
+- domain: `InferenceUseCase._prepare_request` (프롬프트 검증 + 라우팅 + 미리 만든 기본 옵션/캐시 키 재사용)
+- domain(+override): 요청에 옵션 재정의가 있는 경우(같은 재정의 조합의 `InferenceOptions`를 재사용)
+
+엔진을 호출하지 않으므로 서버 없이 실행된다.
+
+실행:
+    python -m benchmarks.bench_request_prep --prompt-chars 2000 --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.application.use_cases import InferenceUseCase
+from src.domain import InferencePolicy
+from src.infrastructure import PromptRouter, load_settings
+
+
+_KEY_FIELDS = ("temperature", "top_p", "num_ctx", "max_tokens")
+
+
+def _legacy_prepare(router: PromptRouter, model_id: str, prompt: str, kwargs: dict[str, Any]) -> tuple[dict, str]:
+    route = router.route(model_id, prompt, kwargs.get("max_tokens"), kwargs.get("num_ctx"))
+    model = route.model
+    options = {
+        "temperature": kwargs.get("temperature", model.parameters.temperature),
+        "top_p": kwargs.get("top_p", model.parameters.top_p),
+        "num_ctx": route.num_ctx or kwargs.get("num_ctx", model.parameters.num_ctx),
+        "max_tokens": kwargs.get("max_tokens"),
+        "timeout": kwargs.get("timeout"),
+        "raw_response": kwargs.get("raw_response", False),
+    }
+    return options, "|".join(str(options[key]) for key in _KEY_FIELDS)
+
+
+def _legacy_validated_prepare(
+    router: PromptRouter,
+    policy: InferencePolicy,
+    model_id: str,
+    prompt: str,
+    kwargs: dict[str, Any],
+) -> tuple[dict, str]:
+    policy.validate_prompt(prompt)
+    route = router.route(model_id, prompt, kwargs.get("max_tokens"), kwargs.get("num_ctx"))
+    parameters = route.model.parameters
+    defaults = {
+        "temperature": parameters.temperature,
+        "top_p": parameters.top_p,
+        "num_ctx": parameters.num_ctx,
+        "max_tokens": None,
+    }
+    overrides = {
+        "temperature": kwargs.get("temperature"),
+        "top_p": kwargs.get("top_p"),
+        "num_ctx": route.num_ctx or kwargs.get("num_ctx"),
+        "max_tokens": kwargs.get("max_tokens"),
+    }
+    options = policy.merge_options(defaults, overrides)
+    options["timeout"] = kwargs.get("timeout")
+    options["raw_response"] = bool(kwargs.get("raw_response"))
+    return options, "|".join(str(options[key]) for key in _KEY_FIELDS)
+
+
+def _domain_prepare(use_case: InferenceUseCase, model_id: str, prompt: str, kwargs: dict[str, Any]) -> tuple[dict, str]:
+    _, request = use_case._prepare_request(model_id, prompt, kwargs)
+    options = request.options.as_kwargs()
+    options["timeout"] = kwargs.get("timeout")
+    options["raw_response"] = bool(kwargs.get("raw_response"))
+    return options, request.options.cache_key
+
+
+def _measure(func: Callable[[], Any], iterations: int, repeat: int = 5) -> float:
+    """`repeat`회 측정 중 가장 빠른 회차의 호출 1회당 평균 소요 시간(마이크로초)을 반환한다."""
+    func()
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - started)
+    return best / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추론 요청 준비 경로 벤치마크")
+    parser.add_argument("--config", default="config/models.yml")
+    parser.add_argument("--prompt-chars", type=int, default=2000, help="프롬프트 길이")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=7, help="최솟값을 취할 측정 반복 횟수")
+    args = parser.parse_args()
+
+    settings = load_settings(Path(args.config))
+    use_case = InferenceUseCase(settings)
+    model_id = settings.models[-1].id
+    prompt = "안녕하세요 local llm " * (args.prompt_chars // 18)
+    # API/CLI는 지정하지 않은 옵션도 None으로 넘긴다.
+    plain = {"temperature": None, "top_p": None, "num_ctx": None, "max_tokens": None, "timeout": None}
+    override = {**plain, "temperature": 0.2, "max_tokens": 128}
+    print(f"model={model_id}, prompt={len(prompt):,} chars, iterations={args.iterations}")
+
+    cases: list[tuple[str, Callable[[], Any]]] = [
+        ("legacy", lambda: _legacy_prepare(use_case.router, model_id, prompt, plain)),
+        (
+            "legacy(+validate/merge)",
+            lambda: _legacy_validated_prepare(use_case.router, use_case.policy, model_id, prompt, override),
+        ),
+        ("domain", lambda: _domain_prepare(use_case, model_id, prompt, plain)),
+        ("domain(+override)", lambda: _domain_prepare(use_case, model_id, prompt, override)),
+    ]
+    baseline = _measure(cases[0][1], args.iterations, args.repeat)
+    for name, func in cases:
+        elapsed = baseline if name == "legacy" else _measure(func, args.iterations, args.repeat)
+        print(f"- {name:<24} {elapsed:8.2f} us/req  x{baseline / elapsed:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""추론 응답 직렬화 경로 마이크로 벤치마크.
+
+비교 대상:
+- legacy: `decode()` + `json.loads` → `dataclasses.asdict` → `json.dumps` (기존 경로)
+- fast: 바이트 직접 `loads` → `to_dict` → 백엔드 `dumps` (orjson/msgspec/json)
+- raw: 엔진 응답 바이트 패스스루 (파싱/재인코딩 없음)
+
+실행:
+    python -m benchmarks.bench_serialization --context-len 8192 --iterations 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+
+from src.application.use_cases.dto import InferenceResultDTO
+from src.infrastructure.serialization import JSON_BACKEND, dumps, loads
+
+
+def _build_engine_body(context_len: int, response_chars: int) -> bytes:
+    """Ollama `/api/generate` 비스트리밍 응답과 비슷한 크기의 JSON 바이트를 만든다."""
+    rng = random.Random(0)
+    payload = {
+        "model": "qwen3:32b",
+        "created_at": "2026-02-28T00:00:00.000000Z",
+        "response": "가나다라마바사 " * (response_chars // 8),
+        "done": True,
+        "done_reason": "stop",
+        "context": [rng.randrange(0, 151_000) for _ in range(context_len)],
+        "total_duration": 5_000_000_000,
+        "load_duration": 10_000_000,
+        "prompt_eval_count": 200,
+        "prompt_eval_duration": 100_000_000,
+        "eval_count": 180,
+        "eval_duration": 4_000_000_000,
+    }
+    return json.dumps(payload).encode("utf-8")
+
+
+def _legacy_path(body: bytes) -> bytes:
+    payload = json.loads(body.decode("utf-8"))
+    dto = InferenceResultDTO(model_id="m", engine="ollama", ok=True, output=payload)
+    return json.dumps(asdict(dto)).encode("utf-8")
+
+
+def _fast_path(body: bytes) -> bytes:
+    payload = loads(body)
+    dto = InferenceResultDTO(model_id="m", engine="ollama", ok=True, output=payload)
+    return dumps(dto.to_dict())
+
+
+def _raw_path(body: bytes) -> bytes:
+    dto = InferenceResultDTO(model_id="m", engine="ollama", ok=True, raw_output=body)
+    assert dto.raw_output is not None
+    return dto.raw_output
+
+
+def _measure(func: Callable[[bytes], bytes], body: bytes, iterations: int) -> float:
+    """호출 1회당 평균 소요 시간(마이크로초)을 반환한다."""
+    func(body)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func(body)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="추론 응답 직렬화 경로 벤치마크")
+    parser.add_argument("--context-len", type=int, default=8192, help="context 토큰 배열 길이")
+    parser.add_argument("--response-chars", type=int, default=2000, help="응답 텍스트 길이")
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    body = _build_engine_body(args.context_len, args.response_chars)
+    print(f"payload={len(body):,} bytes, backend={JSON_BACKEND}, iterations={args.iterations}")
+
+    baseline = _measure(_legacy_path, body, args.iterations)
+    for name, func in (("legacy", _legacy_path), ("fast", _fast_path), ("raw", _raw_path)):
+        elapsed = baseline if name == "legacy" else _measure(func, body, args.iterations)
+        print(f"- {name:<6} {elapsed:10.1f} us/req  x{baseline / elapsed:6.1f}")
+
+
+if __name__ == "__main__":
+    main()
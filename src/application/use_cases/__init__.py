@@ -1,17 +1,40 @@
 """application 계층 유스케이스 공개 심볼을 제공한다."""
 
-from .dto import EngineStatusDTO, InferenceResultDTO, ModelOperationResultDTO
+from .dataset_run_use_case import DatasetRunUseCase
+from .dto import (
+    DatasetRunResultDTO,
+    EmbeddingResultDTO,
+    EngineStatusDTO,
+    EngineTuneResultDTO,
+    InferenceResultDTO,
+    ModelOperationResultDTO,
+    ReplayReportDTO,
+)
 from .engine_selection_use_case import EngineSelectionUseCase
+from .engine_tune_use_case import EngineTuneUseCase
 from .inference_use_case import InferenceUseCase
+from .job_use_case import JobUseCase
 from .model_lifecycle_use_case import ModelLifecycleUseCase
+from .replay_use_case import ReplayOutcome, ReplaySender, ReplayUseCase, synthetic_workload
 from .startup_use_case import StartupUseCase
 
 __all__ = [
+    "DatasetRunResultDTO",
+    "DatasetRunUseCase",
+    "EmbeddingResultDTO",
     "EngineSelectionUseCase",
     "EngineStatusDTO",
+    "EngineTuneResultDTO",
+    "EngineTuneUseCase",
     "InferenceResultDTO",
     "InferenceUseCase",
+    "JobUseCase",
     "ModelLifecycleUseCase",
     "ModelOperationResultDTO",
+    "ReplayOutcome",
+    "ReplayReportDTO",
+    "ReplaySender",
+    "ReplayUseCase",
     "StartupUseCase",
+    "synthetic_workload",
 ]
@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure import CancellationToken, ConfigValidationError
+from src.infrastructure.serialization import dumps, loads
+
+from .dto import DatasetRunResultDTO, InferenceResultDTO
+from .inference_use_case import InferenceUseCase
+
+ROW_OPTION_KEYS = ("temperature", "top_p", "num_ctx", "max_tokens")
+"""입력 행에서 읽어 명령 기본값을 덮어쓰는 추론 옵션 키."""
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass(slots=True)
+class _Row:
+    """입력 JSONL 한 줄."""
+
+    line: int
+    end_offset: int
+    row_id: Any
+    model_id: str
+    prompt: str | None
+    options: dict[str, Any]
+    error: str | None = None
+    # 빈 줄이거나 이전 실행에서 이미 끝난 줄(재개 지점 계산에만 쓴다).
+    skip: bool = False
+
+    def dedupe_key(self) -> bytes:
+        return hashlib.blake2b(dumps([self.model_id, self.prompt, self.options]), digest_size=16).digest()
+
+
+@dataclass(slots=True)
+class _Checkpoint:
+    """재개 지점: `offset`(=`line`줄)까지는 모두 완료, 그 뒤로는 `done_after`의 줄만 완료."""
+
+    input_path: str
+    offset: int = 0
+    line: int = 0
+    done_after: set[int] = field(default_factory=set)
+    output_size: int = 0
+    rows_done: int = 0
+    completion_tokens: int = 0
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "input": self.input_path,
+            "offset": self.offset,
+            "line": self.line,
+            "done_after": sorted(self.done_after),
+            "output_size": self.output_size,
+            "rows_done": self.rows_done,
+            "completion_tokens": self.completion_tokens,
+            "elapsed_seconds": self.elapsed_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "_Checkpoint":
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ConfigValidationError(f"지원하지 않는 체크포인트 버전입니다: {data.get('version')}")
+        return cls(
+            input_path=data["input"],
+            offset=int(data["offset"]),
+            line=int(data["line"]),
+            done_after=set(data.get("done_after") or ()),
+            output_size=int(data["output_size"]),
+            rows_done=int(data.get("rows_done", 0)),
+            completion_tokens=int(data.get("completion_tokens", 0)),
+            elapsed_seconds=float(data.get("elapsed_seconds", 0.0)),
+        )
+
+
+class _ThroughputTuner:
+    """완료 처리량을 보며 동시성을 한 칸씩 올리거나 내리는 언덕 오르기 제어기.
+
+    Rules:
+        - `window_seconds`마다 구간 처리량(생성 토큰/초, 토큰 수를 모르면 행/초)을 잰다.
+        - 직전 구간보다 `tolerance` 이상 좋아졌으면 같은 방향으로 한 칸 더 움직이고,
+          그렇지 않으면 방향을 바꾼다. 그래서 처리량이 더 늘지 않는 지점(엔진 포화점) 주변에 머문다.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        window_seconds: float = 2.0,
+        tolerance: float = 0.05,
+    ) -> None:
+        self.limit = max(minimum, min(initial, maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.window_seconds = window_seconds
+        self.tolerance = tolerance
+        self.history: list[dict[str, float]] = []
+        self._direction = 1
+        self._previous_rate: float | None = None
+        self._window_started = time.monotonic()
+        self._rows = 0
+        self._tokens = 0
+
+    def record(self, tokens: int) -> None:
+        self._rows += 1
+        self._tokens += tokens
+        now = time.monotonic()
+        elapsed = now - self._window_started
+        if elapsed < self.window_seconds or self._rows < self.limit:
+            return
+        rate = (self._tokens or self._rows) / elapsed
+        self.history.append({"limit": self.limit, "rate": rate})
+        if self._previous_rate is not None and rate < self._previous_rate * (1 + self.tolerance):
+            self._direction = -self._direction
+        self._previous_rate = rate
+        self.limit = max(self.minimum, min(self.maximum, self.limit + self._direction))
+        self._window_started = now
+        self._rows = 0
+        self._tokens = 0
+
+
+class DatasetRunUseCase:
+    """JSONL 데이터셋의 프롬프트를 대량으로 추론해 결과를 JSONL로 기록하는 오프라인 실행기.
+
+    Rules:
+        - 입력은 한 줄씩 읽으며(전체를 메모리에 올리지 않는다) 각 줄은 JSON 객체(`prompt_field`, 선택 `id`,
+          `model_id`, 추론 옵션) 또는 JSON 문자열이다. 해석할 수 없는 줄은 오류 행으로 기록한다.
+        - 결과는 완료 순서대로 `{"line", "id", "ok", "text", "usage", "latency_ms", ...}` 한 줄씩 추가한다.
+        - `checkpoint_seconds`마다 출력 파일을 fsync하고 체크포인트(`<출력>.checkpoint.json`)를 원자적으로 교체한다.
+          재개 시 출력 파일을 체크포인트 시점 크기로 자르고, 완료된 줄은 건너뛴다.
+        - 모델/프롬프트/옵션이 같은 행은 엔진을 한 번만 호출하고 나머지는 `duplicate_of`를 붙여 같은 결과를 쓴다
+          (최근 `dedupe_cache`개 결과와 실행 중인 요청 기준).
+        - 동시성은 `_ThroughputTuner`가 `min_concurrency`~`max_concurrency` 사이에서 조정한다.
+        - 엔진 오류로 실패한 행도 완료로 기록한다(`ok: false`). 중단(Ctrl+C) 시 실행 중 요청은 취소하고
+          체크포인트를 남긴 뒤 종료한다.
+    """
+
+    def __init__(self, inference: InferenceUseCase) -> None:
+        self.inference = inference
+
+    @staticmethod
+    def checkpoint_path(output_path: str | Path) -> Path:
+        return Path(f"{output_path}.checkpoint.json")
+
+    def run(
+        self,
+        input_path: str | Path,
+        output_path: str | Path,
+        model_id: str,
+        options: dict[str, Any] | None = None,
+        prompt_field: str = "prompt",
+        id_field: str = "id",
+        concurrency: int | None = None,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        dedupe_cache: int = 10000,
+        checkpoint_seconds: float = 5.0,
+        restart: bool = False,
+        limit: int | None = None,
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+        progress_seconds: float = 1.0,
+    ) -> DatasetRunResultDTO:
+        """데이터셋을 실행한다(체크포인트가 있으면 이어서 실행한다).
+
+        Args:
+            options: 모든 행에 적용할 기본 추론 옵션(행에 같은 키가 있으면 행 값을 쓴다).
+            concurrency: 시작 동시성(기본: `min_concurrency`와 `max_concurrency`의 중간).
+            restart: 체크포인트와 기존 출력을 버리고 처음부터 실행한다.
+            limit: 이번 실행에서 처리할 최대 행 수.
+            on_progress: `progress_seconds`마다 진행 상황 dict를 받는 콜백.
+
+        Raises:
+            ConfigValidationError: 체크포인트 없이 출력 파일이 이미 있거나, 체크포인트가 다른 입력 파일의 것인 경우.
+        """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        checkpoint_file = self.checkpoint_path(output_path)
+        checkpoint = self._load_checkpoint(input_path, output_path, checkpoint_file, restart)
+        defaults = {key: value for key, value in (options or {}).items() if value is not None}
+        if concurrency is None:
+            concurrency = (min_concurrency + max_concurrency) // 2
+        tuner = _ThroughputTuner(concurrency, max(1, min_concurrency), max(1, max_concurrency))
+
+        started = time.monotonic()
+        base_elapsed = checkpoint.elapsed_seconds
+        rows_before = checkpoint.rows_done
+        tokens_before = checkpoint.completion_tokens
+        stats = {"ok": 0, "failed": 0, "duplicates": 0, "submitted": 0}
+        completed_cache: OrderedDict[bytes, tuple[Any, dict[str, Any]]] = OrderedDict()
+        in_flight: dict[Future[InferenceResultDTO], tuple[_Row, bytes, float, CancellationToken]] = {}
+        waiting: dict[bytes, list[_Row]] = {}
+        line_offsets: dict[int, int] = {}
+        interrupted = False
+
+        output = output_path.open("ab")
+        last_checkpoint = last_progress = time.monotonic()
+
+        def write(row: _Row, record: dict[str, Any]) -> None:
+            output.write(dumps({"line": row.line, "id": row.row_id, **record}) + b"\n")
+            checkpoint.rows_done += 1
+            mark_done(row)
+
+        def mark_done(row: _Row) -> None:
+            checkpoint.done_after.add(row.line)
+            # 앞에서부터 연속으로 끝난 줄까지 재개 지점을 전진시킨다.
+            while checkpoint.line in checkpoint.done_after:
+                checkpoint.done_after.discard(checkpoint.line)
+                checkpoint.offset = line_offsets.pop(checkpoint.line, checkpoint.offset)
+                checkpoint.line += 1
+
+        def save_checkpoint() -> None:
+            output.flush()
+            os.fsync(output.fileno())
+            checkpoint.output_size = output.tell()
+            checkpoint.elapsed_seconds = base_elapsed + time.monotonic() - started
+            temp = checkpoint_file.with_suffix(".tmp")
+            temp.write_bytes(dumps(checkpoint.to_dict()))
+            os.replace(temp, checkpoint_file)
+
+        def progress() -> dict[str, Any]:
+            elapsed = time.monotonic() - started
+            rows = checkpoint.rows_done - rows_before
+            tokens = checkpoint.completion_tokens - tokens_before
+            return {
+                "rows_done": checkpoint.rows_done,
+                "rows_per_second": rows / elapsed if elapsed > 0 else 0.0,
+                "tokens_per_second": tokens / elapsed if elapsed > 0 else 0.0,
+                "in_flight": len(in_flight),
+                "concurrency": tuner.limit,
+                **stats,
+            }
+
+        def finish(future: Future[InferenceResultDTO]) -> None:
+            row, key, submitted_at, token = in_flight.pop(future)
+            token.close()
+            latency_ms = (time.monotonic() - submitted_at) * 1000
+            try:
+                result = future.result()
+            except Exception as exc:
+                record: dict[str, Any] = {"ok": False, "error": str(exc), "latency_ms": latency_ms}
+                tokens = 0
+            else:
+                if not result.ok and token.reason in ("interrupted",):
+                    # 중단으로 취소된 행(과 같은 프롬프트를 기다리던 행)은 완료로 기록하지 않는다(재개 시 다시 실행).
+                    waiting.pop(key, None)
+                    return
+                usage = self.inference.result_usage(result)
+                tokens = usage.completion_tokens or 0
+                record = {
+                    "ok": result.ok,
+                    "model_id": result.model_id,
+                    "text": self.inference.result_text(result) if result.ok else None,
+                    "usage": {"prompt_tokens": usage.prompt_tokens, "completion_tokens": usage.completion_tokens},
+                    "latency_ms": latency_ms,
+                    "error": result.error,
+                }
+            checkpoint.completion_tokens += tokens
+            tuner.record(tokens)
+            stats["ok" if record["ok"] else "failed"] += 1
+            write(row, record)
+            if record["ok"]:
+                completed_cache[key] = (row.row_id, record)
+                if len(completed_cache) > dedupe_cache:
+                    completed_cache.popitem(last=False)
+            for duplicate in waiting.pop(key, ()):
+                stats["duplicates"] += 1
+                write(duplicate, {**record, "latency_ms": 0.0, "duplicate_of": row.row_id})
+
+        def drain(block_until: int) -> None:
+            # 실행 중 요청이 `block_until`개 미만이 될 때까지 완료를 처리한다.
+            while in_flight and len(in_flight) >= block_until:
+                done, _ = wait(list(in_flight), timeout=progress_seconds, return_when=FIRST_COMPLETED)
+                for future in done:
+                    finish(future)
+                tick()
+
+        def tick() -> None:
+            nonlocal last_checkpoint, last_progress
+            now = time.monotonic()
+            if now - last_checkpoint >= checkpoint_seconds:
+                save_checkpoint()
+                last_checkpoint = now
+            if on_progress is not None and now - last_progress >= progress_seconds:
+                on_progress(progress())
+                last_progress = now
+
+        executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="dataset-run")
+        try:
+            for row in self._read_rows(input_path, checkpoint, model_id, defaults, prompt_field, id_field):
+                line_offsets[row.line] = row.end_offset
+                if row.skip:
+                    mark_done(row)
+                    continue
+                if limit is not None and stats["submitted"] >= limit:
+                    break
+                stats["submitted"] += 1
+                if row.error is not None:
+                    stats["failed"] += 1
+                    write(row, {"ok": False, "error": row.error})
+                    continue
+                key = row.dedupe_key()
+                cached = completed_cache.get(key)
+                if cached is not None:
+                    completed_cache.move_to_end(key)
+                    stats["duplicates"] += 1
+                    write(row, {**cached[1], "latency_ms": 0.0, "duplicate_of": cached[0]})
+                    continue
+                if key in waiting:
+                    waiting[key].append(row)
+                    continue
+                waiting[key] = []
+                drain(tuner.limit)
+                token = CancellationToken(timeout=row.options.get("timeout"))
+                future = executor.submit(
+                    self.inference.generate,
+                    row.model_id,
+                    row.prompt or "",
+                    cancel_token=token,
+                    **row.options,
+                )
+                in_flight[future] = (row, key, time.monotonic(), token)
+                tick()
+            drain(1)
+        except KeyboardInterrupt:
+            interrupted = True
+            for _, _, _, token in list(in_flight.values()):
+                token.cancel("interrupted")
+            done, _ = wait(list(in_flight))
+            for future in done:
+                finish(future)
+        finally:
+            executor.shutdown(wait=True)
+            save_checkpoint()
+            output.close()
+
+        summary = progress()
+        return DatasetRunResultDTO(
+            input_path=str(input_path),
+            output_path=str(output_path),
+            checkpoint_path=str(checkpoint_file),
+            rows_done=checkpoint.rows_done,
+            rows_this_run=checkpoint.rows_done - rows_before,
+            ok=stats["ok"],
+            failed=stats["failed"],
+            duplicates=stats["duplicates"],
+            completion_tokens=checkpoint.completion_tokens,
+            elapsed_seconds=time.monotonic() - started,
+            rows_per_second=summary["rows_per_second"],
+            tokens_per_second=summary["tokens_per_second"],
+            interrupted=interrupted,
+            concurrency_history=tuner.history,
+        )
+
+    @staticmethod
+    def _load_checkpoint(input_path: Path, output_path: Path, checkpoint_file: Path, restart: bool) -> _Checkpoint:
+        """체크포인트를 읽어 출력 파일을 그 시점 크기로 맞추거나, 새 실행을 준비한다."""
+        resolved = str(input_path.resolve())
+        if restart:
+            checkpoint_file.unlink(missing_ok=True)
+            output_path.unlink(missing_ok=True)
+        if not checkpoint_file.exists():
+            if output_path.exists() and output_path.stat().st_size > 0:
+                raise ConfigValidationError(
+                    f"체크포인트 없이 출력 파일이 이미 있습니다: {output_path} (처음부터 다시 실행하려면 --restart)"
+                )
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            return _Checkpoint(input_path=resolved)
+
+        checkpoint = _Checkpoint.from_dict(loads(checkpoint_file.read_bytes()))
+        if checkpoint.input_path != resolved:
+            raise ConfigValidationError(f"체크포인트가 다른 입력 파일의 것입니다: {checkpoint.input_path}")
+        # 마지막 체크포인트 이후에 추가된 결과는 재개 시 다시 실행하므로 잘라낸다.
+        with output_path.open("ab") as output:
+            output.truncate(checkpoint.output_size)
+        return checkpoint
+
+    @staticmethod
+    def _read_rows(
+        input_path: Path,
+        checkpoint: _Checkpoint,
+        model_id: str,
+        defaults: dict[str, Any],
+        prompt_field: str,
+        id_field: str,
+    ) -> Iterator[_Row]:
+        """체크포인트 위치부터 입력을 한 줄씩 읽어 행으로 변환한다(이미 끝난 줄과 빈 줄은 `skip` 행)."""
+        with input_path.open("rb") as source:
+            source.seek(checkpoint.offset)
+            line = checkpoint.line
+            offset = checkpoint.offset
+            for raw in source:
+                offset += len(raw)
+                current = line
+                line += 1
+                if current in checkpoint.done_after or not raw.strip():
+                    yield _Row(current, offset, None, model_id, None, {}, skip=True)
+                    continue
+                yield DatasetRunUseCase._parse_row(raw, current, offset, model_id, defaults, prompt_field, id_field)
+
+    @staticmethod
+    def _parse_row(
+        raw: bytes,
+        line: int,
+        offset: int,
+        model_id: str,
+        defaults: dict[str, Any],
+        prompt_field: str,
+        id_field: str,
+    ) -> _Row:
+        try:
+            data = loads(raw)
+        except Exception as exc:
+            return _Row(line, offset, line, model_id, None, {}, error=f"JSON 파싱 실패: {exc}")
+        if isinstance(data, str):
+            return _Row(line, offset, line, model_id, data, dict(defaults))
+        if not isinstance(data, dict) or not isinstance(data.get(prompt_field), str):
+            return _Row(line, offset, line, model_id, None, {}, error=f"`{prompt_field}` 문자열 필드가 없습니다.")
+        options = dict(defaults)
+        options.update({key: data[key] for key in ROW_OPTION_KEYS if data.get(key) is not None})
+        return _Row(
+            line,
+            offset,
+            data.get(id_field, line),
+            str(data.get("model_id") or model_id),
+            data[prompt_field],
+            options,
+        )
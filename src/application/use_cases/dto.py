@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
 EngineType = Literal["ollama", "vllm"]
@@ -15,6 +16,10 @@ class EngineStatusDTO:
     port: int
     pid: int
 
+    def to_dict(self) -> dict[str, Any]:
+        """`asdict` 재귀 복사 없이 응답용 dict를 만든다."""
+        return {"engine": self.engine, "host": self.host, "port": self.port, "pid": self.pid}
+
 
 @dataclass(slots=True)
 class ModelOperationResultDTO:
@@ -26,13 +31,247 @@ class ModelOperationResultDTO:
     message: str
     payload: dict[str, Any] | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """`asdict` 재귀 복사 없이 응답용 dict를 만든다(payload는 참조를 공유한다)."""
+        return {
+            "model_id": self.model_id,
+            "engine": self.engine,
+            "ok": self.ok,
+            "message": self.message,
+            "payload": self.payload,
+        }
+
 
 @dataclass(slots=True)
 class InferenceResultDTO:
-    """추론 실행 결과를 전달하기 위한 DTO."""
+    """추론 실행 결과를 전달하기 위한 DTO.
+
+    Attributes:
+        raw_output: 패스스루 모드에서 엔진 응답 원본 바이트(`to_dict`에는 포함되지 않는다).
+    """
 
     model_id: str
     engine: EngineType
     ok: bool
     output: dict[str, Any] | None = None
     error: str | None = None
+    raw_output: bytes | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """`asdict` 재귀 복사 없이 응답용 dict를 만든다(output은 참조를 공유한다)."""
+        return {
+            "model_id": self.model_id,
+            "engine": self.engine,
+            "ok": self.ok,
+            "output": self.output,
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
+class EmbeddingResultDTO:
+    """임베딩 실행 결과 DTO.
+
+    Attributes:
+        vectors: 입력 순서대로 이어 붙인 float32 연속 배열(`count * dimension`).
+        elapsed_seconds: 전체 배치 처리 경과 시간.
+    """
+
+    model_id: str
+    engine: EngineType
+    ok: bool
+    count: int = 0
+    dimension: int = 0
+    vectors: array = field(default_factory=lambda: array("f"))
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def vectors_per_second(self) -> float | None:
+        """초당 처리 벡터 수를 반환한다."""
+        if not self.count or self.elapsed_seconds <= 0:
+            return None
+        return self.count / self.elapsed_seconds
+
+    def rows(self) -> list[list[float]]:
+        """벡터를 행 단위 실수 리스트로 변환한다(JSON 응답용)."""
+        dimension = self.dimension
+        return [self.vectors[index * dimension : (index + 1) * dimension].tolist() for index in range(self.count)]
+
+    def to_dict(self, include_vectors: bool = True) -> dict[str, Any]:
+        """응답용 dict를 만든다. `include_vectors=False`면 통계만 담는다."""
+        result: dict[str, Any] = {
+            "model_id": self.model_id,
+            "engine": self.engine,
+            "ok": self.ok,
+            "count": self.count,
+            "dimension": self.dimension,
+            "batches": self.batches,
+            "elapsed_seconds": self.elapsed_seconds,
+            "vectors_per_second": self.vectors_per_second,
+            "error": self.error,
+        }
+        if include_vectors:
+            result["embeddings"] = self.rows()
+        return result
+
+
+@dataclass(slots=True)
+class DatasetRunResultDTO:
+    """데이터셋 대량 추론 실행 결과 DTO.
+
+    Attributes:
+        rows_done: 이전 실행을 포함해 결과가 기록된 전체 행 수.
+        rows_this_run: 이번 실행에서 기록한 행 수(처리량 계산 기준).
+        duplicates: 중복 프롬프트로 엔진 호출 없이 기록한 행 수.
+        concurrency_history: 동시성 조정 구간별 `{"limit", "rate"}` 기록.
+    """
+
+    input_path: str
+    output_path: str
+    checkpoint_path: str
+    rows_done: int
+    rows_this_run: int
+    ok: int
+    failed: int
+    duplicates: int
+    completion_tokens: int
+    elapsed_seconds: float
+    rows_per_second: float
+    tokens_per_second: float
+    interrupted: bool = False
+    concurrency_history: list[dict[str, float]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """`asdict` 재귀 복사 없이 응답용 dict를 만든다."""
+        return {
+            "input_path": self.input_path,
+            "output_path": self.output_path,
+            "checkpoint_path": self.checkpoint_path,
+            "rows_done": self.rows_done,
+            "rows_this_run": self.rows_this_run,
+            "ok": self.ok,
+            "failed": self.failed,
+            "duplicates": self.duplicates,
+            "completion_tokens": self.completion_tokens,
+            "elapsed_seconds": self.elapsed_seconds,
+            "rows_per_second": self.rows_per_second,
+            "tokens_per_second": self.tokens_per_second,
+            "interrupted": self.interrupted,
+            "concurrency_history": self.concurrency_history,
+        }
+
+
+@dataclass(slots=True)
+class ReplayReportDTO:
+    """캡처 트래픽 재생 결과 DTO.
+
+    Attributes:
+        mode: `timed`(원래 도착 간격을 `speed`배로 재현) 또는 `throughput`(`concurrency`개로 최대한 빨리).
+        latency: 재생 지연 분포(ms, `p50`/`p90`/`p99`/`mean`/`max`).
+        captured_latency: 같은 요청들이 캡처될 때 기록된 지연 분포(ms).
+        schedule_lag: `timed` 모드에서 예정 시각보다 늦게 보낸 정도(ms). 크면 재생기 자체가 병목이다.
+        models: 모델별 `{"requests", "failed", "latency"}`.
+        comparison: 이전 재생 보고서와의 지표별 `{"baseline", "current", "delta", "delta_pct"}`.
+    """
+
+    capture_path: str
+    target: str
+    mode: Literal["timed", "throughput"]
+    speed: float | None
+    concurrency: int
+    requests: int
+    ok: int
+    failed: int
+    completion_tokens: int
+    elapsed_seconds: float
+    requests_per_second: float
+    tokens_per_second: float
+    latency: dict[str, float] = field(default_factory=dict)
+    captured_latency: dict[str, float] = field(default_factory=dict)
+    schedule_lag: dict[str, float] = field(default_factory=dict)
+    status_counts: dict[str, int] = field(default_factory=dict)
+    models: dict[str, dict[str, Any]] = field(default_factory=dict)
+    interrupted: bool = False
+    comparison: dict[str, dict[str, float | None]] | None = None
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """`asdict` 재귀 복사 없이 보고서 dict를 만든다."""
+        result: dict[str, Any] = {
+            "capture_path": self.capture_path,
+            "target": self.target,
+            "mode": self.mode,
+            "speed": self.speed,
+            "concurrency": self.concurrency,
+            "requests": self.requests,
+            "ok": self.ok,
+            "failed": self.failed,
+            "error_rate": self.error_rate,
+            "completion_tokens": self.completion_tokens,
+            "elapsed_seconds": self.elapsed_seconds,
+            "requests_per_second": self.requests_per_second,
+            "tokens_per_second": self.tokens_per_second,
+            "latency": self.latency,
+            "captured_latency": self.captured_latency,
+            "schedule_lag": self.schedule_lag,
+            "status_counts": self.status_counts,
+            "models": self.models,
+            "interrupted": self.interrupted,
+        }
+        if self.comparison is not None:
+            result["comparison"] = self.comparison
+        return result
+
+
+@dataclass(slots=True)
+class EngineTuneResultDTO:
+    """엔진 기동 파라미터 튜닝 결과 DTO.
+
+    Attributes:
+        trials: 시도한 파라미터 조합별 `{"parameters", "ok", "feasible", "tokens_per_second", "p99_ms", ...}`.
+        best: 제약(`max_p99_ms`, `max_error_rate`)을 만족한 조합 중 처리량이 가장 높은 시도. 없으면 `None`.
+    """
+
+    model_id: str
+    engine: EngineType
+    workload: str
+    max_p99_ms: float | None
+    max_error_rate: float
+    initial_parameters: dict[str, Any]
+    trials: list[dict[str, Any]] = field(default_factory=list)
+    best: dict[str, Any] | None = None
+    elapsed_seconds: float = 0.0
+
+    def yaml_snippet(self) -> str | None:
+        """최적 조합을 `config/models.yml`에 붙여 넣을 수 있는 YAML 조각으로 만든다(최적 조합이 없으면 `None`)."""
+        if self.best is None:
+            return None
+        header = (
+            f"# cli tune 제안 ({self.model_id}, {self.workload}): "
+            f"tokens/s {self.best['tokens_per_second']:.1f}, p99 {self.best['p99_ms']:.1f}ms"
+        )
+        values = [f"{name}: {value}" for name, value in self.best["parameters"].items()]
+        if self.engine == "ollama":
+            return "\n".join([header, "runtime:", "  ollama:", *(f"    {line}" for line in values)]) + "\n"
+        lines = [header, "models:", f'  - id: "{self.model_id}"', "    parameters:"]
+        return "\n".join([*lines, *(f"      {line}" for line in values)]) + "\n"
+
+    def to_dict(self) -> dict[str, Any]:
+        """`asdict` 재귀 복사 없이 보고서 dict를 만든다."""
+        return {
+            "model_id": self.model_id,
+            "engine": self.engine,
+            "workload": self.workload,
+            "max_p99_ms": self.max_p99_ms,
+            "max_error_rate": self.max_error_rate,
+            "initial_parameters": self.initial_parameters,
+            "trials": self.trials,
+            "best": self.best,
+            "elapsed_seconds": self.elapsed_seconds,
+            "yaml_snippet": self.yaml_snippet(),
+        }
@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from src.infrastructure import (
+    AppSettings,
+    ConfigValidationError,
+    EngineDriver,
+    apply_engine_parameters,
+    current_engine_parameters,
+)
+from src.infrastructure.runtime import TUNABLE_PARAMETERS
+
+from .dto import EngineTuneResultDTO
+from .inference_use_case import InferenceUseCase
+from .replay_use_case import REPLAY_OPTION_KEYS, ReplayUseCase, synthesize_prompt
+
+DEFAULT_SEARCH_SPACE: dict[str, list[Any]] = {
+    "num_parallel": [1, 2, 4, 8],
+    "max_num_seqs": [32, 64, 128, 256],
+    "max_num_batched_tokens": [2048, 4096, 8192],
+    "gpu_memory_utilization": [0.85, 0.9, 0.95],
+}
+"""파라미터별 기본 후보 값(`cli tune --param`으로 바꿀 수 있다)."""
+
+
+class EngineTuneUseCase:
+    """엔진 기동 파라미터 조합마다 엔진을 다시 띄우고 부하를 걸어 처리량이 가장 높은 조합을 찾는 튜너.
+
+    Rules:
+        - 조합마다 드라이버로 엔진을 띄우고, 같은 파라미터를 반영한 설정으로 `InferenceUseCase`를 만들어
+          `warmup`건을 보낸 뒤 작업 부하(캡처 또는 합성)를 `ReplayUseCase`로 재생해 잰다.
+        - 탐색은 좌표 하강이다. 현재 최적 조합에서 파라미터 하나의 후보 값만 바꿔 시도하고, 더 나은 값을 고정한 뒤
+          다음 파라미터로 넘어간다. 한 바퀴 동안 최적 조합이 바뀌지 않으면 `rounds` 전에 멈춘다.
+        - 시작 조합은 설정 값(없으면 후보 목록의 가운데 값)이다. 이미 잰 조합은 다시 띄우지 않는다.
+        - 오류율이 `max_error_rate`를 넘거나 p99가 `max_p99_ms`를 넘는 조합은 제외하고, 남은 조합 중
+          생성 토큰 처리량(토큰 수를 모르면 요청 처리량)이 가장 높고 같으면 p99가 낮은 조합을 고른다.
+        - 기동 실패(메모리 부족 등)도 시도로 기록하고 다음 후보로 넘어간다.
+    """
+
+    def __init__(self, settings: AppSettings, driver: EngineDriver) -> None:
+        self.settings = settings
+        self.driver = driver
+
+    def run(
+        self,
+        model_id: str,
+        records: Sequence[dict[str, Any]],
+        workload: str,
+        search_space: dict[str, list[Any]] | None = None,
+        speed: float | None = None,
+        concurrency: int = 64,
+        max_p99_ms: float | None = None,
+        max_error_rate: float = 0.01,
+        warmup: int = 2,
+        rounds: int = 2,
+        on_trial: Callable[[dict[str, Any]], None] | None = None,
+    ) -> EngineTuneResultDTO:
+        """튜닝을 실행한다.
+
+        Args:
+            records: 캡처 형식 작업 부하(`read_capture()` 또는 `synthetic_workload()` 결과).
+            workload: 보고서/YAML 조각에 남길 작업 부하 설명.
+            search_space: 파라미터별 후보 값. 엔진이 지원하는 파라미터만 쓰며 없는 파라미터는 기본 후보를 쓴다.
+            speed: 주면 작업 부하를 원래 도착 간격의 `speed`배로 재생한다(없으면 최대 처리량).
+            on_trial: 시도 하나가 끝날 때마다 시도 dict를 받는 콜백.
+
+        Raises:
+            ConfigValidationError: 모델이 없거나, 드라이버와 모델 엔진이 다르거나, 작업 부하가 비어 있는 경우.
+        """
+        model = self.settings.get_model(model_id)
+        if model is None:
+            raise ConfigValidationError(f"모델을 찾을 수 없습니다: {model_id}")
+        if model.engine != self.driver.engine:
+            raise ConfigValidationError(f"드라이버 엔진({self.driver.engine})과 모델 엔진({model.engine})이 다릅니다.")
+        if not records:
+            raise ConfigValidationError("튜닝에 쓸 작업 부하가 비어 있습니다.")
+        space = {
+            name: list((search_space or {}).get(name) or DEFAULT_SEARCH_SPACE[name])
+            for name in TUNABLE_PARAMETERS[model.engine]
+        }
+        configured = current_engine_parameters(self.settings, model)
+        best_parameters = {
+            name: configured[name] if configured[name] is not None else values[len(values) // 2]
+            for name, values in space.items()
+        }
+        result = EngineTuneResultDTO(
+            model_id=model.id,
+            engine=model.engine,
+            workload=workload,
+            max_p99_ms=max_p99_ms,
+            max_error_rate=max_error_rate,
+            initial_parameters=dict(best_parameters),
+        )
+        trials: dict[tuple[Any, ...], dict[str, Any]] = {}
+        started = time.monotonic()
+
+        def measure(parameters: dict[str, Any]) -> dict[str, Any]:
+            key = tuple(parameters[name] for name in space)
+            if key not in trials:
+                trial = self._trial(model.id, parameters, records, speed, concurrency, warmup)
+                trial["feasible"] = trial["ok"] and self._feasible(trial, max_p99_ms, max_error_rate)
+                trials[key] = trial
+                result.trials.append(trial)
+                if on_trial is not None:
+                    on_trial(trial)
+            return trials[key]
+
+        best = measure(best_parameters)
+        for _ in range(max(1, rounds)):
+            previous = dict(best_parameters)
+            for name, values in space.items():
+                for value in values:
+                    candidate = measure({**best_parameters, name: value})
+                    if self._better(candidate, best):
+                        best = candidate
+                best_parameters = dict(best["parameters"])
+            if best_parameters == previous:
+                break
+
+        result.best = best if best["feasible"] else None
+        result.elapsed_seconds = time.monotonic() - started
+        return result
+
+    def _trial(
+        self,
+        model_id: str,
+        parameters: dict[str, Any],
+        records: Sequence[dict[str, Any]],
+        speed: float | None,
+        concurrency: int,
+        warmup: int,
+    ) -> dict[str, Any]:
+        """파라미터 조합 하나로 엔진을 띄워 작업 부하를 재생하고 시도 결과를 만든다."""
+        trial: dict[str, Any] = {"parameters": dict(parameters), "ok": False, "error": None}
+        started = time.monotonic()
+        try:
+            endpoint = self.driver.launch(parameters)
+        except Exception as exc:
+            trial.update(error=f"기동 실패: {exc}", elapsed_seconds=time.monotonic() - started)
+            return trial
+        try:
+            tuned = apply_engine_parameters(self.settings, model_id, parameters)
+            engine = self.driver.engine
+            tuned.runtime.endpoints[engine] = endpoint
+            send = ReplayUseCase.local_sender(InferenceUseCase(tuned))
+            sample = records[0]
+            prompt = sample.get("prompt") or synthesize_prompt(sample)
+            options = {key: value for key, value in (sample.get("options") or {}).items() if key in REPLAY_OPTION_KEYS}
+            for _ in range(warmup):
+                send(model_id, prompt, {**options, "use_cache": False})
+            report = ReplayUseCase(send, target=engine).run_records(
+                records,
+                source="tune",
+                speed=speed,
+                concurrency=concurrency,
+                model_id=model_id,
+            )
+            trial.update(
+                ok=report.ok > 0,
+                error=None if report.ok else "성공한 요청이 없습니다.",
+                tokens_per_second=report.tokens_per_second,
+                requests_per_second=report.requests_per_second,
+                p50_ms=report.latency.get("p50"),
+                p99_ms=report.latency.get("p99"),
+                error_rate=report.error_rate,
+            )
+        except Exception as exc:
+            trial["error"] = str(exc)
+        finally:
+            self.driver.shutdown()
+        trial["elapsed_seconds"] = time.monotonic() - started
+        return trial
+
+    @staticmethod
+    def _feasible(trial: dict[str, Any], max_p99_ms: float | None, max_error_rate: float) -> bool:
+        if trial.get("error_rate", 1.0) > max_error_rate:
+            return False
+        return max_p99_ms is None or (trial.get("p99_ms") or 0.0) <= max_p99_ms
+
+    @staticmethod
+    def _better(candidate: dict[str, Any], best: dict[str, Any]) -> bool:
+        """`candidate`가 현재 최적보다 나은지(실행 가능 > 처리량 > 낮은 p99 순) 판단한다."""
+        if candidate["feasible"] != best["feasible"]:
+            return candidate["feasible"]
+        if not candidate["ok"]:
+            return False
+        if not best["ok"]:
+            return True
+
+        def throughput(trial: dict[str, Any]) -> float:
+            return trial["tokens_per_second"] or trial["requests_per_second"]
+
+        if throughput(candidate) != throughput(best):
+            return throughput(candidate) > throughput(best)
+        return (candidate["p99_ms"] or 0.0) < (best["p99_ms"] or 0.0)
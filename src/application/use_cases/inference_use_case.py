@@ -1,64 +1,979 @@
 from __future__ import annotations
 
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
-from src.infrastructure import AppSettings, ConfigValidationError, EngineType, OllamaAdapter, VllmAdapter
+from src.domain import EngineType as DomainEngineType
+from src.domain import InferenceOptions, InferencePolicy, InferenceRequest, ModelId, early_stop_condition
+from src.infrastructure import (
+    AdapterResponse,
+    AdaptiveConcurrencyLimiter,
+    AppSettings,
+    CancellationToken,
+    CascadeAcceptanceCheck,
+    CascadeConfig,
+    ConfigValidationError,
+    ContextWindowExceeded,
+    DispatchQueue,
+    Embedder,
+    EndpointConfig,
+    EngineHealthMonitor,
+    EngineType,
+    FleetPool,
+    HashEmbedder,
+    MetricsRegistry,
+    ModelConfig,
+    OllamaAdapter,
+    OllamaContextStore,
+    OllamaEmbedder,
+    PromptRouter,
+    RateLimitExceeded,
+    ResilientInvoker,
+    RouteDecision,
+    ScalingSignal,
+    SemanticCache,
+    TenantConfig,
+    TenantRateLimiter,
+    TokenCounter,
+    TokenUsage,
+    VllmAdapter,
+    cancelled_response,
+    current_span,
+    start_span,
+)
 
-from .dto import InferenceResultDTO
+from .dto import EmbeddingResultDTO, InferenceResultDTO
+
+
+@dataclass(frozen=True, slots=True)
+class _ModelProfile:
+    """모델 설정에서 요청마다 다시 만들 필요가 없는 도메인 값을 미리 계산해 둔 묶음."""
+
+    model_id: ModelId
+    engine: DomainEngineType
+    model_name: str
+    defaults: InferenceOptions
+
+    @classmethod
+    def from_config(cls, model: ModelConfig) -> "_ModelProfile":
+        return cls(
+            model_id=ModelId(model.id),
+            engine=DomainEngineType(model.engine),
+            model_name=model.model_name(),
+            defaults=InferenceOptions(
+                temperature=model.parameters.temperature,
+                top_p=model.parameters.top_p,
+                num_ctx=model.parameters.num_ctx,
+            ),
+        )
 
 
 class InferenceUseCase:
     """모델 추론과 엔진 헬스 체크를 담당하는 유스케이스."""
 
-    def __init__(self, settings: AppSettings) -> None:
-        """엔진별 어댑터를 초기화한다."""
+    def __init__(
+        self,
+        settings: AppSettings,
+        metrics: MetricsRegistry | None = None,
+        context_store: OllamaContextStore | None = None,
+        rate_limiter: TenantRateLimiter | None = None,
+        semantic_cache: SemanticCache | None = None,
+    ) -> None:
+        """엔진별 어댑터(레플리카 포함)와 재시도/서킷 브레이커 실행기를 초기화한다.
+
+        Args:
+            context_store: 세션 컨텍스트 저장소. 멀티 워커 모드에서는 공유 프록시를 받는다.
+            rate_limiter: 테넌트 한도기. 멀티 워커 모드에서는 공유 프록시를 받는다.
+            semantic_cache: 의미 유사도 캐시. 없으면 `runtime.semantic_cache.enabled`일 때 설정대로 만든다.
+        """
         self.settings = settings
+        self.metrics = metrics or MetricsRegistry()
+        self.invoker = ResilientInvoker(self.metrics)
+        store_config = self.settings.runtime.context_store
+        if context_store is None:
+            context_store = OllamaContextStore(
+                max_sessions=store_config.max_sessions,
+                max_bytes=store_config.max_bytes,
+            )
+        self.context_store = context_store
+        self.rate_limiter = rate_limiter or TenantRateLimiter(settings.tenancy)
+        self.token_counter = TokenCounter.from_config(settings.runtime.prompt_routing)
+        self.router = PromptRouter(settings, self.token_counter)
+        self.policy = InferencePolicy()
+        self._profiles = {model.id: _ModelProfile.from_config(model) for model in settings.models}
+        self._queues: dict[str, DispatchQueue] = {}
+        self._queues_lock = threading.Lock()
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        self._cascade_checks: dict[str, CascadeAcceptanceCheck] = {}
+        self._cascade_stats: dict[str, dict[str, Any]] = {}
+        self._cascade_lock = threading.Lock()
         endpoints = self.settings.runtime.endpoints
+        self._replicas: dict[EngineType, list[OllamaAdapter | VllmAdapter]] = {
+            "ollama": [OllamaAdapter(host=item.host, port=item.port) for item in endpoints["ollama"].all_endpoints()],
+            "vllm": [VllmAdapter(host=item.host, port=item.port) for item in endpoints["vllm"].all_endpoints()],
+        }
         self._adapters: dict[EngineType, OllamaAdapter | VllmAdapter] = {
-            "ollama": OllamaAdapter(host=endpoints["ollama"].host, port=endpoints["ollama"].port),
-            "vllm": VllmAdapter(host=endpoints["vllm"].host, port=endpoints["vllm"].port),
+            engine: replicas[0] for engine, replicas in self._replicas.items()
         }
+        self._local_replicas = dict(self._replicas)
+        self._fleet_models: dict[str, list[OllamaAdapter | VllmAdapter]] = {}
+        self._fleet_adapters: dict[str, OllamaAdapter | VllmAdapter] = {}
+        self._fleet_rotation = itertools.count()
+        self._scaled_models: dict[str, list[OllamaAdapter | VllmAdapter]] = {}
+        self._active: dict[str, int] = {}
+        self._active_lock = threading.Lock()
+        health_config = self.settings.runtime.health
+        self.health_monitor = EngineHealthMonitor(self._replicas, health_config, self.metrics)
+        if health_config.skip_unhealthy:
+            self.invoker.health = self.health_monitor
+        cache_config = self.settings.runtime.semantic_cache
+        if semantic_cache is None and cache_config.enabled:
+            embedder: Embedder
+            if cache_config.embedder == "ollama":
+                assert cache_config.embedding_model is not None
+                embedder = OllamaEmbedder(self._adapters["ollama"], cache_config.embedding_model)
+            else:
+                embedder = HashEmbedder(dimension=cache_config.hash_dimension)
+            semantic_cache = SemanticCache(cache_config, embedder, self.metrics)
+        self.semantic_cache = semantic_cache
 
     def health(self, engine: EngineType | None = None) -> dict[str, dict[str, Any]]:
         """엔진 헬스 상태를 조회한다.
 
         Args:
             engine: 지정하면 해당 엔진만 검사하고, 없으면 전체 활성 엔진을 검사한다.
+
+        Notes:
+            백그라운드 헬스 폴러가 실행 중이면 캐시된 상태를 바로 반환하고, 아니면(CLI 등)
+            대상 엔진의 모든 엔드포인트를 동시에 한 번 확인한 결과를 반환한다.
         """
         targets = [engine] if engine else self.settings.runtime.resolved_active_engines()
-        result: dict[str, dict[str, Any]] = {}
-
-        for target in targets:
-            response = self._adapters[target].health_check()
-            result[target] = {
-                "ok": response.ok,
-                "payload": response.payload,
-                "error": response.error,
-            }
+        if not self.health_monitor.running:
+            self.health_monitor.check_now(targets)
+        return self.health_monitor.status(targets)
 
-        return result
+    def apply_fleet_pool(self, pool: FleetPool) -> None:
+        """플릿 컨트롤러가 모은 원격 엔진 엔드포인트를 라우팅 풀과 헬스 폴러에 반영한다.
+
+        Rules:
+            - 원격 Ollama 엔드포인트는 모든 Ollama 모델의 레플리카로, 원격 vLLM 엔드포인트는 그 노드가 서빙하는
+              모델의 요청에만 쓴다. 로컬(설정) 엔드포인트는 그대로 남는다.
+            - 원격 엔드포인트가 있는 풀은 요청마다 시작 레플리카를 돌려 부하를 나눈다(`_model_replicas` 참고).
+            - 같은 주소의 어댑터는 재사용해 서킷 브레이커/지연 통계가 풀 변경 후에도 이어진다.
+        """
 
-    def generate(self, model_id: str, prompt: str, **kwargs: Any) -> InferenceResultDTO:
-        """지정 모델로 추론을 수행한다."""
+        def adapters(engine: EngineType, endpoints: list[EndpointConfig]) -> list[OllamaAdapter | VllmAdapter]:
+            result: list[OllamaAdapter | VllmAdapter] = []
+            for endpoint in endpoints:
+                key = f"{engine}:{endpoint.host}:{endpoint.port}"
+                adapter = self._fleet_adapters.get(key)
+                if adapter is None:
+                    adapter_type = OllamaAdapter if engine == "ollama" else VllmAdapter
+                    adapter = self._fleet_adapters[key] = adapter_type(host=endpoint.host, port=endpoint.port)
+                result.append(adapter)
+            return result
+
+        replicas = {
+            engine: [*local, *adapters(engine, pool.engines.get(engine, []))]
+            for engine, local in self._local_replicas.items()
+        }
+        models = {
+            model_id: [*self._local_replicas["vllm"], *adapters("vllm", endpoints)]
+            for model_id, endpoints in pool.models.items()
+        }
+        self._replicas, self._fleet_models = replicas, models
+        self._sync_health_replicas()
+
+    def apply_scaled_replicas(self, model_id: str, endpoints: list[EndpointConfig]) -> None:
+        """오토스케일러가 띄운(준비 완료) 레플리카 엔드포인트를 모델 라우팅 풀과 헬스 폴러에 반영한다."""
         model = self.settings.get_model(model_id)
         if model is None:
-            raise ConfigValidationError(f"존재하지 않는 모델 ID입니다: {model_id}")
+            return
+        adapter_type = OllamaAdapter if model.engine == "ollama" else VllmAdapter
+        current = {(adapter.host, adapter.port): adapter for adapter in self._scaled_models.get(model_id, [])}
+        self._scaled_models[model_id] = [
+            current.get((endpoint.host, endpoint.port)) or adapter_type(host=endpoint.host, port=endpoint.port)
+            for endpoint in endpoints
+        ]
+        self._sync_health_replicas()
 
-        adapter = self._adapters[model.engine]
-        response = adapter.generate(
-            model_name=model.model_name(),
-            prompt=prompt,
-            temperature=kwargs.get("temperature", model.parameters.temperature),
-            top_p=kwargs.get("top_p", model.parameters.top_p),
-            num_ctx=kwargs.get("num_ctx", model.parameters.num_ctx),
-            max_tokens=kwargs.get("max_tokens"),
-            timeout=kwargs.get("timeout"),
+    def scaling_signal(self, model_id: str) -> ScalingSignal:
+        """오토스케일러가 읽는 모델의 현재 수요(진행 중/대기 요청 수, 정상 기본 레플리카 수, 엔진 지연)."""
+        model = self.settings.get_model(model_id)
+        if model is None:
+            return ScalingSignal(base_replicas=0)
+        with self._active_lock:
+            active = self._active.get(model_id, 0)
+        queue = self._queues.get(model_id)
+        queued = queue.depth if queue is not None else 0
+        base = self._fleet_models.get(model_id) or self._replicas[model.engine]
+        return ScalingSignal(
+            in_flight=max(0, active - queued),
+            queued=queued,
+            base_replicas=sum(1 for adapter in base if self.health_monitor.is_healthy(adapter)),
+            latency_p50=self.metrics.quantile("engine_request_seconds", 0.5, model=model_id),
+            latency_p90=self.metrics.quantile("engine_request_seconds", 0.9, model=model_id),
         )
 
+    def _sync_health_replicas(self) -> None:
+        """라우팅 풀(설정/플릿/오토스케일 레플리카) 전체를 헬스 폴러 대상에 맞춘다."""
+        health = {engine: list(items) for engine, items in self._replicas.items()}
+        for items in self._fleet_models.values():
+            health["vllm"].extend(adapter for adapter in items if adapter not in health["vllm"])
+        for model_id, items in self._scaled_models.items():
+            model = self.settings.get_model(model_id)
+            if model is not None:
+                health[model.engine].extend(items)
+        self.health_monitor.set_replicas(health)
+
+    def _model_replicas(self, model: ModelConfig) -> list[OllamaAdapter | VllmAdapter]:
+        """모델 요청을 보낼 레플리카 목록(원격/오토스케일 레플리카가 있으면 요청마다 시작 위치를 돌린다)."""
+        replicas = self._fleet_models.get(model.id) or self._replicas[model.engine]
+        scaled = self._scaled_models.get(model.id)
+        if scaled:
+            replicas = [*replicas, *scaled]
+        if len(replicas) <= len(self._local_replicas[model.engine]):
+            return replicas
+        offset = next(self._fleet_rotation) % len(replicas)
+        return [*replicas[offset:], *replicas[:offset]]
+
+    def result_usage(self, result: InferenceResultDTO) -> TokenUsage:
+        """추론 결과 payload에서 엔진별 형식에 맞춰 토큰 사용량을 추출한다."""
+        return self._adapters[result.engine].token_usage(result.output)
+
+    def result_text(self, result: InferenceResultDTO) -> str:
+        """추론 결과 payload에서 엔진별 형식에 맞춰 생성 텍스트를 추출한다."""
+        return self._adapters[result.engine].generated_text(result.output)
+
+    def generate(
+        self,
+        model_id: str,
+        prompt: str,
+        cancel_token: CancellationToken | None = None,
+        **kwargs: Any,
+    ) -> InferenceResultDTO:
+        """지정 모델로 추론을 수행한다.
+
+        Args:
+            cancel_token: 호출자(API 등)가 관리하는 취소 토큰. 없으면 `timeout`으로 데드라인 토큰을 만든다.
+            raw_response: 키워드 인자로 True를 주면 엔진 응답을 파싱하지 않고 `raw_output`으로 전달한다.
+            session_id / keep_session: Ollama 세션 핸들로 이전 `context`를 재사용하거나 새 세션을 연다.
+            tenant_id: 요청 테넌트. 지정하면 테넌트 한도를 적용하고 사용량을 테넌트별로 집계한다.
+            use_cache: False면 의미 캐시 조회/저장을 건너뛴다.
+            on_text: 지정하면 엔진에 스트리밍으로 요청하고 생성된 텍스트 조각마다 호출한다.
+                최종 결과는 비스트리밍과 같은 모양으로 반환된다(캐시 적중 시에는 호출되지 않는다).
+            logprobs: True면 vLLM에 토큰별 로그 확률을 함께 요청한다.
+            stop: 중지 문자열 목록. 두 엔진 모두 엔진 옵션으로 넘겨 엔진이 직접 멈춘다.
+            max_time: 생성 시간 예산(초). 넘으면 연결을 끊어 생성을 멈추고 그때까지의 텍스트를 성공으로 반환한다
+                (`timeout`은 넘으면 실패다).
+            until: 조기 종료 조건 이름(`first_line`, `json_object`). 스트리밍으로 생성하다 조건을 만족하면 끊는다.
+
+        Raises:
+            RateLimitExceeded: 테넌트의 요청 수/토큰 한도를 초과한 경우.
+            ContextWindowExceeded: 추정 프롬프트 토큰 + `max_tokens`가 모델 컨텍스트 창을 넘는 경우.
+            InvalidPromptError: 프롬프트, 중지 문자열, `max_time`, `until`이 정책에 맞지 않는 경우.
+
+        Notes:
+            - 호출은 모델의 `resilience` 정책(재시도/헤지/서킷 브레이커)을 거쳐 수행된다.
+              생성 요청은 비멱등으로 취급하므로 전송 후 실패는 정책이 허용할 때만 재시도한다.
+            - Ollama 응답의 `context` 배열은 항상 응답에서 제거되며, 세션 사용 시 서버에 보관된다.
+            - 모델에 `dispatch` 정책이 있으면 모델별 디스패치 큐를 거쳐 윈도우 단위로 엔진에 전달된다.
+            - 의미 캐시가 켜져 있으면 세션/원본 패스스루가 아닌 요청은 유사 프롬프트의 이전 응답을
+              `output.cache`(`hit`, `similarity`) 표시와 함께 돌려주고 엔진을 호출하지 않는다.
+            - 트레이스가 샘플링된 요청이면 준비/캐시 조회/큐 대기/엔진 호출 구간을 span으로 남긴다.
+            - `model_id`에 라우팅 그룹 이름을 주면 프롬프트 길이에 맞는 그룹 모델로 보내고,
+              응답 `output.routing`에 선택 결과를 남긴다(`PromptRouter` 참고).
+            - `model_id`에 캐스케이드 이름을 주면 작은 모델부터 시도하고 수용 조건을 통과하지 못하면
+              다음 모델로 올린다(`_generate_cascade` 참고).
+            - `max_time`/`until`로 끊긴 응답에는 `output.early_stop`(`reason`, `completion_tokens`)이 붙고,
+              `max_tokens`까지 생성하지 않아 아낀 토큰 수를 메트릭으로 남긴다(`_record_early_stop` 참고).
+        """
+        with start_span("inference.generate", model_id=model_id) as span:
+            cascade = self.settings.cascade(model_id)
+            if cascade is not None:
+                result = self._generate_cascade(cascade, prompt, cancel_token, kwargs)
+            else:
+                result = self._generate(model_id, prompt, cancel_token, kwargs)
+            span.set(ok=result.ok)
+            return result
+
+    def cascade_stats(self) -> dict[str, dict[str, Any]]:
+        """캐스케이드별 요청 수, 상향 비율, 수용 모델 분포, GPU 사용/절감 시간(초)."""
+        with self._cascade_lock:
+            stats = {
+                name: {**item, "accepted_by": dict(item["accepted_by"])} for name, item in self._cascade_stats.items()
+            }
+        for item in stats.values():
+            item["escalation_rate"] = item["escalated"] / item["requests"] if item["requests"] else 0.0
+        return stats
+
+    def _generate_cascade(
+        self,
+        cascade: CascadeConfig,
+        prompt: str,
+        cancel_token: CancellationToken | None,
+        kwargs: dict[str, Any],
+    ) -> InferenceResultDTO:
+        """캐스케이드 단계 모델을 순서대로 실행해 처음 수용된 응답(또는 마지막 모델 응답)을 반환한다.
+
+        Rules:
+            - 단계 응답이 실패하거나 수용 조건을 통과하지 못하면 다음 모델로 올린다. 마지막 모델 응답은 그대로 반환한다.
+            - `timeout`은 캐스케이드 전체에 적용된다. 취소되면 더 올리지 않는다.
+            - `min_mean_logprob` 조건이 있으면 vLLM 단계에 `logprobs`를 요청하고, 검사 후 응답에서 제거한다.
+              요청한 로그 확률이 응답에 없으면 수용하지 않고 올린다.
+              의미 캐시는 로그 확률 요청 여부를 키에 넣어 로그 확률이 있는 응답만 이 단계에 돌려준다.
+            - `on_text`는 단계마다 스트리밍하지 않고, 수용된 최종 텍스트로 한 번 호출한다.
+            - GPU 사용 시간은 단계 경과 시간 × `tensor_parallel_size`(없으면 1)의 합이다. 절감 시간은 같은 응답을
+              마지막 모델이 생성했을 때의 추정치(관측 디코딩 속도 중앙값 기준)에서 실제 사용 시간을 뺀 값이며,
+              마지막 모델의 디코딩 속도 관측이 없으면 기록하지 않는다.
+            - 세션/원본 패스스루는 모델마다 문맥과 응답 형식이 달라 지원하지 않는다.
+
+        Raises:
+            ConfigValidationError: 세션 또는 `raw_response` 옵션과 함께 호출한 경우.
+        """
+        if kwargs.get("raw_response") or kwargs.get("session_id") or kwargs.get("keep_session"):
+            raise ConfigValidationError(f"캐스케이드 {cascade.name}는 세션/원본 응답 옵션을 지원하지 않습니다.")
+        check = self._cascade_check(cascade)
+        on_text = kwargs.get("on_text")
+        step_kwargs = {key: value for key, value in kwargs.items() if key not in ("on_text", "logprobs")}
+        owns_token = cancel_token is None
+        token = cancel_token or CancellationToken(timeout=kwargs.get("timeout"))
+
+        steps: list[dict[str, Any]] = []
+        gpu_seconds = step_gpu_seconds = 0.0
+        result: InferenceResultDTO | None = None
+        try:
+            for index, model_id in enumerate(cascade.models):
+                model = self.settings.get_model(model_id)
+                assert model is not None
+                want_logprobs = cascade.acceptance.min_mean_logprob is not None and model.engine == "vllm"
+                started = time.monotonic()
+                result = self._generate(model_id, prompt, token, {**step_kwargs, "logprobs": want_logprobs})
+                elapsed = time.monotonic() - started
+                step_gpu_seconds = elapsed * (model.parameters.tensor_parallel_size or 1)
+                gpu_seconds += step_gpu_seconds
+
+                last = index == len(cascade.models) - 1
+                if not result.ok:
+                    reason = "error"
+                else:
+                    adapter = self._adapters[model.engine]
+                    mean_logprob = adapter.mean_logprob(result.output)
+                    text = adapter.generated_text(result.output)
+                    reason = check.rejection(prompt, text, mean_logprob, expect_logprob=want_logprobs)
+                    output = result.output or {}
+                    if want_logprobs and not kwargs.get("logprobs") and output.get("choices"):
+                        # `choices` 항목은 의미 캐시 항목과 공유될 수 있으므로 제자리에서 지우지 않고 복사한다.
+                        output["choices"] = [
+                            {key: value for key, value in choice.items() if key != "logprobs"}
+                            for choice in output["choices"]
+                        ]
+                steps.append({"model_id": model_id, "seconds": round(elapsed, 4), "rejected": reason})
+                if reason is None or last or token.cancelled:
+                    break
+                self.metrics.inc("cascade_escalations_total", cascade=cascade.name, model=model_id, reason=reason)
+        finally:
+            if owns_token:
+                token.close()
+
+        assert result is not None
+        saved = self._cascade_gpu_seconds_saved(cascade, result, gpu_seconds, step_gpu_seconds)
+        self._record_cascade(cascade, result, len(steps) - 1, gpu_seconds, saved)
+        if result.output is not None:
+            result.output["cascade"] = {
+                "name": cascade.name,
+                "model_id": result.model_id,
+                "steps": steps,
+                "gpu_seconds": round(gpu_seconds, 4),
+                "gpu_seconds_saved": round(saved, 4) if saved is not None else None,
+            }
+        if result.ok and on_text is not None:
+            on_text(self.result_text(result))
+        return result
+
+    def _cascade_check(self, cascade: CascadeConfig) -> CascadeAcceptanceCheck:
+        check = self._cascade_checks.get(cascade.name)
+        if check is None:
+            check = self._cascade_checks.setdefault(cascade.name, CascadeAcceptanceCheck(cascade.acceptance))
+        return check
+
+    def _cascade_gpu_seconds_saved(
+        self,
+        cascade: CascadeConfig,
+        result: InferenceResultDTO,
+        gpu_seconds: float,
+        step_gpu_seconds: float,
+    ) -> float | None:
+        """처음부터 마지막 모델만 썼을 때의 GPU 시간 대비 절감량(추정 불가 시 `None`).
+
+        Notes:
+            마지막 모델까지 올라간 요청은 그 단계의 실제 시간이 기준이므로, 앞 단계에 쓴 시간만큼 음수가 된다.
+        """
+        reference = self.settings.get_model(cascade.models[-1])
+        assert reference is not None
+        if not result.ok:
+            return None
+        if result.model_id == reference.id:
+            return step_gpu_seconds - gpu_seconds
+        tokens = self.result_usage(result).completion_tokens
+        rate = self.metrics.quantile("inference_decode_tokens_per_second", 0.5, model=reference.id)
+        if not tokens or rate is None:
+            return None
+        return tokens / rate * (reference.parameters.tensor_parallel_size or 1) - gpu_seconds
+
+    def _record_cascade(
+        self,
+        cascade: CascadeConfig,
+        result: InferenceResultDTO,
+        escalations: int,
+        gpu_seconds: float,
+        saved: float | None,
+    ) -> None:
+        self.metrics.inc("cascade_requests_total", cascade=cascade.name, model=result.model_id, ok=result.ok)
+        self.metrics.inc("cascade_gpu_seconds_total", gpu_seconds, cascade=cascade.name)
+        if saved is not None:
+            self.metrics.inc("cascade_gpu_seconds_saved_total", saved, cascade=cascade.name)
+        with self._cascade_lock:
+            stats = self._cascade_stats.setdefault(
+                cascade.name,
+                {"requests": 0, "escalated": 0, "accepted_by": {}, "gpu_seconds": 0.0, "gpu_seconds_saved": 0.0},
+            )
+            stats["requests"] += 1
+            stats["escalated"] += 1 if escalations else 0
+            stats["gpu_seconds"] += gpu_seconds
+            stats["gpu_seconds_saved"] += saved or 0.0
+            if result.ok:
+                stats["accepted_by"][result.model_id] = stats["accepted_by"].get(result.model_id, 0) + 1
+
+    def _generate(
+        self,
+        model_id: str,
+        prompt: str,
+        cancel_token: CancellationToken | None,
+        kwargs: dict[str, Any],
+    ) -> InferenceResultDTO:
+        """`generate` 본문(트레이스 span 안에서 실행된다)."""
+        route, request = self._prepare_request(model_id, prompt, kwargs)
+        model = route.model
+        self.metrics.observe("prompt_tokens_estimated", route.prompt_tokens, model=model.id)
+        if route.group is not None:
+            self.metrics.inc("prompt_routed_total", group=route.group, model=model.id)
+
+        tenant = self.settings.tenancy.get(kwargs.get("tenant_id"))
+        estimated_tokens = 0
+        if tenant is not None:
+            estimated_tokens = self._estimate_tokens(route.prompt_tokens, request.options.max_tokens)
+            decision = self.rate_limiter.acquire(tenant.id, estimated_tokens)
+            if not decision.allowed:
+                self.metrics.inc("tenant_rate_limited_total", tenant=tenant.id, limit=decision.limit)
+                raise RateLimitExceeded(tenant.id, decision.limit or "requests", decision.retry_after)
+
+        model_name = self._profiles[model.id].model_name
+        options = request.options.as_kwargs()
+        options["timeout"] = kwargs.get("timeout")
+        options["raw_response"] = bool(kwargs.get("raw_response"))
+        if kwargs.get("on_text") is not None:
+            options["on_text"] = kwargs["on_text"]
+        if kwargs.get("logprobs"):
+            options["logprobs"] = True
+        if kwargs.get("stop"):
+            options["stop"] = list(kwargs["stop"])
+        if kwargs.get("max_time"):
+            options["max_time"] = float(kwargs["max_time"])
+        until = kwargs.get("until")
+
+        cache_key: str | None = None
+        cache_vector: Any = None
+        if self.semantic_cache is not None and self._semantic_cacheable(options, kwargs):
+            # 로그 확률을 요청한 응답과 그렇지 않은 응답은 모양이 달라 서로 재사용하지 않는다.
+            cache_key = request.options.cache_key + ("|logprobs" if options.get("logprobs") else "")
+            with start_span("semantic_cache.lookup") as cache_span:
+                hit, cache_vector = self.semantic_cache.lookup(model.id, cache_key, prompt)
+                cache_span.set(hit=hit is not None)
+            if hit is not None:
+                if tenant is not None:
+                    self.rate_limiter.settle(tenant.id, estimated_tokens, 0)
+                    self.metrics.inc("tenant_requests_total", tenant=tenant.id, ok=True)
+                self.metrics.inc("inference_requests_total", model=model.id, ok=True)
+                hit.payload["cache"] = {"hit": True, "similarity": hit.similarity}
+                return InferenceResultDTO(model_id=model.id, engine=model.engine, ok=True, output=hit.payload)
+
+        owns_token = cancel_token is None
+        token = cancel_token or CancellationToken(timeout=kwargs.get("timeout"))
+        session_id = self._resolve_session(model.engine, model_name, options, kwargs)
+        adapters = self._model_replicas(model)
+
+        def _call() -> AdapterResponse:
+            return self.invoker.invoke(
+                adapters,
+                # 조기 종료 조건은 상태를 가지므로 재시도/헤지 시도마다 새로 만든다.
+                lambda adapter, attempt_token: adapter.generate(
+                    model_name=model_name,
+                    prompt=prompt,
+                    cancel_token=attempt_token,
+                    stop_when=early_stop_condition(until).feed if until else None,
+                    **options,
+                ),
+                model.resilience,
+                idempotent=False,
+                model_id=model.id,
+                token=token,
+            )
+
+        queue = self._dispatch_queue(model)
+        limiter = self._concurrency_limiter(model) if queue is None else None
+        with self._active_lock:
+            self._active[model.id] = self._active.get(model.id, 0) + 1
+        try:
+            with start_span("engine.invoke", engine=model.engine) as invoke_span:
+                if limiter is not None:
+                    if limiter.acquire(token):
+                        started = time.monotonic()
+                        limited: AdapterResponse | None = None
+                        try:
+                            response = limited = _call()
+                        finally:
+                            limiter.release(limited, time.monotonic() - started)
+                    else:
+                        response = cancelled_response(token)
+                elif queue is None:
+                    response = _call()
+                elif tenant is None:
+                    response = queue.submit(_call, token)
+                else:
+                    response = queue.submit(
+                        _call,
+                        token,
+                        tenant=tenant.id,
+                        weight=tenant.weight,
+                        cost=estimated_tokens,
+                    )
+                invoke_span.set(ok=response.ok, error_kind=response.error_kind)
+                if response.payload is not None:
+                    invoke_span.set(**self._engine_timings(response.payload))
+        finally:
+            with self._active_lock:
+                self._active[model.id] -= 1
+            if owns_token:
+                token.close()
+
+        if response.ok:
+            self._record_decode_rate(model.id, adapters[0], response.payload, token.elapsed())
+            early_stop = adapters[0].early_stop_reason(response.payload)
+            if early_stop is not None:
+                reason = until if early_stop == "until" else early_stop
+                self._record_early_stop(model.id, adapters[0], response.payload, reason, options["max_tokens"])
+            if model.engine == "ollama" and response.payload is not None:
+                self._finish_session(model.id, model_name, session_id, options.get("context"), response.payload)
+            if cache_vector is not None and response.payload is not None:
+                assert self.semantic_cache is not None and cache_key is not None
+                self.semantic_cache.store(model.id, cache_key, cache_vector, response.payload)
+        elif response.error_kind == "cancelled":
+            self._record_cancellation(model.id, token, options["max_tokens"])
+        self.metrics.inc("inference_requests_total", model=model.id, ok=response.ok)
+        if tenant is not None:
+            self._settle_tenant(tenant, adapters[0], response, estimated_tokens)
+        if response.payload is not None and (route.group is not None or route.num_ctx is not None):
+            response.payload["routing"] = {
+                "group": route.group,
+                "model_id": model.id,
+                "prompt_tokens": route.prompt_tokens,
+                "num_ctx": options["num_ctx"],
+            }
+
         return InferenceResultDTO(
             model_id=model.id,
             engine=model.engine,
             ok=response.ok,
             output=response.payload,
             error=response.error,
+            raw_output=response.raw,
+        )
+
+    def embed(
+        self,
+        model_id: str,
+        texts: list[str],
+        cancel_token: CancellationToken | None = None,
+        **kwargs: Any,
+    ) -> EmbeddingResultDTO:
+        """지정 모델로 여러 텍스트의 임베딩을 배치/병렬로 계산한다.
+
+        Args:
+            batch_size: 엔진 요청 1건에 담을 텍스트 수(기본 32).
+            concurrency: 동시에 보낼 배치 요청 수(기본: 모델 디스패치 슬롯 수).
+            tenant_id: 요청 테넌트. 지정하면 입력 길이 기반 추정 토큰으로 테넌트 한도를 적용한다.
+
+        Notes:
+            - 임베딩은 멱등이므로 배치 요청은 `resilience` 정책에 따라 전송 후 실패도 재시도한다.
+            - 결과는 입력 순서대로 float32 연속 배열(`EmbeddingResultDTO.vectors`)에 모은다.
+        """
+        model = self.settings.get_model(model_id)
+        if model is None:
+            raise ConfigValidationError(f"존재하지 않는 모델 ID입니다: {model_id}")
+        if not texts:
+            raise ConfigValidationError("임베딩할 입력 텍스트가 비어 있습니다.")
+
+        tenant = self.settings.tenancy.get(kwargs.get("tenant_id"))
+        # 임베딩 입력은 재사용되는 경우가 드물어 캐시를 거치지 않고 토크나이저로 바로 센다.
+        estimated_tokens = sum(self.token_counter.tokenizer.count(text) for text in texts)
+        if tenant is not None:
+            decision = self.rate_limiter.acquire(tenant.id, estimated_tokens)
+            if not decision.allowed:
+                self.metrics.inc("tenant_rate_limited_total", tenant=tenant.id, limit=decision.limit)
+                raise RateLimitExceeded(tenant.id, decision.limit or "requests", decision.retry_after)
+
+        batch_size = max(1, int(kwargs.get("batch_size") or 32))
+        concurrency = max(1, int(kwargs.get("concurrency") or self.settings.dispatch_slots(model)))
+        timeout = kwargs.get("timeout")
+        owns_token = cancel_token is None
+        token = cancel_token or CancellationToken(timeout=timeout)
+        model_name = model.model_name()
+        adapters = self._model_replicas(model)
+        batches = [texts[start : start + batch_size] for start in range(0, len(texts), batch_size)]
+
+        def _run(batch: list[str]) -> AdapterResponse:
+            return self.invoker.invoke(
+                adapters,
+                lambda adapter, attempt_token: adapter.embed(
+                    model_name,
+                    batch,
+                    cancel_token=attempt_token,
+                    timeout=timeout,
+                ),
+                model.resilience,
+                idempotent=True,
+                model_id=model.id,
+                token=token,
+            )
+
+        started = time.perf_counter()
+        try:
+            if len(batches) == 1:
+                responses = [_run(batches[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as pool:
+                    responses = list(pool.map(_run, batches))
+        finally:
+            if owns_token:
+                token.close()
+        elapsed = time.perf_counter() - started
+
+        result = self._collect_embeddings(model, adapters[0], batches, responses)
+        result.elapsed_seconds = elapsed
+        if tenant is not None:
+            prompt_tokens = sum(adapters[0].token_usage(item.payload).prompt_tokens or 0 for item in responses)
+            self.rate_limiter.settle(tenant.id, estimated_tokens, prompt_tokens or estimated_tokens)
+            self.metrics.inc("tenant_requests_total", tenant=tenant.id, ok=result.ok)
+        self.metrics.inc("embedding_requests_total", model=model.id, ok=result.ok)
+        if result.ok:
+            self.metrics.inc("embedding_vectors_total", result.count, model=model.id)
+            if result.vectors_per_second is not None:
+                self.metrics.observe("embedding_vectors_per_second", result.vectors_per_second, model=model.id)
+        return result
+
+    @staticmethod
+    def _collect_embeddings(
+        model: ModelConfig,
+        adapter: OllamaAdapter | VllmAdapter,
+        batches: list[list[str]],
+        responses: list[AdapterResponse],
+    ) -> EmbeddingResultDTO:
+        """배치 응답들을 입력 순서대로 하나의 float32 연속 배열로 모은다(실패/차원 불일치 시 오류 DTO)."""
+        result = EmbeddingResultDTO(model_id=model.id, engine=model.engine, ok=False, batches=len(batches))
+        for batch, response in zip(batches, responses):
+            if not response.ok:
+                result.error = response.error
+                return result
+            rows = adapter.embedding_vectors(response.payload)
+            if len(rows) != len(batch):
+                result.error = f"엔진이 {len(batch)}개 입력에 {len(rows)}개 벡터를 반환했습니다."
+                return result
+            for row in rows:
+                if result.dimension == 0:
+                    result.dimension = len(row)
+                elif len(row) != result.dimension:
+                    result.error = f"임베딩 차원이 일치하지 않습니다: {result.dimension} != {len(row)}"
+                    return result
+                result.vectors.fromlist(row)
+        result.count = len(result.vectors) // result.dimension if result.dimension else 0
+        result.ok = True
+        return result
+
+    def _prepare_request(
+        self,
+        model_id: str,
+        prompt: str,
+        kwargs: dict[str, Any],
+    ) -> tuple[RouteDecision, InferenceRequest]:
+        """프롬프트 검증, 모델 라우팅, 옵션 병합을 한 번씩 수행해 도메인 요청을 만든다.
+
+        Rules:
+            - `InferencePolicy.validate_prompt`로 빈/과대 프롬프트를 엔진 호출 전에 거부한다.
+            - 옵션은 모델별로 미리 만든 기본 `InferenceOptions`에 `None`이 아닌 요청 값만 덮어쓴다.
+              (요청 인자가 명시적 `None`이어도 모델 기본값이 유지된다.)
+        """
+        self.policy.validate_prompt(prompt)
+        self.policy.validate_early_stop(kwargs.get("stop"), kwargs.get("max_time"))
+        if kwargs.get("until"):
+            early_stop_condition(kwargs["until"])
+        try:
+            route = self.router.route(model_id, prompt, kwargs.get("max_tokens"), kwargs.get("num_ctx"))
+        except ContextWindowExceeded as exc:
+            self.metrics.inc("prompt_rejected_total", model=exc.model_id)
+            raise
+        span = current_span()
+        if span is not None:
+            span.set(routed_model_id=route.model.id, prompt_tokens=route.prompt_tokens, auto_num_ctx=route.num_ctx)
+
+        profile = self._profiles.get(route.model.id)
+        if profile is None:
+            profile = self._profiles[route.model.id] = _ModelProfile.from_config(route.model)
+        options = self.policy.resolve_options(
+            profile.defaults,
+            temperature=kwargs.get("temperature"),
+            top_p=kwargs.get("top_p"),
+            num_ctx=route.num_ctx or kwargs.get("num_ctx"),
+            max_tokens=kwargs.get("max_tokens"),
+        )
+        request = InferenceRequest(model_id=profile.model_id, engine=profile.engine, prompt=prompt, options=options)
+        return route, request
+
+    @staticmethod
+    def _semantic_cacheable(options: dict[str, Any], kwargs: dict[str, Any]) -> bool:
+        """세션 문맥에 의존하거나 원본 바이트를 요구하는 요청은 의미 캐시 대상에서 제외한다."""
+        if options["raw_response"] or kwargs.get("session_id") or kwargs.get("keep_session"):
+            return False
+        if kwargs.get("stop") or kwargs.get("max_time") or kwargs.get("until"):
+            return False
+        return bool(kwargs.get("use_cache", True))
+
+    def _estimate_tokens(self, prompt_tokens: int, max_tokens: int | None) -> int:
+        """토큰 버킷 선차감용 추정치(추정 프롬프트 토큰 + 생성 상한)를 계산한다."""
+        completion = max_tokens if max_tokens is not None else self.settings.tenancy.default_completion_tokens
+        return prompt_tokens + completion
+
+    def _settle_tenant(
+        self,
+        tenant: TenantConfig,
+        adapter: OllamaAdapter | VllmAdapter,
+        response: AdapterResponse,
+        estimated_tokens: int,
+    ) -> None:
+        """선차감한 추정 토큰을 실제 사용량으로 정산하고 테넌트 사용량 메트릭을 기록한다.
+
+        Rules:
+            - 성공 응답에 사용량이 있으면 `prompt + completion` 토큰으로 정산한다.
+            - 엔진에 도달하지 못한 실패(connect/circuit_open/unhealthy)는 전액 환급한다.
+            - 그 외(취소, 전송 후 실패, 원본 패스스루)는 추정치를 그대로 소비한 것으로 본다.
+        """
+        usage = adapter.token_usage(response.payload) if response.ok else None
+        if usage is not None and (usage.prompt_tokens or usage.completion_tokens):
+            prompt_tokens = usage.prompt_tokens or 0
+            completion_tokens = usage.completion_tokens or 0
+            actual = prompt_tokens + completion_tokens
+            self.metrics.inc("tenant_tokens_total", prompt_tokens, tenant=tenant.id, kind="prompt")
+            self.metrics.inc("tenant_tokens_total", completion_tokens, tenant=tenant.id, kind="completion")
+        elif response.error_kind in ("connect", "circuit_open", "unhealthy"):
+            actual = 0
+        else:
+            actual = estimated_tokens
+        self.rate_limiter.settle(tenant.id, estimated_tokens, actual)
+        self.metrics.inc("tenant_requests_total", tenant=tenant.id, ok=response.ok)
+
+    def _dispatch_queue(self, model: ModelConfig) -> DispatchQueue | None:
+        """모델의 디스패치 큐를 조회하거나 생성한다(`dispatch` 정책이 없으면 `None`)."""
+        if model.dispatch is None:
+            return None
+        with self._queues_lock:
+            queue = self._queues.get(model.id)
+            if queue is None:
+                slots = self.settings.dispatch_slots(model)
+                queue = DispatchQueue(
+                    name=model.id,
+                    max_batch_size=model.dispatch.max_batch_size or slots,
+                    max_wait_ms=model.dispatch.max_wait_ms,
+                    concurrency=slots,
+                    metrics=self.metrics,
+                    limiter=self._concurrency_limiter(model),
+                )
+                self._queues[model.id] = queue
+            return queue
+
+    def _concurrency_limiter(self, model: ModelConfig) -> AdaptiveConcurrencyLimiter | None:
+        """모델의 적응형 동시성 제한기를 조회하거나 생성한다(`concurrency` 정책이 없으면 `None`).
+
+        Notes:
+            지연 표본은 생성 토큰당 경과 시간이다. 출력 길이가 요청마다 달라도 엔진 포화 정도만 반영하도록
+            하기 위함이며, 사용량을 알 수 없는 응답(원본 패스스루 등)은 표본에서 뺀다.
+        """
+        if model.concurrency is None:
+            return None
+        limiter = self._limiters.get(model.id)
+        if limiter is not None:
+            return limiter
+        adapter = self._replicas[model.engine][0]
+
+        def _per_token(response: AdapterResponse, elapsed: float) -> float | None:
+            tokens = adapter.token_usage(response.payload).completion_tokens if response.payload else None
+            return elapsed / tokens if tokens else None
+
+        limiter = AdaptiveConcurrencyLimiter(
+            model.id,
+            model.concurrency,
+            initial_limit=self.settings.dispatch_slots(model),
+            metrics=self.metrics,
+            sample=_per_token,
         )
+        return self._limiters.setdefault(model.id, limiter)
+
+    def concurrency_states(self, include_history: bool = False) -> dict[str, dict[str, Any]]:
+        """모델별 적응형 동시성 제한기의 현재 상한과(선택적으로) 변경 이력."""
+        return {model_id: limiter.state(include_history) for model_id, limiter in self._limiters.items()}
+
+    def _resolve_session(
+        self,
+        engine: EngineType,
+        model_name: str,
+        options: dict[str, Any],
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        """세션 요청을 해석해 재사용할 `context`를 옵션에 넣고 세션 핸들을 반환한다.
+
+        Notes:
+            Ollama가 아니거나 원본 패스스루 모드이면 세션을 사용하지 않는다.
+            알 수 없는(만료/제거된) 핸들은 컨텍스트 없이 같은 핸들로 새로 시작한다.
+        """
+        if engine != "ollama" or options["raw_response"]:
+            return None
+        session_id = kwargs.get("session_id")
+        if session_id:
+            context = self.context_store.get(session_id, model_name)
+            if context is not None:
+                options["context"] = context
+            return session_id
+        if kwargs.get("keep_session"):
+            return self.context_store.new_session_id()
+        return None
+
+    def _finish_session(
+        self,
+        model_id: str,
+        model_name: str,
+        session_id: str | None,
+        reused: Any,
+        payload: dict[str, Any],
+    ) -> None:
+        """Ollama 응답에서 `context`를 떼어 세션에 저장하고 재사용 효과를 기록한다.
+
+        Notes:
+            프롬프트 평가 속도(tokens/s)를 관측해 두고, 재사용한 토큰 수를 그 속도로 나눠
+            절약된 prompt_eval 시간을 추정한다.
+        """
+        context = payload.pop("context", None)
+        prompt_eval_count = payload.get("prompt_eval_count")
+        prompt_eval_ns = payload.get("prompt_eval_duration")
+        if prompt_eval_count and prompt_eval_ns:
+            rate = prompt_eval_count / (prompt_eval_ns / 1_000_000_000)
+            self.metrics.observe("ollama_prompt_eval_tokens_per_second", rate, model=model_id)
+        if session_id is None:
+            return
+
+        if context:
+            self.context_store.put(session_id, model_name, context)
+        reused_tokens = len(reused) if reused is not None else 0
+        saved_seconds: float | None = None
+        if reused_tokens:
+            rate = self.metrics.quantile("ollama_prompt_eval_tokens_per_second", 0.5, model=model_id)
+            if rate:
+                saved_seconds = reused_tokens / rate
+                self.metrics.inc("ollama_prompt_eval_seconds_saved_total", saved_seconds, model=model_id)
+            self.metrics.inc("ollama_context_reused_tokens_total", reused_tokens, model=model_id)
+
+        stats = self.context_store.stats()
+        self.metrics.set_gauge("ollama_context_sessions", stats["sessions"])
+        self.metrics.set_gauge("ollama_context_bytes", stats["bytes"])
+        payload["session"] = {
+            "id": session_id,
+            "resumed": reused is not None,
+            "reused_tokens": reused_tokens,
+            "context_tokens": len(context) if context else 0,
+            "prompt_eval_seconds_saved": saved_seconds,
+        }
+
+    @staticmethod
+    def _engine_timings(payload: dict[str, Any]) -> dict[str, float]:
+        """Ollama 응답의 엔진 내부 소요 시간(ns)을 span 속성용 ms 값으로 변환한다."""
+        timings: dict[str, float] = {}
+        for field_name in ("load_duration", "prompt_eval_duration", "eval_duration", "total_duration"):
+            value = payload.get(field_name)
+            if isinstance(value, int | float):
+                timings[f"engine.{field_name.removesuffix('_duration')}_ms"] = value / 1e6
+        return timings
+
+    def _record_decode_rate(
+        self,
+        model_id: str,
+        adapter: OllamaAdapter | VllmAdapter,
+        payload: dict[str, Any] | None,
+        elapsed: float,
+    ) -> None:
+        """성공 응답에서 모델별 디코딩 속도(tokens/s)를 관측한다.
+
+        Notes:
+            Ollama는 `eval_duration`(ns)을, vLLM은 요청 전체 경과 시간을 분모로 사용한다.
+        """
+        usage = adapter.token_usage(payload)
+        if not usage.completion_tokens:
+            return
+        self.metrics.inc("inference_completion_tokens_total", usage.completion_tokens, model=model_id)
+        eval_ns = (payload or {}).get("eval_duration")
+        seconds = eval_ns / 1_000_000_000 if eval_ns else elapsed
+        if seconds > 0:
+            rate = usage.completion_tokens / seconds
+            self.metrics.observe("inference_decode_tokens_per_second", rate, model=model_id)
+
+    def _record_early_stop(
+        self,
+        model_id: str,
+        adapter: OllamaAdapter | VllmAdapter,
+        payload: dict[str, Any] | None,
+        reason: str,
+        max_tokens: int | None,
+    ) -> None:
+        """생성 상한 전에 끝난 요청 수와 엔진이 생성하지 않게 된 토큰 수(`max_tokens` - 생성 토큰)를 기록한다.
+
+        Notes:
+            `reason`은 `until` 조건 이름, `max_time`, 또는 vLLM이 중지 문자열에서 멈춘 경우 `stop`이다.
+            Ollama는 중지 문자열과 EOS 종료를 구분해 주지 않으므로 중지 문자열 절감은 vLLM에서만 센다.
+        """
+        self.metrics.inc("inference_early_stop_total", model=model_id, reason=reason)
+        completion_tokens = adapter.token_usage(payload).completion_tokens
+        if max_tokens is not None and completion_tokens is not None:
+            saved = max(0, max_tokens - completion_tokens)
+            self.metrics.inc("inference_early_stop_tokens_saved_total", saved, model=model_id, reason=reason)
+
+    def _record_cancellation(self, model_id: str, token: CancellationToken, max_tokens: int | None) -> None:
+        """취소된 요청 수와 엔진이 생성하지 않게 된 토큰 수(추정)를 기록한다.
+
+        Notes:
+            엔진은 취소가 없었다면 `max_tokens` 또는 원래 데드라인까지 생성을 계속했을 것으로 본다.
+            관측된 디코딩 속도 중앙값으로 이미 생성된 양과 남은 생성량을 추정한다.
+        """
+        self.metrics.inc("inference_cancelled_total", model=model_id, reason=token.reason or "unknown")
+        rate = self.metrics.quantile("inference_decode_tokens_per_second", 0.5, model=model_id)
+        if rate is None:
+            return
+        generated = rate * token.elapsed()
+        budgets: list[float] = []
+        if max_tokens is not None:
+            budgets.append(max_tokens - generated)
+        remaining = token.remaining()
+        if remaining:
+            budgets.append(rate * remaining)
+        if budgets:
+            self.metrics.inc("inference_cancelled_tokens_saved_total", max(0.0, min(budgets)), model=model_id)
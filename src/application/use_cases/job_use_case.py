@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+from typing import Any
+
+from src.infrastructure import (
+    AppSettings,
+    CancellationToken,
+    ConfigValidationError,
+    JobRecord,
+    RateLimitExceeded,
+    SqliteJobStore,
+)
+from src.infrastructure.jobs import JobStatus
+
+from .inference_use_case import InferenceUseCase
+
+JOB_OPTION_KEYS = ("temperature", "top_p", "num_ctx", "max_tokens", "timeout", "use_cache", "stop", "max_time", "until")
+"""작업 요청에서 추론 호출로 넘기는 옵션 키(세션/원본 패스스루는 작업에서 지원하지 않는다)."""
+
+
+class JobUseCase:
+    """장시간 추론/배치 작업을 영속 큐에 넣고, 워커 스레드 풀이 `InferenceUseCase`로 처리하는 유스케이스.
+
+    Rules:
+        - `inference` 작업은 엔진 스트리밍으로 생성하며 부분 출력을 `partial_flush_seconds` 간격으로 저장한다.
+        - `batch` 작업은 프롬프트를 순서대로 처리하고 항목별 결과를 즉시 기록한다. 재개 시 기록된 항목은
+          건너뛰므로 재시작 후에도 남은 항목만 처리한다.
+        - 테넌트 한도 초과(`RateLimitExceeded`)는 실패가 아니라 `retry_after` 뒤 재실행으로 처리한다.
+        - `stop()`은 실행 중 작업을 중단하고 바로 대기 상태로 돌려놓는다. 프로세스가 비정상 종료되면
+          점유 만료(`lease_seconds`) 후 다른 워커(또는 재시작한 프로세스)가 이어서 처리한다.
+
+    Notes:
+        하트비트 스레드가 실행 중 작업의 점유를 주기적으로 연장한다. 연장이 거부되면(다른 프로세스에서
+        취소됨) 해당 작업의 취소 토큰을 끊어 엔진 생성을 중단한다.
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        inference: InferenceUseCase,
+        store: SqliteJobStore | None = None,
+    ) -> None:
+        """설정과 추론 유스케이스로 초기화한다. `store`가 없으면 `runtime.jobs.path` 파일을 연다."""
+        self.settings = settings
+        self.config = settings.runtime.jobs
+        self.inference = inference
+        self.metrics = inference.metrics
+        self.store = store or SqliteJobStore(
+            self.config.path,
+            lease_seconds=self.config.lease_seconds,
+            max_attempts=self.config.max_attempts,
+        )
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._active: dict[str, tuple[str, CancellationToken]] = {}
+        self._active_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def submit(
+        self,
+        model_id: str,
+        prompt: str | None = None,
+        prompts: list[str] | None = None,
+        tenant_id: str | None = None,
+        **options: Any,
+    ) -> JobRecord:
+        """추론(`prompt`) 또는 배치(`prompts`) 작업을 큐에 넣는다.
+
+        Raises:
+            ConfigValidationError: 모델(그룹/캐스케이드)이 없거나 `prompt`/`prompts` 중 정확히 하나가 아닌 경우.
+        """
+        if (prompt is None) == (prompts is None):
+            raise ConfigValidationError("prompt와 prompts 중 하나만 지정해야 합니다.")
+        if prompts is not None and not prompts:
+            raise ConfigValidationError("prompts가 비어 있습니다.")
+        known = self.settings.get_model(model_id) or self.settings.model_group(model_id) or self.settings.cascade(model_id)
+        if not known:
+            raise ConfigValidationError(f"존재하지 않는 모델 ID입니다: {model_id}")
+
+        request: dict[str, Any] = {
+            "model_id": model_id,
+            "options": {key: options[key] for key in JOB_OPTION_KEYS if options.get(key) is not None},
+        }
+        if prompts is not None:
+            request["prompts"] = list(prompts)
+            record = self.store.enqueue("batch", request, tenant_id=tenant_id, total=len(prompts))
+        else:
+            request["prompt"] = prompt
+            record = self.store.enqueue("inference", request, tenant_id=tenant_id)
+        self.metrics.inc("jobs_submitted_total", kind=record.kind)
+        return record
+
+    def get(self, job_id: str) -> JobRecord | None:
+        return self.store.get(job_id)
+
+    def items(self, job_id: str, offset: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+        return self.store.items(job_id, offset=offset, limit=limit)
+
+    def list(self, status: JobStatus | None = None, limit: int = 50) -> list[JobRecord]:
+        return self.store.list(status=status, limit=limit)
+
+    def cancel(self, job_id: str) -> JobRecord | None:
+        """작업을 취소한다. 이 프로세스에서 실행 중이면 엔진 연결도 바로 끊는다."""
+        record = self.store.cancel(job_id)
+        with self._active_lock:
+            active = self._active.get(job_id)
+        if active is not None and record is not None and record.status == "cancelled":
+            active[1].cancel("job_cancelled")
+        return record
+
+    def stats(self) -> dict[str, Any]:
+        """상태별 작업 수와 이 프로세스의 실행 중 작업 수."""
+        with self._active_lock:
+            running_here = len(self._active)
+        workers = self.config.workers if self._threads else 0
+        return {"counts": self.store.counts(), "workers": workers, "running_here": running_here}
+
+    def start(self) -> None:
+        """워커 스레드와 점유 연장(하트비트) 스레드를 시작한다(이미 시작했으면 무시)."""
+        if self._threads:
+            return
+        self._stop.clear()
+        for index in range(self.config.workers):
+            worker_id = f"{self.worker_prefix}:{index}"
+            self._threads.append(
+                threading.Thread(target=self._worker_loop, args=(worker_id,), name=f"job-worker-{index}", daemon=True)
+            )
+        self._threads.append(threading.Thread(target=self._heartbeat_loop, name="job-heartbeat", daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """새 작업 가져가기를 멈추고, 실행 중 작업은 중단해 대기 상태로 돌려놓는다."""
+        self._stop.set()
+        with self._active_lock:
+            active = list(self._active.values())
+        for _, token in active:
+            token.cancel("shutdown")
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+    def _worker_loop(self, worker_id: str) -> None:
+        while not self._stop.is_set():
+            try:
+                job = self.store.claim(worker_id)
+            except Exception:
+                job = None
+            if job is None:
+                self._stop.wait(self.config.poll_interval)
+                continue
+            self._run(job, worker_id)
+
+    def _heartbeat_loop(self) -> None:
+        interval = min(self.config.lease_seconds / 3, 1.0)
+        while not self._stop.wait(interval):
+            with self._active_lock:
+                active = list(self._active.items())
+            for job_id, (worker_id, token) in active:
+                if not self.store.renew(job_id, worker_id):
+                    token.cancel("job_cancelled")
+
+    def _run(self, job: JobRecord, worker_id: str) -> None:
+        """작업 하나를 실행하고 결과/실패/재대기를 저장소에 기록한다."""
+        started = time.monotonic()
+        status = "failed"
+        try:
+            if job.kind == "batch":
+                status = self._run_batch(job, worker_id)
+            else:
+                status = self._run_inference(job, worker_id)
+        except RateLimitExceeded as exc:
+            self.store.release(job.id, worker_id, exc.retry_after, error=str(exc))
+            status = "requeued"
+        except Exception as exc:
+            self.store.fail(job.id, worker_id, str(exc))
+        finally:
+            with self._active_lock:
+                self._active.pop(job.id, None)
+        self.metrics.inc("jobs_finished_total", kind=job.kind, status=status)
+        self.metrics.observe("job_run_seconds", time.monotonic() - started, kind=job.kind)
+
+    def _track(self, job: JobRecord, worker_id: str, timeout: float | None) -> CancellationToken:
+        """작업(배치는 항목)마다 새 취소 토큰을 만들어 하트비트/취소 대상으로 등록한다."""
+        token = CancellationToken(timeout=timeout)
+        with self._active_lock:
+            self._active[job.id] = (worker_id, token)
+        if self._stop.is_set():
+            token.cancel("shutdown")
+        return token
+
+    def _interrupted(self, job: JobRecord, worker_id: str, token: CancellationToken) -> str | None:
+        """종료/취소로 중단된 경우 후속 기록을 하고 결과 상태를 반환한다(중단이 아니면 `None`)."""
+        if token.reason == "shutdown":
+            self.store.release(job.id, worker_id, 0.0)
+            return "requeued"
+        if token.reason == "job_cancelled":
+            return "cancelled"
+        return None
+
+    def _run_inference(self, job: JobRecord, worker_id: str) -> str:
+        request = job.request
+        options = dict(request["options"])
+        token = self._track(job, worker_id, options.get("timeout"))
+        pending: list[str] = []
+        last_flush = time.monotonic()
+
+        def on_text(text: str) -> None:
+            nonlocal last_flush
+            pending.append(text)
+            now = time.monotonic()
+            if now - last_flush >= self.config.partial_flush_seconds:
+                self.store.append_partial(job.id, worker_id, "".join(pending))
+                pending.clear()
+                last_flush = now
+
+        try:
+            result = self.inference.generate(
+                request["model_id"],
+                request["prompt"],
+                cancel_token=token,
+                tenant_id=job.tenant_id,
+                on_text=on_text,
+                **options,
+            )
+        finally:
+            token.close()
+        if pending:
+            self.store.append_partial(job.id, worker_id, "".join(pending))
+
+        interrupted = self._interrupted(job, worker_id, token)
+        if interrupted is not None:
+            return interrupted
+        if result.ok:
+            self.store.complete(job.id, worker_id, result.to_dict())
+            return "succeeded"
+        self.store.fail(job.id, worker_id, result.error or "추론에 실패했습니다.", result.to_dict())
+        return "failed"
+
+    def _run_batch(self, job: JobRecord, worker_id: str) -> str:
+        request = job.request
+        options = dict(request["options"])
+        done = self.store.done_items(job.id)
+        for index, prompt in enumerate(request["prompts"]):
+            if index in done:
+                continue
+            token = self._track(job, worker_id, options.get("timeout"))
+            try:
+                result = self.inference.generate(
+                    request["model_id"],
+                    prompt,
+                    cancel_token=token,
+                    tenant_id=job.tenant_id,
+                    **options,
+                )
+            except RateLimitExceeded:
+                raise
+            except Exception as exc:
+                result = None
+                error: str | None = str(exc)
+            else:
+                error = result.error
+            finally:
+                token.close()
+
+            interrupted = self._interrupted(job, worker_id, token)
+            if interrupted is not None:
+                return interrupted
+            ok = result is not None and result.ok
+            if not self.store.add_item(
+                job.id, worker_id, index, ok, result.to_dict() if result is not None else None, error
+            ):
+                # 다른 곳에서 취소되었거나 점유를 잃었다.
+                return "cancelled"
+
+        summary = {"total": len(request["prompts"]), **self.store.item_counts(job.id)}
+        self.store.complete(job.id, worker_id, summary)
+        return "succeeded"
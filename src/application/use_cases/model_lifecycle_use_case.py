@@ -1,6 +1,26 @@
 from __future__ import annotations
 
-from src.infrastructure import AppSettings, ConfigValidationError, EngineType, OllamaAdapter, VllmAdapter
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any
+
+from src.domain import EngineType as DomainEngineType
+from src.domain import ModelAggregate, ModelId, ModelLifecyclePolicy
+from src.infrastructure import (
+    AppSettings,
+    ConfigValidationError,
+    EngineType,
+    MetricsRegistry,
+    ModelDiscoveryCache,
+    OllamaAdapter,
+    PageCachePrewarmer,
+    PrewarmReport,
+    VllmAdapter,
+    evict_page_cache,
+    expand_weight_paths,
+    resolve_weight_files,
+)
+from src.infrastructure.adapters.model_discovery import normalize_model_name
 
 from .dto import ModelOperationResultDTO
 
@@ -8,10 +28,27 @@ from .dto import ModelOperationResultDTO
 class ModelLifecycleUseCase:
     """모델 load/unload/list/apply 흐름을 오케스트레이션하는 유스케이스."""
 
-    def __init__(self, settings: AppSettings) -> None:
-        """엔진별 어댑터를 초기화한다."""
+    def __init__(
+        self,
+        settings: AppSettings,
+        residency: MutableMapping[str, bool] | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        """엔진별 어댑터와 엔진 모델 목록 캐시를 초기화한다.
+
+        Args:
+            residency: 모델 ID별 로드 여부 저장소. 멀티 워커 모드에서는 공유 dict 프록시를 받는다.
+            metrics: 모델 목록 동기화/변경 메트릭을 기록할 저장소.
+
+        Notes:
+            모델 목록 캐시가 적재/해제 변경을 감지하면 해당 설정 모델의 `residency`도 갱신한다.
+        """
         self.settings = settings
+        self.residency: MutableMapping[str, bool] = residency if residency is not None else {}
+        self.policy = ModelLifecyclePolicy()
         self._adapters = self._build_adapters()
+        self.discovery = ModelDiscoveryCache(self._adapters, settings.runtime.discovery, metrics)
+        self.discovery.subscribe(self._on_model_change)
 
     def _build_adapters(self) -> dict[EngineType, OllamaAdapter | VllmAdapter]:
         """설정의 엔드포인트 정보를 바탕으로 엔진 어댑터를 생성한다."""
@@ -28,20 +65,91 @@ class ModelLifecycleUseCase:
             raise ConfigValidationError(f"존재하지 않는 모델 ID입니다: {model_id}")
         return model
 
-    def list(self, engine: EngineType | None = None) -> list[dict[str, object]]:
-        """설정 기준 모델 목록을 반환한다."""
-        models = self.settings.enabled_models(engine=engine)
-        return [
-            {
+    def list(self, engine: EngineType | None = None, include_unconfigured: bool = True) -> list[dict[str, Any]]:
+        """설정 모델과 엔진에서 발견한 모델을 합친 목록을 반환한다.
+
+        Rules:
+            - `installed`/`loaded`는 엔진 모델 목록 캐시 기준이다. 캐시가 아직 없으면 `installed`는 `None`,
+              `loaded`는 마지막 load/unload 결과(미확인 시 `None`)를 쓴다.
+            - Ollama 적재 모델은 `vram_bytes`(`size_vram`)와 `expires_at`을 함께 보여준다.
+            - `include_unconfigured`면 엔진에는 있지만 설정에 없는 모델도 `configured: false`로 덧붙인다.
+
+        Notes:
+            백그라운드 동기화가 돌지 않으면(CLI) `discovery.ttl`이 지난 엔진만 다시 조회한다.
+        """
+        engines = [engine] if engine else self.settings.runtime.resolved_active_engines()
+        self.discovery.ensure_fresh(engines)
+        snapshots = {target: self.discovery.get(target) for target in engines}
+        seen: dict[str, set[str]] = {target: set() for target in engines}
+        rows: list[dict[str, Any]] = []
+        for model in self.settings.enabled_models(engine=engine):
+            name = model.model_name()
+            snapshot = snapshots.get(model.engine)
+            row: dict[str, Any] = {
                 "id": model.id,
                 "engine": model.engine,
-                "model_name": model.model_name(),
+                "model_name": name,
                 "auto_load": model.auto_load,
                 "enabled": model.enabled,
                 "tags": model.tags,
+                "configured": True,
+                "installed": None,
+                "loaded": self.residency.get(model.id),
             }
-            for model in models
-        ]
+            if snapshot is not None and snapshot.synced_at is not None:
+                key = normalize_model_name(model.engine, name)
+                seen[model.engine].add(key)
+                row["installed"] = key in snapshot.installed
+                row["loaded"] = key in snapshot.loaded
+                row.update(self._loaded_details(snapshot.loaded.get(key)))
+            rows.append(row)
+
+        if include_unconfigured:
+            for target, snapshot in snapshots.items():
+                if snapshot is None:
+                    continue
+                for key in sorted((snapshot.installed.keys() | snapshot.loaded.keys()) - seen[target]):
+                    row = {
+                        "id": None,
+                        "engine": target,
+                        "model_name": key,
+                        "configured": False,
+                        "installed": key in snapshot.installed,
+                        "loaded": key in snapshot.loaded,
+                    }
+                    row.update(self._loaded_details(snapshot.loaded.get(key)))
+                    rows.append(row)
+        return rows
+
+    def discovery_status(self, since: float | None = None) -> dict[str, Any]:
+        """엔진별 마지막 동기화 시각/오류와 `since` 이후의 모델 변경 이벤트."""
+        engines: dict[str, Any] = {}
+        for target in self.settings.runtime.resolved_active_engines():
+            snapshot = self.discovery.get(target)
+            if snapshot is not None:
+                engines[target] = {"synced_at": snapshot.synced_at, "error": snapshot.error}
+        return {"running": self.discovery.running, "engines": engines, "events": self.discovery.events(since)}
+
+    @staticmethod
+    def _loaded_details(entry: dict[str, Any] | None) -> dict[str, Any]:
+        if not entry:
+            return {}
+        details: dict[str, Any] = {}
+        if "size_vram" in entry:
+            details["vram_bytes"] = entry["size_vram"]
+        if "expires_at" in entry:
+            details["expires_at"] = entry["expires_at"]
+        return details
+
+    def _on_model_change(self, event: dict[str, Any]) -> None:
+        """엔진에서 적재/해제가 감지된 설정 모델의 상주 상태를 갱신한다."""
+        if event["kind"] not in ("loaded", "unloaded"):
+            return
+        for model in self.settings.models:
+            if model.engine != event["engine"]:
+                continue
+            if normalize_model_name(model.engine, model.model_name()) == event["model"]:
+                self.residency[model.id] = event["kind"] == "loaded"
 
     def load(self, model_id: str) -> ModelOperationResultDTO:
         """단일 모델 로드를 수행한다."""
@@ -51,6 +159,9 @@ class ModelLifecycleUseCase:
             model.model_name(),
             keep_alive=model.resource_policy.keep_alive,
         )
+        if response.ok:
+            self.residency[model.id] = True
+            self.discovery.request_refresh()
         return ModelOperationResultDTO(
             model_id=model.id,
             engine=model.engine,
@@ -59,11 +170,48 @@ class ModelLifecycleUseCase:
             payload=response.payload if response.ok else {"error": response.error},
         )
 
+    def prewarm(
+        self,
+        model_id: str,
+        paths: list[str] | None = None,
+        concurrency: int | None = None,
+        max_bytes: int | None = None,
+        evict: bool = False,
+    ) -> PrewarmReport:
+        """모델 가중치 파일을 OS 페이지 캐시에 미리 읽어 다음 엔진 기동/모델 적재의 디스크 읽기를 줄인다.
+
+        Args:
+            paths: 가중치 파일/디렉터리를 직접 지정한다(없으면 `runtime.prewarm` 설정과 엔진 저장소에서 찾는다).
+            concurrency / max_bytes: `runtime.prewarm`의 I/O 동시성과 바이트 예산을 이번 실행에만 바꾼다.
+            evict: True면 읽기 전에 파일을 페이지 캐시에서 내려 콜드 읽기 속도를 잰다.
+
+        Raises:
+            ConfigValidationError: 모델이 없거나 가중치 파일을 찾지 못한 경우.
+        """
+        model = self._get_model_or_raise(model_id)
+        if paths:
+            files = expand_weight_paths([Path(item).expanduser() for item in paths])
+            if not files:
+                raise ConfigValidationError(f"지정한 경로에 가중치 파일이 없습니다: {paths}")
+        else:
+            files = resolve_weight_files(self.settings, model)
+        if evict:
+            evict_page_cache(files)
+        prewarmer = PageCachePrewarmer.from_config(self.settings.runtime.prewarm)
+        if concurrency is not None:
+            prewarmer.concurrency = max(1, concurrency)
+        if max_bytes is not None:
+            prewarmer.max_bytes = max_bytes
+        return prewarmer.prewarm(files, model.id)
+
     def unload(self, model_id: str) -> ModelOperationResultDTO:
         """단일 모델 언로드를 수행한다."""
         model = self._get_model_or_raise(model_id)
         adapter = self._adapters[model.engine]
         response = adapter.unload_model(model.model_name())
+        if response.ok:
+            self.residency[model.id] = False
+            self.discovery.request_refresh()
         return ModelOperationResultDTO(
             model_id=model.id,
             engine=model.engine,
@@ -85,13 +233,26 @@ class ModelLifecycleUseCase:
         """설정 동기화 정책을 적용한다.
 
         Rules:
-            - enabled + auto_load 모델은 load
+            - `ModelLifecyclePolicy.classify` 기준: enabled + auto_load 모델은 load
             - enabled가 아니거나 auto_load가 false면 unload
+            - 결과는 설정 파일의 모델 순서를 따른다.
         """
+        aggregates = [
+            ModelAggregate(
+                model_id=ModelId(model.id),
+                engine=DomainEngineType(model.engine),
+                model_name=model.model_name(),
+                auto_load=model.auto_load,
+                enabled=model.enabled,
+            )
+            for model in self.settings.models
+        ]
+        to_load, _ = self.policy.classify(aggregates)
+        load_ids = {aggregate.model_id for aggregate in to_load}
         results: list[ModelOperationResultDTO] = []
-        for model in self.settings.models:
-            if model.enabled and model.auto_load:
-                results.append(self.load(model.id))
+        for aggregate in aggregates:
+            if aggregate.model_id in load_ids:
+                results.append(self.load(aggregate.model_id.value))
             else:
-                results.append(self.unload(model.id))
+                results.append(self.unload(aggregate.model_id.value))
         return results
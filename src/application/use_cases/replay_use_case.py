@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure import (
+    CancellationToken,
+    ConfigValidationError,
+    ContextWindowExceeded,
+    RateLimitExceeded,
+    read_capture,
+)
+from src.infrastructure.observability import CAPTURE_VERSION
+
+from .dto import ReplayReportDTO
+from .inference_use_case import InferenceUseCase
+
+REPLAY_OPTION_KEYS = (
+    "temperature",
+    "top_p",
+    "num_ctx",
+    "max_tokens",
+    "timeout",
+    "use_cache",
+    "raw",
+    "stop",
+    "max_time",
+    "until",
+)
+"""캡처 기록의 `options`에서 재생 요청에 그대로 넘기는 키(`/inference` 바디 필드 이름)."""
+
+COMPARED_METRICS = (
+    ("latency", "p50"),
+    ("latency", "p90"),
+    ("latency", "p99"),
+    ("latency", "mean"),
+    (None, "requests_per_second"),
+    (None, "tokens_per_second"),
+    (None, "error_rate"),
+)
+"""이전 보고서와 비교하는 지표(`(하위 dict 키, 지표 키)`)."""
+
+_FILLER = "the quick brown fox jumps over the lazy dog "
+
+
+@dataclass(slots=True)
+class ReplayOutcome:
+    """재생 요청 한 건의 결과(`status`는 API 기준 HTTP 상태 코드)."""
+
+    status: int
+    ok: bool
+    completion_tokens: int = 0
+    error: str | None = None
+
+
+ReplaySender = Callable[[str, str, dict[str, Any]], ReplayOutcome]
+"""`(model_id, prompt, options)`로 요청 한 건을 보내고 결과를 반환하는 함수."""
+
+
+def synthesize_prompt(record: dict[str, Any]) -> str:
+    """원문 없이 해시만 캡처된 기록의 대체 프롬프트(같은 해시·길이면 항상 같은 문자열)."""
+    digest = str(record.get("prompt_sha256") or "")[:16]
+    length = max(1, int(record.get("prompt_chars") or 1))
+    text = f"[{digest}] " + _FILLER * (length // len(_FILLER) + 1)
+    return text[:length]
+
+
+def synthetic_workload(
+    model_id: str,
+    requests: int,
+    prompt_chars: int = 800,
+    max_tokens: int = 128,
+    rate: float | None = None,
+) -> list[dict[str, Any]]:
+    """캡처 없이 쓸 고정 형태의 작업 부하(같은 길이 프롬프트 `requests`건).
+
+    Args:
+        rate: 초당 도착 요청 수. 주면 `ts`를 `1/rate` 간격으로 채워 `timed` 재생에 쓸 수 있다.
+    """
+    interval = 1.0 / rate if rate else 0.0
+    return [
+        {
+            "v": CAPTURE_VERSION,
+            "ts": index * interval,
+            "model_id": model_id,
+            "options": {"max_tokens": max_tokens, "use_cache": False},
+            "prompt": synthesize_prompt({"prompt_sha256": str(index), "prompt_chars": prompt_chars}),
+            "prompt_chars": prompt_chars,
+        }
+        for index in range(requests)
+    ]
+
+
+def latency_summary(values: Sequence[float]) -> dict[str, float]:
+    """초 단위 값 목록을 ms 단위 `p50`/`p90`/`p99`/`mean`/`max`로 요약한다(값이 없으면 빈 dict)."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def percentile(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "p50": round(percentile(0.50), 3),
+        "p90": round(percentile(0.90), 3),
+        "p99": round(percentile(0.99), 3),
+        "mean": round(sum(ordered) / len(ordered) * 1000, 3),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+def compare_reports(current: dict[str, Any], baseline: dict[str, Any]) -> dict[str, dict[str, float | None]]:
+    """두 재생 보고서 dict의 주요 지표 차이(`delta`는 현재 − 기준, `delta_pct`는 기준 대비 %)."""
+    comparison: dict[str, dict[str, float | None]] = {}
+    for section, key in COMPARED_METRICS:
+        before = (baseline.get(section) or {}).get(key) if section else baseline.get(key)
+        after = (current.get(section) or {}).get(key) if section else current.get(key)
+        if before is None or after is None:
+            continue
+        delta = after - before
+        comparison[f"{section}.{key}" if section else key] = {
+            "baseline": before,
+            "current": after,
+            "delta": round(delta, 6),
+            "delta_pct": round(delta / before * 100, 3) if before else None,
+        }
+    return comparison
+
+
+class ReplayUseCase:
+    """캡처한 `/inference` 트래픽을 다시 보내 지연 분포를 재는 재생 벤치마크.
+
+    Rules:
+        - `speed`를 주면 원래 도착 간격을 `1/speed`로 줄여(2면 2배 빠르게) 예정 시각에 보낸다(`timed`).
+          동시 요청 수 상한은 `concurrency`이며, 상한에 걸려 늦게 보낸 정도는 `schedule_lag`로 보고한다.
+        - `speed`가 없으면 도착 간격을 무시하고 `concurrency`개씩 최대한 빨리 보낸다(`throughput`).
+        - 지연은 실제로 보낸 시각부터 응답까지 잰다. 해시만 캡처된 기록은 같은 길이의 대체 프롬프트를 쓴다.
+        - 중단(Ctrl+C) 시 아직 보내지 않은 요청은 버리고 보낸 요청까지만 보고한다.
+    """
+
+    def __init__(self, send: ReplaySender, target: str = "local") -> None:
+        self.send = send
+        self.target = target
+
+    @staticmethod
+    def local_sender(inference: InferenceUseCase) -> ReplaySender:
+        """`InferenceUseCase`로 직접 보내는 전송 함수(API와 같은 규칙으로 예외를 상태 코드로 바꾼다)."""
+
+        def send(model_id: str, prompt: str, options: dict[str, Any]) -> ReplayOutcome:
+            kwargs = {key: value for key, value in options.items() if key != "raw"}
+            if options.get("raw"):
+                kwargs["raw_response"] = True
+            token = CancellationToken(timeout=options.get("timeout"))
+            try:
+                result = inference.generate(model_id, prompt, cancel_token=token, **kwargs)
+            except RateLimitExceeded as exc:
+                return ReplayOutcome(429, False, error=str(exc))
+            except ContextWindowExceeded as exc:
+                return ReplayOutcome(413, False, error=str(exc))
+            except Exception as exc:
+                return ReplayOutcome(400, False, error=str(exc))
+            finally:
+                token.close()
+            tokens = 0
+            if result.ok and result.output is not None:
+                tokens = inference.result_usage(result).completion_tokens or 0
+            return ReplayOutcome(200, result.ok, completion_tokens=tokens, error=result.error)
+
+        return send
+
+    def run(
+        self,
+        capture_path: str | Path,
+        speed: float | None = 1.0,
+        concurrency: int = 64,
+        limit: int | None = None,
+        model_id: str | None = None,
+        baseline: dict[str, Any] | None = None,
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+        progress_seconds: float = 1.0,
+    ) -> ReplayReportDTO:
+        """캡처 파일(또는 디렉터리)을 재생하고 보고서를 반환한다.
+
+        Args:
+            speed: 원래 타이밍 대비 재생 속도 배율. `None`이면 최대 처리량 모드.
+            concurrency: 동시 요청 수 상한.
+            limit: 앞에서부터 재생할 최대 기록 수.
+            model_id: 지정하면 모든 기록을 이 모델로 보낸다(모델 교체 전후 비교용).
+            baseline: 이전 `ReplayReportDTO.to_dict()` 결과. 주면 `comparison`을 채운다.
+
+        Raises:
+            ConfigValidationError: 캡처에 재생할 기록이 없거나 `speed`/`concurrency`가 0 이하인 경우.
+        """
+        records = read_capture(capture_path)
+        if limit is not None:
+            records = records[:limit]
+        return self.run_records(
+            records,
+            source=str(capture_path),
+            speed=speed,
+            concurrency=concurrency,
+            model_id=model_id,
+            baseline=baseline,
+            on_progress=on_progress,
+            progress_seconds=progress_seconds,
+        )
+
+    def run_records(
+        self,
+        records: Sequence[dict[str, Any]],
+        source: str = "<records>",
+        speed: float | None = 1.0,
+        concurrency: int = 64,
+        model_id: str | None = None,
+        baseline: dict[str, Any] | None = None,
+        on_progress: Callable[[dict[str, Any]], None] | None = None,
+        progress_seconds: float = 1.0,
+    ) -> ReplayReportDTO:
+        """캡처 형식 기록 목록(`ts` 순)을 재생한다(`synthetic_workload()` 결과 등). 인자는 `run()`과 같다."""
+        if speed is not None and speed <= 0:
+            raise ConfigValidationError("speed는 0보다 커야 합니다.")
+        if concurrency < 1:
+            raise ConfigValidationError("concurrency는 1 이상이어야 합니다.")
+        if not records:
+            raise ConfigValidationError(f"재생할 캡처 기록이 없습니다: {source}")
+
+        lock = threading.Lock()
+        latencies: list[float] = []
+        lags: list[float] = []
+        statuses: Counter[str] = Counter()
+        per_model: dict[str, list[float]] = {}
+        failures: Counter[str] = Counter()
+        totals = {"ok": 0, "failed": 0, "tokens": 0, "sent": 0}
+
+        def execute(record: dict[str, Any], scheduled_at: float | None) -> None:
+            target_model = model_id or record["model_id"]
+            prompt = record.get("prompt")
+            if prompt is None:
+                prompt = synthesize_prompt(record)
+            options = {key: value for key, value in (record.get("options") or {}).items() if key in REPLAY_OPTION_KEYS}
+            started = time.monotonic()
+            try:
+                outcome = self.send(target_model, prompt, options)
+            except Exception as exc:
+                outcome = ReplayOutcome(0, False, error=str(exc))
+            elapsed = time.monotonic() - started
+            with lock:
+                totals["sent"] += 1
+                if scheduled_at is not None:
+                    lags.append(max(0.0, started - scheduled_at))
+                statuses[str(outcome.status)] += 1
+                if outcome.ok:
+                    totals["ok"] += 1
+                    totals["tokens"] += outcome.completion_tokens
+                    latencies.append(elapsed)
+                    per_model.setdefault(target_model, []).append(elapsed)
+                else:
+                    totals["failed"] += 1
+                    failures[target_model] += 1
+                    per_model.setdefault(target_model, [])
+
+        def progress() -> dict[str, Any]:
+            with lock:
+                return {"sent": totals["sent"], "total": len(records), "ok": totals["ok"], "failed": totals["failed"]}
+
+        interrupted = False
+        started = time.monotonic()
+        last_progress = started
+        first_ts = float(records[0].get("ts") or 0.0)
+        executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="replay")
+        futures: list[Future[None]] = []
+        try:
+            for record in records:
+                scheduled_at: float | None = None
+                if speed is not None:
+                    scheduled_at = started + (float(record.get("ts") or first_ts) - first_ts) / speed
+                    while (remaining := scheduled_at - time.monotonic()) > 0:
+                        time.sleep(min(remaining, progress_seconds))
+                        last_progress = self._report_progress(on_progress, progress, last_progress, progress_seconds)
+                futures.append(executor.submit(execute, record, scheduled_at))
+                last_progress = self._report_progress(on_progress, progress, last_progress, progress_seconds)
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=progress_seconds)
+                last_progress = self._report_progress(on_progress, progress, last_progress, progress_seconds)
+        except KeyboardInterrupt:
+            interrupted = True
+            executor.shutdown(wait=True, cancel_futures=True)
+        finally:
+            executor.shutdown(wait=True)
+        elapsed = time.monotonic() - started
+
+        replayed = records[: totals["sent"]]
+        captured = [float(record["latency"]) for record in replayed if record.get("ok") and record.get("latency")]
+        report = ReplayReportDTO(
+            capture_path=source,
+            target=self.target,
+            mode="throughput" if speed is None else "timed",
+            speed=speed,
+            concurrency=concurrency,
+            requests=totals["sent"],
+            ok=totals["ok"],
+            failed=totals["failed"],
+            completion_tokens=totals["tokens"],
+            elapsed_seconds=elapsed,
+            requests_per_second=totals["sent"] / elapsed if elapsed > 0 else 0.0,
+            tokens_per_second=totals["tokens"] / elapsed if elapsed > 0 else 0.0,
+            latency=latency_summary(latencies),
+            captured_latency=latency_summary(captured),
+            schedule_lag=latency_summary(lags),
+            status_counts=dict(statuses),
+            models={
+                name: {
+                    "requests": len(values) + failures[name],
+                    "failed": failures[name],
+                    "latency": latency_summary(values),
+                }
+                for name, values in sorted(per_model.items())
+            },
+            interrupted=interrupted,
+        )
+        if baseline is not None:
+            report.comparison = compare_reports(report.to_dict(), baseline)
+        return report
+
+    @staticmethod
+    def _report_progress(
+        on_progress: Callable[[dict[str, Any]], None] | None,
+        progress: Callable[[], dict[str, Any]],
+        last: float,
+        interval: float,
+    ) -> float:
+        now = time.monotonic()
+        if on_progress is None or now - last < interval:
+            return last
+        on_progress(progress())
+        return now
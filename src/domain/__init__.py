@@ -7,6 +7,8 @@
 """
 
 from .inference import (
+    EARLY_STOP_CONDITIONS,
+    EarlyStopCondition,
     InferenceDomainError,
     InferenceGateway,
     InferenceOptions,
@@ -15,6 +17,7 @@ from .inference import (
     InferenceResponse,
     InvalidPromptError,
     Prompt,
+    early_stop_condition,
 )
 from .integration import (
     ApiDocLink,
@@ -39,6 +42,8 @@ from .model_management import (
 
 __all__ = [
     "ApiDocLink",
+    "EARLY_STOP_CONDITIONS",
+    "EarlyStopCondition",
     "EndpointNotFoundError",
     "EngineEndpoint",
     "EngineEndpointRepository",
@@ -62,4 +67,5 @@ __all__ = [
     "ModelRepository",
     "ModelStateRepository",
     "Prompt",
+    "early_stop_condition",
 ]
@@ -3,10 +3,12 @@
 from .entities import InferenceRequest, InferenceResponse
 from .exceptions import InferenceDomainError, InvalidPromptError
 from .repositories import InferenceGateway
-from .services import InferencePolicy
+from .services import EARLY_STOP_CONDITIONS, EarlyStopCondition, InferencePolicy, early_stop_condition
 from .value_objects import InferenceOptions, Prompt
 
 __all__ = [
+    "EARLY_STOP_CONDITIONS",
+    "EarlyStopCondition",
     "InferenceDomainError",
     "InferenceGateway",
     "InferenceOptions",
@@ -15,4 +17,5 @@ __all__ = [
     "InferenceResponse",
     "InvalidPromptError",
     "Prompt",
+    "early_stop_condition",
 ]
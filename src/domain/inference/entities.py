@@ -5,6 +5,8 @@ from typing import Any
 
 from src.domain.model_management import EngineType, ModelId
 
+from .value_objects import InferenceOptions
+
 
 @dataclass(slots=True)
 class InferenceRequest:
@@ -13,7 +15,7 @@ class InferenceRequest:
     model_id: ModelId
     engine: EngineType
     prompt: str
-    options: dict[str, Any]
+    options: InferenceOptions
 
 
 @dataclass(slots=True)
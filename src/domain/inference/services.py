@@ -1,18 +1,41 @@
 from __future__ import annotations
 
+from typing import Any
+
 from .exceptions import InvalidPromptError
+from .value_objects import InferenceOptions
 
 
 class InferencePolicy:
     """추론 요청 검증과 옵션 보정을 담당하는 도메인 정책."""
 
+    def __init__(self, max_resolved_options: int = 1024) -> None:
+        """`resolve_options` 결과 재사용 캐시 크기를 설정한다."""
+        self.max_resolved_options = max_resolved_options
+        self._resolved: dict[tuple[Any, ...], tuple[InferenceOptions, InferenceOptions]] = {}
+
     def validate_prompt(self, prompt: str) -> None:
         """프롬프트 유효성을 검증한다."""
-        if not prompt or not prompt.strip():
+        if not prompt or prompt.isspace():
             raise InvalidPromptError("프롬프트는 비어 있을 수 없습니다.")
         if len(prompt) > 100_000:
             raise InvalidPromptError("프롬프트 길이가 정책 제한을 초과했습니다.")
 
+    def validate_early_stop(self, stop: list[str] | None, max_time: float | None) -> None:
+        """중지 문자열과 생성 시간 예산을 검증한다.
+
+        Rules:
+            - 중지 문자열은 최대 8개이며 빈 문자열은 허용하지 않는다.
+            - `max_time`은 0보다 커야 한다.
+        """
+        if stop:
+            if len(stop) > 8:
+                raise InvalidPromptError("중지 문자열은 최대 8개까지 지정할 수 있습니다.")
+            if any(not isinstance(item, str) or not item for item in stop):
+                raise InvalidPromptError("중지 문자열은 비어 있지 않은 문자열이어야 합니다.")
+        if max_time is not None and max_time <= 0:
+            raise InvalidPromptError("max_time은 0보다 커야 합니다.")
+
     def merge_options(self, defaults: dict[str, object], overrides: dict[str, object]) -> dict[str, object]:
         """기본 옵션과 요청 옵션을 병합한다.
 
@@ -25,3 +48,127 @@ class InferencePolicy:
             if value is not None:
                 merged[key] = value
         return merged
+
+    def resolve_options(
+        self,
+        defaults: InferenceOptions,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        num_ctx: int | None = None,
+        max_tokens: int | None = None,
+    ) -> InferenceOptions:
+        """모델 기본 옵션에 요청 옵션을 적용한다.
+
+        Rules:
+            - `merge_options`와 같이 `None`인 요청 값은 무시하고 기본값을 유지한다.
+            - 재정의할 값이 없으면 새 객체를 만들지 않고 `defaults`를 그대로 반환한다.
+            - 같은 기본 옵션과 재정의 조합은 이전에 만든 불변 객체를 재사용한다(최대 `max_resolved_options`개).
+        """
+        if temperature is None and top_p is None and num_ctx is None and max_tokens is None:
+            return defaults
+        key = (id(defaults), temperature, top_p, num_ctx, max_tokens)
+        cached = self._resolved.get(key)
+        if cached is not None and cached[0] is defaults:
+            return cached[1]
+        resolved = InferenceOptions(
+            temperature=defaults.temperature if temperature is None else temperature,
+            top_p=defaults.top_p if top_p is None else top_p,
+            num_ctx=defaults.num_ctx if num_ctx is None else num_ctx,
+            max_tokens=defaults.max_tokens if max_tokens is None else max_tokens,
+        )
+        if len(self._resolved) >= self.max_resolved_options:
+            self._resolved.clear()
+        self._resolved[key] = (defaults, resolved)
+        return resolved
+
+
+class EarlyStopCondition:
+    """스트리밍 생성 텍스트를 조각 단위로 받아 생성을 끊을 위치를 찾는 조기 종료 조건.
+
+    Notes:
+        조건 객체는 상태(지금까지 본 텍스트)를 가지므로 요청마다 새로 만든다.
+        `feed`는 조각마다 호출되며, 조건을 만족하면 응답에 남길 누적 텍스트 길이를, 아니면 `None`을 반환한다.
+    """
+
+    name = ""
+
+    def __init__(self) -> None:
+        self._seen = 0
+
+    def feed(self, piece: str) -> int | None:
+        raise NotImplementedError
+
+
+class FirstLineCondition(EarlyStopCondition):
+    """내용이 있는 첫 줄이 끝나면(줄바꿈) 줄바꿈 앞에서 끊는다(앞쪽 빈 줄은 건너뛴다)."""
+
+    name = "first_line"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._content = False
+
+    def feed(self, piece: str) -> int | None:
+        offset = self._seen
+        self._seen += len(piece)
+        for index, char in enumerate(piece):
+            if char == "\n":
+                if self._content:
+                    return offset + index
+            elif not char.isspace():
+                self._content = True
+        return None
+
+
+class JsonObjectCondition(EarlyStopCondition):
+    """첫 번째 최상위 JSON 객체의 닫는 중괄호까지 생성되면 끊는다(문자열 안의 괄호와 이스케이프는 무시한다)."""
+
+    name = "json_object"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, piece: str) -> int | None:
+        offset = self._seen
+        self._seen += len(piece)
+        for index, char in enumerate(piece):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == "{":
+                self._depth += 1
+            elif self._depth == 0:
+                continue
+            elif char == '"':
+                self._in_string = True
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    return offset + index + 1
+        return None
+
+
+EARLY_STOP_CONDITIONS: dict[str, type[EarlyStopCondition]] = {
+    FirstLineCondition.name: FirstLineCondition,
+    JsonObjectCondition.name: JsonObjectCondition,
+}
+"""`until` 요청 옵션 이름별 조기 종료 조건."""
+
+
+def early_stop_condition(name: str) -> EarlyStopCondition:
+    """이름으로 새 조기 종료 조건을 만든다.
+
+    Raises:
+        InvalidPromptError: 지원하지 않는 조건 이름인 경우.
+    """
+    condition = EARLY_STOP_CONDITIONS.get(name)
+    if condition is None:
+        raise InvalidPromptError(f"지원하지 않는 조기 종료 조건입니다: {name} (가능: {sorted(EARLY_STOP_CONDITIONS)})")
+    return condition()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 
 @dataclass(frozen=True, slots=True)
@@ -16,9 +17,33 @@ class Prompt:
 
 @dataclass(frozen=True, slots=True)
 class InferenceOptions:
-    """추론 옵션 값 객체."""
+    """추론 옵션 값 객체.
+
+    Notes:
+        불변 객체이므로 모델별 기본 옵션은 한 번 만들어 두고, 재정의가 없는 요청은 같은 객체를 그대로 쓴다.
+        캐시 키 문자열도 생성 시 한 번만 만든다.
+    """
 
     temperature: float | None = None
     top_p: float | None = None
     num_ctx: int | None = None
     max_tokens: int | None = None
+    _cache_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        key = f"{self.temperature}|{self.top_p}|{self.num_ctx}|{self.max_tokens}"
+        object.__setattr__(self, "_cache_key", key)
+
+    @property
+    def cache_key(self) -> str:
+        """같은 옵션의 요청끼리만 응답을 재사용하도록 캐시 키로 쓰는 문자열."""
+        return self._cache_key
+
+    def as_kwargs(self) -> dict[str, Any]:
+        """엔진 어댑터 호출 인자 dict로 변환한다."""
+        return {
+            "temperature": self.temperature,
+            "top_p": self.top_p,
+            "num_ctx": self.num_ctx,
+            "max_tokens": self.max_tokens,
+        }
@@ -1,38 +1,221 @@
 """infrastructure 계층 공개 심볼을 모아 제공한다."""
 
-from .adapters import AdapterResponse, EngineAdapter, OllamaAdapter, VllmAdapter
+from .adapters import (
+    AdapterResponse,
+    CancellationToken,
+    CircuitBreaker,
+    EndpointHealth,
+    EngineAdapter,
+    EngineHealthMonitor,
+    EngineModels,
+    ModelDiscoveryCache,
+    OllamaAdapter,
+    ResilientInvoker,
+    TokenUsage,
+    VllmAdapter,
+    cancelled_response,
+)
+from .cache import (
+    Embedder,
+    HashEmbedder,
+    OllamaContextStore,
+    OllamaEmbedder,
+    SemanticCache,
+    SemanticCacheHit,
+    VectorIndex,
+)
 from .config import (
     AppSettings,
+    AutoscaleConfig,
+    CaptureConfig,
+    CascadeAcceptance,
+    CascadeConfig,
     ConfigError,
     ConfigFileNotFoundError,
     ConfigValidationError,
+    ContextStoreConfig,
+    DiscoveryConfig,
     EndpointConfig,
     EngineType,
+    FleetConfig,
+    FleetNodeConfig,
+    HealthCheckConfig,
+    JobsConfig,
+    ModelAutoscalePolicy,
+    ModelConcurrencyPolicy,
     ModelConfig,
+    ModelDispatchPolicy,
     ModelParameters,
+    ModelResiliencePolicy,
     ModelResourcePolicy,
+    OllamaServerConfig,
+    PrewarmConfig,
+    ProfilingConfig,
+    PromptRoutingConfig,
     RuntimeConfig,
+    SemanticCacheConfig,
+    TenancyConfig,
+    TenantConfig,
+    TracingConfig,
     load_settings,
 )
-from .runtime import ApiDocsPublisher, EngineProcessInfo, ProcessManager
+from .jobs import JobRecord, SqliteJobStore
+from .observability import (
+    MetricsRegistry,
+    SamplingProfiler,
+    Tracer,
+    TrafficRecorder,
+    current_span,
+    read_capture,
+    run_with_cprofile,
+    start_span,
+)
+from .runtime import (
+    ApiDocsPublisher,
+    EngineAutoscaler,
+    EngineDriver,
+    EngineProcessInfo,
+    FakeEngineServer,
+    FleetController,
+    FleetPool,
+    MetricsHub,
+    NodeAgent,
+    NodeAgentClient,
+    NodeAgentServer,
+    PageCachePrewarmer,
+    PrewarmReport,
+    ProcessEngineDriver,
+    ProcessManager,
+    ScalingSignal,
+    SharedStateClient,
+    SharedStateServer,
+    SimulatedEngineDriver,
+    apply_engine_parameters,
+    connect_shared_state_from_env,
+    current_engine_parameters,
+    evict_page_cache,
+    expand_weight_paths,
+    resolve_weight_files,
+    serve_shared_state,
+    start_metrics_publisher,
+)
+from .scheduling import (
+    AdaptiveConcurrencyLimiter,
+    CascadeAcceptanceCheck,
+    ContextWindowExceeded,
+    DispatchQueue,
+    PromptRouter,
+    RateDecision,
+    RateLimitExceeded,
+    RouteDecision,
+    TenantRateLimiter,
+    TokenBucket,
+)
+from .tokenization import CharRatioTokenizer, TokenCounter, Tokenizer, TokenizersTokenizer
 
 __all__ = [
     "AdapterResponse",
+    "AdaptiveConcurrencyLimiter",
     "ApiDocsPublisher",
     "AppSettings",
+    "AutoscaleConfig",
+    "CancellationToken",
+    "CaptureConfig",
+    "CascadeAcceptance",
+    "CascadeAcceptanceCheck",
+    "CascadeConfig",
+    "CharRatioTokenizer",
+    "CircuitBreaker",
     "ConfigError",
     "ConfigFileNotFoundError",
     "ConfigValidationError",
+    "ContextStoreConfig",
+    "ContextWindowExceeded",
+    "DiscoveryConfig",
+    "DispatchQueue",
+    "Embedder",
     "EndpointConfig",
+    "EndpointHealth",
     "EngineAdapter",
+    "EngineAutoscaler",
+    "EngineDriver",
+    "EngineHealthMonitor",
+    "EngineModels",
     "EngineProcessInfo",
     "EngineType",
+    "FakeEngineServer",
+    "FleetConfig",
+    "FleetController",
+    "FleetNodeConfig",
+    "FleetPool",
+    "HashEmbedder",
+    "HealthCheckConfig",
+    "JobRecord",
+    "JobsConfig",
+    "MetricsHub",
+    "MetricsRegistry",
+    "ModelAutoscalePolicy",
+    "ModelConcurrencyPolicy",
     "ModelConfig",
+    "ModelDiscoveryCache",
+    "ModelDispatchPolicy",
     "ModelParameters",
+    "ModelResiliencePolicy",
     "ModelResourcePolicy",
+    "NodeAgent",
+    "NodeAgentClient",
+    "NodeAgentServer",
     "OllamaAdapter",
+    "OllamaContextStore",
+    "OllamaEmbedder",
+    "OllamaServerConfig",
+    "PageCachePrewarmer",
+    "PrewarmConfig",
+    "PrewarmReport",
+    "ProcessEngineDriver",
     "ProcessManager",
+    "ProfilingConfig",
+    "PromptRouter",
+    "PromptRoutingConfig",
+    "RateDecision",
+    "RateLimitExceeded",
+    "ResilientInvoker",
+    "RouteDecision",
     "RuntimeConfig",
+    "SamplingProfiler",
+    "ScalingSignal",
+    "SemanticCache",
+    "SemanticCacheConfig",
+    "SemanticCacheHit",
+    "SharedStateClient",
+    "SharedStateServer",
+    "SimulatedEngineDriver",
+    "SqliteJobStore",
+    "TenancyConfig",
+    "TenantConfig",
+    "TenantRateLimiter",
+    "TokenBucket",
+    "TokenCounter",
+    "TokenUsage",
+    "Tokenizer",
+    "TokenizersTokenizer",
+    "Tracer",
+    "TracingConfig",
+    "TrafficRecorder",
+    "VectorIndex",
     "VllmAdapter",
+    "apply_engine_parameters",
+    "cancelled_response",
+    "connect_shared_state_from_env",
+    "current_engine_parameters",
+    "current_span",
+    "evict_page_cache",
+    "expand_weight_paths",
     "load_settings",
+    "read_capture",
+    "resolve_weight_files",
+    "run_with_cprofile",
+    "serve_shared_state",
+    "start_metrics_publisher",
+    "start_span",
 ]
@@ -1,12 +1,25 @@
 """엔진 어댑터 계층 공개 심볼을 모아 제공한다."""
 
-from .base import AdapterResponse, EngineAdapter
+from .base import AdapterResponse, EngineAdapter, TokenUsage, cancelled_response
+from .cancellation import CancellationToken
+from .health_monitor import EndpointHealth, EngineHealthMonitor
+from .model_discovery import EngineModels, ModelDiscoveryCache
 from .ollama_adapter import OllamaAdapter
+from .resilience import CircuitBreaker, ResilientInvoker
 from .vllm_adapter import VllmAdapter
 
 __all__ = [
     "AdapterResponse",
+    "CancellationToken",
+    "CircuitBreaker",
+    "EndpointHealth",
     "EngineAdapter",
+    "EngineHealthMonitor",
+    "EngineModels",
+    "ModelDiscoveryCache",
     "OllamaAdapter",
+    "ResilientInvoker",
+    "TokenUsage",
     "VllmAdapter",
+    "cancelled_response",
 ]
@@ -1,8 +1,27 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from http.client import HTTPConnection, HTTPException
+from typing import Any, Literal
+
+from ..observability import SPAN_KIND_CLIENT, start_span
+from ..serialization import dumps, loads
+from .cancellation import CancellationToken
+
+ErrorKind = Literal["connect", "timeout", "reset", "http", "circuit_open", "unhealthy", "cancelled", "unknown"]
+"""어댑터 실패 원인 분류.
+
+- connect: 요청 전송 전 연결 실패(엔진이 요청을 받지 않았으므로 항상 재시도 안전)
+- timeout: 요청 전송 후 응답 대기 중 타임아웃
+- reset: 요청 전송 후 연결 끊김
+- http: 엔진이 4xx/5xx 상태 코드로 응답
+- circuit_open: 서킷 브레이커가 열려 호출 없이 즉시 실패
+- unhealthy: 헬스 폴러가 모든 엔드포인트를 비정상으로 판정해 호출 없이 즉시 실패
+- cancelled: 데드라인 초과 또는 클라이언트 연결 종료로 요청이 중단됨
+"""
 
 
 @dataclass(slots=True)
@@ -13,11 +32,92 @@ class AdapterResponse:
         ok: 요청 성공 여부.
         payload: 성공 시 반환되는 응답 데이터.
         error: 실패 시 오류 메시지.
+        error_kind: 실패 원인 분류(재시도 판단에 사용).
+        status_code: 엔진 HTTP 응답 상태 코드.
+        raw: 원본 응답 바이트(패스스루 모드에서만 채워지며, 이때 `payload`는 비어 있다).
     """
 
     ok: bool
     payload: dict[str, Any] | None = None
     error: str | None = None
+    error_kind: ErrorKind | None = None
+    status_code: int | None = None
+    raw: bytes | None = None
+
+
+StreamHandler = Callable[[dict[str, Any]], bool | None]
+"""스트리밍 응답의 JSON 이벤트(NDJSON 한 줄 또는 SSE `data:` 한 건)를 받는 콜백(`True`를 반환하면 읽기를 멈춘다)."""
+
+TextHandler = Callable[[str], None]
+"""스트리밍 생성 중 새로 생성된 텍스트 조각을 받는 콜백."""
+
+StopCheck = Callable[[str], int | None]
+"""생성 텍스트 조각을 차례로 받아, 생성을 끊어야 하면 응답에 남길 누적 텍스트 길이를 반환하는 검사(계속이면 `None`)."""
+
+
+class StreamCut:
+    """스트리밍 생성 조각을 모으며 시간 예산과 조기 종료 검사로 생성을 끊을 시점을 판단한다.
+
+    Rules:
+        - `stop_when`이 길이를 반환하면 그 길이까지만 남기고 `reason="until"`로 끊는다.
+        - 생성 시작 후 `max_time`초가 지나면 받은 조각까지 남기고 `reason="max_time"`으로 끊는다.
+          검사는 조각이 도착할 때 하므로 첫 조각 전(프리필)에는 끊지 않는다.
+        - `on_text`에는 남길 부분만 넘긴다. 텍스트가 있는 조각 하나를 생성 토큰 하나로 센다.
+    """
+
+    def __init__(
+        self,
+        on_text: TextHandler | None = None,
+        max_time: float | None = None,
+        stop_when: StopCheck | None = None,
+    ) -> None:
+        self.on_text = on_text
+        self.stop_when = stop_when
+        self.deadline = time.monotonic() + max_time if max_time else None
+        self.pieces: list[str] = []
+        self.tokens = 0
+        self.reason: str | None = None
+        self._length = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(self.pieces)
+
+    def add(self, text: str, last: bool = False) -> bool:
+        """조각 하나를 반영하고, 여기서 생성을 끊어야 하면 `True`를 반환한다(`last`면 시간 예산은 보지 않는다)."""
+        if self.reason is not None:
+            return True
+        if text:
+            self.tokens += 1
+            kept = self.stop_when(text) if self.stop_when is not None else None
+            if kept is not None:
+                text = text[: max(0, kept - self._length)]
+                self.reason = "until"
+            if text:
+                self.pieces.append(text)
+                self._length += len(text)
+                if self.on_text is not None:
+                    self.on_text(text)
+        if self.reason is None and not last and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = "max_time"
+        return self.reason is not None
+
+    def summary(self) -> dict[str, Any]:
+        """응답 payload의 `early_stop` 항목(끊은 사유와 그때까지 생성한 토큰 수)."""
+        return {"reason": self.reason, "completion_tokens": self.tokens}
+
+
+def cancelled_response(token: CancellationToken) -> AdapterResponse:
+    """취소된 요청의 표준 실패 응답을 생성한다."""
+    return AdapterResponse(ok=False, error=f"Cancelled: {token.reason}", error_kind="cancelled")
+
+
+@dataclass(frozen=True, slots=True)
+class TokenUsage:
+    """엔진 응답에서 추출한 토큰 사용량."""
+
+    prompt_tokens: int | None = None
+    completion_tokens: int | None = None
 
 
 class EngineAdapter(ABC):
@@ -39,13 +139,132 @@ class EngineAdapter(ABC):
         """엔진 API의 기본 URL을 반환한다."""
         return f"http://{self.host}:{self.port}"
 
+    def _http_request(
+        self,
+        path: str,
+        method: str = "GET",
+        payload: dict[str, Any] | None = None,
+        timeout: float = 30,
+        token: CancellationToken | None = None,
+        raw: bool = False,
+        stream: StreamHandler | None = None,
+    ) -> AdapterResponse:
+        """엔진 API로 JSON HTTP 요청을 보내고 표준 응답으로 변환한다.
+
+        Notes:
+            - 연결 단계와 송수신 단계를 분리해 실패 원인을 `error_kind`로 구분한다.
+              연결 단계 실패(`connect`)는 엔진이 요청을 받지 않았음을 보장한다.
+            - `token`이 주어지면 남은 데드라인으로 타임아웃을 줄이고, 취소 시 연결을 끊는다.
+            - `raw=True`면 응답 바이트를 파싱하지 않고 `AdapterResponse.raw`로 그대로 전달한다.
+            - `stream`이 주어지면 응답 본문을 줄 단위로 읽어 각 JSON 이벤트(NDJSON 또는 SSE `data:`)를
+              도착 즉시 넘기고, 성공 시 빈 `payload`를 반환한다(최종 응답 조립은 호출 어댑터 몫).
+              콜백이 `True`를 반환하면 남은 본문을 읽지 않고 연결을 닫아 엔진이 생성을 멈추게 한다.
+            - 트레이스가 샘플링된 요청이면 `engine.http` span에 connected/request_sent/first_byte/last_byte
+              이벤트를 남긴다.
+        """
+        if token is not None:
+            if token.cancelled:
+                return cancelled_response(token)
+            remaining = token.remaining()
+            if remaining is not None:
+                timeout = max(0.001, min(timeout, remaining))
+
+        span = start_span("engine.http", SPAN_KIND_CLIENT, engine=self.engine, url=f"{self.base_url}{path}")
+        data = dumps(payload) if payload is not None else None
+        headers = {"Content-Type": "application/json"}
+        connection = HTTPConnection(self.host, self.port, timeout=timeout)
+
+        try:
+            try:
+                connection.connect()
+            except OSError as exc:
+                span.set(error_kind="connect")
+                return AdapterResponse(ok=False, error=f"ConnectError: {exc}", error_kind="connect")
+
+            span.event("connected")
+            if token is not None:
+                token.attach(connection)
+            connection.request(method, path, body=data, headers=headers)
+            span.event("request_sent")
+            response = connection.getresponse()
+            span.event("first_byte")
+            if stream is not None and response.status < 400:
+                received = 0
+                for line in response:
+                    received += len(line)
+                    line = line.strip()
+                    if line.startswith(b"data:"):
+                        line = line[5:].strip()
+                    if line and line != b"[DONE]" and stream(loads(line)):
+                        span.set(stream_cut=True)
+                        break
+                span.event("last_byte")
+                span.set(status_code=response.status, response_bytes=received)
+                return AdapterResponse(ok=True, payload={}, status_code=response.status)
+            body = response.read()
+            span.event("last_byte")
+            span.set(status_code=response.status, response_bytes=len(body))
+            if response.status >= 400:
+                return AdapterResponse(
+                    ok=False,
+                    error=f"HTTPError {response.status}: {response.reason}",
+                    error_kind="http",
+                    status_code=response.status,
+                )
+            if raw:
+                return AdapterResponse(ok=True, raw=body, status_code=response.status)
+            if body:
+                return AdapterResponse(ok=True, payload=loads(body), status_code=response.status)
+            return AdapterResponse(ok=True, payload={}, status_code=response.status)
+        except Exception as exc:
+            if token is not None and token.cancelled:
+                return cancelled_response(token)
+            if isinstance(exc, TimeoutError):
+                return AdapterResponse(ok=False, error=f"TimeoutError: {exc}", error_kind="timeout")
+            if isinstance(exc, (ConnectionError, HTTPException)):
+                return AdapterResponse(ok=False, error=f"ConnectionError: {exc!r}", error_kind="reset")
+            return AdapterResponse(ok=False, error=str(exc), error_kind="unknown")
+        finally:
+            if token is not None:
+                token.detach(connection)
+            connection.close()
+            span.end()
+
+    def token_usage(self, payload: dict[str, Any] | None) -> TokenUsage:
+        """엔진 응답 payload에서 토큰 사용량을 추출한다(엔진별로 재정의)."""
+        return TokenUsage()
+
+    def embedding_vectors(self, payload: dict[str, Any] | None) -> list[list[float]]:
+        """`embed` 응답 payload에서 입력 순서대로 임베딩 벡터 목록을 추출한다(엔진별로 재정의)."""
+        return []
+
+    def generated_text(self, payload: dict[str, Any] | None) -> str:
+        """`generate` 응답 payload에서 생성 텍스트를 추출한다(엔진별로 재정의)."""
+        return ""
+
+    def early_stop_reason(self, payload: dict[str, Any] | None) -> str | None:
+        """`generate` 응답이 생성 상한 전에 끊겼다면 그 사유(`until`, `max_time`; 엔진이 알려 주면 `stop`)."""
+        return ((payload or {}).get("early_stop") or {}).get("reason")
+
+    def mean_logprob(self, payload: dict[str, Any] | None) -> float | None:
+        """생성 토큰 평균 로그 확률(엔진이 주지 않으면 `None`, 엔진별로 재정의)."""
+        return None
+
+    def model_entries(self, payload: dict[str, Any] | None) -> list[dict[str, Any]]:
+        """모델 목록 응답에서 `name`(과 엔진이 주는 크기/만료 정보)을 담은 항목 목록을 추출한다(엔진별로 재정의)."""
+        return []
+
+    def running_models(self, timeout: float = 30) -> AdapterResponse:
+        """현재 메모리에 올라와 있는 모델 목록을 조회한다(기본: 서빙 중인 모델 = 사용 가능 모델)."""
+        return self.list_models(timeout=timeout)
+
     @abstractmethod
-    def health_check(self) -> AdapterResponse:
-        """엔진 헬스 체크를 수행한다."""
+    def health_check(self, timeout: float = 30) -> AdapterResponse:
+        """엔진 헬스 체크를 수행한다(모델 목록 조회 없이 가벼운 엔드포인트를 쓴다)."""
         raise NotImplementedError
 
     @abstractmethod
-    def list_models(self) -> AdapterResponse:
+    def list_models(self, timeout: float = 30) -> AdapterResponse:
         """엔진에서 사용 가능한 모델 목록을 조회한다."""
         raise NotImplementedError
 
@@ -63,3 +282,8 @@ class EngineAdapter(ABC):
     def generate(self, model_name: str, prompt: str, **kwargs: Any) -> AdapterResponse:
         """모델 추론 요청을 실행하고 결과를 반환한다."""
         raise NotImplementedError
+
+    @abstractmethod
+    def embed(self, model_name: str, texts: list[str], **kwargs: Any) -> AdapterResponse:
+        """여러 텍스트의 임베딩을 한 번의 배치 요청으로 조회한다(`embedding_vectors`로 벡터 추출)."""
+        raise NotImplementedError
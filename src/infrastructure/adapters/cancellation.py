@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from http.client import HTTPConnection
+
+
+def _abort_connection(connection: HTTPConnection) -> None:
+    """다른 스레드에서 블로킹 중인 연결을 깨우기 위해 소켓 송수신을 차단한다.
+
+    Notes:
+        엔진(vLLM/Ollama)은 클라이언트 연결 종료를 감지하면 해당 요청의 생성을 중단한다.
+    """
+    sock = connection.sock
+    if sock is None:
+        return
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+
+
+class CancellationToken:
+    """요청 단위 데드라인과 취소 신호를 전달하는 토큰.
+
+    Notes:
+        - `timeout`을 지정하면 데드라인 도달 시 타이머가 스스로 취소한다.
+        - 취소 시 `attach`된 엔진 연결을 즉시 끊어 업스트림 생성을 중단시킨다.
+        - `child()`로 만든 하위 토큰은 상위 취소를 전파받지만, 하위 취소는 상위에 영향이 없다.
+    """
+
+    def __init__(self, timeout: float | None = None, *, deadline: float | None = None) -> None:
+        """상대 타임아웃(초) 또는 절대 데드라인(`time.monotonic` 기준)으로 토큰을 만든다."""
+        if timeout is not None and timeout > 0:
+            deadline = time.monotonic() + timeout
+        self.deadline = deadline
+        self.started_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._reason: str | None = None
+        self._connections: set[HTTPConnection] = set()
+        self._children: set[CancellationToken] = set()
+        self._timer: threading.Timer | None = None
+        if timeout is not None and timeout > 0:
+            self._timer = threading.Timer(timeout, self.cancel, args=("deadline_exceeded",))
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부를 반환한다."""
+        return self._reason is not None
+
+    @property
+    def reason(self) -> str | None:
+        """취소 사유(`deadline_exceeded`, `client_disconnected` 등)를 반환한다."""
+        return self._reason
+
+    def remaining(self) -> float | None:
+        """데드라인까지 남은 시간(초)을 반환한다. 데드라인이 없으면 `None`."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def elapsed(self) -> float:
+        """토큰 생성 이후 경과 시간(초)을 반환한다."""
+        return time.monotonic() - self.started_at
+
+    def child(self) -> CancellationToken:
+        """상위 취소를 전파받는 하위 토큰을 생성한다(헤지/재시도 시도 단위)."""
+        token = CancellationToken(deadline=self.deadline)
+        with self._lock:
+            if self._reason is None:
+                self._children.add(token)
+                return token
+            reason = self._reason
+        token.cancel(reason)
+        return token
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """토큰을 취소하고 연결된 엔진 요청과 하위 토큰을 모두 중단한다."""
+        with self._lock:
+            if self._reason is not None:
+                return
+            self._reason = reason
+            connections = list(self._connections)
+            children = list(self._children)
+        if self._timer is not None:
+            self._timer.cancel()
+        for connection in connections:
+            _abort_connection(connection)
+        for child in children:
+            child.cancel(reason)
+
+    def attach(self, connection: HTTPConnection) -> None:
+        """진행 중인 엔진 연결을 등록한다. 이미 취소된 경우 즉시 끊는다."""
+        with self._lock:
+            if self._reason is None:
+                self._connections.add(connection)
+                return
+        _abort_connection(connection)
+
+    def detach(self, connection: HTTPConnection) -> None:
+        """완료된 엔진 연결 등록을 해제한다."""
+        with self._lock:
+            self._connections.discard(connection)
+
+    def close(self) -> None:
+        """데드라인 타이머를 정리한다(요청 처리 완료 후 호출)."""
+        if self._timer is not None:
+            self._timer.cancel()
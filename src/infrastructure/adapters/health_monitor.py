@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..config.settings import HealthCheckConfig
+from ..observability import MetricsRegistry
+from .base import EngineAdapter
+
+
+@dataclass(slots=True)
+class EndpointHealth:
+    """엔드포인트 하나의 캐시된 헬스 상태.
+
+    Attributes:
+        healthy: 최근 판정 결과. 아직 확인하지 않았으면 `None`.
+        checked_at: 마지막 확인 시각(epoch 초).
+        last_success: 마지막 성공 시각(epoch 초).
+        consecutive_failures: 연속 실패 횟수. `failure_threshold`에 도달하면 비정상으로 판정한다.
+        latencies: 최근 헬스 요청 지연(초) 이동 창.
+    """
+
+    engine: str
+    endpoint: str
+    healthy: bool | None = None
+    checked_at: float | None = None
+    last_success: float | None = None
+    consecutive_failures: int = 0
+    error: str | None = None
+    payload: dict[str, Any] | None = None
+    latencies: deque[float] = field(default_factory=deque)
+
+    def record(self, ok: bool, elapsed: float, failure_threshold: int, now: float, **details: Any) -> None:
+        """확인 결과 하나를 반영한다(성공 1회면 바로 정상, 연속 실패가 임계값에 닿으면 비정상)."""
+        self.checked_at = now
+        if ok:
+            self.healthy = True
+            self.last_success = now
+            self.consecutive_failures = 0
+            self.error = None
+            self.payload = details.get("payload")
+            self.latencies.append(elapsed)
+            return
+        self.consecutive_failures += 1
+        self.error = details.get("error")
+        if self.healthy is None or self.consecutive_failures >= failure_threshold:
+            self.healthy = False
+
+    def to_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+        latency: dict[str, float] | None = None
+        if ordered:
+            latency = {
+                "last_ms": round(self.latencies[-1] * 1000, 3),
+                "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return {
+            "endpoint": self.endpoint,
+            "healthy": self.healthy,
+            "checked_at": self.checked_at,
+            "last_success": self.last_success,
+            "consecutive_failures": self.consecutive_failures,
+            "error": self.error,
+            "latency": latency,
+        }
+
+
+class EngineHealthMonitor:
+    """엔진 엔드포인트를 백그라운드에서 주기적으로 확인하고 결과를 캐시하는 헬스 폴러.
+
+    Rules:
+        - `interval`마다 모든 엔진의 모든 레플리카에 가벼운 헬스 요청을 동시에 보낸다.
+        - `/health`와 라우팅 판단은 캐시만 읽으므로 엔진 요청 없이 즉시 응답한다.
+        - 마지막 확인이 `interval × 3`보다 오래됐거나 아직 확인 전인 엔드포인트는 정상으로 간주한다.
+          폴러가 멈춰도 요청이 막히지 않게 하기 위함이다.
+    """
+
+    def __init__(
+        self,
+        replicas: Mapping[str, Sequence[EngineAdapter]],
+        config: HealthCheckConfig,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """엔진별 레플리카 어댑터 목록과 폴링 설정으로 초기화한다(폴링은 `start()`로 시작)."""
+        self.config = config
+        self.metrics = metrics
+        self._clock = clock
+        self._adapters = {engine: list(adapters) for engine, adapters in replicas.items()}
+        self._states = {
+            adapter.base_url: EndpointHealth(engine, adapter.base_url, latencies=deque(maxlen=config.latency_window))
+            for engine, adapters in self._adapters.items()
+            for adapter in adapters
+        }
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """폴링 스레드를 시작한다(이미 실행 중이면 무시). 첫 확인은 즉시 수행한다."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="engine-health", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def set_replicas(self, replicas: Mapping[str, Sequence[EngineAdapter]]) -> None:
+        """엔진별 레플리카 목록을 바꾼다(플릿 풀 변경 시).
+
+        Notes:
+            이미 알던 엔드포인트는 캐시 상태를 유지하고, 새 엔드포인트는 확인 전 상태로 추가하며, 빠진 엔드포인트는 버린다.
+        """
+        adapters = {engine: list(items) for engine, items in replicas.items()}
+        urls = {adapter.base_url for items in adapters.values() for adapter in items}
+        with self._lock:
+            for engine, items in adapters.items():
+                for adapter in items:
+                    if adapter.base_url not in self._states:
+                        self._states[adapter.base_url] = EndpointHealth(
+                            engine, adapter.base_url, latencies=deque(maxlen=self.config.latency_window)
+                        )
+            for url in [url for url in self._states if url not in urls]:
+                del self._states[url]
+            self._adapters = adapters
+
+    def check_now(self, engines: Sequence[str] | None = None) -> None:
+        """지정 엔진(없으면 전체)의 모든 엔드포인트를 동시에 한 번 확인하고 캐시를 갱신한다."""
+        targets = [
+            adapter for engine in (engines or list(self._adapters)) for adapter in self._adapters.get(engine, [])
+        ]
+        if not targets:
+            return
+        if len(targets) == 1:
+            self._check(targets[0])
+            return
+        executor = self._get_executor(len(targets))
+        list(executor.map(self._check, targets))
+
+    def is_healthy(self, adapter: EngineAdapter) -> bool:
+        """라우팅용 판정. 비정상으로 확인됐고 그 결과가 최신일 때만 `False`를 반환한다."""
+        state = self._states.get(adapter.base_url)
+        if state is None or state.healthy is not False or state.checked_at is None:
+            return True
+        return self._clock() - state.checked_at > self.config.interval * 3
+
+    def status(self, engines: Sequence[str] | None = None) -> dict[str, dict[str, Any]]:
+        """엔진별 캐시 상태. 엔진 `ok`는 정상 엔드포인트가 하나라도 있으면 `True`다."""
+        result: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for engine in engines or list(self._adapters):
+                states = [
+                    self._states[adapter.base_url]
+                    for adapter in self._adapters.get(engine, [])
+                    if adapter.base_url in self._states
+                ]
+                if not states:
+                    continue
+                healthy = [state for state in states if state.healthy]
+                primary = healthy[0] if healthy else states[0]
+                result[engine] = {
+                    "ok": bool(healthy),
+                    "payload": primary.payload,
+                    "error": None if healthy else primary.error,
+                    "cached": self.running,
+                    "endpoints": [state.to_dict() for state in states],
+                }
+        return result
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                self.check_now()
+            except Exception:
+                # 폴러 자체 오류로 스레드가 죽으면 캐시가 영영 갱신되지 않으므로 다음 주기에 다시 시도한다.
+                pass
+            if self._stop.wait(self.config.interval):
+                return
+
+    def _check(self, adapter: EngineAdapter) -> None:
+        started = time.perf_counter()
+        try:
+            response = adapter.health_check(timeout=self.config.timeout)
+            ok, error, payload = response.ok, response.error, response.payload
+        except Exception as exc:
+            ok, error, payload = False, str(exc), None
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            state = self._states.get(adapter.base_url)
+            if state is None:
+                return
+            state.record(ok, elapsed, self.config.failure_threshold, self._clock(), error=error, payload=payload)
+            healthy = state.healthy
+        if self.metrics is not None:
+            self.metrics.set_gauge("engine_health_up", 1.0 if healthy else 0.0, endpoint=adapter.base_url)
+            self.metrics.observe("engine_health_check_seconds", elapsed, endpoint=adapter.base_url)
+
+    def _get_executor(self, size: int) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="engine-health-check")
+            return self._executor
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from ..config.settings import DiscoveryConfig
+from ..observability import MetricsRegistry
+from .base import EngineAdapter
+
+ModelChangeKind = Literal["installed", "removed", "loaded", "unloaded"]
+ModelChangeListener = Callable[[dict[str, Any]], None]
+"""모델 변경 이벤트(`engine`, `kind`, `model`, `at`)를 받는 콜백. 동기화 스레드에서 호출된다."""
+
+
+def normalize_model_name(engine: str, name: str) -> str:
+    """엔진 목록과 설정 이름을 비교할 수 있게 정규화한다(Ollama는 태그가 없으면 `:latest`)."""
+    if engine == "ollama" and ":" not in name.rsplit("/", 1)[-1]:
+        return f"{name}:latest"
+    return name
+
+
+@dataclass(slots=True)
+class EngineModels:
+    """엔진 하나의 마지막 동기화 결과.
+
+    Attributes:
+        installed: 정규화 이름 → 설치 모델 항목(Ollama `/api/tags`, vLLM `/v1/models`).
+        loaded: 정규화 이름 → 메모리 적재 모델 항목(Ollama `/api/ps`의 `size_vram`/`expires_at` 포함).
+        synced_at: 마지막 동기화 성공 시각(epoch 초). 한 번도 성공하지 못했으면 `None`.
+        error: 마지막 동기화 실패 메시지(성공하면 `None`).
+    """
+
+    engine: str
+    installed: dict[str, dict[str, Any]] = field(default_factory=dict)
+    loaded: dict[str, dict[str, Any]] = field(default_factory=dict)
+    synced_at: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "engine": self.engine,
+            "synced_at": self.synced_at,
+            "error": self.error,
+            "installed": sorted(self.installed),
+            "loaded": list(self.loaded.values()),
+        }
+
+
+class ModelDiscoveryCache:
+    """엔진의 설치/적재 모델 목록을 주기적으로 동기화해 메모리에서 제공하는 캐시.
+
+    Rules:
+        - `interval`마다 모든 엔진의 모델 목록과 적재 목록을 동시에 조회한다. `request_refresh()`는
+          다음 주기를 기다리지 않고 바로 동기화하게 한다(load/unload 직후 등).
+        - 조회에 실패하면 이전 목록을 유지하고 `error`만 기록한다(엔진 일시 장애로 목록이 비지 않도록).
+        - 이전 동기화 대비 설치/삭제/적재/해제된 모델을 변경 이벤트로 만들어 구독자에게 알리고
+          최근 `history_size`건을 보관한다. 첫 동기화 결과는 이벤트로 만들지 않는다.
+        - 조회 메서드는 캐시만 읽는다. 폴러가 돌지 않을 때는 `ensure_fresh()`로 `ttl`이 지난 엔진만 다시 조회한다.
+    """
+
+    def __init__(
+        self,
+        adapters: Mapping[str, EngineAdapter],
+        config: DiscoveryConfig,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """엔진별 어댑터와 동기화 설정으로 초기화한다(백그라운드 동기화는 `start()`로 시작)."""
+        self.config = config
+        self.metrics = metrics
+        self._clock = clock
+        self._adapters = dict(adapters)
+        self._models = {engine: EngineModels(engine) for engine in self._adapters}
+        self._events: deque[dict[str, Any]] = deque(maxlen=config.history_size)
+        self._listeners: list[ModelChangeListener] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, listener: ModelChangeListener) -> None:
+        """모델 변경 이벤트 구독자를 등록한다."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def start(self) -> None:
+        """백그라운드 동기화 스레드를 시작한다(이미 실행 중이면 무시). 첫 동기화는 즉시 수행한다."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="model-discovery", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def request_refresh(self) -> None:
+        """백그라운드 폴러가 다음 주기를 기다리지 않고 바로 동기화하게 한다(폴러가 없으면 무시)."""
+        self._wake.set()
+
+    def refresh(self, engines: Sequence[str] | None = None) -> None:
+        """지정 엔진(없으면 전체)의 모델 목록을 동시에 조회해 캐시를 갱신한다."""
+        targets = [engine for engine in (engines or list(self._adapters)) if engine in self._adapters]
+        if len(targets) == 1:
+            self._sync(targets[0])
+        elif targets:
+            list(self._get_executor().map(self._sync, targets))
+
+    def ensure_fresh(self, engines: Sequence[str] | None = None) -> None:
+        """폴러가 돌지 않을 때 마지막 동기화가 `ttl`보다 오래된 엔진만 다시 조회한다."""
+        if self.running:
+            return
+        now = self._clock()
+        with self._lock:
+            stale = [
+                engine
+                for engine in (engines or list(self._adapters))
+                if engine in self._models
+                and (self._models[engine].synced_at is None or now - self._models[engine].synced_at > self.config.ttl)
+            ]
+        if stale:
+            self.refresh(stale)
+
+    def get(self, engine: str) -> EngineModels | None:
+        """엔진의 캐시된 동기화 결과(복사본)."""
+        with self._lock:
+            models = self._models.get(engine)
+            if models is None:
+                return None
+            return EngineModels(
+                engine,
+                installed=dict(models.installed),
+                loaded=dict(models.loaded),
+                synced_at=models.synced_at,
+                error=models.error,
+            )
+
+    def is_loaded(self, engine: str, model_name: str) -> bool | None:
+        """캐시 기준 적재 여부. 아직 동기화하지 못했으면 `None`."""
+        with self._lock:
+            models = self._models.get(engine)
+            if models is None or models.synced_at is None:
+                return None
+            return normalize_model_name(engine, model_name) in models.loaded
+
+    def events(self, since: float | None = None) -> list[dict[str, Any]]:
+        """보관 중인 변경 이벤트(`since` 이후 것만)."""
+        with self._lock:
+            return [event for event in self._events if since is None or event["at"] > since]
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.refresh()
+            except Exception:
+                # 동기화 스레드가 죽으면 캐시가 갱신되지 않으므로 다음 주기에 다시 시도한다.
+                pass
+            self._wake.wait(self.config.interval)
+
+    def _sync(self, engine: str) -> None:
+        adapter = self._adapters[engine]
+        installed_response = adapter.list_models(timeout=self.config.timeout)
+        loaded_response = adapter.running_models(timeout=self.config.timeout) if installed_response.ok else None
+        now = self._clock()
+        if not installed_response.ok or loaded_response is None or not loaded_response.ok:
+            failed = loaded_response if installed_response.ok and loaded_response is not None else installed_response
+            with self._lock:
+                self._models[engine].error = failed.error
+            if self.metrics is not None:
+                self.metrics.inc("model_discovery_sync_total", engine=engine, ok=False)
+            return
+
+        installed = self._index(engine, adapter.model_entries(installed_response.payload))
+        loaded = self._index(engine, adapter.model_entries(loaded_response.payload))
+        with self._lock:
+            previous = self._models[engine]
+            changes: list[tuple[ModelChangeKind, str]] = []
+            if previous.synced_at is not None:
+                changes += [("installed", name) for name in installed.keys() - previous.installed.keys()]
+                changes += [("removed", name) for name in previous.installed.keys() - installed.keys()]
+                changes += [("loaded", name) for name in loaded.keys() - previous.loaded.keys()]
+                changes += [("unloaded", name) for name in previous.loaded.keys() - loaded.keys()]
+            self._models[engine] = EngineModels(engine, installed=installed, loaded=loaded, synced_at=now)
+            events = [{"engine": engine, "kind": kind, "model": name, "at": now} for kind, name in sorted(changes)]
+            self._events.extend(events)
+            listeners = list(self._listeners)
+
+        if self.metrics is not None:
+            self.metrics.inc("model_discovery_sync_total", engine=engine, ok=True)
+            self.metrics.set_gauge("engine_models_loaded", len(loaded), engine=engine)
+        for event in events:
+            if self.metrics is not None:
+                self.metrics.inc("model_discovery_changes_total", engine=engine, kind=event["kind"])
+            for listener in listeners:
+                try:
+                    listener(event)
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _index(engine: str, entries: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        return {normalize_model_name(engine, entry["name"]): entry for entry in entries if entry.get("name")}
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, len(self._adapters)), thread_name_prefix="model-discovery-sync"
+                )
+            return self._executor
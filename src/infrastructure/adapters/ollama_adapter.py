@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import json
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
-from .base import AdapterResponse, EngineAdapter
+from .base import AdapterResponse, EngineAdapter, StreamCut, StreamHandler, TokenUsage
+from .cancellation import CancellationToken
 
 
 class OllamaAdapter(EngineAdapter):
@@ -21,38 +19,60 @@ class OllamaAdapter(EngineAdapter):
         path: str,
         method: str = "GET",
         payload: dict[str, Any] | None = None,
-        timeout: int = 30,
+        timeout: float = 30,
+        token: CancellationToken | None = None,
+        raw: bool = False,
+        stream: StreamHandler | None = None,
     ) -> AdapterResponse:
         """Ollama API로 HTTP 요청을 보내고 표준 응답으로 변환한다."""
-        url = f"{self.base_url}{path}"
-        data = None
-        headers = {"Content-Type": "application/json"}
-
-        if payload is not None:
-            data = json.dumps(payload).encode("utf-8")
-
-        request = Request(url=url, data=data, headers=headers, method=method)
-
-        try:
-            with urlopen(request, timeout=timeout) as response:
-                body = response.read().decode("utf-8")
-                if body:
-                    return AdapterResponse(ok=True, payload=json.loads(body))
-                return AdapterResponse(ok=True, payload={})
-        except HTTPError as exc:
-            return AdapterResponse(ok=False, error=f"HTTPError {exc.code}: {exc.reason}")
-        except URLError as exc:
-            return AdapterResponse(ok=False, error=f"URLError: {exc.reason}")
-        except Exception as exc:
-            return AdapterResponse(ok=False, error=str(exc))
-
-    def health_check(self) -> AdapterResponse:
-        """Ollama 서버 상태를 확인한다."""
-        return self._request("/api/tags")
-
-    def list_models(self) -> AdapterResponse:
+        return self._http_request(
+            path,
+            method=method,
+            payload=payload,
+            timeout=timeout,
+            token=token,
+            raw=raw,
+            stream=stream,
+        )
+
+    def token_usage(self, payload: dict[str, Any] | None) -> TokenUsage:
+        """`prompt_eval_count`/`eval_count`에서 토큰 사용량을 추출한다."""
+        payload = payload or {}
+        return TokenUsage(
+            prompt_tokens=payload.get("prompt_eval_count"),
+            completion_tokens=payload.get("eval_count"),
+        )
+
+    def embedding_vectors(self, payload: dict[str, Any] | None) -> list[list[float]]:
+        """`/api/embed` 응답의 `embeddings` 배열을 반환한다."""
+        return list((payload or {}).get("embeddings") or [])
+
+    def generated_text(self, payload: dict[str, Any] | None) -> str:
+        """`/api/generate` 응답의 `response` 문자열을 반환한다."""
+        return str((payload or {}).get("response") or "")
+
+    def model_entries(self, payload: dict[str, Any] | None) -> list[dict[str, Any]]:
+        """`/api/tags`/`/api/ps` 응답의 `models`를 이름, 디스크/VRAM 크기, 상주 만료 시각으로 정리한다."""
+        entries: list[dict[str, Any]] = []
+        for item in (payload or {}).get("models") or []:
+            entry = {"name": item.get("name") or item.get("model")}
+            for key in ("size", "size_vram", "expires_at"):
+                if item.get(key) is not None:
+                    entry[key] = item[key]
+            entries.append(entry)
+        return entries
+
+    def running_models(self, timeout: float = 30) -> AdapterResponse:
+        """`/api/ps`로 메모리에 적재된 모델(VRAM 사용량 포함)을 조회한다."""
+        return self._request("/api/ps", timeout=timeout)
+
+    def health_check(self, timeout: float = 30) -> AdapterResponse:
+        """Ollama 서버 상태를 확인한다(`/api/tags`는 설치 모델을 모두 나열하므로 `/api/version`을 쓴다)."""
+        return self._request("/api/version", timeout=timeout)
+
+    def list_models(self, timeout: float = 30) -> AdapterResponse:
         """Ollama에 등록된 모델 목록을 조회한다."""
-        return self._request("/api/tags")
+        return self._request("/api/tags", timeout=timeout)
 
     def load_model(self, model_name: str, **kwargs: Any) -> AdapterResponse:
         """지정 모델을 keep_alive 옵션으로 메모리에 유지하도록 요청한다."""
@@ -74,10 +94,40 @@ class OllamaAdapter(EngineAdapter):
         }
         return self._request("/api/generate", method="POST", payload=payload)
 
+    def embeddings(self, model_name: str, prompt: str, timeout: float = 30) -> AdapterResponse:
+        """Ollama `/api/embeddings` 엔드포인트로 단일 텍스트 임베딩(`embedding`)을 조회한다."""
+        payload = {"model": model_name, "prompt": prompt}
+        return self._request("/api/embeddings", method="POST", payload=payload, timeout=timeout)
+
+    def embed(self, model_name: str, texts: list[str], **kwargs: Any) -> AdapterResponse:
+        """Ollama `/api/embed` 엔드포인트로 여러 텍스트를 한 번에 임베딩한다."""
+        payload: dict[str, Any] = {"model": model_name, "input": texts}
+        if kwargs.get("keep_alive") is not None:
+            payload["keep_alive"] = kwargs["keep_alive"]
+        return self._request(
+            "/api/embed",
+            method="POST",
+            payload=payload,
+            timeout=float(kwargs.get("timeout") or 60),
+            token=kwargs.get("cancel_token"),
+        )
+
     def generate(self, model_name: str, prompt: str, **kwargs: Any) -> AdapterResponse:
-        """Ollama `/api/generate` 엔드포인트로 비스트리밍 추론을 실행한다."""
+        """Ollama `/api/generate` 엔드포인트로 비스트리밍 추론을 실행한다.
+
+        Notes:
+            - `cancel_token`이 취소되면 연결을 끊어 Ollama가 생성을 중단하도록 한다.
+            - `raw_response=True`면 응답 바이트를 파싱 없이 `AdapterResponse.raw`로 전달한다.
+            - `context`(이전 응답의 토큰 배열)를 주면 Ollama가 이전 대화 재평가를 건너뛴다.
+            - `on_text` 콜백을 주면 `stream=True`로 요청해 새 텍스트 조각마다 콜백을 호출하고,
+              마지막(`done`) 청크에 누적 `response`를 채워 비스트리밍과 같은 모양으로 반환한다.
+            - `stop`(중지 문자열 목록)은 Ollama `options.stop`으로 넘겨 엔진이 직접 멈추게 한다.
+            - `max_time`(생성 시간 예산, 초)이나 `stop_when`(조기 종료 검사)을 주면 스트리밍으로 요청하고,
+              조건에 걸리면 연결을 끊어 생성을 멈춘 뒤 받은 텍스트로 응답을 만든다(`StreamCut` 참고).
+              이때 `done_reason`은 끊은 사유, `eval_count`는 받은 조각 수이고 `early_stop` 항목이 붙는다.
+        """
         max_tokens = kwargs.get("max_tokens")
-        timeout = int(kwargs.get("timeout") or 300)
+        timeout = float(kwargs.get("timeout") or 300)
         payload = {
             "model": model_name,
             "prompt": prompt,
@@ -89,4 +139,71 @@ class OllamaAdapter(EngineAdapter):
                 "num_predict": max_tokens,
             },
         }
-        return self._request("/api/generate", method="POST", payload=payload, timeout=timeout)
+        if kwargs.get("stop"):
+            payload["options"]["stop"] = list(kwargs["stop"])
+        context = kwargs.get("context")
+        if context:
+            payload["context"] = list(context)
+        cut = StreamCut(kwargs.get("on_text"), kwargs.get("max_time"), kwargs.get("stop_when"))
+        streamed = cut.on_text is not None or cut.deadline is not None or cut.stop_when is not None
+        if streamed and not kwargs.get("raw_response"):
+            return self._generate_stream(payload, timeout, kwargs.get("cancel_token"), cut)
+        return self._request(
+            "/api/generate",
+            method="POST",
+            payload=payload,
+            timeout=timeout,
+            token=kwargs.get("cancel_token"),
+            raw=bool(kwargs.get("raw_response")),
+        )
+
+    def _generate_stream(
+        self,
+        payload: dict[str, Any],
+        timeout: float,
+        token: CancellationToken | None,
+        cut: StreamCut,
+    ) -> AdapterResponse:
+        """NDJSON 스트리밍으로 생성하며 조각을 `cut`에 모으고, 최종 청크(끊었으면 받은 조각)를 응답 payload로 반환한다.
+
+        Notes:
+            Ollama는 생성 중 오류를 `done` 없는 `{"error": ...}` 청크로 알린다. 오류 청크를 받거나 `cut`이 끊지 않았는데
+            `done` 청크 없이 스트림이 끝나면 받은 일부 텍스트를 성공으로 돌려주지 않고 실패 응답을 반환한다.
+        """
+        final: dict[str, Any] = {}
+
+        def handle(chunk: dict[str, Any]) -> bool:
+            nonlocal final
+            if "error" in chunk:
+                final = chunk
+                return True
+            if chunk.get("done"):
+                final = chunk
+            return cut.add(chunk.get("response") or "", last=bool(chunk.get("done")))
+
+        response = self._request(
+            "/api/generate",
+            method="POST",
+            payload={**payload, "stream": True},
+            timeout=timeout,
+            token=token,
+            stream=handle,
+        )
+        if not response.ok:
+            return response
+        if "error" in final:
+            return AdapterResponse(
+                ok=False, error=str(final["error"]), error_kind="http", status_code=response.status_code
+            )
+        if not final and cut.reason is None:
+            return AdapterResponse(
+                ok=False,
+                error=f"IncompleteStream: done 청크 없이 스트림이 끝났습니다({cut.tokens}개 조각 수신).",
+                error_kind="reset",
+                status_code=response.status_code,
+            )
+        if cut.reason is not None:
+            final = {"model": payload["model"], "eval_count": cut.tokens, **final}
+            final.update(done=True, done_reason=cut.reason, early_stop=cut.summary())
+        response.payload = {**final, "response": cut.text}
+        return response
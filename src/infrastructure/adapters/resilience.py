@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import random
+import contextvars
+import threading
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Literal
+
+from ..config.settings import ModelResiliencePolicy
+from ..observability import MetricsRegistry, current_span, start_span
+from .base import AdapterResponse, EngineAdapter, cancelled_response
+from .cancellation import CancellationToken
+from .health_monitor import EngineHealthMonitor
+
+CircuitState = Literal["closed", "open", "half_open"]
+AdapterCall = Callable[[EngineAdapter, CancellationToken | None], AdapterResponse]
+"""어댑터와 시도 단위 취소 토큰을 받아 실제 요청을 수행하는 함수."""
+
+_CIRCUIT_STATE_GAUGE: dict[CircuitState, float] = {"closed": 0.0, "half_open": 1.0, "open": 2.0}
+_BREAKER_FAILURE_KINDS = frozenset({"connect", "timeout", "reset"})
+
+
+@dataclass(slots=True)
+class CircuitBreaker:
+    """엔드포인트 단위 서킷 브레이커.
+
+    Rules:
+        - closed: 연속 실패가 `failure_threshold`에 도달하면 open으로 전이
+        - open: `reset_timeout` 동안 호출을 즉시 거부, 경과 후 half_open
+        - half_open: 시험 호출 1건만 허용, 성공 시 closed / 실패 시 다시 open
+    """
+
+    failure_threshold: int
+    reset_timeout: float
+    clock: Callable[[], float] = time.monotonic
+    state: CircuitState = "closed"
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    _probe_in_flight: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def is_available(self) -> bool:
+        """상태를 바꾸지 않고 호출 가능 여부만 확인한다(대상 선정용)."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                return self.clock() - self.opened_at >= self.reset_timeout
+            return not self._probe_in_flight
+
+    def allow(self) -> bool:
+        """현재 호출을 허용할지 판단한다(half_open이면 시험 호출 슬롯을 점유한다)."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if self.clock() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = "half_open"
+                self._probe_in_flight = False
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        """호출 성공을 기록하고 closed 상태로 복귀한다."""
+        with self._lock:
+            self.state = "closed"
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """상태 변화 없이 시험 호출 슬롯만 반납한다(취소된 호출 등)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """호출 실패를 기록하고 필요 시 open 상태로 전이한다."""
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = self.clock()
+
+
+def is_engine_failure(response: AdapterResponse) -> bool:
+    """엔진 가용성 문제로 볼 수 있는 실패인지 판단한다(4xx 등 요청 오류 제외)."""
+    if response.ok:
+        return False
+    if response.error_kind in _BREAKER_FAILURE_KINDS:
+        return True
+    return response.error_kind == "http" and (response.status_code or 0) >= 500
+
+
+def is_retryable(response: AdapterResponse, idempotent: bool) -> bool:
+    """실패 응답을 재시도해도 되는지 판단한다.
+
+    Rules:
+        - 연결 실패/503은 엔진이 요청을 처리하지 않았으므로 항상 재시도 가능
+        - 전송 후 타임아웃/연결 끊김/502/504는 멱등 요청일 때만 재시도
+    """
+    if response.ok:
+        return False
+    if response.error_kind == "connect" or response.status_code == 503:
+        return True
+    if not idempotent:
+        return False
+    return response.error_kind in ("timeout", "reset") or response.status_code in (502, 504)
+
+
+class ResilientInvoker:
+    """어댑터 호출에 재시도, 헤지 요청, 서킷 브레이커를 적용하는 실행기.
+
+    Notes:
+        `health`가 지정되면 헬스 폴러가 비정상으로 판정한 엔드포인트를 타임아웃을 기다리지 않고 건너뛴다.
+    """
+
+    def __init__(
+        self,
+        metrics: MetricsRegistry,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[], float] = random.random,
+        max_hedge_workers: int = 16,
+    ) -> None:
+        """메트릭 저장소와 대기/지터 함수(테스트 시 교체 가능)를 받아 초기화한다."""
+        self.metrics = metrics
+        self._sleep = sleep
+        self._jitter = jitter
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+        self._max_hedge_workers = max_hedge_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self.health: EngineHealthMonitor | None = None
+
+    def breaker(self, adapter: EngineAdapter, policy: ModelResiliencePolicy) -> CircuitBreaker:
+        """엔드포인트(base_url)별 서킷 브레이커를 조회하거나 생성한다."""
+        with self._breakers_lock:
+            breaker = self._breakers.get(adapter.base_url)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    failure_threshold=policy.breaker_failure_threshold,
+                    reset_timeout=policy.breaker_reset_timeout,
+                )
+                self._breakers[adapter.base_url] = breaker
+            return breaker
+
+    def circuit_states(self) -> dict[str, CircuitState]:
+        """엔드포인트별 현재 서킷 상태를 반환한다."""
+        with self._breakers_lock:
+            return {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
+
+    def invoke(
+        self,
+        adapters: Sequence[EngineAdapter],
+        call: AdapterCall,
+        policy: ModelResiliencePolicy,
+        *,
+        idempotent: bool,
+        model_id: str,
+        token: CancellationToken | None = None,
+    ) -> AdapterResponse:
+        """정책에 따라 레플리카 어댑터들에 호출을 수행한다.
+
+        Args:
+            adapters: 동일 모델을 서빙하는 어댑터 목록(첫 항목이 기본 엔드포인트).
+            call: 어댑터 하나를 받아 실제 요청을 수행하는 함수.
+            idempotent: 전송 후 실패도 재시도해도 되는 요청인지 여부.
+            model_id: 메트릭 라벨로 사용할 모델 ID.
+            token: 요청 데드라인/취소 토큰. 취소되면 재시도와 백오프 대기를 중단한다.
+        """
+        retry_idempotent = idempotent or policy.retry_non_idempotent
+        last: AdapterResponse | None = None
+
+        for attempt in range(policy.max_attempts):
+            if token is not None and token.cancelled:
+                return cancelled_response(token)
+            # 재시도마다 다음 레플리카부터 시도해 동일 엔드포인트 집중을 피한다.
+            offset = attempt % len(adapters)
+            ordered = [*adapters[offset:], *adapters[:offset]]
+            available = [adapter for adapter in ordered if self.breaker(adapter, policy).is_available()]
+            if self.health is not None and available:
+                healthy = [adapter for adapter in available if self.health.is_healthy(adapter)]
+                if not healthy:
+                    self.metrics.inc("engine_unhealthy_rejections_total", model=model_id)
+                    return AdapterResponse(
+                        ok=False,
+                        error="Unhealthy: 헬스 체크에서 모든 엔드포인트가 비정상으로 판정되어 요청을 거부했습니다.",
+                        error_kind="unhealthy",
+                    )
+                available = healthy
+            if not available:
+                self.metrics.inc("engine_circuit_rejections_total", model=model_id)
+                return AdapterResponse(
+                    ok=False,
+                    error="CircuitOpen: 모든 엔드포인트의 서킷이 열려 있어 요청을 거부했습니다.",
+                    error_kind="circuit_open",
+                )
+
+            if policy.hedge_enabled and len(available) > 1:
+                last = self._hedged_call(available[0], available[1], call, policy, model_id, token)
+            else:
+                last = self._tracked_call(available[0], call, policy, model_id, token)
+
+            if last.ok or not is_retryable(last, retry_idempotent) or attempt + 1 >= policy.max_attempts:
+                return last
+
+            self.metrics.inc("engine_retries_total", model=model_id, kind=last.error_kind or "unknown")
+            span = current_span()
+            if span is not None:
+                span.event(f"retry:{last.error_kind or 'unknown'}")
+            delay = self._backoff_delay(attempt, policy)
+            remaining = token.remaining() if token is not None else None
+            if remaining is not None:
+                if remaining <= delay:
+                    return last
+                delay = min(delay, remaining)
+            self._sleep(delay)
+
+        assert last is not None
+        return last
+
+    def _backoff_delay(self, attempt: int, policy: ModelResiliencePolicy) -> float:
+        """지수 백오프 상한 내에서 full jitter 대기 시간을 계산한다."""
+        ceiling = min(policy.backoff_max, policy.backoff_base * (2**attempt))
+        return ceiling * self._jitter()
+
+    def _tracked_call(
+        self,
+        adapter: EngineAdapter,
+        call: AdapterCall,
+        policy: ModelResiliencePolicy,
+        model_id: str,
+        token: CancellationToken | None,
+    ) -> AdapterResponse:
+        """단일 엔드포인트 호출 후 브레이커/지연/결과 메트릭을 기록한다."""
+        breaker = self.breaker(adapter, policy)
+        if not breaker.allow():
+            self.metrics.inc("engine_circuit_rejections_total", model=model_id)
+            return AdapterResponse(
+                ok=False,
+                error=f"CircuitOpen: {adapter.base_url} 서킷이 열려 있습니다.",
+                error_kind="circuit_open",
+            )
+        started = time.perf_counter()
+        with start_span("engine.attempt", endpoint=adapter.base_url) as span:
+            try:
+                response = call(adapter, token)
+            except Exception as exc:
+                response = AdapterResponse(ok=False, error=str(exc), error_kind="unknown")
+            span.set(outcome="ok" if response.ok else response.error_kind or "unknown")
+        elapsed = time.perf_counter() - started
+
+        if response.error_kind == "cancelled":
+            breaker.release()
+        elif is_engine_failure(response):
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        outcome = "ok" if response.ok else response.error_kind or "unknown"
+        self.metrics.inc("engine_requests_total", endpoint=adapter.base_url, outcome=outcome)
+        self.metrics.set_gauge("engine_circuit_state", _CIRCUIT_STATE_GAUGE[breaker.state], endpoint=adapter.base_url)
+        if response.ok:
+            self.metrics.observe("engine_request_seconds", elapsed, model=model_id)
+        return response
+
+    def _hedged_call(
+        self,
+        primary: EngineAdapter,
+        secondary: EngineAdapter,
+        call: AdapterCall,
+        policy: ModelResiliencePolicy,
+        model_id: str,
+        token: CancellationToken | None,
+    ) -> AdapterResponse:
+        """기본 엔드포인트 응답이 분위수 지연을 넘기면 다른 레플리카로 사본을 보낸다.
+
+        Notes:
+            각 사본은 별도 하위 토큰으로 실행되며, 먼저 성공한 쪽이 나오면
+            나머지 사본의 연결을 끊어 엔진이 중복 생성을 멈추도록 한다.
+        """
+        executor = self._get_executor()
+        delay = self._hedge_delay(policy, model_id)
+        tokens = {
+            "primary": token.child() if token is not None else CancellationToken(),
+            "hedge": token.child() if token is not None else CancellationToken(),
+        }
+        # 트레이스 컨텍스트가 헤지 스레드에서도 이어지도록 사본마다 컨텍스트를 복사해 실행한다.
+        first = executor.submit(
+            contextvars.copy_context().run, self._tracked_call, primary, call, policy, model_id, tokens["primary"]
+        )
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+
+        self.metrics.inc("engine_hedges_total", model=model_id)
+        second = executor.submit(
+            contextvars.copy_context().run, self._tracked_call, secondary, call, policy, model_id, tokens["hedge"]
+        )
+        pending: set[Future[AdapterResponse]] = {first, second}
+        failed: AdapterResponse | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                response = future.result()
+                if response.ok:
+                    winner, loser = ("hedge", "primary") if future is second else ("primary", "hedge")
+                    tokens[loser].cancel("hedge_lost")
+                    self.metrics.inc("engine_hedge_wins_total", model=model_id, winner=winner)
+                    return response
+                failed = failed or response
+        assert failed is not None
+        return failed
+
+    def _hedge_delay(self, policy: ModelResiliencePolicy, model_id: str) -> float:
+        """관측된 지연 분위수(표본 부족 시 최소 지연)로 헤지 대기 시간을 정한다."""
+        observed = self.metrics.quantile(
+            "engine_request_seconds",
+            policy.hedge_quantile,
+            min_samples=20,
+            model=model_id,
+        )
+        if observed is None:
+            return policy.hedge_min_delay
+        return max(policy.hedge_min_delay, observed)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """헤지 요청용 스레드 풀을 지연 생성한다."""
+        with self._breakers_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_hedge_workers,
+                    thread_name_prefix="engine-hedge",
+                )
+            return self._executor
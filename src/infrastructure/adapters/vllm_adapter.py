@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import json
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
 
-from .base import AdapterResponse, EngineAdapter
+from .base import AdapterResponse, EngineAdapter, StreamCut, StreamHandler, TokenUsage
+from .cancellation import CancellationToken
 
 
 class VllmAdapter(EngineAdapter):
@@ -16,40 +14,81 @@ class VllmAdapter(EngineAdapter):
         """어댑터 엔진 식별자 값을 반환한다."""
         return "vllm"
 
-    def _request(self, path: str, method: str = "GET", payload: dict[str, Any] | None = None) -> AdapterResponse:
+    def _request(
+        self,
+        path: str,
+        method: str = "GET",
+        payload: dict[str, Any] | None = None,
+        timeout: float = 10,
+        token: CancellationToken | None = None,
+        raw: bool = False,
+        stream: StreamHandler | None = None,
+    ) -> AdapterResponse:
         """vLLM API로 HTTP 요청을 보내고 표준 응답으로 변환한다."""
-        url = f"{self.base_url}{path}"
-        data = None
-        headers = {"Content-Type": "application/json"}
-
-        if payload is not None:
-            data = json.dumps(payload).encode("utf-8")
-
-        request = Request(url=url, data=data, headers=headers, method=method)
-
-        try:
-            with urlopen(request, timeout=10) as response:
-                body = response.read().decode("utf-8")
-                if body:
-                    return AdapterResponse(ok=True, payload=json.loads(body))
-                return AdapterResponse(ok=True, payload={})
-        except HTTPError as exc:
-            return AdapterResponse(ok=False, error=f"HTTPError {exc.code}: {exc.reason}")
-        except URLError as exc:
-            return AdapterResponse(ok=False, error=f"URLError: {exc.reason}")
-        except Exception as exc:
-            return AdapterResponse(ok=False, error=str(exc))
-
-    def health_check(self) -> AdapterResponse:
+        return self._http_request(
+            path,
+            method=method,
+            payload=payload,
+            timeout=timeout,
+            token=token,
+            raw=raw,
+            stream=stream,
+        )
+
+    def token_usage(self, payload: dict[str, Any] | None) -> TokenUsage:
+        """OpenAI 호환 `usage` 필드에서 토큰 사용량을 추출한다."""
+        usage = (payload or {}).get("usage") or {}
+        return TokenUsage(
+            prompt_tokens=usage.get("prompt_tokens"),
+            completion_tokens=usage.get("completion_tokens"),
+        )
+
+    def embedding_vectors(self, payload: dict[str, Any] | None) -> list[list[float]]:
+        """OpenAI 호환 `data[].embedding`을 `index` 순서로 정렬해 반환한다."""
+        data = sorted((payload or {}).get("data") or [], key=lambda item: item.get("index", 0))
+        return [item["embedding"] for item in data]
+
+    def generated_text(self, payload: dict[str, Any] | None) -> str:
+        """첫 번째 `choices` 항목의 `message.content`(없으면 `text`)를 반환한다."""
+        choices = (payload or {}).get("choices") or [{}]
+        choice = choices[0]
+        return str((choice.get("message") or {}).get("content") or choice.get("text") or "")
+
+    def mean_logprob(self, payload: dict[str, Any] | None) -> float | None:
+        """`logprobs=True` 요청 응답의 `choices[0].logprobs.content` 평균 로그 확률."""
+        choices = (payload or {}).get("choices") or [{}]
+        content = (choices[0].get("logprobs") or {}).get("content") or []
+        values = [item["logprob"] for item in content if item.get("logprob") is not None]
+        return sum(values) / len(values) if values else None
+
+    def early_stop_reason(self, payload: dict[str, Any] | None) -> str | None:
+        """스트리밍을 끊은 사유, 또는 요청한 중지 문자열에서 멈췄으면 `"stop"`(`choices[0].stop_reason`이 문자열)."""
+        reason = super().early_stop_reason(payload)
+        if reason is not None:
+            return reason
+        choices = (payload or {}).get("choices") or [{}]
+        return "stop" if isinstance(choices[0].get("stop_reason"), str) else None
+
+    def model_entries(self, payload: dict[str, Any] | None) -> list[dict[str, Any]]:
+        """`/v1/models` 응답의 `data`를 모델 이름(`id`)과 최대 문맥 길이로 정리한다."""
+        entries: list[dict[str, Any]] = []
+        for item in (payload or {}).get("data") or []:
+            entry = {"name": item.get("id")}
+            if item.get("max_model_len") is not None:
+                entry["max_model_len"] = item["max_model_len"]
+            entries.append(entry)
+        return entries
+
+    def health_check(self, timeout: float = 10) -> AdapterResponse:
         """vLLM 헬스 체크를 수행한다."""
-        response = self._request("/health")
+        response = self._request("/health", timeout=timeout)
         if response.ok and response.payload == {}:
             return AdapterResponse(ok=True, payload={"status": "ok"})
         return response
 
-    def list_models(self) -> AdapterResponse:
+    def list_models(self, timeout: float = 10) -> AdapterResponse:
         """vLLM의 OpenAI 호환 모델 목록을 조회한다."""
-        return self._request("/v1/models")
+        return self._request("/v1/models", timeout=timeout)
 
     def load_model(self, model_name: str, **kwargs: Any) -> AdapterResponse:
         """vLLM의 모델 로드 정책(프로세스 기동 시 지정)을 설명용 응답으로 반환한다."""
@@ -71,8 +110,33 @@ class VllmAdapter(EngineAdapter):
             },
         )
 
+    def embed(self, model_name: str, texts: list[str], **kwargs: Any) -> AdapterResponse:
+        """OpenAI 호환 `/v1/embeddings`로 여러 텍스트를 한 번에 임베딩한다."""
+        payload = {"model": model_name, "input": texts}
+        return self._request(
+            "/v1/embeddings",
+            method="POST",
+            payload=payload,
+            timeout=float(kwargs.get("timeout") or 60),
+            token=kwargs.get("cancel_token"),
+        )
+
     def generate(self, model_name: str, prompt: str, **kwargs: Any) -> AdapterResponse:
-        """OpenAI 호환 `/v1/chat/completions`로 채팅 추론을 실행한다."""
+        """OpenAI 호환 `/v1/chat/completions`로 채팅 추론을 실행한다.
+
+        Notes:
+            - 요청 `timeout`(기본 300초)을 그대로 사용하며, `cancel_token`이 취소되면
+              연결을 끊어 vLLM이 해당 요청을 abort하도록 한다.
+            - `raw_response=True`면 응답 바이트를 파싱 없이 `AdapterResponse.raw`로 전달한다.
+            - `on_text` 콜백을 주면 SSE 스트리밍(`stream=True`, 사용량 포함)으로 요청해 델타마다 콜백을
+              호출하고, 비스트리밍 `chat.completion`과 같은 모양의 payload로 조립해 반환한다.
+            - `logprobs=True`면 토큰별 로그 확률을 함께 요청한다(`mean_logprob`으로 평균 추출).
+            - `stop`(중지 문자열 목록)은 요청 `stop`으로 넘겨 vLLM이 직접 멈추게 한다. 중지 문자열에서 멈추면
+              응답 `choices[0].stop_reason`에 그 문자열이 남는다.
+            - `max_time`(생성 시간 예산, 초)이나 `stop_when`(조기 종료 검사)을 주면 스트리밍으로 요청하고,
+              조건에 걸리면 연결을 끊어 vLLM이 요청을 abort하게 한 뒤 받은 텍스트로 응답을 만든다.
+              이때 `finish_reason`은 끊은 사유, `usage.completion_tokens`는 받은 조각 수이고 `early_stop` 항목이 붙는다.
+        """
         payload = {
             "model": model_name,
             "messages": [{"role": "user", "content": prompt}],
@@ -80,4 +144,94 @@ class VllmAdapter(EngineAdapter):
             "top_p": kwargs.get("top_p"),
             "max_tokens": kwargs.get("max_tokens"),
         }
-        return self._request("/v1/chat/completions", method="POST", payload=payload)
+        if kwargs.get("logprobs"):
+            payload["logprobs"] = True
+        if kwargs.get("stop"):
+            payload["stop"] = list(kwargs["stop"])
+        cut = StreamCut(kwargs.get("on_text"), kwargs.get("max_time"), kwargs.get("stop_when"))
+        streamed = cut.on_text is not None or cut.deadline is not None or cut.stop_when is not None
+        if streamed and not kwargs.get("raw_response"):
+            return self._generate_stream(payload, float(kwargs.get("timeout") or 300), kwargs.get("cancel_token"), cut)
+        return self._request(
+            "/v1/chat/completions",
+            method="POST",
+            payload=payload,
+            timeout=float(kwargs.get("timeout") or 300),
+            token=kwargs.get("cancel_token"),
+            raw=bool(kwargs.get("raw_response")),
+        )
+
+    def _generate_stream(
+        self,
+        payload: dict[str, Any],
+        timeout: float,
+        token: CancellationToken | None,
+        cut: StreamCut,
+    ) -> AdapterResponse:
+        """SSE 스트리밍으로 생성하며 델타를 `cut`에 모으고, 결과를 `chat.completion` 모양으로 조립한다.
+
+        Notes:
+            - `logprobs`를 요청했으면 델타마다 오는 `choices[].logprobs.content`를 이어 붙여 조립한 choice에 넣는다.
+            - 생성 중 오류 이벤트(`error` 항목 또는 `object: "error"`)를 받거나, `cut`이 끊지 않았는데
+              `finish_reason` 없이 스트림이 끝나면 받은 일부 텍스트를 성공으로 돌려주지 않고 실패 응답을 반환한다.
+        """
+        result: dict[str, Any] = {"object": "chat.completion"}
+        finish_reason: str | None = None
+        stop_reason: Any = None
+        logprobs: list[dict[str, Any]] = []
+        error: Any = None
+
+        def handle(chunk: dict[str, Any]) -> bool:
+            nonlocal finish_reason, stop_reason, error
+            if "error" in chunk or chunk.get("object") == "error":
+                error = chunk.get("error") or chunk.get("message") or chunk
+                return True
+            result.setdefault("id", chunk.get("id"))
+            result.setdefault("model", chunk.get("model"))
+            result.setdefault("created", chunk.get("created"))
+            if chunk.get("usage"):
+                result["usage"] = chunk["usage"]
+            for choice in chunk.get("choices") or ():
+                finish_reason = choice.get("finish_reason") or finish_reason
+                stop_reason = choice.get("stop_reason") or stop_reason
+                logprobs.extend((choice.get("logprobs") or {}).get("content") or ())
+                if cut.add((choice.get("delta") or {}).get("content") or "", last=finish_reason is not None):
+                    return True
+            return False
+
+        response = self._request(
+            "/v1/chat/completions",
+            method="POST",
+            payload={**payload, "stream": True, "stream_options": {"include_usage": True}},
+            timeout=timeout,
+            token=token,
+            stream=handle,
+        )
+        if not response.ok:
+            return response
+        if error is not None:
+            message = error.get("message", error) if isinstance(error, dict) else error
+            return AdapterResponse(ok=False, error=str(message), error_kind="http", status_code=response.status_code)
+        if finish_reason is None and cut.reason is None:
+            return AdapterResponse(
+                ok=False,
+                error=f"IncompleteStream: finish_reason 없이 스트림이 끝났습니다({cut.tokens}개 조각 수신).",
+                error_kind="reset",
+                status_code=response.status_code,
+            )
+        choice: dict[str, Any] = {
+            "index": 0,
+            "message": {"role": "assistant", "content": cut.text},
+            "finish_reason": finish_reason,
+        }
+        if stop_reason is not None:
+            choice["stop_reason"] = stop_reason
+        if payload.get("logprobs"):
+            choice["logprobs"] = {"content": logprobs}
+        if cut.reason is not None:
+            choice["finish_reason"] = cut.reason
+            result.setdefault("usage", {"prompt_tokens": None, "completion_tokens": cut.tokens})
+            result["early_stop"] = cut.summary()
+        result["choices"] = [choice]
+        response.payload = result
+        return response
@@ -0,0 +1,15 @@
+"""서버 측 캐시 계층 공개 심볼을 모아 제공한다."""
+
+from .context_store import OllamaContextStore
+from .embedders import Embedder, HashEmbedder, OllamaEmbedder
+from .semantic_cache import SemanticCache, SemanticCacheHit, VectorIndex
+
+__all__ = [
+    "Embedder",
+    "HashEmbedder",
+    "OllamaContextStore",
+    "OllamaEmbedder",
+    "SemanticCache",
+    "SemanticCacheHit",
+    "VectorIndex",
+]
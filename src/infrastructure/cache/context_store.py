@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import secrets
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class _ContextEntry:
+    """세션 하나의 컨텍스트 토큰 배열과 소속 모델."""
+
+    model_name: str
+    tokens: array
+
+    @property
+    def nbytes(self) -> int:
+        return self.tokens.itemsize * len(self.tokens)
+
+
+class OllamaContextStore:
+    """Ollama `/api/generate`의 `context` 배열을 세션 핸들 단위로 보관하는 LRU 저장소.
+
+    Notes:
+        - 토큰 ID는 `array('I')`(uint32)로 저장해 파이썬 int 리스트 대비 메모리를 크게 줄인다.
+        - `max_sessions` 또는 `max_bytes`를 넘으면 가장 오래 사용되지 않은 세션부터 제거한다.
+        - 다른 모델의 컨텍스트는 재사용하지 않도록 모델 이름을 함께 검사한다.
+    """
+
+    def __init__(self, max_sessions: int = 1024, max_bytes: int = 256 * 1024 * 1024) -> None:
+        """세션 수/총 바이트 상한으로 저장소를 초기화한다."""
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _ContextEntry] = OrderedDict()
+        self._bytes = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_session_id() -> str:
+        """추측하기 어려운 세션 핸들을 생성한다."""
+        return secrets.token_urlsafe(16)
+
+    def get(self, session_id: str, model_name: str) -> array | None:
+        """세션 컨텍스트를 조회하고 최근 사용으로 표시한다(모델이 다르면 `None`)."""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry.model_name != model_name:
+                return None
+            self._entries.move_to_end(session_id)
+            return entry.tokens
+
+    def put(self, session_id: str, model_name: str, context: Sequence[int]) -> None:
+        """세션 컨텍스트를 저장(갱신)하고 상한을 넘으면 LRU 순으로 제거한다."""
+        entry = _ContextEntry(model_name=model_name, tokens=array("I", context))
+        with self._lock:
+            previous = self._entries.pop(session_id, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            if entry.nbytes > self.max_bytes:
+                return
+            self._entries[session_id] = entry
+            self._bytes += entry.nbytes
+            while len(self._entries) > self.max_sessions or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self._evictions += 1
+
+    def discard(self, session_id: str) -> None:
+        """세션을 삭제한다."""
+        with self._lock:
+            entry = self._entries.pop(session_id, None)
+            if entry is not None:
+                self._bytes -= entry.nbytes
+
+    def stats(self) -> dict[str, Any]:
+        """저장소 사용량 통계를 반환한다."""
+        with self._lock:
+            return {
+                "sessions": len(self._entries),
+                "bytes": self._bytes,
+                "max_sessions": self.max_sessions,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+            }
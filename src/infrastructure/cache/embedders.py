@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections.abc import Sequence
+from typing import Protocol
+
+from ..adapters import OllamaAdapter
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+
+class Embedder(Protocol):
+    """의미 캐시가 사용하는 텍스트 임베더 인터페이스."""
+
+    def embed(self, text: str) -> Sequence[float] | None:
+        """텍스트 임베딩 벡터를 반환한다(실패 시 `None`)."""
+        ...
+
+
+class HashEmbedder:
+    """문자 n-gram/단어 특징을 해싱해 고정 차원 벡터를 만드는 결정적 로컬 임베더.
+
+    Notes:
+        - 대소문자, 문장부호, 공백 차이를 정규화하므로 이런 근사 중복 프롬프트는 유사도 1.0에 가깝다.
+        - 외부 모델 없이 프로세스/실행 간 같은 입력에 항상 같은 벡터를 돌려주므로 테스트용 대역으로도 쓴다.
+    """
+
+    def __init__(self, dimension: int = 256, ngram: int = 3) -> None:
+        """벡터 차원과 문자 n-gram 길이를 설정한다."""
+        self.dimension = dimension
+        self.ngram = ngram
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """대소문자/문장부호/연속 공백을 정규화한다."""
+        return _SPACES.sub(" ", _NON_WORD.sub(" ", text.casefold())).strip()
+
+    def embed(self, text: str) -> list[float]:
+        """정규화한 텍스트의 특징을 부호 있는 해시 버킷에 누적한다."""
+        normalized = self.normalize(text)
+        padded = f" {normalized} "
+        features = [padded[i : i + self.ngram] for i in range(max(1, len(padded) - self.ngram + 1))]
+        features.extend(f"w:{word}" for word in normalized.split(" ") if word)
+
+        vector = [0.0] * self.dimension
+        for feature in features:
+            digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+            vector[digest % self.dimension] += 1.0 if digest >> 63 else -1.0
+        return vector
+
+
+class OllamaEmbedder:
+    """Ollama `/api/embeddings`로 프롬프트 임베딩을 조회하는 임베더."""
+
+    def __init__(self, adapter: OllamaAdapter, model_name: str, timeout: float = 10) -> None:
+        """임베딩 호출에 사용할 어댑터와 모델 이름을 설정한다."""
+        self.adapter = adapter
+        self.model_name = model_name
+        self.timeout = timeout
+
+    def embed(self, text: str) -> list[float] | None:
+        """임베딩을 조회한다. 엔진 호출이 실패하면 `None`을 반환한다."""
+        response = self.adapter.embeddings(self.model_name, text, timeout=self.timeout)
+        if not response.ok or not response.payload:
+            return None
+        return response.payload.get("embedding") or None
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from ..config import ConfigValidationError, SemanticCacheConfig
+from ..observability import MetricsRegistry
+from .embedders import Embedder
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - 선택 의존성
+    np = None
+
+
+@dataclass(slots=True)
+class SemanticCacheHit:
+    """의미 캐시 조회 적중 결과."""
+
+    payload: dict[str, Any]
+    similarity: float
+
+
+class VectorIndex:
+    """고정 용량 float32 행렬과 랜덤 초평면 LSH 버킷으로 구성된 근사 최근접 인덱스.
+
+    Notes:
+        - 벡터는 정규화된 상태로 연속된 `(rows, dimension)` float32 행렬에 저장한다. 행렬은 필요할 때
+          두 배씩 `capacity`까지 늘리고, 용량을 넘으면 가장 오래된 슬롯부터 덮어쓴다(링 버퍼).
+        - 항목 수가 `exact_search_below` 미만이면 전체 행렬과 한 번의 행렬곱으로 전수 탐색한다.
+        - 그 이상이면 `lsh_tables`개 해시 테이블 각각에서 질의 서명과 해밍 거리 1 이내 버킷(multi-probe)의
+          후보를 모아 코사인 유사도로 재정렬한다.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        capacity: int,
+        lsh_bits: int,
+        exact_search_below: int,
+        lsh_tables: int = 4,
+        seed: int = 0,
+    ) -> None:
+        """빈 인덱스를 만든다. 초평면은 `seed`로 결정적으로 생성한다."""
+        rng = np.random.default_rng(seed)
+        self.dimension = dimension
+        self.capacity = capacity
+        self.exact_search_below = exact_search_below
+        initial_rows = min(capacity, 256)
+        self._vectors = np.zeros((initial_rows, dimension), dtype=np.float32)
+        self._planes = rng.standard_normal((lsh_tables * lsh_bits, dimension)).astype(np.float32)
+        self._bit_weights = np.left_shift(1, np.arange(lsh_bits, dtype=np.int64))
+        self._tables = lsh_tables
+        self._bits = lsh_bits
+        self._signatures = np.zeros((initial_rows, lsh_tables), dtype=np.int64)
+        self._buckets: list[dict[int, list[int]]] = [{} for _ in range(lsh_tables)]
+        self._keys: list[str | None] = [None] * capacity
+        self._payloads: list[dict[str, Any] | None] = [None] * capacity
+        self._size = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """벡터 행렬과 서명 배열이 차지하는 바이트 수."""
+        return self._vectors.nbytes + self._signatures.nbytes
+
+    def _signatures_of(self, vector: Any) -> Any:
+        """테이블별 서명(`lsh_tables`개 정수)을 한 번의 행렬곱으로 계산한다."""
+        bits = (self._planes @ vector > 0).reshape(self._tables, self._bits)
+        return bits @ self._bit_weights
+
+    def _grow(self) -> None:
+        """행렬/서명 배열 행 수를 두 배(최대 `capacity`)로 늘린다."""
+        rows = min(self.capacity, len(self._vectors) * 2)
+        vectors = np.zeros((rows, self.dimension), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        signatures = np.zeros((rows, self._tables), dtype=np.int64)
+        signatures[: self._size] = self._signatures[: self._size]
+        self._vectors, self._signatures = vectors, signatures
+
+    def add(self, vector: Any, key: str, payload: dict[str, Any]) -> None:
+        """정규화된 벡터와 응답을 다음 슬롯에 저장한다."""
+        slot = self._next
+        if slot == len(self._vectors):
+            self._grow()
+        if self._size == self.capacity:
+            for table, signature in enumerate(self._signatures[slot]):
+                self._buckets[table][int(signature)].remove(slot)
+        signatures = self._signatures_of(vector)
+        self._vectors[slot] = vector
+        self._signatures[slot] = signatures
+        for table, signature in enumerate(signatures):
+            self._buckets[table].setdefault(int(signature), []).append(slot)
+        self._keys[slot] = key
+        self._payloads[slot] = payload
+        self._next = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _candidates(self, vector: Any) -> Any:
+        if self._size < self.exact_search_below:
+            return np.arange(self._size)
+        slots: set[int] = set()
+        for table, signature in enumerate(self._signatures_of(vector)):
+            buckets = self._buckets[table]
+            signature = int(signature)
+            for probe in (signature, *(signature ^ int(weight) for weight in self._bit_weights)):
+                slots.update(buckets.get(probe, ()))
+        return np.fromiter(slots, dtype=np.int64, count=len(slots))
+
+    def search(self, vector: Any, key: str) -> tuple[dict[str, Any], float] | None:
+        """같은 `key`를 가진 항목 중 코사인 유사도가 가장 높은 항목을 반환한다."""
+        candidates = self._candidates(vector)
+        if candidates.size == 0:
+            return None
+        similarities = self._vectors[candidates] @ vector
+        for position in np.argsort(-similarities):
+            slot = int(candidates[position])
+            if self._keys[slot] == key:
+                payload = self._payloads[slot]
+                assert payload is not None
+                return payload, float(similarities[position])
+        return None
+
+
+class SemanticCache:
+    """프롬프트 임베딩 유사도로 이전 추론 응답을 재사용하는 모델별 의미 캐시.
+
+    Rules:
+        - 모델마다 별도 인덱스를 두고, 생성 옵션 키(`key`)가 같은 항목만 적중 후보로 본다.
+        - 최고 유사도가 `threshold` 이상이면 적중으로 보고 저장된 응답을 반환한다.
+        - 임베딩에 실패하면 캐시를 건너뛴다(미적중으로 처리하고 저장하지 않는다).
+
+    Notes:
+        NumPy가 필요하다. 캐시는 워커 프로세스마다 따로 유지된다.
+    """
+
+    def __init__(self, config: SemanticCacheConfig, embedder: Embedder, metrics: MetricsRegistry) -> None:
+        """캐시 설정과 임베더로 초기화한다."""
+        if np is None:
+            raise ConfigValidationError("runtime.semantic_cache를 사용하려면 numpy가 필요합니다.")
+        self.config = config
+        self.embedder = embedder
+        self.metrics = metrics
+        self._indexes: dict[str, VectorIndex] = {}
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def _embed(self, model_id: str, prompt: str) -> Any | None:
+        """프롬프트를 정규화된 float32 벡터로 임베딩한다(실패하거나 영벡터면 `None`)."""
+        raw = self.embedder.embed(prompt)
+        if raw is None:
+            self.metrics.inc("semantic_cache_errors_total", model=model_id)
+            return None
+        vector = np.asarray(raw, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def lookup(self, model_id: str, key: str, prompt: str) -> tuple[SemanticCacheHit | None, Any | None]:
+        """프롬프트와 유사한 캐시 응답을 찾는다.
+
+        Returns:
+            `(적중 결과 또는 None, 질의 벡터)`. 미적중 시 질의 벡터를 `store`에 다시 넘겨 재임베딩을 피한다.
+        """
+        started = time.perf_counter()
+        vector = self._embed(model_id, prompt)
+        match = None
+        if vector is not None:
+            with self._lock:
+                index = self._indexes.get(model_id)
+                if index is not None and index.dimension == vector.shape[0]:
+                    match = index.search(vector, key)
+
+        hit = match is not None and match[1] >= self.config.threshold
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+        self.metrics.observe("semantic_cache_lookup_seconds", time.perf_counter() - started, model=model_id)
+        self.metrics.inc("semantic_cache_lookups_total", model=model_id, hit=hit)
+        if not hit:
+            return None, vector
+        assert match is not None
+        payload, similarity = match
+        self.metrics.observe("semantic_cache_hit_similarity", similarity, model=model_id)
+        return SemanticCacheHit(payload=dict(payload), similarity=similarity), vector
+
+    def store(self, model_id: str, key: str, vector: Any, payload: dict[str, Any]) -> None:
+        """`lookup`에서 받은 질의 벡터로 응답을 저장한다."""
+        with self._lock:
+            index = self._indexes.get(model_id)
+            if index is None or index.dimension != vector.shape[0]:
+                index = VectorIndex(
+                    dimension=vector.shape[0],
+                    capacity=self.config.max_entries,
+                    lsh_bits=self.config.lsh_bits,
+                    lsh_tables=self.config.lsh_tables,
+                    exact_search_below=self.config.exact_search_below,
+                )
+                self._indexes[model_id] = index
+            index.add(vector, key, dict(payload))
+            entries = len(index)
+        self.metrics.set_gauge("semantic_cache_entries", entries, model=model_id)
+
+    def stats(self) -> dict[str, Any]:
+        """적중률과 인덱스 크기 통계를 반환한다."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else None,
+                "entries": {model_id: len(index) for model_id, index in self._indexes.items()},
+                "bytes": sum(index.nbytes for index in self._indexes.values()),
+            }
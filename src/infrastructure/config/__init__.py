@@ -3,25 +3,69 @@
 from .exceptions import ConfigError, ConfigFileNotFoundError, ConfigValidationError
 from .settings import (
     AppSettings,
+    AutoscaleConfig,
+    CaptureConfig,
+    CascadeAcceptance,
+    CascadeConfig,
+    ContextStoreConfig,
+    DiscoveryConfig,
     EndpointConfig,
     EngineType,
+    FleetConfig,
+    FleetNodeConfig,
+    HealthCheckConfig,
+    JobsConfig,
+    ModelAutoscalePolicy,
+    ModelConcurrencyPolicy,
     ModelConfig,
+    ModelDispatchPolicy,
     ModelParameters,
+    ModelResiliencePolicy,
     ModelResourcePolicy,
+    OllamaServerConfig,
+    PrewarmConfig,
+    ProfilingConfig,
+    PromptRoutingConfig,
     RuntimeConfig,
+    SemanticCacheConfig,
+    TenancyConfig,
+    TenantConfig,
+    TracingConfig,
 )
 from .yaml_loader import load_settings
 
 __all__ = [
     "AppSettings",
+    "AutoscaleConfig",
+    "CaptureConfig",
+    "CascadeAcceptance",
+    "CascadeConfig",
     "ConfigError",
     "ConfigFileNotFoundError",
     "ConfigValidationError",
+    "ContextStoreConfig",
+    "DiscoveryConfig",
     "EndpointConfig",
     "EngineType",
+    "FleetConfig",
+    "FleetNodeConfig",
+    "HealthCheckConfig",
+    "JobsConfig",
+    "ModelAutoscalePolicy",
+    "ModelConcurrencyPolicy",
     "ModelConfig",
+    "ModelDispatchPolicy",
     "ModelParameters",
+    "ModelResiliencePolicy",
     "ModelResourcePolicy",
+    "OllamaServerConfig",
+    "PrewarmConfig",
+    "ProfilingConfig",
+    "PromptRoutingConfig",
     "RuntimeConfig",
+    "SemanticCacheConfig",
+    "TenancyConfig",
+    "TenantConfig",
+    "TracingConfig",
     "load_settings",
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -11,10 +12,618 @@ EngineType = Literal["ollama", "vllm"]
 
 @dataclass(slots=True)
 class EndpointConfig:
-    """엔진별 API 엔드포인트 정보."""
+    """엔진별 API 엔드포인트 정보.
+
+    Notes:
+        `replicas`는 동일 모델을 서빙하는 추가 엔드포인트 목록으로,
+        재시도 시 대체 대상이나 헤지 요청 대상으로 사용된다.
+    """
 
     host: str
     port: int
+    replicas: list["EndpointConfig"] = field(default_factory=list)
+
+    def all_endpoints(self) -> list["EndpointConfig"]:
+        """기본 엔드포인트를 포함한 전체 레플리카 목록을 반환한다."""
+        return [self, *self.replicas]
+
+
+@dataclass(slots=True)
+class ContextStoreConfig:
+    """Ollama 세션 컨텍스트 저장소 상한 설정."""
+
+    max_sessions: int = 1024
+    max_bytes: int = 256 * 1024 * 1024
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "ContextStoreConfig":
+        """dict 입력을 `ContextStoreConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            max_sessions=int(data.get("max_sessions", defaults.max_sessions)),
+            max_bytes=int(data.get("max_bytes", defaults.max_bytes)),
+        )
+        if config.max_sessions < 1 or config.max_bytes < 1:
+            raise ConfigValidationError("context_store 상한 값은 1 이상이어야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class SemanticCacheConfig:
+    """프롬프트 임베딩 기반 의미 유사도 응답 캐시 설정.
+
+    Attributes:
+        embedder: `ollama`(`/api/embeddings` 호출) 또는 `hash`(결정적 로컬 n-gram 해시 임베더).
+        embedding_model: `ollama` 임베더가 사용할 Ollama 모델 이름.
+        threshold: 캐시 응답을 반환할 최소 코사인 유사도.
+        max_entries: 모델별 인덱스 최대 항목 수(초과 시 오래된 항목부터 덮어쓴다).
+        hash_dimension: `hash` 임베더 벡터 차원.
+        lsh_bits / lsh_tables: 근사 최근접 탐색용 랜덤 초평면 서명 비트 수와 해시 테이블 수.
+        exact_search_below: 항목 수가 이보다 적으면 전수 탐색한다.
+    """
+
+    enabled: bool = False
+    embedder: Literal["ollama", "hash"] = "hash"
+    embedding_model: str | None = None
+    threshold: float = 0.95
+    max_entries: int = 10_000
+    hash_dimension: int = 256
+    lsh_bits: int = 12
+    lsh_tables: int = 4
+    exact_search_below: int = 2048
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "SemanticCacheConfig":
+        """dict 입력을 `SemanticCacheConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            embedder=data.get("embedder", defaults.embedder),
+            embedding_model=data.get("embedding_model"),
+            threshold=float(data.get("threshold", defaults.threshold)),
+            max_entries=int(data.get("max_entries", defaults.max_entries)),
+            hash_dimension=int(data.get("hash_dimension", defaults.hash_dimension)),
+            lsh_bits=int(data.get("lsh_bits", defaults.lsh_bits)),
+            lsh_tables=int(data.get("lsh_tables", defaults.lsh_tables)),
+            exact_search_below=int(data.get("exact_search_below", defaults.exact_search_below)),
+        )
+        if config.embedder not in ("ollama", "hash"):
+            raise ConfigValidationError(f"semantic_cache.embedder 값이 유효하지 않습니다: {config.embedder}")
+        if config.embedder == "ollama" and not config.embedding_model:
+            raise ConfigValidationError("semantic_cache.embedder가 ollama이면 embedding_model이 필요합니다.")
+        if not 0.0 < config.threshold <= 1.0:
+            raise ConfigValidationError("semantic_cache.threshold는 0보다 크고 1 이하여야 합니다.")
+        if config.max_entries < 1 or config.hash_dimension < 8:
+            raise ConfigValidationError("semantic_cache.max_entries/hash_dimension 값이 유효하지 않습니다.")
+        if config.lsh_tables < 1 or not 1 <= config.lsh_bits <= 30:
+            raise ConfigValidationError("semantic_cache.lsh_tables/lsh_bits 값이 유효하지 않습니다.")
+        return config
+
+
+@dataclass(slots=True)
+class TracingConfig:
+    """요청 단위 span 트레이싱 설정.
+
+    Attributes:
+        sample_rate: 트레이스를 남길 요청 비율(0.0~1.0). `traceparent` 헤더의 sampled 플래그는 항상 존중한다.
+        buffer_size: `/debug/traces`로 조회할 최근 트레이스 보관 개수.
+        export_path: 지정하면 완료된 트레이스를 OTLP/JSON Lines로 이 파일에 추가한다.
+    """
+
+    sample_rate: float = 0.0
+    buffer_size: int = 256
+    export_path: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "TracingConfig":
+        """dict 입력을 `TracingConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            sample_rate=float(data.get("sample_rate", defaults.sample_rate)),
+            buffer_size=int(data.get("buffer_size", defaults.buffer_size)),
+            export_path=data.get("export_path"),
+        )
+        if not 0.0 <= config.sample_rate <= 1.0:
+            raise ConfigValidationError("tracing.sample_rate는 0 이상 1 이하여야 합니다.")
+        if config.buffer_size < 1:
+            raise ConfigValidationError("tracing.buffer_size는 1 이상이어야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class CaptureConfig:
+    """`/inference` 트래픽 캡처(재생 벤치마크용) 설정.
+
+    Attributes:
+        enabled: `true`면 샘플링된 `/inference` 요청을 캡처 로그에 추가한다.
+        dir: 캡처 파일 디렉터리. 프로세스마다 `capture-<pid>.jsonl`에 기록한다.
+        sample_rate: 캡처할 요청 비율(0.0~1.0).
+        prompts: `full`이면 프롬프트 원문을, `hash`면 해시와 길이만 남긴다.
+        max_bytes: 현재 파일이 이 크기를 넘으면 시각을 붙인 이름으로 넘기고 새 파일을 연다.
+        max_files: 프로세스별로 보관할 넘긴 파일 수(오래된 것부터 삭제).
+    """
+
+    enabled: bool = False
+    dir: str = "data/capture"
+    sample_rate: float = 1.0
+    prompts: Literal["full", "hash"] = "full"
+    max_bytes: int = 64 * 1024 * 1024
+    max_files: int = 10
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "CaptureConfig":
+        """dict 입력을 `CaptureConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            dir=str(data.get("dir", defaults.dir)),
+            sample_rate=float(data.get("sample_rate", defaults.sample_rate)),
+            prompts=data.get("prompts", defaults.prompts),
+            max_bytes=int(data.get("max_bytes", defaults.max_bytes)),
+            max_files=int(data.get("max_files", defaults.max_files)),
+        )
+        if not 0.0 <= config.sample_rate <= 1.0:
+            raise ConfigValidationError("capture.sample_rate는 0 이상 1 이하여야 합니다.")
+        if config.prompts not in ("full", "hash"):
+            raise ConfigValidationError(f"capture.prompts 값이 유효하지 않습니다: {config.prompts}")
+        if config.max_bytes < 1024 or config.max_files < 1:
+            raise ConfigValidationError("capture.max_bytes는 1024 이상, max_files는 1 이상이어야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class FleetNodeConfig:
+    """플릿 컨트롤러가 관리하는 노드 에이전트 하나.
+
+    Attributes:
+        name: 노드 이름(상태/이벤트 표시용, 중복 불가).
+        host / port: 노드 에이전트(`python -m src.main agent`) 주소. 엔진 엔드포인트도 이 호스트로 접근한다.
+        engines: 이 노드에서 띄울 수 있는 엔진. `ollama`는 재배치 시 항상 실행 상태로 맞춘다.
+    """
+
+    name: str
+    host: str
+    port: int = 19090
+    engines: list[EngineType] = field(default_factory=lambda: ["ollama", "vllm"])
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FleetNodeConfig":
+        """dict 입력을 `FleetNodeConfig` 객체로 변환한다."""
+        if not data.get("name") or not data.get("host"):
+            raise ConfigValidationError("fleet.nodes 항목에는 name과 host가 필요합니다.")
+        engines = list(data.get("engines") or ["ollama", "vllm"])
+        for engine in engines:
+            if engine not in ("ollama", "vllm"):
+                raise ConfigValidationError(f"fleet.nodes[{data['name']}] 지원하지 않는 엔진: {engine}")
+        return cls(name=str(data["name"]), host=str(data["host"]), port=int(data.get("port", 19090)), engines=engines)
+
+
+@dataclass(slots=True)
+class FleetConfig:
+    """여러 호스트의 노드 에이전트를 묶어 엔진 풀로 쓰는 플릿 컨트롤러 설정.
+
+    Attributes:
+        enabled: `true`면 API 서버가 노드 에이전트를 주기적으로 조회해 정상 엔진을 라우팅 풀에 합친다.
+        nodes: 노드 에이전트 목록.
+        placements: vLLM 모델 ID별로 모델을 띄울 노드 수(노드 하나는 vLLM 모델 하나를 서빙한다).
+        auto_rebalance: `true`면 조회할 때마다 `placements`와 노드 `engines`에 맞게 엔진을 띄우거나 옮긴다.
+        poll_interval: 노드 조회 간격(초).
+        timeout: 에이전트 요청 1건의 제한 시간(초).
+        restart_backoff: 기동에 실패한 엔진을 자동 재배치에서 다시 시도하기까지 기다리는 시간(초).
+        token: 에이전트 요청에 붙일 Bearer 토큰(에이전트 `--token`과 같아야 한다).
+        history_size: 보관할 최근 재배치 이벤트 수.
+    """
+
+    enabled: bool = False
+    nodes: list[FleetNodeConfig] = field(default_factory=list)
+    placements: dict[str, int] = field(default_factory=dict)
+    auto_rebalance: bool = False
+    poll_interval: float = 5.0
+    timeout: float = 5.0
+    restart_backoff: float = 60.0
+    token: str | None = None
+    history_size: int = 256
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "FleetConfig":
+        """dict 입력을 `FleetConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            nodes=[FleetNodeConfig.from_dict(item) for item in data.get("nodes") or []],
+            placements={str(model_id): int(count) for model_id, count in (data.get("placements") or {}).items()},
+            auto_rebalance=bool(data.get("auto_rebalance", defaults.auto_rebalance)),
+            poll_interval=float(data.get("poll_interval", defaults.poll_interval)),
+            timeout=float(data.get("timeout", defaults.timeout)),
+            restart_backoff=float(data.get("restart_backoff", defaults.restart_backoff)),
+            token=data.get("token", defaults.token),
+            history_size=int(data.get("history_size", defaults.history_size)),
+        )
+        names = [node.name for node in config.nodes]
+        if len(names) != len(set(names)):
+            raise ConfigValidationError("fleet.nodes 이름이 중복되었습니다.")
+        if config.poll_interval <= 0 or config.timeout <= 0 or config.restart_backoff < 0:
+            raise ConfigValidationError("fleet.poll_interval, timeout은 0보다 크고 restart_backoff는 0 이상이어야 합니다.")
+        if any(count < 0 for count in config.placements.values()) or config.history_size < 1:
+            raise ConfigValidationError("fleet.placements 값은 0 이상, history_size는 1 이상이어야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class AutoscaleConfig:
+    """대기열 깊이/지연에 따라 로컬 엔진 레플리카를 늘리고 줄이는 오토스케일러 공통 설정.
+
+    Attributes:
+        enabled: `true`면 API 서버(단일 워커)가 모델 `autoscale` 정책에 따라 레플리카 프로세스를 띄우고 내린다.
+        interval: 판단 주기(초).
+        port_start / port_end: 추가 레플리카에 배정할 포트 범위(양 끝 포함). 이미 열린 포트는 건너뛴다.
+        max_replicas: 모든 모델을 합친 추가 레플리카 상한.
+        gpu_memory_budget: 추가 레플리카가 차지할 수 있는 GPU 메모리 합계(GPU 1장 = 1.0). `None`이면 제한하지 않는다.
+        drain_timeout: 축소할 레플리카를 라우팅에서 뺀 뒤 진행 중 요청이 끝나길 기다리는 최대 시간(초).
+        startup_timeout: 레플리카가 헬스 요청에 응답할 때까지 기다리는 최대 시간(초).
+        simulate: `true`면 실제 엔진 대신 가짜 엔진 서버를 띄운다(정책 시험용).
+        history_size: 보관할 최근 스케일링 이벤트 수.
+    """
+
+    enabled: bool = False
+    interval: float = 5.0
+    port_start: int = 29000
+    port_end: int = 29099
+    max_replicas: int = 4
+    gpu_memory_budget: float | None = None
+    drain_timeout: float = 30.0
+    startup_timeout: float = 900.0
+    simulate: bool = False
+    history_size: int = 256
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "AutoscaleConfig":
+        """dict 입력을 `AutoscaleConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        budget = data.get("gpu_memory_budget")
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            interval=float(data.get("interval", defaults.interval)),
+            port_start=int(data.get("port_start", defaults.port_start)),
+            port_end=int(data.get("port_end", defaults.port_end)),
+            max_replicas=int(data.get("max_replicas", defaults.max_replicas)),
+            gpu_memory_budget=float(budget) if budget is not None else None,
+            drain_timeout=float(data.get("drain_timeout", defaults.drain_timeout)),
+            startup_timeout=float(data.get("startup_timeout", defaults.startup_timeout)),
+            simulate=bool(data.get("simulate", defaults.simulate)),
+            history_size=int(data.get("history_size", defaults.history_size)),
+        )
+        if not 0 < config.port_start <= config.port_end < 65536:
+            raise ConfigValidationError("autoscale.port_start~port_end는 1~65535 사이의 올바른 범위여야 합니다.")
+        if config.interval <= 0 or config.drain_timeout < 0 or config.startup_timeout <= 0:
+            raise ConfigValidationError("autoscale.interval, startup_timeout은 0보다 크고 drain_timeout은 0 이상이어야 합니다.")
+        if config.max_replicas < 0 or (config.gpu_memory_budget is not None and config.gpu_memory_budget < 0):
+            raise ConfigValidationError("autoscale.max_replicas와 gpu_memory_budget은 0 이상이어야 합니다.")
+        if config.history_size < 1:
+            raise ConfigValidationError("autoscale.history_size는 1 이상이어야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class PrewarmConfig:
+    """엔진 기동 전에 모델 가중치 파일을 OS 페이지 캐시에 미리 읽어 두는 프리웜 설정.
+
+    Attributes:
+        enabled: `true`면 vLLM 기동 직전(`ProcessManager`)과 노드 에이전트의 모델 교체 시 이전 모델을 내리기 전에
+            새 모델의 가중치 파일을 읽는다. `cli prewarm`은 이 값과 관계없이 동작한다.
+        concurrency: 동시에 읽는 구간 수(I/O 동시성).
+        max_bytes: 한 번에 디스크에서 읽을 최대 바이트 수(이미 캐시에 있는 부분은 세지 않는다). `None`이면 제한 없음.
+        segment_bytes: 파일을 나눠 병렬로 읽는 구간 크기. 구간 안에서는 순차로 읽는다.
+        chunk_bytes: 한 번의 읽기 호출 크기.
+        hf_cache_dir: vLLM 모델 가중치를 찾을 Hugging Face 허브 캐시 경로(기본: `HF_HUB_CACHE`/`HF_HOME` 환경 변수
+            또는 `~/.cache/huggingface/hub`).
+        ollama_models_dir: Ollama 모델 저장소 경로(기본: `OLLAMA_MODELS` 또는 `~/.ollama/models`).
+        paths: 모델 ID별로 가중치 파일/디렉터리를 직접 지정한다(자동 탐색보다 우선).
+    """
+
+    enabled: bool = False
+    concurrency: int = 4
+    max_bytes: int | None = None
+    segment_bytes: int = 256 * 1024 * 1024
+    chunk_bytes: int = 8 * 1024 * 1024
+    hf_cache_dir: str | None = None
+    ollama_models_dir: str | None = None
+    paths: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "PrewarmConfig":
+        """dict 입력을 `PrewarmConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        max_bytes = data.get("max_bytes")
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            concurrency=int(data.get("concurrency", defaults.concurrency)),
+            max_bytes=int(max_bytes) if max_bytes is not None else None,
+            segment_bytes=int(data.get("segment_bytes", defaults.segment_bytes)),
+            chunk_bytes=int(data.get("chunk_bytes", defaults.chunk_bytes)),
+            hf_cache_dir=data.get("hf_cache_dir", defaults.hf_cache_dir),
+            ollama_models_dir=data.get("ollama_models_dir", defaults.ollama_models_dir),
+            paths={
+                str(model_id): [str(item) for item in ([paths] if isinstance(paths, str) else paths or [])]
+                for model_id, paths in (data.get("paths") or {}).items()
+            },
+        )
+        if config.concurrency < 1 or (config.max_bytes is not None and config.max_bytes < 0):
+            raise ConfigValidationError("prewarm.concurrency는 1 이상, max_bytes는 0 이상이어야 합니다.")
+        if config.chunk_bytes < 4096 or config.segment_bytes < config.chunk_bytes:
+            raise ConfigValidationError("prewarm.chunk_bytes는 4096 이상, segment_bytes는 chunk_bytes 이상이어야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class JobsConfig:
+    """장시간 추론용 영속 비동기 작업 큐 설정.
+
+    Attributes:
+        enabled: `true`면 `/jobs` 엔드포인트와 워커 풀을 켠다.
+        path: 작업 큐 SQLite(WAL) 파일 경로. 재시작 후 미완료 작업을 이어서 처리한다.
+        workers: 프로세스당 작업 워커 스레드 수.
+        lease_seconds: 워커가 작업을 점유하는 기간. 워커가 죽으면 만료 후 다른 워커가 다시 가져간다.
+        poll_interval: 대기 작업이 없을 때 큐를 다시 확인하는 간격(초).
+        max_attempts: 실패로 확정하기 전 최대 실행 시도 횟수.
+        partial_flush_seconds: 실행 중 부분 출력을 저장소에 기록하는 최소 간격(초).
+    """
+
+    enabled: bool = False
+    path: str = "data/jobs.sqlite3"
+    workers: int = 2
+    lease_seconds: float = 60.0
+    poll_interval: float = 0.5
+    max_attempts: int = 3
+    partial_flush_seconds: float = 0.25
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "JobsConfig":
+        """dict 입력을 `JobsConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            path=str(data.get("path", defaults.path)),
+            workers=int(data.get("workers", defaults.workers)),
+            lease_seconds=float(data.get("lease_seconds", defaults.lease_seconds)),
+            poll_interval=float(data.get("poll_interval", defaults.poll_interval)),
+            max_attempts=int(data.get("max_attempts", defaults.max_attempts)),
+            partial_flush_seconds=float(data.get("partial_flush_seconds", defaults.partial_flush_seconds)),
+        )
+        if config.workers < 1 or config.max_attempts < 1:
+            raise ConfigValidationError("jobs.workers와 jobs.max_attempts는 1 이상이어야 합니다.")
+        if config.lease_seconds < 1.0 or config.poll_interval <= 0 or config.partial_flush_seconds < 0:
+            raise ConfigValidationError(
+                "jobs.lease_seconds는 1 이상, poll_interval은 0보다 크고 partial_flush_seconds는 0 이상이어야 합니다."
+            )
+        return config
+
+
+@dataclass(slots=True)
+class HealthCheckConfig:
+    """엔진 엔드포인트 백그라운드 헬스 폴링 설정.
+
+    Attributes:
+        enabled: `true`면 API 서버가 주기적으로 엔드포인트를 확인하고 `/health`를 캐시에서 응답한다.
+        interval: 폴링 간격(초).
+        timeout: 헬스 요청 1건의 제한 시간(초).
+        failure_threshold: 비정상으로 판정하기까지의 연속 실패 횟수.
+        latency_window: 지연 통계에 쓰는 최근 헬스 요청 수.
+        skip_unhealthy: `true`면 추론/임베딩 호출이 비정상 엔드포인트를 건너뛴다.
+    """
+
+    enabled: bool = True
+    interval: float = 5.0
+    timeout: float = 2.0
+    failure_threshold: int = 2
+    latency_window: int = 20
+    skip_unhealthy: bool = True
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "HealthCheckConfig":
+        """dict 입력을 `HealthCheckConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            interval=float(data.get("interval", defaults.interval)),
+            timeout=float(data.get("timeout", defaults.timeout)),
+            failure_threshold=int(data.get("failure_threshold", defaults.failure_threshold)),
+            latency_window=int(data.get("latency_window", defaults.latency_window)),
+            skip_unhealthy=bool(data.get("skip_unhealthy", defaults.skip_unhealthy)),
+        )
+        if config.interval <= 0 or config.timeout <= 0:
+            raise ConfigValidationError("health.interval과 health.timeout은 0보다 커야 합니다.")
+        if config.failure_threshold < 1 or config.latency_window < 1:
+            raise ConfigValidationError("health.failure_threshold와 health.latency_window는 1 이상이어야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class DiscoveryConfig:
+    """엔진 설치/적재 모델 목록 캐시 설정.
+
+    Attributes:
+        enabled: `true`면 API 서버가 `interval`마다 엔진 모델 목록을 백그라운드로 동기화한다.
+        interval: 동기화 간격(초). 모델 load/unload 직후에는 간격과 무관하게 바로 다시 동기화한다.
+        ttl: 캐시 유효 시간(초). 폴러가 돌지 않는 환경(CLI)에서는 이보다 오래된 캐시를 읽을 때 다시 조회한다.
+        timeout: 엔진 목록 요청 1건의 제한 시간(초).
+        history_size: 보관할 최근 변경 이벤트 수.
+    """
+
+    enabled: bool = True
+    interval: float = 30.0
+    ttl: float = 60.0
+    timeout: float = 5.0
+    history_size: int = 256
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "DiscoveryConfig":
+        """dict 입력을 `DiscoveryConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            interval=float(data.get("interval", defaults.interval)),
+            ttl=float(data.get("ttl", defaults.ttl)),
+            timeout=float(data.get("timeout", defaults.timeout)),
+            history_size=int(data.get("history_size", defaults.history_size)),
+        )
+        if config.interval <= 0 or config.ttl <= 0 or config.timeout <= 0:
+            raise ConfigValidationError("discovery.interval, ttl, timeout은 0보다 커야 합니다.")
+        if config.history_size < 1:
+            raise ConfigValidationError("discovery.history_size는 1 이상이어야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class ProfilingConfig:
+    """관리용 샘플링 프로파일러 엔드포인트 설정.
+
+    Attributes:
+        enabled: `false`면 `/debug/profile/*` 엔드포인트가 403을 반환한다.
+        interval_ms: 스택 수집 간격.
+        max_seconds: 한 번에 요청할 수 있는 최대 수집 시간.
+    """
+
+    enabled: bool = False
+    interval_ms: float = 5.0
+    max_seconds: float = 300.0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "ProfilingConfig":
+        """dict 입력을 `ProfilingConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            enabled=bool(data.get("enabled", defaults.enabled)),
+            interval_ms=float(data.get("interval_ms", defaults.interval_ms)),
+            max_seconds=float(data.get("max_seconds", defaults.max_seconds)),
+        )
+        if config.interval_ms < 1.0 or config.max_seconds <= 0:
+            raise ConfigValidationError("profiling.interval_ms는 1 이상, max_seconds는 0보다 커야 합니다.")
+        return config
+
+
+@dataclass(slots=True)
+class PromptRoutingConfig:
+    """프롬프트 토큰 수 추정 기반 컨텍스트 검사/라우팅/`num_ctx` 자동 조정 설정.
+
+    Attributes:
+        tokenizer: `char_ratio`(문자 비율 근사) 또는 `tokenizers`(HF `tokenizers` 패키지, `tokenizer_path` 필요).
+        ascii_chars_per_token / other_chars_per_token: `char_ratio`의 ASCII/비ASCII 문자당 토큰 비율.
+        cache_size: 프롬프트별 토큰 수 LRU 캐시 크기.
+        safety_margin: 라우팅/`num_ctx` 계산 시 추정치에 더할 여유 비율.
+        reserve_completion_tokens: `max_tokens`가 없는 요청에 예약할 생성 토큰 수.
+        auto_num_ctx: Ollama 요청과 모델 설정에 `num_ctx`가 없으면 프롬프트 크기에 맞춰 2의 거듭제곱 단위로 정한다.
+        num_ctx_min: 자동 `num_ctx` 최솟값.
+        group_tag_prefix: 이 접두사를 가진 모델 태그(예: `group:chat`)가 라우팅 그룹을 만든다.
+    """
+
+    tokenizer: Literal["char_ratio", "tokenizers"] = "char_ratio"
+    tokenizer_path: str | None = None
+    ascii_chars_per_token: float = 4.0
+    other_chars_per_token: float = 1.5
+    cache_size: int = 4096
+    safety_margin: float = 0.1
+    reserve_completion_tokens: int = 512
+    auto_num_ctx: bool = False
+    num_ctx_min: int = 2048
+    group_tag_prefix: str = "group:"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "PromptRoutingConfig":
+        """dict 입력을 `PromptRoutingConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        defaults = cls()
+        config = cls(
+            tokenizer=data.get("tokenizer", defaults.tokenizer),
+            tokenizer_path=data.get("tokenizer_path"),
+            ascii_chars_per_token=float(data.get("ascii_chars_per_token", defaults.ascii_chars_per_token)),
+            other_chars_per_token=float(data.get("other_chars_per_token", defaults.other_chars_per_token)),
+            cache_size=int(data.get("cache_size", defaults.cache_size)),
+            safety_margin=float(data.get("safety_margin", defaults.safety_margin)),
+            reserve_completion_tokens=int(data.get("reserve_completion_tokens", defaults.reserve_completion_tokens)),
+            auto_num_ctx=bool(data.get("auto_num_ctx", defaults.auto_num_ctx)),
+            num_ctx_min=int(data.get("num_ctx_min", defaults.num_ctx_min)),
+            group_tag_prefix=str(data.get("group_tag_prefix", defaults.group_tag_prefix)),
+        )
+        if config.tokenizer not in ("char_ratio", "tokenizers"):
+            raise ConfigValidationError(f"prompt_routing.tokenizer 값이 유효하지 않습니다: {config.tokenizer}")
+        if config.tokenizer == "tokenizers" and not config.tokenizer_path:
+            raise ConfigValidationError("prompt_routing.tokenizer가 tokenizers이면 tokenizer_path가 필요합니다.")
+        if config.ascii_chars_per_token <= 0 or config.other_chars_per_token <= 0:
+            raise ConfigValidationError("prompt_routing 문자당 토큰 비율은 0보다 커야 합니다.")
+        if config.safety_margin < 0 or config.reserve_completion_tokens < 0 or config.num_ctx_min < 1:
+            raise ConfigValidationError(
+                "prompt_routing safety_margin/reserve_completion_tokens/num_ctx_min 값이 유효하지 않습니다."
+            )
+        return config
+
+
+@dataclass(slots=True)
+class OllamaServerConfig:
+    """`ollama serve` 기동 시 환경 변수로 전달할 서버 튜닝 값.
+
+    Notes:
+        값이 `None`이면 해당 환경 변수를 설정하지 않아 Ollama 기본값을 따른다.
+    """
+
+    num_parallel: int | None = None
+    max_loaded_models: int | None = None
+    keep_alive: str | None = None
+    flash_attention: bool | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "OllamaServerConfig":
+        """dict 입력을 `OllamaServerConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        num_parallel = data.get("num_parallel")
+        max_loaded_models = data.get("max_loaded_models")
+        flash_attention = data.get("flash_attention")
+        config = cls(
+            num_parallel=int(num_parallel) if num_parallel is not None else None,
+            max_loaded_models=int(max_loaded_models) if max_loaded_models is not None else None,
+            keep_alive=str(data["keep_alive"]) if data.get("keep_alive") is not None else None,
+            flash_attention=bool(flash_attention) if flash_attention is not None else None,
+        )
+        if config.num_parallel is not None and config.num_parallel < 1:
+            raise ConfigValidationError("runtime.ollama.num_parallel은 1 이상이어야 합니다.")
+        return config
+
+    def to_env(self) -> dict[str, str]:
+        """설정된 값만 `OLLAMA_*` 환경 변수 dict로 변환한다."""
+        env: dict[str, str] = {}
+        if self.num_parallel is not None:
+            env["OLLAMA_NUM_PARALLEL"] = str(self.num_parallel)
+        if self.max_loaded_models is not None:
+            env["OLLAMA_MAX_LOADED_MODELS"] = str(self.max_loaded_models)
+        if self.keep_alive is not None:
+            env["OLLAMA_KEEP_ALIVE"] = self.keep_alive
+        if self.flash_attention is not None:
+            env["OLLAMA_FLASH_ATTENTION"] = "1" if self.flash_attention else "0"
+        return env
 
 
 @dataclass(slots=True)
@@ -34,6 +643,19 @@ class RuntimeConfig:
         }
     )
     docs_paths: list[str] = field(default_factory=lambda: ["/docs", "/redoc", "/openapi.json"])
+    context_store: ContextStoreConfig = field(default_factory=ContextStoreConfig)
+    ollama: OllamaServerConfig = field(default_factory=OllamaServerConfig)
+    semantic_cache: SemanticCacheConfig = field(default_factory=SemanticCacheConfig)
+    tracing: TracingConfig = field(default_factory=TracingConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
+    prompt_routing: PromptRoutingConfig = field(default_factory=PromptRoutingConfig)
+    jobs: JobsConfig = field(default_factory=JobsConfig)
+    health: HealthCheckConfig = field(default_factory=HealthCheckConfig)
+    discovery: DiscoveryConfig = field(default_factory=DiscoveryConfig)
+    capture: CaptureConfig = field(default_factory=CaptureConfig)
+    fleet: FleetConfig = field(default_factory=FleetConfig)
+    autoscale: AutoscaleConfig = field(default_factory=AutoscaleConfig)
+    prewarm: PrewarmConfig = field(default_factory=PrewarmConfig)
 
     def resolved_active_engines(self) -> list[EngineType]:
         """유효성 검증을 거친 활성 엔진 목록을 반환한다."""
@@ -49,7 +671,12 @@ class RuntimeConfig:
 
 @dataclass(slots=True)
 class ModelParameters:
-    """모델 추론 파라미터 묶음."""
+    """모델 추론 파라미터 묶음.
+
+    Attributes:
+        max_num_seqs / max_num_batched_tokens / gpu_memory_utilization: vLLM 서버 기동 인자
+            (`--max-num-seqs` 등). `None`이면 인자를 넘기지 않아 vLLM 기본값을 따른다.
+    """
 
     temperature: float | None = None
     top_p: float | None = None
@@ -57,20 +684,41 @@ class ModelParameters:
     dtype: str | None = None
     max_model_len: int | None = None
     tensor_parallel_size: int | None = None
+    max_num_seqs: int | None = None
+    max_num_batched_tokens: int | None = None
+    gpu_memory_utilization: float | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any] | None) -> "ModelParameters":
         """dict 입력을 `ModelParameters` 객체로 변환한다."""
         if not data:
             return cls()
-        return cls(
+        parameters = cls(
             temperature=data.get("temperature"),
             top_p=data.get("top_p"),
             num_ctx=data.get("num_ctx"),
             dtype=data.get("dtype"),
             max_model_len=data.get("max_model_len"),
             tensor_parallel_size=data.get("tensor_parallel_size"),
+            max_num_seqs=data.get("max_num_seqs"),
+            max_num_batched_tokens=data.get("max_num_batched_tokens"),
+            gpu_memory_utilization=data.get("gpu_memory_utilization"),
         )
+        utilization = parameters.gpu_memory_utilization
+        if utilization is not None and not 0.0 < utilization <= 1.0:
+            raise ConfigValidationError("parameters.gpu_memory_utilization은 0보다 크고 1 이하여야 합니다.")
+        return parameters
+
+    def vllm_server_args(self) -> list[str]:
+        """설정된 vLLM 서버 튜닝 값만 기동 인자 목록으로 변환한다."""
+        args: list[str] = []
+        if self.max_num_seqs is not None:
+            args += ["--max-num-seqs", str(self.max_num_seqs)]
+        if self.max_num_batched_tokens is not None:
+            args += ["--max-num-batched-tokens", str(self.max_num_batched_tokens)]
+        if self.gpu_memory_utilization is not None:
+            args += ["--gpu-memory-utilization", str(self.gpu_memory_utilization)]
+        return args
 
 
 @dataclass(slots=True)
@@ -91,6 +739,195 @@ class ModelResourcePolicy:
         )
 
 
+@dataclass(slots=True)
+class ModelResiliencePolicy:
+    """엔진 호출 재시도/헤지/서킷 브레이커 정책."""
+
+    max_attempts: int = 3
+    backoff_base: float = 0.2
+    backoff_max: float = 2.0
+    retry_non_idempotent: bool = False
+    hedge_enabled: bool = False
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 0.5
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "ModelResiliencePolicy":
+        """dict 입력(`retry`/`hedge`/`circuit_breaker` 하위 섹션)을 정책 객체로 변환한다."""
+        if not data:
+            return cls()
+        retry = data.get("retry") or {}
+        hedge = data.get("hedge") or {}
+        breaker = data.get("circuit_breaker") or {}
+        defaults = cls()
+        policy = cls(
+            max_attempts=int(retry.get("max_attempts", defaults.max_attempts)),
+            backoff_base=float(retry.get("backoff_base", defaults.backoff_base)),
+            backoff_max=float(retry.get("backoff_max", defaults.backoff_max)),
+            retry_non_idempotent=bool(retry.get("retry_non_idempotent", defaults.retry_non_idempotent)),
+            hedge_enabled=bool(hedge.get("enabled", defaults.hedge_enabled)),
+            hedge_quantile=float(hedge.get("quantile", defaults.hedge_quantile)),
+            hedge_min_delay=float(hedge.get("min_delay", defaults.hedge_min_delay)),
+            breaker_failure_threshold=int(breaker.get("failure_threshold", defaults.breaker_failure_threshold)),
+            breaker_reset_timeout=float(breaker.get("reset_timeout", defaults.breaker_reset_timeout)),
+        )
+        if policy.max_attempts < 1:
+            raise ConfigValidationError("resilience.retry.max_attempts는 1 이상이어야 합니다.")
+        if not 0.0 < policy.hedge_quantile < 1.0:
+            raise ConfigValidationError("resilience.hedge.quantile은 0과 1 사이여야 합니다.")
+        if policy.breaker_failure_threshold < 1:
+            raise ConfigValidationError("resilience.circuit_breaker.failure_threshold는 1 이상이어야 합니다.")
+        return policy
+
+
+@dataclass(slots=True)
+class ModelDispatchPolicy:
+    """모델별 마이크로 배칭 디스패치 큐 정책.
+
+    Attributes:
+        max_batch_size: 한 윈도우에 묶을 최대 요청 수(미지정 시 엔진 병렬 슬롯 수).
+        max_wait_ms: 첫 요청 도착 후 윈도우를 채우기 위해 기다리는 최대 시간(ms).
+        max_concurrency: 엔진 동시 처리 슬롯 수(Ollama는 `runtime.ollama.num_parallel`이 우선).
+    """
+
+    max_batch_size: int | None = None
+    max_wait_ms: float = 5.0
+    max_concurrency: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "ModelDispatchPolicy | None":
+        """dict 입력을 정책 객체로 변환한다. 섹션이 없으면 `None`(큐 미사용)을 반환한다."""
+        if not data:
+            return None
+        max_batch_size = data.get("max_batch_size")
+        max_concurrency = data.get("max_concurrency")
+        policy = cls(
+            max_batch_size=int(max_batch_size) if max_batch_size is not None else None,
+            max_wait_ms=float(data.get("max_wait_ms", 5.0)),
+            max_concurrency=int(max_concurrency) if max_concurrency is not None else None,
+        )
+        if policy.max_wait_ms < 0:
+            raise ConfigValidationError("dispatch.max_wait_ms는 0 이상이어야 합니다.")
+        for value in (policy.max_batch_size, policy.max_concurrency):
+            if value is not None and value < 1:
+                raise ConfigValidationError("dispatch 배치/동시성 값은 1 이상이어야 합니다.")
+        return policy
+
+
+@dataclass(slots=True)
+class ModelConcurrencyPolicy:
+    """관측 지연으로 엔진 동시 요청 수 상한을 조정하는 적응형 동시성 정책.
+
+    Attributes:
+        algorithm: `gradient`(기준 지연 대비 최근 지연 비율로 조정) 또는 `aimd`(가산 증가/곱셈 감소).
+        initial_limit: 시작 상한(미지정 시 모델 디스패치 슬롯 수).
+        min_limit / max_limit: 상한의 범위.
+        tolerance: 최근 지연이 기준 지연의 몇 배까지를 정상으로 볼지.
+        backoff_ratio: 오류(타임아웃/연결 끊김/5xx)나 `aimd` 지연 초과 시 상한에 곱하는 비율.
+        smoothing: `gradient`에서 새 상한을 반영하는 비율(0~1).
+        long_window / short_window: 기준 지연/최근 지연 지수 이동 평균의 표본 창 크기.
+        history_size: 보관할 상한 변경 이력 수.
+    """
+
+    algorithm: Literal["gradient", "aimd"] = "gradient"
+    initial_limit: int | None = None
+    min_limit: int = 1
+    max_limit: int = 64
+    tolerance: float = 1.5
+    backoff_ratio: float = 0.9
+    smoothing: float = 0.2
+    long_window: int = 100
+    short_window: int = 5
+    history_size: int = 256
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "ModelConcurrencyPolicy | None":
+        """dict 입력을 정책 객체로 변환한다. 섹션이 없거나 `adaptive: false`면 `None`(고정 동시성)을 반환한다."""
+        if not data or not data.get("adaptive", True):
+            return None
+        defaults = cls()
+        initial_limit = data.get("initial_limit")
+        policy = cls(
+            algorithm=data.get("algorithm", defaults.algorithm),
+            initial_limit=int(initial_limit) if initial_limit is not None else None,
+            min_limit=int(data.get("min_limit", defaults.min_limit)),
+            max_limit=int(data.get("max_limit", defaults.max_limit)),
+            tolerance=float(data.get("tolerance", defaults.tolerance)),
+            backoff_ratio=float(data.get("backoff_ratio", defaults.backoff_ratio)),
+            smoothing=float(data.get("smoothing", defaults.smoothing)),
+            long_window=int(data.get("long_window", defaults.long_window)),
+            short_window=int(data.get("short_window", defaults.short_window)),
+            history_size=int(data.get("history_size", defaults.history_size)),
+        )
+        if policy.algorithm not in ("gradient", "aimd"):
+            raise ConfigValidationError(f"concurrency.algorithm 값이 유효하지 않습니다: {policy.algorithm}")
+        if not 1 <= policy.min_limit <= policy.max_limit:
+            raise ConfigValidationError("concurrency는 1 <= min_limit <= max_limit 이어야 합니다.")
+        if policy.tolerance < 1.0 or not 0 < policy.backoff_ratio < 1 or not 0 < policy.smoothing <= 1:
+            raise ConfigValidationError(
+                "concurrency.tolerance는 1 이상, backoff_ratio는 0~1 사이, smoothing은 0 초과 1 이하여야 합니다."
+            )
+        if policy.short_window < 1 or policy.long_window <= policy.short_window:
+            raise ConfigValidationError("concurrency.long_window는 short_window(1 이상)보다 커야 합니다.")
+        return policy
+
+
+@dataclass(slots=True)
+class ModelAutoscalePolicy:
+    """모델별 레플리카 오토스케일 정책(`runtime.autoscale.enabled`일 때만 적용).
+
+    Attributes:
+        max_replicas: 설정 엔드포인트 외에 띄울 수 있는 추가 레플리카 수.
+        target_load: 레플리카 하나가 맡을 진행 중+대기 요청 수(미지정 시 모델 디스패치 슬롯 수).
+        max_latency_p90: 엔진 요청 p90 지연(초)이 이 값을 넘어도 부하가 높은 것으로 본다(미지정 시 대기열만 본다).
+        scale_up_after: 부하가 높은 상태가 이 시간(초) 이상 이어져야 레플리카를 늘린다.
+        idle_after: 부하가 낮은 상태가 이 시간(초)과 콜드 스타트 추정치 중 긴 쪽 이상 이어지면 레플리카를 줄인다.
+        cold_start: 레플리카 기동부터 준비까지 걸리는 시간(초)의 초기 추정치. 실제 기동 시간으로 갱신된다.
+        gpu_memory: 레플리카 하나가 차지하는 GPU 메모리(GPU 1장 = 1.0). 미지정 시 vLLM은
+            `parameters.gpu_memory_utilization`(없으면 0.9)으로 본다. Ollama는 레플리카마다 모델 전체를 적재하지만
+            차지량을 알 수 없으므로 `runtime.autoscale.gpu_memory_budget`이 있으면 반드시 지정해야 한다.
+    """
+
+    max_replicas: int = 1
+    target_load: float | None = None
+    max_latency_p90: float | None = None
+    scale_up_after: float = 10.0
+    idle_after: float = 300.0
+    cold_start: float = 60.0
+    gpu_memory: float | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "ModelAutoscalePolicy | None":
+        """dict 입력을 정책 객체로 변환한다. 섹션이 없으면 `None`(오토스케일 제외)을 반환한다."""
+        if not data:
+            return None
+        defaults = cls()
+        target_load = data.get("target_load")
+        max_latency_p90 = data.get("max_latency_p90")
+        gpu_memory = data.get("gpu_memory")
+        policy = cls(
+            max_replicas=int(data.get("max_replicas", defaults.max_replicas)),
+            target_load=float(target_load) if target_load is not None else None,
+            max_latency_p90=float(max_latency_p90) if max_latency_p90 is not None else None,
+            scale_up_after=float(data.get("scale_up_after", defaults.scale_up_after)),
+            idle_after=float(data.get("idle_after", defaults.idle_after)),
+            cold_start=float(data.get("cold_start", defaults.cold_start)),
+            gpu_memory=float(gpu_memory) if gpu_memory is not None else None,
+        )
+        if policy.max_replicas < 0:
+            raise ConfigValidationError("autoscale.max_replicas는 0 이상이어야 합니다.")
+        for value in (policy.target_load, policy.max_latency_p90):
+            if value is not None and value <= 0:
+                raise ConfigValidationError("autoscale.target_load와 max_latency_p90은 0보다 커야 합니다.")
+        if min(policy.scale_up_after, policy.idle_after, policy.cold_start) < 0:
+            raise ConfigValidationError("autoscale.scale_up_after, idle_after, cold_start는 0 이상이어야 합니다.")
+        if policy.gpu_memory is not None and policy.gpu_memory < 0:
+            raise ConfigValidationError("autoscale.gpu_memory는 0 이상이어야 합니다.")
+        return policy
+
+
 @dataclass(slots=True)
 class ModelConfig:
     """단일 모델 설정 엔티티."""
@@ -102,6 +939,10 @@ class ModelConfig:
     auto_load: bool = False
     parameters: ModelParameters = field(default_factory=ModelParameters)
     resource_policy: ModelResourcePolicy = field(default_factory=ModelResourcePolicy)
+    resilience: ModelResiliencePolicy = field(default_factory=ModelResiliencePolicy)
+    dispatch: ModelDispatchPolicy | None = None
+    concurrency: ModelConcurrencyPolicy | None = None
+    autoscale: ModelAutoscalePolicy | None = None
     enabled: bool = True
     tags: list[str] = field(default_factory=list)
     source: str | None = None
@@ -116,6 +957,10 @@ class ModelConfig:
             raise ConfigValidationError(f"모델 {self.id}는 vllm_model 값이 필요합니다.")
         return self.vllm_model
 
+    def context_window(self) -> int | None:
+        """모델 컨텍스트 창 크기(`max_model_len` 또는 `num_ctx`)를 반환한다. 둘 다 없으면 `None`."""
+        return self.parameters.max_model_len or self.parameters.num_ctx
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ModelConfig":
         """dict 입력을 검증하여 `ModelConfig` 객체로 변환한다."""
@@ -134,6 +979,10 @@ class ModelConfig:
             auto_load=bool(data.get("auto_load", False)),
             parameters=ModelParameters.from_dict(data.get("parameters")),
             resource_policy=ModelResourcePolicy.from_dict(data.get("resource_policy")),
+            resilience=ModelResiliencePolicy.from_dict(data.get("resilience")),
+            dispatch=ModelDispatchPolicy.from_dict(data.get("dispatch")),
+            concurrency=ModelConcurrencyPolicy.from_dict(data.get("concurrency")),
+            autoscale=ModelAutoscalePolicy.from_dict(data.get("autoscale")),
             enabled=bool(data.get("enabled", True)),
             tags=list(data.get("tags") or []),
             source=data.get("source"),
@@ -142,12 +991,182 @@ class ModelConfig:
         return model_config
 
 
+@dataclass(slots=True)
+class TenantConfig:
+    """테넌트(API 키 소유자)별 요청/토큰 한도와 스케줄링 가중치.
+
+    Attributes:
+        api_keys: 이 테넌트로 식별할 API 키 목록.
+        weight: 모델 디스패치 큐 안에서의 가중 공정 스케줄링 가중치.
+        requests_per_second / burst: 요청 수 토큰 버킷(초당 보충량/최대 적립량). `None`이면 무제한.
+        tokens_per_minute / token_burst: 토큰 소비 버킷. `token_burst` 미지정 시 `tokens_per_minute`.
+    """
+
+    id: str
+    api_keys: list[str] = field(default_factory=list)
+    weight: float = 1.0
+    requests_per_second: float | None = None
+    burst: float | None = None
+    tokens_per_minute: float | None = None
+    token_burst: float | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], default_id: str | None = None) -> "TenantConfig":
+        """dict 입력을 검증하여 `TenantConfig` 객체로 변환한다."""
+        tenant_id = data.get("id", default_id)
+        if not tenant_id:
+            raise ConfigValidationError("tenancy.tenants[].id는 필수입니다.")
+
+        def _optional(key: str) -> float | None:
+            value = data.get(key)
+            return float(value) if value is not None else None
+
+        tenant = cls(
+            id=str(tenant_id),
+            api_keys=[str(key) for key in data.get("api_keys") or []],
+            weight=float(data.get("weight", 1.0)),
+            requests_per_second=_optional("requests_per_second"),
+            burst=_optional("burst"),
+            tokens_per_minute=_optional("tokens_per_minute"),
+            token_burst=_optional("token_burst"),
+        )
+        if tenant.weight <= 0:
+            raise ConfigValidationError(f"tenancy.tenants[{tenant.id}] weight는 0보다 커야 합니다.")
+        for value in (tenant.requests_per_second, tenant.burst, tenant.tokens_per_minute, tenant.token_burst):
+            if value is not None and value <= 0:
+                raise ConfigValidationError(f"tenancy.tenants[{tenant.id}] 한도 값은 0보다 커야 합니다.")
+        return tenant
+
+
+@dataclass(slots=True)
+class TenancyConfig:
+    """API 키 기반 테넌트 식별과 요청 한도 설정.
+
+    Notes:
+        - API 키 없이 들어온 요청은 `require_api_key`가 False이면 `anonymous` 테넌트로 취급한다.
+        - `default_completion_tokens`는 `max_tokens` 없는 요청의 토큰 버킷 선차감 추정치다.
+    """
+
+    require_api_key: bool = False
+    default_completion_tokens: int = 512
+    anonymous: TenantConfig = field(default_factory=lambda: TenantConfig(id="anonymous"))
+    tenants: list[TenantConfig] = field(default_factory=list)
+    _by_key: dict[str, TenantConfig] = field(init=False, repr=False)
+    _by_id: dict[str, TenantConfig] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._by_key = {key: tenant for tenant in self.tenants for key in tenant.api_keys}
+        self._by_id = {tenant.id: tenant for tenant in (self.anonymous, *self.tenants)}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> "TenancyConfig":
+        """dict 입력을 `TenancyConfig` 객체로 변환한다."""
+        if not data:
+            return cls()
+        tenants = [TenantConfig.from_dict(item) for item in data.get("tenants") or []]
+        anonymous = TenantConfig.from_dict(data.get("anonymous") or {}, default_id="anonymous")
+        ids = [anonymous.id, *(tenant.id for tenant in tenants)]
+        if len(ids) != len(set(ids)):
+            raise ConfigValidationError("tenancy 테넌트 ID가 중복되었습니다.")
+        keys = [key for tenant in tenants for key in tenant.api_keys]
+        if len(keys) != len(set(keys)):
+            raise ConfigValidationError("tenancy API 키가 여러 테넌트에 중복 등록되었습니다.")
+        return cls(
+            require_api_key=bool(data.get("require_api_key", False)),
+            default_completion_tokens=int(data.get("default_completion_tokens", 512)),
+            anonymous=anonymous,
+            tenants=tenants,
+        )
+
+    def resolve(self, api_key: str | None) -> TenantConfig | None:
+        """API 키로 테넌트를 식별한다. 알 수 없는 키이거나 키가 필수인데 없으면 `None`을 반환한다."""
+        if api_key:
+            return self._by_key.get(api_key)
+        return None if self.require_api_key else self.anonymous
+
+    def get(self, tenant_id: str | None) -> TenantConfig | None:
+        """테넌트 ID로 설정을 조회하고, 없으면 `None`을 반환한다."""
+        if tenant_id is None:
+            return None
+        return self._by_id.get(tenant_id)
+
+
+@dataclass(slots=True)
+class CascadeAcceptance:
+    """캐스케이드 단계 응답을 그대로 수용할지 판단하는 조건(모두 통과해야 수용한다).
+
+    Attributes:
+        min_length: 생성 텍스트(앞뒤 공백 제외)의 최소 글자 수.
+        refusal_patterns: 생성 텍스트에서 찾으면 거절 응답으로 보는 정규식(대소문자 무시).
+        min_mean_logprob: 생성 토큰 평균 로그 확률 하한. vLLM 단계에서만 `logprobs`를 요청해 검사한다.
+        verifier: `package.module:function` 형식의 검증 함수. `(prompt, text) -> bool`로 호출한다.
+    """
+
+    min_length: int = 1
+    refusal_patterns: list[str] = field(default_factory=list)
+    min_mean_logprob: float | None = None
+    verifier: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None, name: str) -> "CascadeAcceptance":
+        """dict 입력을 `CascadeAcceptance` 객체로 변환한다."""
+        if not data:
+            return cls()
+        min_mean_logprob = data.get("min_mean_logprob")
+        acceptance = cls(
+            min_length=int(data.get("min_length", 1)),
+            refusal_patterns=[str(pattern) for pattern in data.get("refusal_patterns") or []],
+            min_mean_logprob=float(min_mean_logprob) if min_mean_logprob is not None else None,
+            verifier=data.get("verifier"),
+        )
+        for pattern in acceptance.refusal_patterns:
+            try:
+                re.compile(pattern)
+            except re.error as exc:
+                raise ConfigValidationError(f"cascades[{name}] refusal_patterns 정규식 오류: {pattern} ({exc})") from exc
+        if acceptance.verifier is not None and ":" not in acceptance.verifier:
+            raise ConfigValidationError(f"cascades[{name}] verifier는 'module:function' 형식이어야 합니다.")
+        return acceptance
+
+
+@dataclass(slots=True)
+class CascadeConfig:
+    """작은 모델부터 시도하고 수용 조건을 통과하지 못하면 다음 모델로 올리는 캐스케이드 라우팅 그룹.
+
+    Attributes:
+        name: 요청 `model_id`로 쓰는 캐스케이드 이름(모델 ID/라우팅 그룹과 겹치면 안 된다).
+        models: 시도 순서대로 나열한 모델 ID(저렴한 모델 먼저). 마지막 모델의 응답은 조건과 무관하게 수용한다.
+        acceptance: 단계 응답 수용 조건.
+    """
+
+    name: str
+    models: list[str]
+    acceptance: CascadeAcceptance = field(default_factory=CascadeAcceptance)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CascadeConfig":
+        """dict 입력을 `CascadeConfig` 객체로 변환한다."""
+        name = data.get("name")
+        if not name:
+            raise ConfigValidationError("cascades 항목에 name이 필요합니다.")
+        models = [str(model_id) for model_id in data.get("models") or []]
+        if len(models) < 2 or len(set(models)) != len(models):
+            raise ConfigValidationError(f"cascades[{name}] models는 서로 다른 모델 ID 2개 이상이어야 합니다.")
+        return cls(
+            name=str(name),
+            models=models,
+            acceptance=CascadeAcceptance.from_dict(data.get("acceptance"), str(name)),
+        )
+
+
 @dataclass(slots=True)
 class AppSettings:
     """애플리케이션 전체 설정 루트 객체."""
 
     runtime: RuntimeConfig
     models: list[ModelConfig]
+    tenancy: TenancyConfig = field(default_factory=TenancyConfig)
+    cascades: list[CascadeConfig] = field(default_factory=list)
 
     def enabled_models(self, engine: EngineType | None = None) -> list[ModelConfig]:
         """활성화된 모델 목록을 반환한다.
@@ -160,9 +1179,75 @@ class AppSettings:
             return [model for model in models if model.engine == engine]
         return models
 
+    def dispatch_slots(self, model: ModelConfig) -> int:
+        """모델 디스패치 큐의 동시 처리 슬롯 수를 엔진 설정과 일관되게 결정한다.
+
+        Rules:
+            - Ollama: `runtime.ollama.num_parallel` > `dispatch.max_concurrency` > `max_batch_size` > 1
+            - vLLM: `dispatch.max_concurrency` > `max_batch_size` > 1
+        """
+        policy = model.dispatch or ModelDispatchPolicy()
+        if model.engine == "ollama" and self.runtime.ollama.num_parallel is not None:
+            return self.runtime.ollama.num_parallel
+        return policy.max_concurrency or policy.max_batch_size or 1
+
+    def validate_dispatch(self) -> None:
+        """Ollama 모델의 배치 크기가 엔진 병렬 슬롯 수를 넘지 않는지 검증한다."""
+        num_parallel = self.runtime.ollama.num_parallel
+        for model in self.models:
+            if model.engine != "ollama" or model.dispatch is None or num_parallel is None:
+                continue
+            if model.dispatch.max_batch_size is not None and model.dispatch.max_batch_size > num_parallel:
+                raise ConfigValidationError(
+                    f"models[{model.id}] dispatch.max_batch_size({model.dispatch.max_batch_size})가 "
+                    f"runtime.ollama.num_parallel({num_parallel})보다 큽니다."
+                )
+
+    def validate_autoscale(self) -> None:
+        """GPU 메모리 예산이 있으면 오토스케일 대상 Ollama 모델에 레플리카 `gpu_memory`가 있는지 검증한다."""
+        if self.runtime.autoscale.gpu_memory_budget is None:
+            return
+        for model in self.models:
+            if model.engine == "ollama" and model.autoscale is not None and model.autoscale.gpu_memory is None:
+                raise ConfigValidationError(
+                    f"models[{model.id}] autoscale.gpu_memory가 필요합니다"
+                    "(runtime.autoscale.gpu_memory_budget이 설정된 경우 Ollama 레플리카 차지량을 알 수 없습니다)."
+                )
+
+    def validate_cascades(self) -> None:
+        """캐스케이드 이름이 겹치지 않고, 단계 모델이 모두 존재하는 모델 ID인지 검증한다."""
+        names = [cascade.name for cascade in self.cascades]
+        if len(names) != len(set(names)):
+            raise ConfigValidationError("cascades 이름이 중복되었습니다.")
+        for cascade in self.cascades:
+            if self.get_model(cascade.name) is not None or self.model_group(cascade.name):
+                raise ConfigValidationError(f"cascades[{cascade.name}] 이름이 모델 ID 또는 라우팅 그룹과 겹칩니다.")
+            for model_id in cascade.models:
+                if self.get_model(model_id) is None:
+                    raise ConfigValidationError(f"cascades[{cascade.name}]에 존재하지 않는 모델 ID가 있습니다: {model_id}")
+
+    def validate_fleet(self) -> None:
+        """플릿 배치 대상이 모두 존재하는 vLLM 모델 ID인지 검증한다."""
+        for model_id in self.runtime.fleet.placements:
+            model = self.get_model(model_id)
+            if model is None or model.engine != "vllm":
+                raise ConfigValidationError(f"fleet.placements에 vLLM 모델이 아닌 ID가 있습니다: {model_id}")
+
+    def cascade(self, name: str) -> CascadeConfig | None:
+        """이름으로 캐스케이드 설정을 조회하고, 없으면 `None`을 반환한다."""
+        for cascade in self.cascades:
+            if cascade.name == name:
+                return cascade
+        return None
+
     def get_model(self, model_id: str) -> ModelConfig | None:
         """모델 ID로 설정을 조회하고, 없으면 `None`을 반환한다."""
         for model in self.models:
             if model.id == model_id:
                 return model
         return None
+
+    def model_group(self, name: str) -> list[ModelConfig]:
+        """`<group_tag_prefix><name>` 태그를 가진 활성 모델을 설정 순서대로 반환한다."""
+        tag = f"{self.runtime.prompt_routing.group_tag_prefix}{name}"
+        return [model for model in self.enabled_models() if tag in model.tags]
@@ -6,7 +6,37 @@ from typing import Any
 import yaml
 
 from .exceptions import ConfigFileNotFoundError, ConfigValidationError
-from .settings import AppSettings, EndpointConfig, ModelConfig, RuntimeConfig
+from .settings import (
+    AppSettings,
+    AutoscaleConfig,
+    CaptureConfig,
+    CascadeConfig,
+    ContextStoreConfig,
+    DiscoveryConfig,
+    EndpointConfig,
+    FleetConfig,
+    HealthCheckConfig,
+    JobsConfig,
+    ModelConfig,
+    OllamaServerConfig,
+    PrewarmConfig,
+    ProfilingConfig,
+    PromptRoutingConfig,
+    RuntimeConfig,
+    SemanticCacheConfig,
+    TenancyConfig,
+    TracingConfig,
+)
+
+
+def _parse_endpoint(data: dict[str, Any], default_port: int) -> EndpointConfig:
+    """엔드포인트 섹션(선택적 `replicas` 포함)을 `EndpointConfig`로 변환한다."""
+    host = str(data.get("host", "127.0.0.1"))
+    replicas = [
+        EndpointConfig(host=str(item.get("host", host)), port=int(item["port"]))
+        for item in data.get("replicas") or []
+    ]
+    return EndpointConfig(host=host, port=int(data.get("port", default_port)), replicas=replicas)
 
 
 def _parse_runtime(data: dict[str, Any] | None) -> RuntimeConfig:
@@ -24,14 +54,8 @@ def _parse_runtime(data: dict[str, Any] | None) -> RuntimeConfig:
     vllm_data = endpoint_data.get("vllm") or {}
 
     endpoints = {
-        "ollama": EndpointConfig(
-            host=str(ollama_data.get("host", "127.0.0.1")),
-            port=int(ollama_data.get("port", 11434)),
-        ),
-        "vllm": EndpointConfig(
-            host=str(vllm_data.get("host", "127.0.0.1")),
-            port=int(vllm_data.get("port", 8000)),
-        ),
+        "ollama": _parse_endpoint(ollama_data, default_port=11434),
+        "vllm": _parse_endpoint(vllm_data, default_port=8000),
     }
 
     docs_paths = list(runtime_data.get("docs_paths") or ["/docs", "/redoc", "/openapi.json"])
@@ -41,6 +65,19 @@ def _parse_runtime(data: dict[str, Any] | None) -> RuntimeConfig:
         active_engines=active_engines,
         endpoints=endpoints,
         docs_paths=docs_paths,
+        context_store=ContextStoreConfig.from_dict(runtime_data.get("context_store")),
+        ollama=OllamaServerConfig.from_dict(runtime_data.get("ollama")),
+        semantic_cache=SemanticCacheConfig.from_dict(runtime_data.get("semantic_cache")),
+        tracing=TracingConfig.from_dict(runtime_data.get("tracing")),
+        profiling=ProfilingConfig.from_dict(runtime_data.get("profiling")),
+        prompt_routing=PromptRoutingConfig.from_dict(runtime_data.get("prompt_routing")),
+        jobs=JobsConfig.from_dict(runtime_data.get("jobs")),
+        health=HealthCheckConfig.from_dict(runtime_data.get("health")),
+        discovery=DiscoveryConfig.from_dict(runtime_data.get("discovery")),
+        capture=CaptureConfig.from_dict(runtime_data.get("capture")),
+        fleet=FleetConfig.from_dict(runtime_data.get("fleet")),
+        autoscale=AutoscaleConfig.from_dict(runtime_data.get("autoscale")),
+        prewarm=PrewarmConfig.from_dict(runtime_data.get("prewarm")),
     )
     runtime.resolved_active_engines()
     return runtime
@@ -74,4 +111,11 @@ def load_settings(config_path: str | Path) -> AppSettings:
 
     runtime = _parse_runtime(raw.get("runtime"))
     models = _parse_models(raw.get("models"))
-    return AppSettings(runtime=runtime, models=models)
+    tenancy = TenancyConfig.from_dict(raw.get("tenancy"))
+    cascades = [CascadeConfig.from_dict(item) for item in raw.get("cascades") or []]
+    settings = AppSettings(runtime=runtime, models=models, tenancy=tenancy, cascades=cascades)
+    settings.validate_dispatch()
+    settings.validate_autoscale()
+    settings.validate_cascades()
+    settings.validate_fleet()
+    return settings
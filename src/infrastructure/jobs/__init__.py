@@ -0,0 +1,5 @@
+"""영속 비동기 작업 큐 계층 공개 심볼을 모아 제공한다."""
+
+from .job_store import FINISHED_STATUSES, JobKind, JobRecord, JobStatus, SqliteJobStore
+
+__all__ = ["FINISHED_STATUSES", "JobKind", "JobRecord", "JobStatus", "SqliteJobStore"]
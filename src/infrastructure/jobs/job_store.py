@@ -0,0 +1,386 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Literal
+
+from ..serialization import dumps, loads
+
+JobKind = Literal["inference", "batch"]
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+FINISHED_STATUSES: frozenset[str] = frozenset({"succeeded", "failed", "cancelled"})
+"""더 이상 상태가 바뀌지 않는 작업 상태."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    request BLOB NOT NULL,
+    tenant_id TEXT,
+    result BLOB,
+    error TEXT,
+    partial TEXT NOT NULL DEFAULT '',
+    completed INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 1,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_until REAL,
+    not_before REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_items (
+    job_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    ok INTEGER NOT NULL,
+    result BLOB,
+    error TEXT,
+    PRIMARY KEY (job_id, idx)
+);
+"""
+
+_COLUMNS = (
+    "id, kind, status, request, tenant_id, result, error, partial, completed, total, attempts, "
+    "created_at, started_at, finished_at"
+)
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """작업 큐의 작업 한 건.
+
+    Attributes:
+        request: 작업 입력(`inference`는 추론 인자, `batch`는 `prompts` 목록 포함).
+        result: 완료된 `inference` 작업의 추론 결과(`InferenceResultDTO.to_dict()`).
+        partial: 실행 중 스트리밍으로 받은 부분 출력(재시도하면 처음부터 다시 채워진다).
+        completed / total: 처리한 항목 수 / 전체 항목 수(`inference`는 1).
+        attempts: 워커가 작업을 가져간 횟수.
+    """
+
+    id: str
+    kind: JobKind
+    status: JobStatus
+    request: dict[str, Any]
+    tenant_id: str | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    partial: str = ""
+    completed: int = 0
+    total: int = 1
+    attempts: int = 0
+    created_at: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> dict[str, Any]:
+        """API 응답용 dict로 변환한다."""
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "tenant_id": self.tenant_id,
+            "completed": self.completed,
+            "total": self.total,
+            "attempts": self.attempts,
+            "partial": self.partial,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    @classmethod
+    def _from_row(cls, row: tuple[Any, ...]) -> "JobRecord":
+        return cls(
+            id=row[0],
+            kind=row[1],
+            status=row[2],
+            request=loads(row[3]),
+            tenant_id=row[4],
+            result=loads(row[5]) if row[5] is not None else None,
+            error=row[6],
+            partial=row[7],
+            completed=row[8],
+            total=row[9],
+            attempts=row[10],
+            created_at=row[11],
+            started_at=row[12],
+            finished_at=row[13],
+        )
+
+
+class SqliteJobStore:
+    """SQLite(WAL) 파일 하나에 작업과 배치 항목 결과를 보관하는 영속 작업 큐.
+
+    Rules:
+        - 워커는 `claim`으로 작업을 가져가며 `lease_seconds` 동안 점유한다. 실행 중에는 `renew`로 점유를
+          연장하고, 점유가 끝난(워커/프로세스가 죽은) `running` 작업은 다음 `claim`에서 다시 가져간다.
+          이것이 재시작 후 미완료 작업 재개 경로다.
+        - 결과/부분 출력 기록은 현재 점유한 워커일 때만 반영된다. 취소되었거나 다른 워커가 가져간
+          작업에 대한 늦은 기록은 `False`를 반환하고 무시된다.
+        - `max_attempts`번 가져간 작업이 다시 점유 만료되면 실패로 확정한다.
+
+    Notes:
+        - 가져가기는 `BEGIN IMMEDIATE` 트랜잭션으로 수행하므로 같은 파일을 여는 여러 API 워커 프로세스가
+          한 작업을 중복 실행하지 않는다.
+        - WAL 모드와 `synchronous=NORMAL`로 커밋마다 fsync하지 않으면서 읽기와 쓰기가 서로 막지 않게 한다.
+          전원 장애 시 마지막 몇 건의 상태 갱신만 잃을 수 있고, 해당 작업은 점유 만료 후 다시 실행된다.
+    """
+
+    def __init__(self, path: str | Path, lease_seconds: float = 60.0, max_attempts: int = 3) -> None:
+        """파일을 열고(없으면 생성) 스키마를 준비한다."""
+        self.path = Path(path)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), isolation_level=None, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(
+        self,
+        kind: JobKind,
+        request: dict[str, Any],
+        tenant_id: str | None = None,
+        total: int = 1,
+    ) -> JobRecord:
+        """작업을 대기 상태로 추가하고 기록을 반환한다."""
+        record = JobRecord(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            status="queued",
+            request=request,
+            tenant_id=tenant_id,
+            total=total,
+            created_at=time.time(),
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, status, request, tenant_id, total, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (record.id, kind, "queued", dumps(request), tenant_id, total, record.created_at),
+            )
+        return record
+
+    def claim(self, worker_id: str) -> JobRecord | None:
+        """실행할 작업 하나를 점유해 반환한다(없으면 `None`).
+
+        Notes:
+            대기 작업(`not_before`가 지난 것)과 점유가 만료된 실행 중 작업을 생성 순서대로 본다.
+            다시 가져가는 `inference` 작업은 부분 출력을 비우고 처음부터 실행한다.
+        """
+        with self._lock:
+            while True:
+                now = time.time()
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = self._conn.execute(
+                        "SELECT id, attempts, status FROM jobs "
+                        "WHERE (status = 'queued' AND not_before <= ?) OR (status = 'running' AND lease_until < ?) "
+                        "ORDER BY created_at LIMIT 1",
+                        (now, now),
+                    ).fetchone()
+                    if row is None:
+                        self._conn.execute("COMMIT")
+                        return None
+                    job_id, attempts, status = row
+                    if status == "running" and attempts >= self.max_attempts:
+                        self._conn.execute(
+                            "UPDATE jobs SET status = 'failed', error = ?, worker = NULL, finished_at = ? WHERE id = ?",
+                            (f"작업 점유가 {attempts}번 만료되어 실패로 처리했습니다.", now, job_id),
+                        )
+                        self._conn.execute("COMMIT")
+                        continue
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'running', worker = ?, lease_until = ?, attempts = attempts + 1, "
+                        "partial = CASE WHEN kind = 'inference' THEN '' ELSE partial END, "
+                        "started_at = COALESCE(started_at, ?) WHERE id = ?",
+                        (worker_id, now + self.lease_seconds, now, job_id),
+                    )
+                    record = self._get(job_id)
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                return record
+
+    def renew(self, job_id: str, worker_id: str) -> bool:
+        """점유를 연장한다. 작업이 취소되었거나 다른 워커에 넘어갔으면 `False`."""
+        return self._update(
+            "UPDATE jobs SET lease_until = ? WHERE id = ? AND worker = ? AND status = 'running'",
+            (time.time() + self.lease_seconds, job_id, worker_id),
+        )
+
+    def append_partial(self, job_id: str, worker_id: str, text: str) -> bool:
+        """실행 중 작업의 부분 출력 뒤에 텍스트를 덧붙인다."""
+        return self._update(
+            "UPDATE jobs SET partial = partial || ? WHERE id = ? AND worker = ? AND status = 'running'",
+            (text, job_id, worker_id),
+        )
+
+    def add_item(
+        self,
+        job_id: str,
+        worker_id: str,
+        index: int,
+        ok: bool,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> bool:
+        """배치 작업의 항목 결과를 기록하고 진행 수를 올린다(같은 항목은 한 번만 집계)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                owner = self._conn.execute(
+                    "SELECT 1 FROM jobs WHERE id = ? AND worker = ? AND status = 'running'", (job_id, worker_id)
+                ).fetchone()
+                inserted = owner is not None and (
+                    self._conn.execute(
+                        "INSERT OR IGNORE INTO job_items (job_id, idx, ok, result, error) VALUES (?, ?, ?, ?, ?)",
+                        (job_id, index, int(ok), dumps(result) if result is not None else None, error),
+                    ).rowcount
+                    > 0
+                )
+                if inserted:
+                    self._conn.execute("UPDATE jobs SET completed = completed + 1 WHERE id = ?", (job_id,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return owner is not None
+
+    def done_items(self, job_id: str) -> set[int]:
+        """이미 결과가 기록된 배치 항목 인덱스(재개 시 건너뛸 항목)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT idx FROM job_items WHERE job_id = ?", (job_id,)).fetchall()
+        return {row[0] for row in rows}
+
+    def item_counts(self, job_id: str) -> dict[str, int]:
+        """배치 항목 결과 수(`completed`)와 그중 실패 수(`failed`)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(1 - ok), 0) FROM job_items WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return {"completed": row[0], "failed": row[1]}
+
+    def complete(self, job_id: str, worker_id: str, result: dict[str, Any] | None = None) -> bool:
+        """작업을 성공으로 확정한다."""
+        return self._finish(job_id, worker_id, "succeeded", result=result)
+
+    def fail(self, job_id: str, worker_id: str, error: str, result: dict[str, Any] | None = None) -> bool:
+        """작업을 실패로 확정한다."""
+        return self._finish(job_id, worker_id, "failed", result=result, error=error)
+
+    def release(self, job_id: str, worker_id: str, delay: float, error: str | None = None) -> bool:
+        """작업을 `delay`초 뒤 다시 실행하도록 대기 상태로 돌려놓는다(이번 시도는 횟수에서 뺀다)."""
+        return self._update(
+            "UPDATE jobs SET status = 'queued', worker = NULL, lease_until = NULL, not_before = ?, "
+            "attempts = attempts - 1, error = ? WHERE id = ? AND worker = ? AND status = 'running'",
+            (time.time() + delay, error, job_id, worker_id),
+        )
+
+    def cancel(self, job_id: str) -> JobRecord | None:
+        """끝나지 않은 작업을 취소한다. 실행 중이면 워커가 다음 점유 연장 때 알아차리고 중단한다."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'cancelled', worker = NULL, finished_at = ? "
+                "WHERE id = ? AND status IN ('queued', 'running')",
+                (time.time(), job_id),
+            )
+            return self._get(job_id)
+
+    def get(self, job_id: str) -> JobRecord | None:
+        with self._lock:
+            return self._get(job_id)
+
+    def read_partial(self, job_id: str, offset: int = 0) -> dict[str, Any] | None:
+        """스트리밍 폴링용 진행 상태(`status`, `attempts`, `completed`, `total`)와 `offset` 이후 부분 출력(`text`).
+
+        Notes:
+            결과/요청 본문을 읽지 않고 필요한 열과 부분 출력 뒷부분만 가져온다.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, attempts, completed, total, substr(partial, ? + 1) FROM jobs WHERE id = ?",
+                (offset, job_id),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"status": row[0], "attempts": row[1], "completed": row[2], "total": row[3], "text": row[4]}
+
+    def items(self, job_id: str, offset: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+        """배치 항목 결과를 인덱스 순으로 반환한다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT idx, ok, result, error FROM job_items WHERE job_id = ? AND idx >= ? ORDER BY idx LIMIT ?",
+                (job_id, offset, limit),
+            ).fetchall()
+        return [
+            {
+                "index": idx,
+                "ok": bool(ok),
+                "result": loads(result) if result is not None else None,
+                "error": error,
+            }
+            for idx, ok, result, error in rows
+        ]
+
+    def list(self, status: JobStatus | None = None, limit: int = 50) -> list[JobRecord]:
+        """최근 생성 순으로 작업 목록을 반환한다."""
+        query = f"SELECT {_COLUMNS} FROM jobs"
+        params: tuple[Any, ...] = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY created_at DESC LIMIT ?", (*params, limit)).fetchall()
+        return [JobRecord._from_row(row) for row in rows]
+
+    def counts(self) -> dict[str, int]:
+        """상태별 작업 수."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def _get(self, job_id: str) -> JobRecord | None:
+        row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return JobRecord._from_row(row) if row is not None else None
+
+    def _update(self, query: str, params: tuple[Any, ...]) -> bool:
+        with self._lock:
+            return self._conn.execute(query, params).rowcount > 0
+
+    def _finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: JobStatus,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> bool:
+        return self._update(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, worker = NULL, lease_until = NULL, finished_at = ?, "
+            "completed = CASE WHEN kind = 'inference' AND ? = 'succeeded' THEN total ELSE completed END "
+            "WHERE id = ? AND worker = ? AND status = 'running'",
+            (status, dumps(result) if result is not None else None, error, time.time(), status, job_id, worker_id),
+        )
@@ -0,0 +1,40 @@
+"""관측(메트릭/트레이싱) 계층 공개 심볼을 모아 제공한다."""
+
+from .metrics import MetricsRegistry
+from .profiling import IDLE_LEAVES, SamplingProfiler, run_with_cprofile
+from .traffic_capture import CAPTURE_VERSION, TrafficRecorder, prompt_digest, read_capture
+from .tracing import (
+    NOOP_SPAN,
+    SPAN_KIND_CLIENT,
+    SPAN_KIND_INTERNAL,
+    SPAN_KIND_SERVER,
+    Span,
+    SpanHandle,
+    Trace,
+    Tracer,
+    current_span,
+    parse_traceparent,
+    start_span,
+)
+
+__all__ = [
+    "CAPTURE_VERSION",
+    "IDLE_LEAVES",
+    "MetricsRegistry",
+    "NOOP_SPAN",
+    "SPAN_KIND_CLIENT",
+    "SPAN_KIND_INTERNAL",
+    "SPAN_KIND_SERVER",
+    "SamplingProfiler",
+    "Span",
+    "SpanHandle",
+    "Trace",
+    "Tracer",
+    "TrafficRecorder",
+    "current_span",
+    "parse_traceparent",
+    "prompt_digest",
+    "read_capture",
+    "run_with_cprofile",
+    "start_span",
+]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
+"""메트릭 이름과 정렬된 라벨 쌍으로 구성된 시계열 키."""
+
+
+def _series_key(name: str, labels: dict[str, Any]) -> SeriesKey:
+    """이름/라벨 조합을 해시 가능한 시계열 키로 변환한다."""
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _render_key(key: SeriesKey) -> str:
+    """시계열 키를 `name{label="value"}` 형태 문자열로 변환한다."""
+    name, labels = key
+    if not labels:
+        return name
+    rendered = ",".join(f'{label}="{value}"' for label, value in labels)
+    return f"{name}{{{rendered}}}"
+
+
+@dataclass(slots=True)
+class _Summary:
+    """요약 메트릭 상태(누적 카운트/합계와 최근 관측 윈도우)."""
+
+    window_size: int
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+    window: deque[float] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.window = deque(maxlen=self.window_size)
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+        self.window.append(value)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.window:
+            return None
+        ordered = sorted(self.window)
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
+
+
+class MetricsRegistry:
+    """프로세스 내 카운터/게이지/요약 메트릭 저장소.
+
+    Notes:
+        요약 메트릭은 최근 `window_size`개 관측값만 유지하며,
+        분위수(p50/p95/p99)는 이 윈도우 기준으로 계산한다.
+    """
+
+    def __init__(self, window_size: int = 512) -> None:
+        """메트릭 저장소를 초기화한다."""
+        self._window_size = window_size
+        self._lock = threading.Lock()
+        self._counters: dict[SeriesKey, float] = {}
+        self._gauges: dict[SeriesKey, float] = {}
+        self._summaries: dict[SeriesKey, _Summary] = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """카운터를 증가시킨다."""
+        key = _series_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        """게이지 값을 설정한다."""
+        key = _series_key(name, labels)
+        with self._lock:
+            self._gauges[key] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """요약 메트릭에 관측값을 추가한다."""
+        key = _series_key(name, labels)
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                summary = _Summary(window_size=self._window_size)
+                self._summaries[key] = summary
+            summary.observe(value)
+
+    def counter_value(self, name: str, **labels: Any) -> float:
+        """카운터 현재값을 반환한다(없으면 0)."""
+        with self._lock:
+            return self._counters.get(_series_key(name, labels), 0.0)
+
+    def quantile(self, name: str, q: float, min_samples: int = 1, **labels: Any) -> float | None:
+        """요약 메트릭의 최근 윈도우 분위수를 반환한다.
+
+        Args:
+            min_samples: 윈도우 관측 수가 이보다 적으면 `None`을 반환한다.
+        """
+        with self._lock:
+            summary = self._summaries.get(_series_key(name, labels))
+            if summary is None or len(summary.window) < min_samples:
+                return None
+            return summary.quantile(q)
+
+    def export_state(self) -> dict[str, Any]:
+        """다른 프로세스에서 병합할 수 있도록 원시 메트릭 상태를 pickle 가능한 형태로 반환한다."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "summaries": {
+                    key: (summary.count, summary.total, summary.maximum, list(summary.window))
+                    for key, summary in self._summaries.items()
+                },
+            }
+
+    def merge_state(self, state: dict[str, Any]) -> None:
+        """`export_state` 결과를 현재 저장소에 병합한다.
+
+        Rules:
+            - 카운터/요약 카운트/합계는 더한다.
+            - 게이지와 요약 최대값은 최댓값을 취한다.
+            - 요약 윈도우는 이어 붙인 뒤 `window_size`만큼 최근 값만 유지한다.
+        """
+        with self._lock:
+            for key, value in state.get("counters", {}).items():
+                self._counters[key] = self._counters.get(key, 0.0) + value
+            for key, value in state.get("gauges", {}).items():
+                self._gauges[key] = max(self._gauges.get(key, value), value)
+            for key, (count, total, maximum, window) in state.get("summaries", {}).items():
+                summary = self._summaries.get(key)
+                if summary is None:
+                    summary = _Summary(window_size=self._window_size)
+                    self._summaries[key] = summary
+                summary.count += count
+                summary.total += total
+                summary.maximum = max(summary.maximum, maximum)
+                summary.window.extend(window)
+
+    def snapshot(self) -> dict[str, Any]:
+        """전체 메트릭을 JSON 직렬화 가능한 dict로 반환한다."""
+        with self._lock:
+            summaries = {
+                _render_key(key): {
+                    "count": summary.count,
+                    "sum": summary.total,
+                    "max": summary.maximum,
+                    "p50": summary.quantile(0.5),
+                    "p95": summary.quantile(0.95),
+                    "p99": summary.quantile(0.99),
+                }
+                for key, summary in self._summaries.items()
+            }
+            return {
+                "counters": {_render_key(key): value for key, value in self._counters.items()},
+                "gauges": {_render_key(key): value for key, value in self._gauges.items()},
+                "summaries": summaries,
+            }
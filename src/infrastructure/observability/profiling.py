@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+
+IDLE_LEAVES = frozenset(
+    {
+        "threading:Condition.wait",
+        "threading:Event.wait",
+        "threading:Thread.join",
+        "queue:Queue.get",
+        "selectors:EpollSelector.select",
+        "selectors:KqueueSelector.select",
+        "selectors:PollSelector.select",
+        "selectors:SelectSelector.select",
+        "concurrent.futures.thread:_worker",
+        "socket:SocketIO.readinto",
+        "time:sleep",
+    }
+)
+"""대기 중인 스레드로 보고 기본적으로 집계에서 빼는 최하위 프레임 이름."""
+
+
+class SamplingProfiler:
+    """별도 스레드에서 모든 스레드의 파이썬 스택을 주기적으로 수집하는 샘플링 프로파일러.
+
+    Rules:
+        - 한 번에 하나의 세션만 실행한다. `seconds`가 지나면 스스로 멈춘다.
+        - 스택은 `스레드이름;모듈:함수;...` collapsed 형식으로 합산한다(flamegraph.pl/speedscope 입력).
+        - 최하위 프레임이 `IDLE_LEAVES`에 해당하는 대기 스택은 `include_idle=True`일 때만 집계한다.
+
+    Notes:
+        대상 코드를 계측하지 않으므로 수집 간격(기본 5ms)마다 `sys._current_frames()` 1회 비용만 든다.
+        프로세스 단위로 동작하므로 멀티 워커 모드에서는 요청을 받은 워커만 프로파일링한다.
+    """
+
+    def __init__(self, interval: float = 0.005, max_depth: int = 64) -> None:
+        """수집 간격(초)과 스택 최대 깊이를 설정한다."""
+        self.interval = interval
+        self.max_depth = max_depth
+        self._stacks: Counter[str] = Counter()
+        self._names: dict[CodeType, str] = {}
+        self._samples = 0
+        self._started_at: float | None = None
+        self._stopped_at: float | None = None
+        self._deadline = 0.0
+        self._include_idle = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds: float, include_idle: bool = False) -> dict[str, Any]:
+        """이전 결과를 비우고 `seconds` 동안 수집을 시작한다."""
+        with self._lock:
+            if self.running:
+                raise RuntimeError("프로파일러가 이미 실행 중입니다.")
+            self._stacks = Counter()
+            self._samples = 0
+            self._include_idle = include_idle
+            self._started_at = time.time()
+            self._stopped_at = None
+            self._deadline = time.monotonic() + seconds
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+        return self.status()
+
+    def stop(self) -> dict[str, Any]:
+        """실행 중인 수집을 멈추고 상태를 반환한다."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+        return self.status()
+
+    def status(self) -> dict[str, Any]:
+        """실행 여부, 수집 샘플 수, 고유 스택 수를 반환한다."""
+        with self._lock:
+            end = self._stopped_at or time.time()
+            return {
+                "running": self.running,
+                "interval_ms": self.interval * 1000,
+                "samples": self._samples,
+                "stacks": len(self._stacks),
+                "started_at": self._started_at,
+                "elapsed_seconds": end - self._started_at if self._started_at is not None else None,
+            }
+
+    def collapsed(self) -> str:
+        """합산한 스택을 collapsed 형식(`frame;frame;... count` 줄)으로 반환한다."""
+        with self._lock:
+            items = self._stacks.most_common()
+        return "".join(f"{stack} {count}\n" for stack, count in items)
+
+    def _frame_name(self, frame: FrameType) -> str:
+        code = frame.f_code
+        name = self._names.get(code)
+        if name is None:
+            name = f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}"
+            self._names[code] = name
+        return name
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval) and time.monotonic() < self._deadline:
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            collected: list[str] = []
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                names: list[str] = []
+                current: FrameType | None = frame
+                while current is not None and len(names) < self.max_depth:
+                    names.append(self._frame_name(current))
+                    current = current.f_back
+                if not self._include_idle and names and names[0] in IDLE_LEAVES:
+                    continue
+                names.append(thread_names.get(ident, str(ident)).replace(" ", "_"))
+                names.reverse()
+                collected.append(";".join(names))
+            with self._lock:
+                self._stacks.update(collected)
+                self._samples += 1
+        with self._lock:
+            self._stopped_at = time.time()
+
+
+def run_with_cprofile(func: Any, output_path: str | Path, top: int = 25) -> tuple[Any, str]:
+    """`func()`을 cProfile로 실행해 pstats 파일을 저장하고 `(반환값, 누적시간 상위 요약)`을 돌려준다.
+
+    Notes:
+        `func`이 예외를 던져도 그때까지의 프로파일은 저장한 뒤 예외를 다시 던진다.
+    """
+    profiler = cProfile.Profile()
+    try:
+        result = profiler.runcall(func)
+    finally:
+        profiler.dump_stats(str(output_path))
+    buffer = io.StringIO()
+    pstats.Stats(profiler, stream=buffer).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return result, buffer.getvalue()
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..serialization import dumps
+
+SpanKind = int
+"""OTLP span kind 값(1=INTERNAL, 2=SERVER, 3=CLIENT)."""
+
+SPAN_KIND_INTERNAL: SpanKind = 1
+SPAN_KIND_SERVER: SpanKind = 2
+SPAN_KIND_CLIENT: SpanKind = 3
+
+_CURRENT_SPAN: ContextVar["Span | None"] = ContextVar("current_span", default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    """트레이스 안의 단일 구간. `with` 블록으로 쓰면 블록 동안 현재 span이 된다."""
+
+    trace: "Trace"
+    name: str
+    span_id: str
+    parent_id: str | None
+    kind: SpanKind = SPAN_KIND_INTERNAL
+    start_ns: int = field(default_factory=time.time_ns)
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    events: list[tuple[str, int]] = field(default_factory=list)
+    _context_token: Token | None = None
+
+    def set(self, **attributes: Any) -> None:
+        """속성을 추가/갱신한다."""
+        self.attributes.update(attributes)
+
+    def event(self, name: str) -> None:
+        """현재 시각에 이름 있는 이벤트(예: first_byte)를 기록한다."""
+        self.events.append((name, time.time_ns()))
+
+    def end(self) -> None:
+        """구간을 종료한다. 루트 span이면 트레이스 전체를 tracer에 넘긴다."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        self.trace.finish_span(self)
+
+    def __enter__(self) -> "Span":
+        self._context_token = _CURRENT_SPAN.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc is not None:
+            self.attributes["error"] = repr(exc)
+        if self._context_token is not None:
+            _CURRENT_SPAN.reset(self._context_token)
+            self._context_token = None
+        self.end()
+
+
+class _NoopSpan:
+    """샘플링되지 않은 요청에서 쓰이는 아무 일도 하지 않는 span."""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def event(self, name: str) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+"""샘플링되지 않았을 때 반환되는 공유 no-op span."""
+
+SpanHandle = Span | _NoopSpan
+"""`start_span` 반환 타입(샘플링 여부에 따라 실제 span 또는 no-op span)."""
+
+
+class Trace:
+    """하나의 요청에 속한 span 묶음."""
+
+    def __init__(self, tracer: "Tracer", trace_id: str) -> None:
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.spans: list[Span] = []
+        self.root: Span | None = None
+        self._lock = threading.Lock()
+
+    def new_span(self, name: str, parent: Span | None, kind: SpanKind, attributes: dict[str, Any]) -> Span:
+        span = Span(
+            trace=self,
+            name=name,
+            span_id=os.urandom(8).hex(),
+            parent_id=parent.span_id if parent is not None else None,
+            kind=kind,
+            attributes=attributes,
+        )
+        if parent is None:
+            self.root = span
+        return span
+
+    def finish_span(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+        if span is self.root:
+            self.tracer.record(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """`/debug/traces` 응답용 요약(루트 기준 상대 시각, ms 단위)을 만든다."""
+        root = self.root
+        assert root is not None and root.end_ns is not None
+        origin = root.start_ns
+        with self._lock:
+            spans = sorted(self.spans, key=lambda item: item.start_ns)
+        return {
+            "trace_id": self.trace_id,
+            "name": root.name,
+            "start_unix_ns": origin,
+            "duration_ms": (root.end_ns - origin) / 1e6,
+            "spans": [
+                {
+                    "name": span.name,
+                    "span_id": span.span_id,
+                    "parent_id": span.parent_id,
+                    "offset_ms": (span.start_ns - origin) / 1e6,
+                    "duration_ms": ((span.end_ns or span.start_ns) - span.start_ns) / 1e6,
+                    "attributes": span.attributes,
+                    "events": {name: (at - origin) / 1e6 for name, at in span.events},
+                }
+                for span in spans
+            ],
+        }
+
+    def to_otlp(self, service_name: str) -> dict[str, Any]:
+        """OTLP/JSON `ExportTraceServiceRequest` 형식으로 변환한다."""
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "local-llm-tracing"},
+                            "spans": [_otlp_span(self.trace_id, span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    return {"key": key, "value": _otlp_value(value)}
+
+
+def _otlp_span(trace_id: str, span: Span) -> dict[str, Any]:
+    item: dict[str, Any] = {
+        "traceId": trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns or span.start_ns),
+        "attributes": [_otlp_attribute(key, value) for key, value in span.attributes.items() if value is not None],
+        "events": [{"name": name, "timeUnixNano": str(at)} for name, at in span.events],
+    }
+    if span.parent_id is not None:
+        item["parentSpanId"] = span.parent_id
+    if "error" in span.attributes:
+        item["status"] = {"code": 2, "message": str(span.attributes["error"])}
+    return item
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str, bool] | None:
+    """W3C `traceparent` 헤더에서 `(trace_id, parent_span_id, sampled)`를 꺼낸다(형식이 틀리면 `None`)."""
+    if not header:
+        return None
+    parts = header.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16 or len(parts[3]) != 2:
+        return None
+    try:
+        flags = int(parts[3], 16)
+        int(parts[1], 16)
+        int(parts[2], 16)
+    except ValueError:
+        return None
+    return parts[1], parts[2], bool(flags & 0x01)
+
+
+class Tracer:
+    """샘플링된 요청의 트레이스를 링 버퍼에 보관하고 선택적으로 OTLP/JSON 파일에 내보내는 수집기.
+
+    Notes:
+        - 샘플링되지 않은 요청에서는 현재 span이 없으므로 모든 `start_span` 호출이
+          공유 no-op span을 반환한다(컨텍스트 변수 조회 1회).
+        - 내보내기 파일은 트레이스당 `ExportTraceServiceRequest` 한 줄(JSON Lines)이다.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        buffer_size: int = 256,
+        export_path: str | Path | None = None,
+        service_name: str = "local-llm-api",
+    ) -> None:
+        """샘플링 비율/버퍼 크기/내보내기 경로로 초기화한다."""
+        self.sample_rate = sample_rate
+        self.service_name = service_name
+        self.export_path = Path(export_path) if export_path else None
+        self._traces: deque[Trace] = deque(maxlen=buffer_size)
+        self._lock = threading.Lock()
+
+    def should_sample(self, forced: bool = False) -> bool:
+        """이번 요청을 샘플링할지 결정한다."""
+        return forced or (self.sample_rate > 0 and random.random() < self.sample_rate)
+
+    def start_trace(
+        self,
+        name: str,
+        trace_id: str | None = None,
+        parent_id: str | None = None,
+        kind: SpanKind = SPAN_KIND_SERVER,
+    ) -> Span:
+        """새 트레이스의 루트 span을 만든다(`with`로 진입해야 하위 span이 연결된다).
+
+        Args:
+            trace_id / parent_id: 상위 서비스가 `traceparent`로 넘긴 트레이스를 이어 쓸 때 지정한다.
+        """
+        trace = Trace(self, trace_id or os.urandom(16).hex())
+        root = trace.new_span(name, None, kind, {})
+        root.parent_id = parent_id
+        return root
+
+    def record(self, trace: Trace) -> None:
+        """완료된 트레이스를 링 버퍼에 넣고 내보내기 파일에 추가한다."""
+        with self._lock:
+            self._traces.append(trace)
+            if self.export_path is not None:
+                with self.export_path.open("ab") as handle:
+                    handle.write(dumps(trace.to_otlp(self.service_name)) + b"\n")
+
+    def recent(self, limit: int = 50, trace_id: str | None = None) -> list[dict[str, Any]]:
+        """최근 트레이스 요약을 최신순으로 반환한다."""
+        with self._lock:
+            traces = list(self._traces)
+        traces.reverse()
+        if trace_id is not None:
+            traces = [trace for trace in traces if trace.trace_id == trace_id]
+        return [trace.to_dict() for trace in traces[:limit]]
+
+
+def current_span() -> Span | None:
+    """현재 컨텍스트의 span을 반환한다(샘플링되지 않았으면 `None`)."""
+    return _CURRENT_SPAN.get()
+
+
+def start_span(name: str, kind: SpanKind = SPAN_KIND_INTERNAL, **attributes: Any) -> SpanHandle:
+    """현재 span의 하위 span을 만든다. 현재 span이 없으면 no-op span을 반환한다."""
+    parent = _CURRENT_SPAN.get()
+    if parent is None:
+        return NOOP_SPAN
+    return parent.trace.new_span(name, parent, kind, attributes)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import IO, Any
+
+from ..config.settings import CaptureConfig
+from ..serialization import dumps, loads
+
+CAPTURE_VERSION = 1
+
+
+def prompt_digest(prompt: str) -> str:
+    """캡처에 남기는 프롬프트 해시(SHA-256 hex)."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class TrafficRecorder:
+    """샘플링한 추론 요청을 재생용 캡처 로그(JSON Lines)에 추가하는 기록기.
+
+    Rules:
+        - 프로세스마다 `<dir>/capture-<pid>.jsonl` 한 파일에만 추가하므로 멀티 워커에서도 잠금이 필요 없다.
+        - 파일이 `max_bytes`를 넘으면 `capture-<pid>-<시각 ns>.jsonl`로 이름을 바꾸고 새 파일을 연다.
+          넘긴 파일은 프로세스별로 최근 `max_files`개만 남긴다.
+        - 한 줄은 `{"v", "ts", "model_id", "options", "tenant", "prompt" | "prompt_sha256", "prompt_chars",
+          "status", "ok", "latency", "completion_tokens"}`이다. `ts`는 요청 도착 시각(epoch 초)이다.
+        - 기록 실패(디스크 부족 등)는 요청 처리에 영향을 주지 않도록 삼킨다.
+    """
+
+    def __init__(self, config: CaptureConfig) -> None:
+        self.config = config
+        self.directory = Path(config.dir)
+        self.path = self.directory / f"capture-{os.getpid()}.jsonl"
+        self._file: IO[bytes] | None = None
+        self._size = 0
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    def should_sample(self) -> bool:
+        """이번 요청을 캡처할지 `sample_rate`로 정한다."""
+        rate = self.config.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and self._random.random() < rate)
+
+    def record(
+        self,
+        ts: float,
+        model_id: str,
+        prompt: str,
+        options: dict[str, Any],
+        status: int,
+        ok: bool,
+        latency: float,
+        tenant: str | None = None,
+        completion_tokens: int | None = None,
+    ) -> None:
+        """요청 한 건을 캡처 로그에 추가한다."""
+        entry: dict[str, Any] = {
+            "v": CAPTURE_VERSION,
+            "ts": ts,
+            "model_id": model_id,
+            "options": options,
+            "tenant": tenant,
+        }
+        if self.config.prompts == "full":
+            entry["prompt"] = prompt
+        else:
+            entry["prompt_sha256"] = prompt_digest(prompt)
+        entry["prompt_chars"] = len(prompt)
+        entry.update(status=status, ok=ok, latency=round(latency, 6), completion_tokens=completion_tokens)
+        line = dumps(entry) + b"\n"
+        try:
+            with self._lock:
+                output = self._open()
+                output.write(line)
+                output.flush()
+                self._size += len(line)
+                if self._size >= self.config.max_bytes:
+                    self._rotate()
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open(self) -> IO[bytes]:
+        if self._file is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("ab")
+            self._size = self._file.tell()
+        return self._file
+
+    def _rotate(self) -> None:
+        """현재 파일을 시각 이름으로 넘기고 오래된 넘긴 파일을 정리한다(잠금 안에서 호출)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        target = self.path.with_name(f"{self.path.stem}-{time.time_ns()}.jsonl")
+        os.replace(self.path, target)
+        rotated = sorted(self.directory.glob(f"{self.path.stem}-*.jsonl"))
+        for stale in rotated[: max(0, len(rotated) - self.config.max_files)]:
+            stale.unlink(missing_ok=True)
+
+
+def iter_capture_files(path: str | Path) -> Iterator[Path]:
+    """캡처 파일 경로(파일이면 그 파일, 디렉터리면 `capture-*.jsonl` 전체)."""
+    path = Path(path)
+    if path.is_dir():
+        yield from sorted(path.glob("capture-*.jsonl"))
+    else:
+        yield path
+
+
+def read_capture(path: str | Path) -> list[dict[str, Any]]:
+    """캡처 파일(또는 디렉터리)의 기록을 도착 시각 순으로 읽는다. 해석할 수 없는 줄(잘린 마지막 줄 등)은 건너뛴다."""
+    records: list[dict[str, Any]] = []
+    for file in iter_capture_files(path):
+        with file.open("rb") as source:
+            for line in source:
+                if not line.strip():
+                    continue
+                try:
+                    record = loads(line)
+                except Exception:
+                    continue
+                if isinstance(record, dict) and record.get("v") == CAPTURE_VERSION and "model_id" in record:
+                    records.append(record)
+    records.sort(key=lambda record: record.get("ts", 0.0))
+    return records
@@ -1,6 +1,62 @@
 """런타임 제어 계층 공개 심볼을 모아 제공한다."""
 
+from .autoscaler import EngineAutoscaler, ScalingSignal
 from .docs_publisher import ApiDocsPublisher
+from .engine_driver import (
+    EngineDriver,
+    ProcessEngineDriver,
+    SimulatedEngineDriver,
+    TUNABLE_PARAMETERS,
+    apply_engine_parameters,
+    current_engine_parameters,
+)
+from .fake_engine import FakeEngineServer
+from .fleet import FleetController, FleetPool
+from .node_agent import NodeAgent, NodeAgentClient, NodeAgentServer
+from .prewarm import (
+    PageCachePrewarmer,
+    PrewarmReport,
+    evict_page_cache,
+    expand_weight_paths,
+    resolve_weight_files,
+)
 from .process_manager import EngineProcessInfo, ProcessManager
+from .shared_state import (
+    MetricsHub,
+    SharedStateClient,
+    SharedStateServer,
+    connect_shared_state_from_env,
+    serve_shared_state,
+    start_metrics_publisher,
+)
 
-__all__ = ["ApiDocsPublisher", "EngineProcessInfo", "ProcessManager"]
+__all__ = [
+    "ApiDocsPublisher",
+    "EngineAutoscaler",
+    "EngineDriver",
+    "EngineProcessInfo",
+    "FakeEngineServer",
+    "FleetController",
+    "FleetPool",
+    "MetricsHub",
+    "NodeAgent",
+    "NodeAgentClient",
+    "NodeAgentServer",
+    "PageCachePrewarmer",
+    "PrewarmReport",
+    "ProcessEngineDriver",
+    "ProcessManager",
+    "ScalingSignal",
+    "SharedStateClient",
+    "SharedStateServer",
+    "SimulatedEngineDriver",
+    "TUNABLE_PARAMETERS",
+    "apply_engine_parameters",
+    "connect_shared_state_from_env",
+    "current_engine_parameters",
+    "evict_page_cache",
+    "expand_weight_paths",
+    "resolve_weight_files",
+    "serve_shared_state",
+    "start_metrics_publisher",
+]
@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..config.settings import AppSettings, EndpointConfig, ModelAutoscalePolicy, ModelConfig
+from ..observability import MetricsRegistry
+from .engine_driver import EngineDriver, ProcessEngineDriver, SimulatedEngineDriver
+from .process_manager import is_port_open
+
+COLD_START_SMOOTHING = 0.5
+"""관측한 기동 시간을 콜드 스타트 추정치에 반영하는 지수 이동 평균 비율."""
+
+SCALE_DOWN_LOAD_RATIO = 0.5
+"""레플리카 하나를 뺀 뒤의 부하가 `target_load`의 이 비율 이하일 때만 축소 대상으로 본다(진동 방지)."""
+
+
+@dataclass(slots=True)
+class ScalingSignal:
+    """오토스케일 판단에 쓰는 모델 하나의 현재 수요.
+
+    Attributes:
+        in_flight: 엔진에서 처리 중인 요청 수.
+        queued: 디스패치 큐 등에서 엔진 슬롯을 기다리는 요청 수.
+        base_replicas: 오토스케일러가 관리하지 않는 정상 레플리카 수(설정/플릿 엔드포인트).
+        latency_p50 / latency_p90: 최근 엔진 요청 지연 분위수(초). 표본이 없으면 `None`.
+    """
+
+    in_flight: int = 0
+    queued: int = 0
+    base_replicas: int = 1
+    latency_p50: float | None = None
+    latency_p90: float | None = None
+
+    @property
+    def demand(self) -> int:
+        return self.in_flight + self.queued
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "base_replicas": self.base_replicas,
+            "latency_p50": self.latency_p50,
+            "latency_p90": self.latency_p90,
+        }
+
+
+@dataclass(slots=True)
+class _Replica:
+    """오토스케일러가 띄운 레플리카 하나(`starting` → `running` → `draining` → `stopped` | `failed`)."""
+
+    model_id: str
+    port: int
+    gpu_memory: float
+    driver: EngineDriver
+    state: str = "starting"
+    endpoint: EndpointConfig | None = None
+    started_at: float = field(default_factory=time.time)
+    ready_seconds: float | None = None
+    draining_since: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "port": self.endpoint.port if self.endpoint is not None else self.port,
+            "state": self.state,
+            "gpu_memory": self.gpu_memory,
+            "started_at": self.started_at,
+            "ready_seconds": self.ready_seconds,
+            "draining_since": self.draining_since,
+        }
+
+
+@dataclass(slots=True)
+class _ModelScaleState:
+    """모델별 오토스케일 판단 상태."""
+
+    cold_start: float
+    pressure_since: float | None = None
+    idle_since: float | None = None
+    blocked_until: float = 0.0
+    budget_reported: bool = False
+    signal: ScalingSignal = field(default_factory=ScalingSignal)
+
+
+class EngineAutoscaler:
+    """모델별 대기열 깊이와 지연을 보고 로컬 엔진 레플리카 프로세스를 늘리고 줄이는 오토스케일러.
+
+    Rules:
+        - `interval`마다 `autoscale` 정책이 있는 모델의 수요(`signals`)를 읽는다. 용량은
+          `(정상 기본 레플리카 + 실행/기동 중 추가 레플리카) × target_load`이며, 진행 중+대기 요청이 용량을 넘거나
+          p90 지연이 `max_latency_p90`을 넘으면 부하가 높은 상태다.
+        - 부하가 높은 상태가 `scale_up_after`초 이상 이어지고, 현재 용량으로 밀린 요청을 처리하는 데 걸릴 추정 시간
+          (`초과 요청 수 / 용량 × p50 지연`)이나 부하 지속 시간이 콜드 스타트 추정치 이상일 때만 레플리카를
+          하나 띄운다. 준비되기 전에 밀린 요청이 끝날 레플리카는 띄우지 않는다는 뜻이다.
+        - 레플리카는 `port_start~port_end`의 빈 포트에 `ProcessManager`(`simulate`면 가짜 엔진)로 띄우고, 헬스 요청에
+          응답하면 `on_replicas`로 라우팅에 넣는다. 실제 기동 시간으로 콜드 스타트 추정치를 갱신한다.
+        - 모델 `max_replicas`, 전체 `max_replicas`, `gpu_memory_budget`을 넘는 확장은 하지 않는다.
+          기동에 실패하면 콜드 스타트 추정치만큼 다시 시도하지 않는다.
+        - 레플리카 하나를 뺀 부하가 `target_load`의 절반 이하인 상태가 `idle_after`와 콜드 스타트 추정치 중 긴 시간
+          이상 이어지면 가장 최근 레플리카를 라우팅에서 빼고(drain), 모델의 진행 중 요청이 없어지거나
+          `drain_timeout`이 지나면 프로세스를 내린다.
+        - 스케일링 이벤트는 표준 출력(`[AUTOSCALE]`)과 최근 이벤트 목록(`status()`), 메트릭에 남긴다.
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        signals: Callable[[str], ScalingSignal],
+        on_replicas: Callable[[str, list[EndpointConfig]], None] | None = None,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.settings = settings
+        self.config = settings.runtime.autoscale
+        self.signals = signals
+        self.on_replicas = on_replicas
+        self.metrics = metrics
+        self._clock = clock
+        self._models = [model for model in settings.enabled_models() if model.autoscale is not None]
+        self._states = {
+            model.id: _ModelScaleState(cold_start=model.autoscale.cold_start)
+            for model in self._models
+            if model.autoscale is not None
+        }
+        self._replicas: dict[str, list[_Replica]] = {model.id: [] for model in self._models}
+        self._events: deque[dict[str, Any]] = deque(maxlen=self.config.history_size)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """판단 스레드를 시작한다(이미 실행 중이거나 정책이 있는 모델이 없으면 무시)."""
+        if self.running or not self._models:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="engine-autoscaler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """판단 스레드를 멈추고 띄운 레플리카를 모두 내린다."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            replicas = [replica for items in self._replicas.values() for replica in items]
+            for items in self._replicas.values():
+                items.clear()
+        for replica in replicas:
+            replica.state = "stopped"
+            replica.driver.shutdown()
+
+    def tick(self) -> list[dict[str, Any]]:
+        """모든 모델을 한 번 판단하고 이번에 발생한 스케일링 이벤트를 반환한다."""
+        events: list[dict[str, Any]] = []
+        for model in self._models:
+            assert model.autoscale is not None
+            events.extend(self._evaluate(model, model.autoscale, self.signals(model.id)))
+        return events
+
+    def status(self) -> dict[str, Any]:
+        """모델별 수요, 레플리카, 콜드 스타트 추정치와 최근 스케일링 이벤트."""
+        with self._lock:
+            models = {
+                model.id: {
+                    "signal": self._states[model.id].signal.to_dict(),
+                    "target_load": self._target_load(model),
+                    "cold_start_estimate": self._states[model.id].cold_start,
+                    "pressure_since": self._states[model.id].pressure_since,
+                    "idle_since": self._states[model.id].idle_since,
+                    "replicas": [replica.to_dict() for replica in self._replicas[model.id]],
+                }
+                for model in self._models
+            }
+            events = list(self._events)
+        return {
+            "running": self.running,
+            "max_replicas": self.config.max_replicas,
+            "gpu_memory_budget": self.config.gpu_memory_budget,
+            "gpu_memory_used": self._gpu_memory_used(),
+            "models": models,
+            "events": events,
+        }
+
+    def _evaluate(
+        self,
+        model: ModelConfig,
+        policy: ModelAutoscalePolicy,
+        signal: ScalingSignal,
+    ) -> list[dict[str, Any]]:
+        now = self._clock()
+        state = self._states[model.id]
+        events = self._finish_draining(model, signal, now)
+        with self._lock:
+            state.signal = signal
+            replicas = self._replicas[model.id]
+            running = [replica for replica in replicas if replica.state == "running"]
+            starting = [replica for replica in replicas if replica.state == "starting"]
+        target = self._target_load(model)
+        serving = signal.base_replicas + len(running)
+        capacity = (serving + len(starting)) * target
+        limit = policy.max_latency_p90
+        slow = signal.demand > 0 and limit is not None and (signal.latency_p90 or 0.0) > limit
+        if signal.demand > capacity or slow:
+            state.idle_since = None
+            state.pressure_since = state.pressure_since if state.pressure_since is not None else now
+            pressure = now - state.pressure_since
+            backlog = self._backlog_seconds(signal, serving * target)
+            worth = backlog >= state.cold_start or pressure >= state.cold_start
+            if pressure >= policy.scale_up_after and worth and now >= state.blocked_until:
+                event = self._scale_up(model, policy, signal, backlog, pressure)
+                if event is not None:
+                    events.append(event)
+            return events
+
+        state.pressure_since = None
+        state.budget_reported = False
+        if not running or signal.demand > (serving - 1) * target * SCALE_DOWN_LOAD_RATIO:
+            state.idle_since = None
+            return events
+        state.idle_since = state.idle_since if state.idle_since is not None else now
+        if now - state.idle_since >= max(policy.idle_after, state.cold_start):
+            state.idle_since = None
+            events.append(self._drain(model, running[-1], signal, now))
+        return events
+
+    def _scale_up(
+        self,
+        model: ModelConfig,
+        policy: ModelAutoscalePolicy,
+        signal: ScalingSignal,
+        backlog: float,
+        pressure: float,
+    ) -> dict[str, Any] | None:
+        state = self._states[model.id]
+        gpu_memory = self._replica_gpu_memory(model, policy)
+        host = self.settings.runtime.endpoints[model.engine].host
+        with self._lock:
+            reason = self._scale_up_blocked(model, policy, gpu_memory)
+            candidates = self._port_candidates() if reason is None else []
+        # 포트 확인은 소켓 연결을 시도하므로 잠금 밖에서 한다(`status()`/`_publish`를 막지 않도록).
+        port = next((candidate for candidate in candidates if not is_port_open(host, candidate)), None)
+        replica = None
+        with self._lock:
+            # 확인하는 사이 다른 스레드가 레플리카를 띄웠을 수 있으므로 다시 검사한다.
+            reason = reason or self._scale_up_blocked(model, policy, gpu_memory)
+            if reason is None and (port is None or port not in self._port_candidates()):
+                reason = "no_free_port"
+            if reason is None and port is not None:
+                replica = _Replica(model.id, port, gpu_memory, self._driver(model, port), started_at=self._clock())
+                self._replicas[model.id].append(replica)
+        if replica is None:
+            if state.budget_reported:
+                return None
+            state.budget_reported = True
+            return self._event(model.id, "scale_up_blocked", reason=reason, signal=signal.to_dict())
+        threading.Thread(target=self._launch, args=(model, replica), name=f"autoscale-{model.id}", daemon=True).start()
+        return self._event(
+            model.id,
+            "scale_up",
+            port=port,
+            backlog_seconds=round(backlog, 3),
+            pressure_seconds=round(pressure, 3),
+            cold_start_estimate=round(state.cold_start, 3),
+            signal=signal.to_dict(),
+        )
+
+    def _launch(self, model: ModelConfig, replica: _Replica) -> None:
+        """레플리카를 띄우고 준비되면 라우팅에 넣는다(그 사이 중지되었으면 바로 내린다)."""
+        try:
+            endpoint: EndpointConfig | None = replica.driver.launch({})
+            error = None
+        except Exception as exc:
+            endpoint, error = None, str(exc)
+        state = self._states[model.id]
+        with self._lock:
+            cancelled = replica.state != "starting"
+            if not cancelled and endpoint is not None:
+                replica.state, replica.endpoint = "running", endpoint
+                replica.ready_seconds = self._clock() - replica.started_at
+                state.cold_start += COLD_START_SMOOTHING * (replica.ready_seconds - state.cold_start)
+            elif not cancelled:
+                replica.state = "failed"
+                self._replicas[model.id].remove(replica)
+                state.blocked_until = self._clock() + state.cold_start
+        if cancelled or endpoint is None:
+            replica.driver.shutdown()
+        if cancelled:
+            return
+        if endpoint is None:
+            self._event(model.id, "scale_up_failed", port=replica.port, error=error)
+            return
+        if self.metrics is not None:
+            self.metrics.observe("autoscale_cold_start_seconds", replica.ready_seconds or 0.0, model=model.id)
+        self._event(model.id, "replica_ready", port=endpoint.port, ready_seconds=round(replica.ready_seconds or 0.0, 3))
+        self._publish(model.id)
+
+    def _drain(self, model: ModelConfig, replica: _Replica, signal: ScalingSignal, now: float) -> dict[str, Any]:
+        with self._lock:
+            replica.state, replica.draining_since = "draining", now
+        self._publish(model.id)
+        return self._event(model.id, "scale_down", port=replica.to_dict()["port"], signal=signal.to_dict())
+
+    def _finish_draining(self, model: ModelConfig, signal: ScalingSignal, now: float) -> list[dict[str, Any]]:
+        """진행 중 요청이 없거나 `drain_timeout`이 지난 drain 레플리카를 내린다."""
+        with self._lock:
+            done = [
+                replica
+                for replica in self._replicas[model.id]
+                if replica.state == "draining"
+                and (signal.in_flight == 0 or now - (replica.draining_since or now) >= self.config.drain_timeout)
+            ]
+            for replica in done:
+                replica.state = "stopped"
+                self._replicas[model.id].remove(replica)
+        events = []
+        for replica in done:
+            replica.driver.shutdown()
+            events.append(self._event(model.id, "replica_stopped", port=replica.to_dict()["port"]))
+        if done:
+            self._publish(model.id)
+        return events
+
+    def _publish(self, model_id: str) -> None:
+        """`running` 레플리카 엔드포인트를 라우팅에 반영하고 레플리카 수 게이지를 갱신한다."""
+        with self._lock:
+            replicas = list(self._replicas[model_id])
+        endpoints = [
+            replica.endpoint for replica in replicas if replica.state == "running" and replica.endpoint is not None
+        ]
+        if self.on_replicas is not None:
+            self.on_replicas(model_id, endpoints)
+        if self.metrics is not None:
+            for state in ("starting", "running", "draining"):
+                count = sum(1 for replica in replicas if replica.state == state)
+                self.metrics.set_gauge("autoscale_replicas", float(count), model=model_id, state=state)
+
+    def _event(self, model_id: str, action: str, **details: Any) -> dict[str, Any]:
+        event = {"time": self._clock(), "model_id": model_id, "action": action, **details}
+        with self._lock:
+            self._events.append(event)
+        if self.metrics is not None:
+            self.metrics.inc("autoscale_events_total", model=model_id, action=action)
+        summary = " ".join(f"{key}={value}" for key, value in details.items() if key != "signal")
+        print(f"[AUTOSCALE] {model_id} {action} {summary}".rstrip())
+        return event
+
+    def _driver(self, model: ModelConfig, port: int) -> EngineDriver:
+        if self.config.simulate:
+            return SimulatedEngineDriver(model.engine)
+        replica_settings = copy.deepcopy(self.settings)
+        endpoint = replica_settings.runtime.endpoints[model.engine]
+        endpoint.port, endpoint.replicas = port, []
+        return ProcessEngineDriver(replica_settings, model, startup_timeout=self.config.startup_timeout)
+
+    def _scale_up_blocked(self, model: ModelConfig, policy: ModelAutoscalePolicy, gpu_memory: float) -> str | None:
+        """레플리카를 더 띄울 수 없는 이유(한도 이름), 띄울 수 있으면 `None`(잠금 안에서 호출)."""
+        active = [replica for replica in self._replicas[model.id] if replica.state in ("starting", "running")]
+        total = sum(1 for items in self._replicas.values() for replica in items if replica.state != "stopped")
+        if len(active) >= policy.max_replicas:
+            return "model_max_replicas"
+        if total >= self.config.max_replicas:
+            return "max_replicas"
+        budget = self.config.gpu_memory_budget
+        if budget is not None and self._gpu_memory_used() + gpu_memory > budget + 1e-9:
+            return "gpu_memory_budget"
+        return None
+
+    def _port_candidates(self) -> list[int]:
+        """포트 범위에서 다른 레플리카가 쓰지 않는 포트 목록(잠금 안에서 호출, 열려 있는지는 확인하지 않는다)."""
+        used = {replica.port for items in self._replicas.values() for replica in items}
+        return [port for port in range(self.config.port_start, self.config.port_end + 1) if port not in used]
+
+    def _gpu_memory_used(self) -> float:
+        return sum(
+            replica.gpu_memory
+            for items in self._replicas.values()
+            for replica in items
+            if replica.state != "stopped"
+        )
+
+    def _target_load(self, model: ModelConfig) -> float:
+        assert model.autoscale is not None
+        return model.autoscale.target_load or float(self.settings.dispatch_slots(model))
+
+    @staticmethod
+    def _replica_gpu_memory(model: ModelConfig, policy: ModelAutoscalePolicy) -> float:
+        """레플리카 하나가 차지할 GPU 메모리. Ollama는 예산이 있으면 `gpu_memory`가 필수다(설정 검증)."""
+        if policy.gpu_memory is not None:
+            return policy.gpu_memory
+        if model.engine == "vllm":
+            return model.parameters.gpu_memory_utilization or 0.9
+        return 0.0
+
+    @staticmethod
+    def _backlog_seconds(signal: ScalingSignal, capacity: float) -> float:
+        """현재 용량으로 용량을 넘는 요청을 처리하는 데 걸릴 추정 시간(용량이 없으면 무한대)."""
+        excess = signal.demand - capacity
+        if excess <= 0:
+            return 0.0
+        if capacity <= 0:
+            return float("inf")
+        return excess / capacity * (signal.latency_p50 or 0.0)
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                self.tick()
+            except Exception as exc:
+                # 판단 오류로 스레드가 죽으면 레플리카가 방치되므로 기록만 하고 다음 주기에 다시 시도한다.
+                print(f"[WARN] 오토스케일 판단 실패: {exc}")
+            if self._stop.wait(self.config.interval):
+                return
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import copy
+import time
+from typing import Any, Protocol
+
+from ..adapters import EngineAdapter, OllamaAdapter, VllmAdapter
+from ..config.settings import AppSettings, ConfigValidationError, EndpointConfig, EngineType, ModelConfig
+from .fake_engine import FakeEngineServer
+from .process_manager import ProcessManager
+
+TUNABLE_PARAMETERS: dict[EngineType, tuple[str, ...]] = {
+    "ollama": ("num_parallel",),
+    "vllm": ("max_num_seqs", "max_num_batched_tokens", "gpu_memory_utilization"),
+}
+"""엔진별로 기동 시 조정할 수 있는 파라미터(Ollama는 `runtime.ollama`, vLLM은 모델 `parameters`)."""
+
+
+def apply_engine_parameters(settings: AppSettings, model_id: str, parameters: dict[str, Any]) -> AppSettings:
+    """기동 파라미터를 반영한 설정 사본을 만든다(원본 설정은 바꾸지 않는다).
+
+    Raises:
+        ConfigValidationError: 모델이 없거나 엔진이 지원하지 않는 파라미터가 있는 경우.
+    """
+    tuned = copy.deepcopy(settings)
+    model = tuned.get_model(model_id)
+    if model is None:
+        raise ConfigValidationError(f"모델을 찾을 수 없습니다: {model_id}")
+    unknown = set(parameters) - set(TUNABLE_PARAMETERS[model.engine])
+    if unknown:
+        raise ConfigValidationError(f"{model.engine} 엔진이 지원하지 않는 튜닝 파라미터입니다: {sorted(unknown)}")
+    for name, value in parameters.items():
+        target = tuned.runtime.ollama if model.engine == "ollama" else model.parameters
+        setattr(target, name, value)
+    return tuned
+
+
+def current_engine_parameters(settings: AppSettings, model: ModelConfig) -> dict[str, Any]:
+    """설정에 지정된 현재 기동 파라미터(지정하지 않은 값은 `None`)."""
+    source = settings.runtime.ollama if model.engine == "ollama" else model.parameters
+    return {name: getattr(source, name) for name in TUNABLE_PARAMETERS[model.engine]}
+
+
+class EngineDriver(Protocol):
+    """튜너가 파라미터 조합마다 엔진을 띄우고 내리는 인터페이스."""
+
+    engine: EngineType
+
+    def launch(self, parameters: dict[str, Any]) -> EndpointConfig:
+        """파라미터로 엔진을 기동하고 요청을 받을 준비가 되면 엔드포인트를 반환한다(실패 시 `RuntimeError`)."""
+        ...
+
+    def shutdown(self) -> None:
+        """`launch()`로 띄운 엔진을 내린다(띄운 것이 없으면 무시)."""
+        ...
+
+
+class ProcessEngineDriver:
+    """`ProcessManager`로 실제 엔진 프로세스를 파라미터마다 다시 띄우는 드라이버.
+
+    Rules:
+        - 설정 엔드포인트에 이미 엔진이 떠 있으면 파라미터를 적용할 수 없으므로 기동하지 않고 실패한다.
+        - 기동 후 헬스 요청이 성공할 때까지 `startup_timeout`초 기다린다(vLLM은 모델 적재에 수 분이 걸린다).
+        - 내린 뒤에는 포트가 닫힐 때까지 기다려 다음 기동이 이전 프로세스와 겹치지 않게 한다.
+    """
+
+    def __init__(self, settings: AppSettings, model: ModelConfig, startup_timeout: float = 900.0) -> None:
+        self.settings = settings
+        self.model = model
+        self.engine: EngineType = model.engine
+        self.startup_timeout = startup_timeout
+        self._manager: ProcessManager | None = None
+
+    def launch(self, parameters: dict[str, Any]) -> EndpointConfig:
+        tuned = apply_engine_parameters(self.settings, self.model.id, parameters)
+        endpoint = tuned.runtime.endpoints[self.engine]
+        manager = ProcessManager(tuned)
+        if manager._is_port_open(endpoint.host, endpoint.port):
+            raise RuntimeError(
+                f"{self.engine} 엔드포인트({endpoint.host}:{endpoint.port})에 이미 엔진이 떠 있어 "
+                "튜닝 파라미터를 적용할 수 없습니다. 먼저 엔진을 중지하세요."
+            )
+        self._manager = manager
+        manager.start_engines([self.engine], vllm_model_id=self.model.id)
+        adapter = self._adapter(endpoint)
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if not manager.status():
+                raise RuntimeError(f"{self.engine} 프로세스가 준비 전에 종료되었습니다(파라미터: {parameters}).")
+            if adapter.health_check(timeout=2).ok:
+                return EndpointConfig(host=endpoint.host, port=endpoint.port)
+            time.sleep(1.0)
+        raise RuntimeError(f"{self.engine} 엔진이 {self.startup_timeout:.0f}초 안에 준비되지 않았습니다.")
+
+    def shutdown(self) -> None:
+        manager, self._manager = self._manager, None
+        if manager is None:
+            return
+        manager.stop_all()
+        endpoint = self.settings.runtime.endpoints[self.engine]
+        deadline = time.monotonic() + 30
+        while manager._is_port_open(endpoint.host, endpoint.port) and time.monotonic() < deadline:
+            time.sleep(0.2)
+
+    def _adapter(self, endpoint: EndpointConfig) -> EngineAdapter:
+        if self.engine == "ollama":
+            return OllamaAdapter(host=endpoint.host, port=endpoint.port)
+        return VllmAdapter(host=endpoint.host, port=endpoint.port)
+
+
+class SimulatedEngineDriver:
+    """`FakeEngineServer`로 기동 파라미터의 효과를 흉내 내는 드라이버(튜닝 루프 검증/오프라인 테스트용).
+
+    Rules:
+        - 동시 생성 슬롯: Ollama는 `num_parallel`, vLLM은 `max_num_seqs`와
+          `kv_capacity × gpu_memory_utilization`(KV 캐시에 들어가는 시퀀스 수) 중 작은 값이다.
+        - 동시 생성이 늘수록 토큰 지연이 `batch_slowdown` 비율로 커지고, 프롬프트는
+          `max_num_batched_tokens` 단위로 나눠 프리필한다.
+        - `gpu_memory_utilization`이 `oom_above`를 넘으면 기동에 실패한다(메모리 부족 모사).
+    """
+
+    def __init__(
+        self,
+        engine: EngineType,
+        kv_capacity: int = 128,
+        base_latency: float = 0.01,
+        token_latency: float = 0.002,
+        batch_slowdown: float = 0.05,
+        prefill_latency: float = 0.004,
+        oom_above: float = 0.95,
+    ) -> None:
+        self.engine = engine
+        self.kv_capacity = kv_capacity
+        self.base_latency = base_latency
+        self.token_latency = token_latency
+        self.batch_slowdown = batch_slowdown
+        self.prefill_latency = prefill_latency
+        self.oom_above = oom_above
+        self._server: FakeEngineServer | None = None
+
+    def launch(self, parameters: dict[str, Any]) -> EndpointConfig:
+        if self.engine == "ollama":
+            slots = int(parameters.get("num_parallel") or 1)
+            chunk = None
+        else:
+            utilization = float(parameters.get("gpu_memory_utilization") or 0.9)
+            if utilization > self.oom_above:
+                raise RuntimeError(f"시뮬레이션 메모리 부족: gpu_memory_utilization={utilization}")
+            slots = min(int(parameters.get("max_num_seqs") or 256), max(1, int(self.kv_capacity * utilization)))
+            chunk = int(parameters.get("max_num_batched_tokens") or 2048)
+        self._server = FakeEngineServer(
+            base_latency=self.base_latency,
+            token_latency=self.token_latency,
+            slots=slots,
+            batch_slowdown=self.batch_slowdown,
+            prefill_chunk_tokens=chunk,
+            prefill_latency=self.prefill_latency if chunk else 0.0,
+        ).start()
+        return EndpointConfig(host=self._server.host, port=self._server.port)
+
+    def shutdown(self) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            server.stop()
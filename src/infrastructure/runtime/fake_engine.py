@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from ..serialization import dumps, loads
+
+_WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit")
+
+
+class _FakeEngineHandler(BaseHTTPRequestHandler):
+    """Ollama/vLLM 생성·조회 API 형태로 응답하는 요청 핸들러."""
+
+    server: "_FakeHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        engine = self.server.engine
+        if self.path == "/api/version":
+            self._send_json({"version": "fake"})
+        elif self.path in ("/api/tags", "/api/ps"):
+            self._send_json({"models": [{"name": name, "model": name, "size": 0} for name in engine.models]})
+        elif self.path == "/health":
+            self._send_json({})
+        elif self.path == "/v1/models":
+            self._send_json({"object": "list", "data": [{"id": name, "object": "model"} for name in engine.models]})
+        else:
+            self._send_json({"error": f"not found: {self.path}"}, status=404)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = loads(self.rfile.read(length)) if length else {}
+        except Exception:
+            self._send_json({"error": "invalid json"}, status=400)
+            return
+        if self.path == "/api/generate":
+            self._ollama_generate(body)
+        elif self.path == "/v1/chat/completions":
+            self._openai_chat(body)
+        else:
+            self._send_json({"error": f"not found: {self.path}"}, status=404)
+
+    def _ollama_generate(self, body: dict[str, Any]) -> None:
+        engine = self.server.engine
+        prompt = body.get("prompt")
+        if not prompt:
+            # keep_alive만 있는 load/unload 요청.
+            self._send_json({"model": body.get("model"), "response": "", "done": True, "done_reason": "load"})
+            return
+        options = body.get("options") or {}
+        prompt_tokens = engine.prompt_tokens(prompt)
+        words = engine.words(engine.completion_tokens(options.get("num_predict")))
+        words, _ = engine.truncate(words, options.get("stop"))
+        tokens = len(words)
+        final = {
+            "model": body.get("model"),
+            "done": True,
+            "done_reason": "stop",
+            "prompt_eval_count": prompt_tokens,
+            "eval_count": tokens,
+            "eval_duration": int(tokens * engine.token_latency * 1e9),
+        }
+        with engine.slot():
+            if not body.get("stream"):
+                engine.generate(prompt_tokens, tokens)
+                self._send_json({**final, "response": "".join(words)})
+                return
+            self._start_chunked("application/x-ndjson")
+            for word in engine.stream(prompt_tokens, words):
+                if not self._send_chunk(dumps({"model": body.get("model"), "response": word, "done": False}) + b"\n"):
+                    return
+        if self._send_chunk(dumps({**final, "response": ""}) + b"\n"):
+            self._send_chunk(b"")
+
+    def _openai_chat(self, body: dict[str, Any]) -> None:
+        engine = self.server.engine
+        prompt = "".join(str(message.get("content", "")) for message in body.get("messages") or [])
+        words = engine.words(engine.completion_tokens(body.get("max_tokens")))
+        words, stop_reason = engine.truncate(words, body.get("stop"))
+        tokens = len(words)
+        usage = {
+            "prompt_tokens": engine.prompt_tokens(prompt),
+            "completion_tokens": tokens,
+            "total_tokens": engine.prompt_tokens(prompt) + tokens,
+        }
+        logprobs = {"content": [{"token": word, "logprob": -0.1} for word in words]} if body.get("logprobs") else None
+        if not body.get("stream"):
+            with engine.slot():
+                engine.generate(usage["prompt_tokens"], tokens)
+            self._send_json(
+                {
+                    "id": "fake",
+                    "object": "chat.completion",
+                    "model": body.get("model"),
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "".join(words)},
+                            "logprobs": logprobs,
+                            "finish_reason": "stop",
+                            "stop_reason": stop_reason,
+                        }
+                    ],
+                    "usage": usage,
+                }
+            )
+            return
+        self._start_chunked("text/event-stream")
+        with engine.slot():
+            for word in engine.stream(usage["prompt_tokens"], words):
+                choice: dict[str, Any] = {"index": 0, "delta": {"content": word}, "finish_reason": None}
+                if logprobs is not None:
+                    choice["logprobs"] = {"content": [{"token": word, "logprob": -0.1}]}
+                chunk = {"id": "fake", "choices": [choice]}
+                if not self._send_chunk(b"data: " + dumps(chunk) + b"\n\n"):
+                    return
+        for event in (
+            {"id": "fake", "choices": [{"index": 0, "delta": {}, "finish_reason": "stop", "stop_reason": stop_reason}]},
+            {"id": "fake", "choices": [], "usage": usage},
+        ):
+            if not self._send_chunk(b"data: " + dumps(event) + b"\n\n"):
+                return
+        if self._send_chunk(b"data: [DONE]\n\n"):
+            self._send_chunk(b"")
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        data = dumps(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_chunked(self, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _send_chunk(self, data: bytes) -> bool:
+        """청크 하나를 보낸다(빈 바이트는 종료 청크). 클라이언트가 끊었으면 `False`."""
+        try:
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+            return True
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+            return False
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    engine: "FakeEngineServer"
+
+
+class FakeEngineServer:
+    """오프라인 회귀 테스트/재생 벤치마크용 가짜 추론 엔진 HTTP 서버.
+
+    Rules:
+        - 한 서버가 Ollama(`/api/generate`, `/api/version`, `/api/tags`, `/api/ps`)와
+          vLLM(`/v1/chat/completions`, `/v1/models`, `/health`) 경로를 모두 제공하므로 두 엔드포인트를 같은 포트로 둘 수 있다.
+        - 지연은 `base_latency + 프리필 + 생성 토큰 수 × 토큰 지연`이다. 생성 토큰 수는 요청의 최대 토큰
+          (없으면 `default_tokens`)이고, 스트리밍 요청은 토큰마다 조각을 보낸다.
+        - `slots`를 주면 동시에 그만큼만 생성하고 나머지는 대기한다(엔진 병렬 슬롯/`max_num_seqs` 모사).
+          토큰 지연은 동시 생성 수에 비례해 `× (1 + batch_slowdown × (동시 생성 수 - 1))`로 늘어나고,
+          프리필은 프롬프트를 `prefill_chunk_tokens`씩 나눠 조각마다 `prefill_latency`가 걸린다.
+        - 생성 텍스트는 고정 단어 목록을 반복한 결정적 문자열(목록 한 바퀴마다 줄바꿈)이라 같은 요청의 결과가
+          항상 같다. 요청의 중지 문자열(Ollama `options.stop`, vLLM `stop`)이 나오면 그 앞에서 생성을 멈춘다.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        base_latency: float = 0.02,
+        token_latency: float = 0.002,
+        default_tokens: int = 32,
+        models: tuple[str, ...] = (),
+        slots: int | None = None,
+        batch_slowdown: float = 0.0,
+        prefill_chunk_tokens: int | None = None,
+        prefill_latency: float = 0.0,
+    ) -> None:
+        """`port=0`이면 빈 포트를 고른다(실제 포트는 `start()` 뒤 `port`)."""
+        self.host = host
+        self.base_latency = base_latency
+        self.token_latency = token_latency
+        self.default_tokens = default_tokens
+        self.models = list(models)
+        self.batch_slowdown = batch_slowdown
+        self.prefill_chunk_tokens = prefill_chunk_tokens
+        self.prefill_latency = prefill_latency
+        self._slots = threading.BoundedSemaphore(slots) if slots else None
+        self._active = 0
+        self._active_lock = threading.Lock()
+        self._server = _FakeHTTPServer((host, port), _FakeEngineHandler)
+        self._server.engine = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> "FakeEngineServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="fake-engine", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def completion_tokens(self, max_tokens: Any) -> int:
+        try:
+            requested = int(max_tokens) if max_tokens is not None else self.default_tokens
+        except (TypeError, ValueError):
+            requested = self.default_tokens
+        return max(1, requested)
+
+    @staticmethod
+    def prompt_tokens(prompt: str) -> int:
+        return max(1, len(prompt) // 4)
+
+    @staticmethod
+    def words(tokens: int) -> list[str]:
+        return [
+            _WORDS[index % len(_WORDS)] + ("\n" if index % len(_WORDS) == len(_WORDS) - 1 else " ")
+            for index in range(tokens)
+        ]
+
+    @staticmethod
+    def truncate(words: list[str], stop: Any) -> tuple[list[str], str | None]:
+        """처음 나오는 중지 문자열 앞까지의 단어와 멈춘 중지 문자열(없으면 전체와 `None`)."""
+        if not stop:
+            return words, None
+        text = "".join(words)
+        hits = [(text.find(item), item) for item in stop if isinstance(item, str) and item and item in text]
+        if not hits:
+            return words, None
+        cut, matched = min(hits)
+        kept: list[str] = []
+        length = 0
+        for word in words:
+            if length + len(word) > cut:
+                if cut > length:
+                    kept.append(word[: cut - length])
+                break
+            kept.append(word)
+            length += len(word)
+        return kept, matched
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """생성 슬롯 하나를 잡는다(`slots`가 없으면 바로 통과)."""
+        if self._slots is not None:
+            self._slots.acquire()
+        with self._active_lock:
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._active_lock:
+                self._active -= 1
+            if self._slots is not None:
+                self._slots.release()
+
+    def generate(self, prompt_tokens: int, tokens: int) -> None:
+        """비스트리밍 요청의 프리필과 토큰 생성 지연만큼 기다린다."""
+        time.sleep(self._prefill_seconds(prompt_tokens) + tokens * self._token_seconds())
+
+    def stream(self, prompt_tokens: int, words: list[str]) -> Iterator[str]:
+        """프리필 지연 뒤 토큰 지연 간격으로 단어를 하나씩 내보낸다."""
+        time.sleep(self._prefill_seconds(prompt_tokens))
+        for word in words:
+            time.sleep(self._token_seconds())
+            yield word
+
+    def _prefill_seconds(self, prompt_tokens: int) -> float:
+        chunks = -(-prompt_tokens // self.prefill_chunk_tokens) if self.prefill_chunk_tokens else 0
+        return self.base_latency + chunks * self.prefill_latency
+
+    def _token_seconds(self) -> float:
+        return self.token_latency * (1 + self.batch_slowdown * max(0, self._active - 1))
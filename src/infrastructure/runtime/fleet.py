@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..config.settings import EndpointConfig, EngineType, FleetConfig, FleetNodeConfig
+from ..observability import MetricsRegistry
+from .node_agent import NodeAgentClient
+
+
+@dataclass(slots=True)
+class FleetPool:
+    """노드 에이전트에서 모은 정상 원격 엔진 엔드포인트.
+
+    Attributes:
+        engines: 엔진별 엔드포인트. Ollama는 모델 구분 없이 모든 Ollama 모델의 레플리카로 쓴다.
+        models: vLLM 모델 ID별 엔드포인트(그 모델을 서빙하는 노드만).
+    """
+
+    engines: dict[EngineType, list[EndpointConfig]] = field(default_factory=dict)
+    models: dict[str, list[EndpointConfig]] = field(default_factory=dict)
+
+    def key(self) -> tuple[Any, ...]:
+        """풀 변경 감지용 비교 키."""
+        data = self.to_dict()
+        return tuple(sorted(data["engines"].items())), tuple(sorted(data["models"].items()))
+
+    def to_dict(self) -> dict[str, Any]:
+        def addresses(items: list[EndpointConfig]) -> list[str]:
+            return [f"{item.host}:{item.port}" for item in items]
+
+        return {
+            "engines": {engine: addresses(items) for engine, items in self.engines.items()},
+            "models": {model: addresses(items) for model, items in self.models.items()},
+        }
+
+
+@dataclass(slots=True)
+class FleetAction:
+    """재배치 계획의 작업 하나(노드의 엔진을 띄우거나 내린다)."""
+
+    node: str
+    action: str
+    engine: EngineType
+    model_id: str | None = None
+    reason: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "node": self.node,
+            "action": self.action,
+            "engine": self.engine,
+            "model_id": self.model_id,
+            "reason": self.reason,
+        }
+
+
+class FleetController:
+    """여러 호스트의 노드 에이전트를 조회해 정상 엔진을 라우팅 풀로 모으고, 모델을 노드에 배치하는 컨트롤러.
+
+    Rules:
+        - `poll_interval`마다 모든 에이전트의 `/status`를 동시에 조회한다. `running`이고 헬스가 정상인 엔진만
+          풀에 넣고, 풀이 바뀌면 `on_pool` 콜백으로 알린다. 응답하지 않는 노드의 엔진은 풀에서 빠진다.
+        - 재배치(`rebalance`)는 노드 `engines`에 `ollama`가 있으면 Ollama를 띄우고, `placements`의 vLLM 모델마다
+          원하는 노드 수를 맞춘다. 초과한 노드는 내리고, 부족하면 빈 vLLM 노드에 먼저, 그다음 배치 대상이 아닌
+          모델을 서빙하는 노드로 옮겨 띄운다. 노드 선택은 이름 순이라 같은 상태에서 계획이 항상 같다.
+        - 기동에 실패한 엔진은 `restart_backoff`초 동안 다시 시도하지 않는다.
+        - `auto_rebalance`면 조회할 때마다 재배치한다. 에이전트는 같은 모델의 중복 기동 요청을 무시하므로
+          멀티 워커에서 워커마다 컨트롤러가 돌아도 같은 계획이 한 번만 반영된다.
+    """
+
+    def __init__(
+        self,
+        config: FleetConfig,
+        on_pool: Callable[[FleetPool], None] | None = None,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.config = config
+        self.on_pool = on_pool
+        self.metrics = metrics
+        self._clock = clock
+        self._clients = {
+            node.name: NodeAgentClient(node.host, node.port, token=config.token, timeout=config.timeout)
+            for node in config.nodes
+        }
+        self._nodes: dict[str, dict[str, Any]] = {node.name: {"reachable": False} for node in config.nodes}
+        self._pool = FleetPool()
+        self._attempts: dict[tuple[str, EngineType], float] = {}
+        self._events: deque[dict[str, Any]] = deque(maxlen=config.history_size)
+        self._lock = threading.Lock()
+        self._rebalance_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def pool(self) -> FleetPool:
+        return self._pool
+
+    def start(self) -> None:
+        """조회 스레드를 시작한다(이미 실행 중이거나 노드가 없으면 무시). 첫 조회는 즉시 수행한다."""
+        if self.running or not self.config.nodes:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="fleet-controller", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def refresh(self) -> FleetPool:
+        """모든 에이전트 상태를 조회해 풀을 다시 만들고, 바뀌었으면 `on_pool`로 알린다."""
+        nodes = self.config.nodes
+        if not nodes:
+            return self._pool
+        results = list(self._get_executor().map(self._fetch, nodes))
+        pool = FleetPool()
+        for node, state in zip(nodes, results):
+            for engine, item in (state.get("engines") or {}).items():
+                if item.get("state") != "running" or not item.get("healthy") or item.get("port") is None:
+                    continue
+                endpoint = EndpointConfig(host=node.host, port=int(item["port"]))
+                if engine == "vllm" and item.get("model_id"):
+                    pool.models.setdefault(item["model_id"], []).append(endpoint)
+                else:
+                    pool.engines.setdefault(engine, []).append(endpoint)
+        with self._lock:
+            self._nodes = {node.name: state for node, state in zip(nodes, results)}
+            changed = pool.key() != self._pool.key()
+            self._pool = pool
+        if self.metrics is not None:
+            self.metrics.set_gauge("fleet_nodes_up", float(sum(1 for state in results if state["reachable"])))
+            for engine in ("ollama", "vllm"):
+                count = len(pool.engines.get(engine, [])) + (
+                    sum(len(items) for items in pool.models.values()) if engine == "vllm" else 0
+                )
+                self.metrics.set_gauge("fleet_engines_ready", float(count), engine=engine)
+        if changed:
+            self._event({"action": "pool_changed", "pool": pool.to_dict()})
+            if self.on_pool is not None:
+                self.on_pool(pool)
+        return pool
+
+    def plan(self) -> list[FleetAction]:
+        """최근 조회한 노드 상태로 재배치 계획을 만든다(실행하지 않는다)."""
+        with self._lock:
+            nodes = {name: dict(state) for name, state in self._nodes.items()}
+        now = self._clock()
+        ordered = sorted(self.config.nodes, key=lambda item: item.name)
+        reachable = [node for node in ordered if nodes[node.name].get("reachable")]
+        actions: list[FleetAction] = []
+
+        def engine_state(node: FleetNodeConfig, engine: EngineType) -> dict[str, Any]:
+            return (nodes[node.name].get("engines") or {}).get(engine) or {"state": "stopped"}
+
+        def startable(node: FleetNodeConfig, engine: EngineType) -> bool:
+            state = engine_state(node, engine)["state"]
+            if state == "stopped":
+                return True
+            attempted = self._attempts.get((node.name, engine))
+            return state == "failed" and (attempted is None or now - attempted >= self.config.restart_backoff)
+
+        for node in reachable:
+            if "ollama" in node.engines and startable(node, "ollama"):
+                actions.append(FleetAction(node.name, "start", "ollama", reason="node_engines"))
+
+        vllm_nodes = [node for node in reachable if "vllm" in node.engines]
+        serving: dict[str, list[FleetNodeConfig]] = {}
+        for node in vllm_nodes:
+            state = engine_state(node, "vllm")
+            if state["state"] in ("starting", "running") and state.get("model_id"):
+                serving.setdefault(state["model_id"], []).append(node)
+        free = [node for node in vllm_nodes if startable(node, "vllm")]
+        movable = [
+            node
+            for model_id, items in sorted(serving.items())
+            if model_id not in self.config.placements
+            for node in items
+        ]
+        for model_id, want in sorted(self.config.placements.items()):
+            current = serving.get(model_id, [])
+            for node in current[want:]:
+                actions.append(FleetAction(node.name, "stop", "vllm", model_id, reason="over_placed"))
+                free.append(node)
+            for _ in range(max(0, want - len(current))):
+                if free:
+                    node, reason = free.pop(0), "place"
+                elif movable:
+                    node, reason = movable.pop(0), "move"
+                else:
+                    actions.append(FleetAction("-", "unplaced", "vllm", model_id, reason="no_free_node"))
+                    break
+                actions.append(FleetAction(node.name, "start", "vllm", model_id, reason=reason))
+        return actions
+
+    def rebalance(self, refresh: bool = True) -> list[dict[str, Any]]:
+        """상태를 조회하고 재배치 계획을 실행한 뒤 실행한 작업 목록(성공 여부 포함)을 반환한다."""
+        with self._rebalance_lock:
+            if refresh:
+                self.refresh()
+            performed: list[dict[str, Any]] = []
+            for action in self.plan():
+                item = action.to_dict()
+                if action.action in ("start", "stop"):
+                    client = self._clients[action.node]
+                    try:
+                        if action.action == "start":
+                            self._attempts[(action.node, action.engine)] = self._clock()
+                            client.start(action.engine, action.model_id)
+                        else:
+                            client.stop(action.engine)
+                        item["ok"] = True
+                    except RuntimeError as exc:
+                        item.update(ok=False, error=str(exc))
+                else:
+                    item["ok"] = False
+                self._event(item)
+                if self.metrics is not None:
+                    self.metrics.inc("fleet_actions_total", action=action.action, engine=action.engine, ok=item["ok"])
+                performed.append(item)
+            if performed and refresh:
+                self.refresh()
+            return performed
+
+    def status(self) -> dict[str, Any]:
+        """노드별 최근 상태, 현재 풀, 배치 목표, 최근 이벤트."""
+        with self._lock:
+            nodes = [
+                {"name": node.name, "agent": self._clients[node.name].base_url, "engines_allowed": node.engines}
+                | self._nodes.get(node.name, {})
+                for node in self.config.nodes
+            ]
+            events = list(self._events)
+        return {
+            "running": self.running,
+            "auto_rebalance": self.config.auto_rebalance,
+            "placements": dict(self.config.placements),
+            "nodes": nodes,
+            "pool": self._pool.to_dict(),
+            "events": events,
+        }
+
+    def _fetch(self, node: FleetNodeConfig) -> dict[str, Any]:
+        try:
+            status = self._clients[node.name].status()
+        except RuntimeError as exc:
+            return {"reachable": False, "error": str(exc), "checked_at": self._clock()}
+        return {"reachable": True, "error": None, "checked_at": self._clock(), "engines": status.get("engines") or {}}
+
+    def _event(self, item: dict[str, Any]) -> None:
+        with self._lock:
+            self._events.append({"time": self._clock(), **item})
+
+    def _loop(self) -> None:
+        while True:
+            try:
+                if self.config.auto_rebalance:
+                    self.rebalance()
+                else:
+                    self.refresh()
+            except Exception:
+                # 컨트롤러 오류로 스레드가 죽으면 풀이 갱신되지 않으므로 다음 주기에 다시 시도한다.
+                pass
+            if self._stop.wait(self.config.poll_interval):
+                return
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=min(32, max(1, len(self.config.nodes))),
+                    thread_name_prefix="fleet-poll",
+                )
+            return self._executor
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import copy
+import hmac
+import ipaddress
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from http.client import HTTPConnection, HTTPException
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+
+from ..adapters import EngineAdapter, OllamaAdapter, VllmAdapter
+from ..config.settings import AppSettings, ConfigValidationError, EndpointConfig, EngineType, ModelConfig
+from ..serialization import dumps, loads
+from .engine_driver import EngineDriver, ProcessEngineDriver, SimulatedEngineDriver
+from .process_manager import ProcessManager
+
+AGENT_ENGINES: tuple[EngineType, ...] = ("ollama", "vllm")
+
+
+@dataclass(slots=True)
+class _EngineSlot:
+    """노드 에이전트가 관리하는 엔진 하나의 상태(`stopped` → `starting` → `running` | `failed`)."""
+
+    engine: EngineType
+    state: str = "stopped"
+    model_id: str | None = None
+    port: int | None = None
+    error: str | None = None
+    started_at: float | None = None
+    ready_seconds: float | None = None
+    generation: int = 0
+    driver: EngineDriver | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "engine": self.engine,
+            "state": self.state,
+            "model_id": self.model_id,
+            "port": self.port,
+            "error": self.error,
+            "started_at": self.started_at,
+            "ready_seconds": self.ready_seconds,
+        }
+
+
+class NodeAgent:
+    """호스트 하나의 로컬 엔진(Ollama/vLLM)을 띄우고 내리며 상태를 보고하는 노드 에이전트.
+
+    Rules:
+        - 엔진마다 프로세스 하나를 관리한다. vLLM은 모델 하나를 서빙하므로 다른 모델로 `start`하면 기존 프로세스를
+          내리고 새 모델로 다시 띄운다. 같은 모델(Ollama는 항상)로 다시 `start`하면 아무것도 하지 않는다.
+        - 기동은 백그라운드 스레드에서 하고 헬스 요청이 성공하면 `running`이 된다(vLLM 모델 적재는 수 분이 걸린다).
+          `ready_seconds`는 기동 요청부터 준비까지 걸린 시간(콜드 스타트)이다.
+        - 실제 엔진은 `ProcessEngineDriver`(`ProcessManager`)로, `simulate=True`면 `SimulatedEngineDriver`
+          (`FakeEngineServer`, 빈 포트)로 띄운다. 한 호스트에서 에이전트 여러 개를 돌려 플릿을 시험할 수 있다.
+        - `status()`는 `running` 엔진에 헬스 요청을 보내 `healthy`를 함께 보고한다(프로세스가 죽었으면 `False`).
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        name: str | None = None,
+        simulate: bool = False,
+        startup_timeout: float = 900.0,
+        engine_host: str | None = None,
+        ports: dict[EngineType, int] | None = None,
+    ) -> None:
+        """에이전트 설정 사본을 만든다.
+
+        Args:
+            engine_host: 엔진 바인드 주소(다른 호스트의 컨트롤러가 접근하려면 `0.0.0.0`). 없으면 설정 엔드포인트 host.
+            ports: 엔진별 포트 재정의(같은 호스트에서 에이전트를 여러 개 돌릴 때).
+        """
+        self.settings = copy.deepcopy(settings)
+        for engine, endpoint in self.settings.runtime.endpoints.items():
+            endpoint.host = engine_host or endpoint.host
+            endpoint.port = (ports or {}).get(engine, endpoint.port)
+            endpoint.replicas = []
+        self.name = name or socket.gethostname()
+        self.simulate = simulate
+        self.startup_timeout = startup_timeout
+        self._slots = {engine: _EngineSlot(engine) for engine in AGENT_ENGINES}
+        self._lock = threading.Lock()
+
+    def status(self) -> dict[str, Any]:
+        """노드 이름과 엔진별 상태(`running` 엔진은 `healthy` 포함)."""
+        with self._lock:
+            engines = {engine: slot.to_dict() for engine, slot in self._slots.items()}
+        for engine, item in engines.items():
+            item["healthy"] = self._healthy(engine, item["port"]) if item["state"] == "running" else False
+        return {"node": self.name, "simulate": self.simulate, "time": time.time(), "engines": engines}
+
+    def health(self) -> dict[str, Any]:
+        """에이전트 생존과 엔진별 헬스(`running`이 아닌 엔진은 `False`)."""
+        engines = {engine: item["healthy"] for engine, item in self.status()["engines"].items()}
+        return {"ok": True, "node": self.name, "engines": engines}
+
+    def start(self, engine: EngineType, model_id: str | None = None) -> dict[str, Any]:
+        """엔진 기동을 요청하고 현재 상태를 반환한다(준비 완료를 기다리지 않는다).
+
+        Raises:
+            ConfigValidationError: 엔진/모델이 없거나 모델 엔진이 다른 경우.
+        """
+        model = self._resolve_model(engine, model_id)
+        served = model.id if engine == "vllm" else None
+        with self._lock:
+            slot = self._slots[engine]
+            if slot.state in ("starting", "running") and slot.model_id == served:
+                return slot.to_dict()
+            previous = slot.driver
+            slot.generation += 1
+            slot.driver = self._driver(engine, model)
+            slot.state, slot.model_id, slot.port, slot.error = "starting", served, None, None
+            slot.started_at, slot.ready_seconds = time.time(), None
+            args = (slot, slot.generation, previous, slot.driver, model)
+            snapshot = slot.to_dict()
+        threading.Thread(target=self._launch, args=args, name=f"agent-start-{engine}", daemon=True).start()
+        return snapshot
+
+    def stop(self, engine: EngineType) -> dict[str, Any]:
+        """엔진을 내리고 상태를 반환한다(기동 중이면 기동을 중단한다)."""
+        if engine not in self._slots:
+            raise ConfigValidationError(f"지원하지 않는 엔진: {engine}")
+        with self._lock:
+            slot = self._slots[engine]
+            driver, slot.driver = slot.driver, None
+            slot.generation += 1
+            slot.state, slot.port, slot.error, slot.ready_seconds = "stopped", None, None, None
+            snapshot = slot.to_dict()
+        if driver is not None:
+            driver.shutdown()
+        return snapshot
+
+    def shutdown(self) -> None:
+        """관리 중인 엔진을 모두 내린다(에이전트 종료 시)."""
+        for engine in AGENT_ENGINES:
+            self.stop(engine)
+
+    def _resolve_model(self, engine: EngineType, model_id: str | None) -> ModelConfig:
+        if engine not in self._slots:
+            raise ConfigValidationError(f"지원하지 않는 엔진: {engine}")
+        if model_id is not None:
+            model = self.settings.get_model(model_id)
+            if model is None or model.engine != engine:
+                raise ConfigValidationError(f"{engine} 모델을 찾을 수 없습니다: {model_id}")
+            return model
+        models = self.settings.enabled_models(engine=engine)
+        if not models:
+            raise ConfigValidationError(f"{engine} 엔진으로 띄울 활성 모델이 없습니다.")
+        auto_models = [model for model in models if model.auto_load]
+        return auto_models[0] if auto_models else models[0]
+
+    def _driver(self, engine: EngineType, model: ModelConfig) -> EngineDriver:
+        if self.simulate:
+            return SimulatedEngineDriver(engine)
+        return ProcessEngineDriver(self.settings, model, startup_timeout=self.startup_timeout)
+
+    def _launch(
+        self,
+        slot: _EngineSlot,
+        generation: int,
+        previous: EngineDriver | None,
+        driver: EngineDriver,
+        model: ModelConfig,
+    ) -> None:
+        """이전 프로세스를 내리고 새로 띄운다. 그 사이 다른 요청이 들어왔으면(세대 변경) 결과를 버린다.
+
+        Notes:
+            `runtime.prewarm.enabled`면 이전 모델이 서빙하는 동안 새 vLLM 모델 가중치를 페이지 캐시에 먼저 읽는다.
+        """
+        if model.engine == "vllm" and self.settings.runtime.prewarm.enabled and not self.simulate:
+            ProcessManager(self.settings).prewarm(model)
+        if previous is not None:
+            previous.shutdown()
+        try:
+            endpoint: EndpointConfig | None = driver.launch({})
+            error = None
+        except Exception as exc:
+            endpoint, error = None, str(exc)
+        with self._lock:
+            current = slot.generation == generation
+            if current:
+                if endpoint is not None:
+                    slot.state, slot.port = "running", endpoint.port
+                    slot.ready_seconds = time.time() - (slot.started_at or time.time())
+                else:
+                    slot.state, slot.error, slot.driver = "failed", error, None
+        if not current or endpoint is None:
+            driver.shutdown()
+
+    def _healthy(self, engine: EngineType, port: int | None) -> bool:
+        if port is None:
+            return False
+        host = self.settings.runtime.endpoints[engine].host
+        if host in ("0.0.0.0", "::", ""):
+            host = "127.0.0.1"
+        adapter: EngineAdapter = (
+            OllamaAdapter(host=host, port=port) if engine == "ollama" else VllmAdapter(host=host, port=port)
+        )
+        try:
+            return adapter.health_check(timeout=2).ok
+        except Exception:
+            return False
+
+
+class _AgentHandler(BaseHTTPRequestHandler):
+    """노드 에이전트 HTTP API 핸들러(`/status`, `/health`, `/engines/{engine}/start|stop`)."""
+
+    server: "_AgentHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if not self._authorized():
+            return
+        agent = self.server.agent
+        if self.path == "/status":
+            self._send_json(agent.status())
+        elif self.path == "/health":
+            self._send_json(agent.health())
+        else:
+            self._send_json({"detail": f"not found: {self.path}"}, status=404)
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if not self._authorized():
+            return
+        parts = self.path.strip("/").split("/")
+        valid = len(parts) == 3 and parts[0] == "engines" and parts[2] in ("start", "stop")
+        if not valid or parts[1] not in AGENT_ENGINES:
+            self._send_json({"detail": f"not found: {self.path}"}, status=404)
+            return
+        engine = cast(EngineType, parts[1])
+        try:
+            data = loads(body) if body else {}
+            if parts[2] == "start":
+                self._send_json(self.server.agent.start(engine, data.get("model_id")), status=202)
+            else:
+                self._send_json(self.server.agent.stop(engine))
+        except ConfigValidationError as exc:
+            self._send_json({"detail": str(exc)}, status=400)
+        except Exception as exc:
+            self._send_json({"detail": f"잘못된 요청입니다: {exc}"}, status=400)
+
+    def _authorized(self) -> bool:
+        token = self.server.token
+        if token is None:
+            return True
+        supplied = self.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if hmac.compare_digest(supplied.encode("utf-8"), token.encode("utf-8")):
+            return True
+        self._send_json({"detail": "유효한 에이전트 토큰이 필요합니다."}, status=401)
+        return False
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        data = dumps(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _AgentHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    agent: NodeAgent
+    token: str | None
+
+
+class NodeAgentServer:
+    """`NodeAgent`를 HTTP로 노출하는 서버(`python -m src.main agent`).
+
+    Notes:
+        - `token`을 주면 모든 요청에 `Authorization: Bearer <token>`을 요구한다.
+        - 엔진 프로세스를 띄우고 내리는 API이므로 루프백이 아닌 주소에는 `token` 없이 바인드하지 않는다.
+    """
+
+    def __init__(self, agent: NodeAgent, host: str = "127.0.0.1", port: int = 19090, token: str | None = None) -> None:
+        """`port=0`이면 빈 포트를 고른다(실제 포트는 `port`).
+
+        Raises:
+            ConfigValidationError: 루프백이 아닌 주소에 `token` 없이 바인드하려는 경우.
+        """
+        if not token and not _is_loopback(host):
+            raise ConfigValidationError(
+                f"노드 에이전트를 루프백이 아닌 주소({host})에 열려면 --token 또는 LOCAL_LLM_AGENT_TOKEN이 필요합니다."
+            )
+        self.agent = agent
+        self.host = host
+        self._server = _AgentHTTPServer((host, port), _AgentHandler)
+        self._server.agent = agent
+        self._server.token = token
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> "NodeAgentServer":
+        """백그라운드 스레드에서 요청을 받기 시작한다."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="node-agent", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 요청을 받는다(Ctrl+C로 종료하면 관리 중인 엔진도 내린다)."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+            self.agent.shutdown()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        self.agent.shutdown()
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class NodeAgentClient:
+    """노드 에이전트 HTTP API 클라이언트(플릿 컨트롤러용).
+
+    Notes:
+        요청마다 새 연결을 연다. 연결 실패/HTTP 오류는 `RuntimeError`로 올린다.
+    """
+
+    def __init__(self, host: str, port: int, token: str | None = None, timeout: float = 5.0) -> None:
+        self.host = host
+        self.port = port
+        self.token = token
+        self.timeout = timeout
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def status(self) -> dict[str, Any]:
+        return self._request("GET", "/status")
+
+    def health(self) -> dict[str, Any]:
+        return self._request("GET", "/health")
+
+    def start(self, engine: EngineType, model_id: str | None = None) -> dict[str, Any]:
+        return self._request("POST", f"/engines/{engine}/start", {"model_id": model_id})
+
+    def stop(self, engine: EngineType) -> dict[str, Any]:
+        return self._request("POST", f"/engines/{engine}/stop", {})
+
+    def _request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        connection = HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            connection.request(method, path, body=dumps(payload) if payload is not None else None, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, HTTPException) as exc:
+            raise RuntimeError(f"노드 에이전트({self.base_url}) 요청 실패: {exc}") from exc
+        finally:
+            connection.close()
+        try:
+            data = loads(body) if body else {}
+        except Exception:
+            data = {}
+        if response.status >= 400:
+            detail = data.get("detail") if isinstance(data, dict) else None
+            raise RuntimeError(f"노드 에이전트({self.base_url}) {method} {path} 실패({response.status}): {detail}")
+        return data
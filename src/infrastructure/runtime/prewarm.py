@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import mmap
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..config.settings import AppSettings, ConfigValidationError, ModelConfig, PrewarmConfig
+from ..serialization import loads
+
+try:
+    import ctypes
+    import ctypes.util
+
+    _libc: Any = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    _libc.mmap.restype = ctypes.c_void_p
+    _libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_long]
+    _libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+    _libc.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p]
+except (ImportError, OSError, AttributeError):
+    _libc = None
+
+WEIGHT_SUFFIXES = (".safetensors", ".bin", ".pt", ".pth", ".gguf", ".ckpt")
+"""디렉터리에서 가중치 파일로 볼 확장자."""
+
+OLLAMA_WEIGHT_MEDIA_TYPES = (
+    "application/vnd.ollama.image.model",
+    "application/vnd.ollama.image.projector",
+    "application/vnd.ollama.image.adapter",
+)
+"""Ollama 매니페스트에서 가중치 blob으로 볼 레이어 미디어 타입."""
+
+_PAGE_SIZE = mmap.PAGESIZE
+_RESIDENT_BIT = bytes(value & 1 for value in range(256))
+_MAP_FAILED = ctypes.c_void_p(-1).value if _libc is not None else None
+
+
+@dataclass(slots=True)
+class PrewarmFileReport:
+    """프리웜한 파일 하나의 결과(`resident_*`는 페이지 캐시 상주량을 알 수 없으면 `None`)."""
+
+    path: str
+    size: int
+    resident_before: int | None = None
+    resident_after: int | None = None
+    read_bytes: int = 0
+    skipped_bytes: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "size": self.size,
+            "resident_before": self.resident_before,
+            "resident_after": self.resident_after,
+            "read_bytes": self.read_bytes,
+            "skipped_bytes": self.skipped_bytes,
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
+class PrewarmReport:
+    """가중치 파일 프리웜 결과.
+
+    Attributes:
+        resident_bytes: 시작 전에 이미 페이지 캐시에 있던 바이트 수(알 수 없으면 `None`).
+        read_bytes: 이번에 디스크에서 읽은 구간의 바이트 수.
+        skipped_bytes: 바이트 예산을 넘어 읽지 않은 바이트 수.
+        bytes_per_second: `read_bytes / elapsed_seconds`.
+        mem_available: 시작 시점 `MemAvailable`(리눅스가 아니면 `None`). 가중치가 이보다 크면 먼저 읽은 부분이
+            밀려날 수 있다.
+    """
+
+    model_id: str | None
+    files: list[PrewarmFileReport] = field(default_factory=list)
+    concurrency: int = 1
+    max_bytes: int | None = None
+    elapsed_seconds: float = 0.0
+    mem_available: int | None = None
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(item.size for item in self.files)
+
+    @property
+    def resident_bytes(self) -> int | None:
+        values = [item.resident_before for item in self.files]
+        return None if any(value is None for value in values) else sum(value or 0 for value in values)
+
+    @property
+    def read_bytes(self) -> int:
+        return sum(item.read_bytes for item in self.files)
+
+    @property
+    def skipped_bytes(self) -> int:
+        return sum(item.skipped_bytes for item in self.files)
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.read_bytes / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        """로그 한 줄 요약."""
+        resident = self.resident_bytes
+        resident_text = "?" if resident is None else _format_bytes(resident)
+        return (
+            f"{self.model_id or '-'} files={len(self.files)} total={_format_bytes(self.total_bytes)} "
+            f"resident={resident_text} read={_format_bytes(self.read_bytes)} "
+            f"skipped={_format_bytes(self.skipped_bytes)} {_format_bytes(self.bytes_per_second)}/s "
+            f"elapsed={self.elapsed_seconds:.2f}s"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "model_id": self.model_id,
+            "total_bytes": self.total_bytes,
+            "resident_bytes": self.resident_bytes,
+            "read_bytes": self.read_bytes,
+            "skipped_bytes": self.skipped_bytes,
+            "elapsed_seconds": self.elapsed_seconds,
+            "bytes_per_second": self.bytes_per_second,
+            "concurrency": self.concurrency,
+            "max_bytes": self.max_bytes,
+            "mem_available": self.mem_available,
+            "files": [item.to_dict() for item in self.files],
+        }
+
+
+def resolve_weight_files(settings: AppSettings, model: ModelConfig) -> list[Path]:
+    """모델의 가중치 파일 경로를 찾는다.
+
+    Rules:
+        - `runtime.prewarm.paths`에 모델 항목이 있으면 그 파일/디렉터리만 쓴다.
+        - vLLM: `vllm_model`이 로컬 경로면 그 경로를, 아니면 Hugging Face 허브 캐시의 `refs/main` 스냅샷
+          (없으면 가장 최근 스냅샷)을 쓴다.
+        - Ollama: 매니페스트(`manifests/<registry>/<namespace>/<name>/<tag>`)의 모델/프로젝터/어댑터 blob을 쓴다.
+        - 디렉터리는 하위의 가중치 확장자 파일로 펼치고, 심볼릭 링크는 실제 파일로 풀어 중복을 없앤다.
+
+    Raises:
+        ConfigValidationError: 가중치 파일을 하나도 찾지 못한 경우.
+    """
+    config = settings.runtime.prewarm
+    if model.id in config.paths:
+        candidates = [Path(item).expanduser() for item in config.paths[model.id]]
+    elif model.engine == "vllm":
+        candidates = _huggingface_paths(config, model.model_name())
+    else:
+        candidates = _ollama_paths(config, model.model_name())
+    files = expand_weight_paths(candidates)
+    if not files:
+        searched = ", ".join(str(item) for item in candidates) or "-"
+        raise ConfigValidationError(f"모델 {model.id}의 가중치 파일을 찾을 수 없습니다(탐색: {searched}).")
+    return files
+
+
+def expand_weight_paths(paths: list[Path]) -> list[Path]:
+    """파일은 그대로, 디렉터리는 하위 가중치 파일로 펼쳐 실제 경로 기준으로 중복 없이 반환한다."""
+    files: list[Path] = []
+    seen: set[Path] = set()
+    for path in paths:
+        if path.is_dir():
+            items = sorted(item for item in path.rglob("*") if item.suffix in WEIGHT_SUFFIXES and item.is_file())
+        elif path.is_file():
+            items = [path]
+        else:
+            continue
+        for item in items:
+            resolved = item.resolve()
+            if resolved not in seen:
+                seen.add(resolved)
+                files.append(resolved)
+    return files
+
+
+def _huggingface_paths(config: PrewarmConfig, name: str) -> list[Path]:
+    local = Path(name).expanduser()
+    if local.exists():
+        return [local]
+    hub = config.hf_cache_dir or os.getenv("HF_HUB_CACHE")
+    root = Path(hub) if hub else Path(os.getenv("HF_HOME", "~/.cache/huggingface")) / "hub"
+    repo = root.expanduser() / f"models--{name.replace('/', '--')}"
+    ref = repo / "refs" / "main"
+    if ref.is_file():
+        return [repo / "snapshots" / ref.read_text(encoding="utf-8").strip()]
+    snapshots = sorted((repo / "snapshots").glob("*"), key=lambda item: item.stat().st_mtime)
+    return snapshots[-1:]
+
+
+def _ollama_paths(config: PrewarmConfig, name: str) -> list[Path]:
+    root = Path(config.ollama_models_dir or os.getenv("OLLAMA_MODELS") or "~/.ollama/models").expanduser()
+    base, _, tag = name.rpartition(":") if ":" in name.rsplit("/", 1)[-1] else (name, "", "latest")
+    parts = base.split("/")
+    if len(parts) == 1:
+        parts = ["registry.ollama.ai", "library", *parts]
+    elif len(parts) == 2:
+        parts = ["registry.ollama.ai", *parts]
+    manifest = root.joinpath("manifests", *parts, tag)
+    if not manifest.is_file():
+        return []
+    layers = loads(manifest.read_bytes()).get("layers") or []
+    return [
+        root / "blobs" / str(layer["digest"]).replace(":", "-")
+        for layer in layers
+        if layer.get("mediaType") in OLLAMA_WEIGHT_MEDIA_TYPES and layer.get("digest")
+    ]
+
+
+class PageCachePrewarmer:
+    """가중치 파일을 구간별 병렬 순차 읽기로 OS 페이지 캐시에 올리는 프리워머.
+
+    Rules:
+        - 파일을 `segment_bytes` 구간으로 나누고, `concurrency`개 스레드가 구간마다 `POSIX_FADV_WILLNEED`로
+          미리 읽기를 요청한 뒤 `chunk_bytes` 단위로 순차로 읽는다(버퍼는 스레드마다 하나를 재사용한다).
+        - 시작 전에 `mincore`로 파일별 캐시 상주량을 재고, 모든 페이지가 이미 캐시에 있는 구간은 읽지 않는다.
+          `mincore`를 쓸 수 없는 플랫폼에서는 상주량을 `None`으로 보고하고 모든 구간을 읽는다.
+        - `max_bytes`는 캐시에 없는 바이트 기준 예산이다. 파일 순서대로 구간을 배정하다 예산을 넘는 구간은 남은
+          예산만큼 앞부분만 읽고, 그 뒤는 읽지 않고 `skipped_bytes`로 보고한다.
+        - 페이지 캐시는 OS가 관리하므로 메모리가 부족하면 먼저 읽은 부분이 밀려날 수 있다(`mem_available` 참고).
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        max_bytes: int | None = None,
+        segment_bytes: int = 256 * 1024 * 1024,
+        chunk_bytes: int = 8 * 1024 * 1024,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self.max_bytes = max_bytes
+        self.segment_bytes = max(chunk_bytes, segment_bytes)
+        self.chunk_bytes = chunk_bytes
+
+    @classmethod
+    def from_config(cls, config: PrewarmConfig) -> "PageCachePrewarmer":
+        return cls(
+            concurrency=config.concurrency,
+            max_bytes=config.max_bytes,
+            segment_bytes=config.segment_bytes,
+            chunk_bytes=config.chunk_bytes,
+        )
+
+    def prewarm(self, paths: list[Path], model_id: str | None = None) -> PrewarmReport:
+        """파일들을 페이지 캐시에 읽어 들이고 결과를 반환한다."""
+        report = PrewarmReport(
+            model_id=model_id,
+            concurrency=self.concurrency,
+            max_bytes=self.max_bytes,
+            mem_available=_mem_available(),
+        )
+        started = time.perf_counter()
+        budget = self.max_bytes
+        tasks: list[tuple[PrewarmFileReport, int, int]] = []
+        for path in paths:
+            item = PrewarmFileReport(path=str(path), size=0)
+            report.files.append(item)
+            try:
+                item.size = path.stat().st_size
+                pages = resident_pages(path)
+            except OSError as exc:
+                item.error = str(exc)
+                continue
+            item.resident_before = pages.count(1) * _PAGE_SIZE if pages is not None else None
+            for offset in range(0, item.size, self.segment_bytes):
+                length = min(self.segment_bytes, item.size - offset)
+                cold = length
+                if pages is not None:
+                    first, last = offset // _PAGE_SIZE, -(-(offset + length) // _PAGE_SIZE)
+                    cold = length - min(length, pages.count(1, first, last) * _PAGE_SIZE)
+                    if cold == 0:
+                        continue
+                if budget is not None and cold > budget:
+                    # 예산이 남은 만큼 구간 앞부분만 읽고 나머지는 건너뛴다.
+                    if budget > 0:
+                        tasks.append((item, offset, budget))
+                    item.skipped_bytes += length - budget
+                    budget = 0
+                    continue
+                if budget is not None:
+                    budget -= cold
+                tasks.append((item, offset, length))
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="prewarm") as executor:
+            for item, length, error in executor.map(lambda task: (task[0], *self._read(*task)), tasks):
+                item.read_bytes += length
+                if error is not None and item.error is None:
+                    item.error = error
+        report.elapsed_seconds = time.perf_counter() - started
+        for item in report.files:
+            if item.resident_before is not None:
+                pages = resident_pages(Path(item.path))
+                item.resident_after = pages.count(1) * _PAGE_SIZE if pages is not None else None
+        return report
+
+    def _read(self, item: PrewarmFileReport, offset: int, length: int) -> tuple[int, str | None]:
+        """구간 하나를 순차로 읽고 읽은 바이트 수를 반환한다."""
+        buffer = bytearray(min(self.chunk_bytes, length))
+        view = memoryview(buffer)
+        done = 0
+        try:
+            with open(item.path, "rb", buffering=0) as file:
+                fd = file.fileno()
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, offset, length, os.POSIX_FADV_SEQUENTIAL)
+                    os.posix_fadvise(fd, offset, length, os.POSIX_FADV_WILLNEED)
+                while done < length:
+                    size = os.preadv(fd, [view[: min(len(buffer), length - done)]], offset + done)
+                    if size <= 0:
+                        break
+                    done += size
+        except OSError as exc:
+            return done, str(exc)
+        return done, None
+
+
+def evict_page_cache(paths: list[Path]) -> None:
+    """파일들을 페이지 캐시에서 내리도록 요청한다(`POSIX_FADV_DONTNEED`, 측정/시험용). 지원하지 않으면 무시."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        with open(path, "rb", buffering=0) as file:
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def resident_pages(path: Path) -> bytes | None:
+    """파일 페이지별 페이지 캐시 상주 여부(1/0)를 반환한다. `mincore`를 쓸 수 없으면 `None`."""
+    if _libc is None:
+        return None
+    size = path.stat().st_size
+    if size == 0:
+        return b""
+    count = -(-size // _PAGE_SIZE)
+    vector = (ctypes.c_ubyte * count)()
+    with open(path, "rb", buffering=0) as file:
+        address = _libc.mmap(None, size, mmap.PROT_READ, mmap.MAP_SHARED, file.fileno(), 0)
+        if address is None or address == _MAP_FAILED:
+            return None
+        try:
+            if _libc.mincore(address, size, vector) != 0:
+                return None
+        finally:
+            _libc.munmap(address, size)
+    return bytes(vector).translate(_RESIDENT_BIT)
+
+
+def _mem_available() -> int | None:
+    try:
+        with open("/proc/meminfo", encoding="ascii") as file:
+            for line in file:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def _format_bytes(value: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(value) < 1024 or unit == "GiB":
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GiB"
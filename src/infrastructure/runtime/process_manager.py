@@ -7,7 +7,8 @@ import subprocess
 import time
 from dataclasses import dataclass
 
-from ..config.settings import AppSettings, EngineType, ModelConfig
+from ..config.settings import AppSettings, ConfigValidationError, EngineType, ModelConfig
+from .prewarm import PageCachePrewarmer, resolve_weight_files
 
 
 @dataclass(slots=True)
@@ -20,6 +21,13 @@ class EngineProcessInfo:
     pid: int
 
 
+def is_port_open(host: str, port: int, timeout: float = 0.3) -> bool:
+    """지정 host/port 에 리스닝 중인 프로세스가 있는지 연결을 시도해 확인한다(최대 `timeout`초)."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex((host, port)) == 0
+
+
 class ProcessManager:
     """추론 엔진 프로세스의 기동/중지/상태 조회를 담당한다."""
 
@@ -50,8 +58,21 @@ class ProcessManager:
         """Ollama 서버 기동 커맨드를 생성한다."""
         return ["ollama", "serve"]
 
-    def _build_vllm_command(self, model_name: str, host: str, port: int) -> list[str]:
-        """vLLM(OpenAI 호환) 서버 기동 커맨드를 생성한다."""
+    def _build_ollama_env(self, host: str, port: int) -> dict[str, str]:
+        """Ollama 서버 기동 환경 변수(바인드 주소와 `runtime.ollama` 튜닝 값)를 생성한다."""
+        env = os.environ.copy()
+        env["OLLAMA_HOST"] = f"{host}:{port}"
+        env.update(self.settings.runtime.ollama.to_env())
+        return env
+
+    def _build_vllm_command(
+        self,
+        model_name: str,
+        host: str,
+        port: int,
+        server_args: list[str] | None = None,
+    ) -> list[str]:
+        """vLLM(OpenAI 호환) 서버 기동 커맨드를 생성한다(`server_args`는 모델 튜닝 인자)."""
         return [
             "python3.12",
             "-m",
@@ -63,6 +84,7 @@ class ProcessManager:
             "--port",
             str(port),
             "--trust-remote-code",
+            *(server_args or []),
         ]
 
     def _has_vllm_module(self) -> bool:
@@ -71,12 +93,18 @@ class ProcessManager:
 
     def _is_port_open(self, host: str, port: int) -> bool:
         """지정 host/port 에 리스닝 중인 프로세스가 있는지 확인한다."""
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-            sock.settimeout(0.3)
-            return sock.connect_ex((host, port)) == 0
+        return is_port_open(host, port)
+
+    def start_engines(
+        self,
+        selected_engines: list[EngineType] | None = None,
+        vllm_model_id: str | None = None,
+    ) -> dict[EngineType, EngineProcessInfo]:
+        """엔진 프로세스를 시작하고 PID/포트 정보를 반환한다.
 
-    def start_engines(self, selected_engines: list[EngineType] | None = None) -> dict[EngineType, EngineProcessInfo]:
-        """엔진 프로세스를 시작하고 PID/포트 정보를 반환한다."""
+        Args:
+            vllm_model_id: vLLM으로 서빙할 모델 ID. 없으면 첫 활성 모델(`auto_load` 우선)을 쓴다.
+        """
         active_engines = self.resolve_engines(selected_engines)
         started: dict[EngineType, EngineProcessInfo] = {}
         failures: list[str] = []
@@ -100,19 +128,24 @@ class ProcessManager:
             try:
                 if engine == "ollama":
                     command = self._build_ollama_command()
-                    env = os.environ.copy()
-                    env["OLLAMA_HOST"] = f"{endpoint.host}:{endpoint.port}"
+                    env = self._build_ollama_env(endpoint.host, endpoint.port)
                     process = subprocess.Popen(command, text=True, env=env)
                 else:
                     if not self._has_vllm_module():
                         raise RuntimeError("vllm 패키지가 설치되어 있지 않습니다.")
-                    model = self._first_enabled_model("vllm")
+                    if vllm_model_id is not None:
+                        model = self.settings.get_model(vllm_model_id)
+                    else:
+                        model = self._first_enabled_model("vllm")
                     if model is None:
                         raise RuntimeError("vLLM 기동을 위한 활성 모델이 없습니다.")
+                    if self.settings.runtime.prewarm.enabled:
+                        self.prewarm(model)
                     command = self._build_vllm_command(
                         model_name=model.model_name(),
                         host=endpoint.host,
                         port=endpoint.port,
+                        server_args=model.parameters.vllm_server_args(),
                     )
                     process = subprocess.Popen(command, text=True)
 
@@ -142,6 +175,20 @@ class ProcessManager:
 
         return started
 
+    def prewarm(self, model: ModelConfig) -> None:
+        """모델 가중치 파일을 페이지 캐시에 미리 읽는다(`runtime.prewarm`).
+
+        Notes:
+            가중치를 찾지 못하거나(엔진이 처음 내려받는 경우 등) 읽기에 실패해도 기동은 계속한다.
+        """
+        try:
+            files = resolve_weight_files(self.settings, model)
+            report = PageCachePrewarmer.from_config(self.settings.runtime.prewarm).prewarm(files, model.id)
+        except (ConfigValidationError, OSError) as exc:
+            print(f"[WARN] 가중치 프리웜을 건너뜁니다: {exc}")
+            return
+        print(f"[PREWARM] {report.summary()}")
+
     def stop_engine(self, engine: EngineType) -> None:
         """단일 엔진 프로세스를 안전하게 종료한다."""
         process = self._processes.get(engine)
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import secrets
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.managers import BaseManager, DictProxy
+from pathlib import Path
+from typing import Any
+
+from ..observability import MetricsRegistry
+
+STATE_ADDRESS_ENV = "LOCAL_LLM_STATE_ADDRESS"
+"""API 워커가 접속할 공유 상태 서버 주소(유닉스 소켓 경로) 환경 변수."""
+
+STATE_AUTHKEY_ENV = "LOCAL_LLM_STATE_AUTHKEY"
+"""공유 상태 서버 인증 키(hex) 환경 변수."""
+
+
+class MetricsHub:
+    """워커별 메트릭 상태를 모아 하나의 스냅샷으로 병합하는 집계기.
+
+    Notes:
+        워커는 주기적으로 `publish`를 호출해 자신의 전체 상태를 덮어쓴다.
+        `stale_after`초 동안 갱신이 없는 워커(종료/재시작)는 병합에서 제외한다.
+    """
+
+    def __init__(self, stale_after: float = 30.0) -> None:
+        """집계기를 초기화한다."""
+        self.stale_after = stale_after
+        self._states: dict[int, tuple[float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, worker_id: int, state: dict[str, Any]) -> None:
+        """워커의 최신 메트릭 상태를 등록한다."""
+        with self._lock:
+            self._states[worker_id] = (time.monotonic(), state)
+
+    def merged_snapshot(self) -> dict[str, Any]:
+        """활성 워커 전체의 메트릭을 병합한 스냅샷을 반환한다."""
+        now = time.monotonic()
+        with self._lock:
+            live = {
+                worker_id: state
+                for worker_id, (published_at, state) in self._states.items()
+                if now - published_at <= self.stale_after
+            }
+        merged = MetricsRegistry(window_size=4096)
+        for state in live.values():
+            merged.merge_state(state)
+        snapshot = merged.snapshot()
+        snapshot["workers"] = sorted(live)
+        return snapshot
+
+
+class SharedStateManager(BaseManager):
+    """슈퍼바이저 프로세스의 공유 객체를 API 워커에 노출하는 매니저.
+
+    Registered:
+        - engines: 엔진 프로세스 소유/제어 객체(start/stop/stop_all/status)
+        - context_store: Ollama 세션 컨텍스트 저장소
+        - residency: 모델 ID → 로드 여부 dict
+        - metrics_hub: 워커 메트릭 집계기
+        - rate_limiter: 테넌트 요청/토큰 한도기
+    """
+
+
+_SHARED_TYPEIDS = ("engines", "context_store", "metrics_hub", "rate_limiter")
+
+
+@dataclass(slots=True)
+class SharedStateClient:
+    """API 워커에서 사용하는 공유 객체 프록시 묶음."""
+
+    engines: Any
+    context_store: Any
+    residency: Any
+    metrics_hub: Any
+    rate_limiter: Any
+
+
+@dataclass(slots=True)
+class SharedStateServer:
+    """슈퍼바이저 프로세스에서 실행 중인 공유 상태 서버 핸들."""
+
+    address: str
+    authkey: bytes
+    thread: threading.Thread
+
+    def export_env(self) -> dict[str, str]:
+        """워커 프로세스에 전달할 접속 환경 변수를 반환한다."""
+        return {STATE_ADDRESS_ENV: self.address, STATE_AUTHKEY_ENV: self.authkey.hex()}
+
+
+def serve_shared_state(
+    *,
+    engines: Any,
+    context_store: Any,
+    metrics_hub: MetricsHub,
+    rate_limiter: Any,
+    residency: dict[str, bool] | None = None,
+    address: str | None = None,
+) -> SharedStateServer:
+    """현재 프로세스의 백그라운드 스레드에서 공유 상태 서버를 시작한다.
+
+    Notes:
+        객체가 슈퍼바이저 프로세스에 그대로 남아 있으므로, 엔진 자식 프로세스도
+        이 프로세스가 소유한다. 주소는 기본적으로 임시 디렉터리의 유닉스 소켓을 사용한다.
+    """
+    shared = {
+        "engines": engines,
+        "context_store": context_store,
+        "metrics_hub": metrics_hub,
+        "rate_limiter": rate_limiter,
+    }
+    for typeid in _SHARED_TYPEIDS:
+        SharedStateManager.register(typeid, callable=lambda obj=shared[typeid]: obj)
+    residency_dict = residency if residency is not None else {}
+    SharedStateManager.register("residency", callable=lambda: residency_dict, proxytype=DictProxy)
+
+    address = address or str(Path(tempfile.gettempdir()) / f"local-llm-state-{os.getpid()}.sock")
+    if os.path.exists(address):
+        os.unlink(address)
+    authkey = secrets.token_bytes(32)
+    manager = SharedStateManager(address=address, authkey=authkey)
+    server = manager.get_server()
+    thread = threading.Thread(target=server.serve_forever, name="shared-state", daemon=True)
+    thread.start()
+    return SharedStateServer(address=address, authkey=authkey, thread=thread)
+
+
+def connect_shared_state(address: str, authkey: bytes) -> SharedStateClient:
+    """공유 상태 서버에 접속해 프록시 묶음을 반환한다."""
+    for typeid in _SHARED_TYPEIDS:
+        SharedStateManager.register(typeid)
+    SharedStateManager.register("residency", proxytype=DictProxy)
+    manager = SharedStateManager(address=address, authkey=authkey)
+    manager.connect()
+    return SharedStateClient(
+        engines=manager.engines(),
+        context_store=manager.context_store(),
+        residency=manager.residency(),
+        metrics_hub=manager.metrics_hub(),
+        rate_limiter=manager.rate_limiter(),
+    )
+
+
+def connect_shared_state_from_env() -> SharedStateClient | None:
+    """환경 변수에 공유 상태 서버 정보가 있으면 접속하고, 없으면 `None`을 반환한다."""
+    address = os.getenv(STATE_ADDRESS_ENV)
+    authkey = os.getenv(STATE_AUTHKEY_ENV)
+    if not address or not authkey:
+        return None
+    return connect_shared_state(address, bytes.fromhex(authkey))
+
+
+def start_metrics_publisher(
+    client: SharedStateClient,
+    metrics: MetricsRegistry,
+    interval: float = 1.0,
+) -> threading.Thread:
+    """워커 메트릭을 주기적으로 집계기에 게시하는 데몬 스레드를 시작한다."""
+    worker_id = os.getpid()
+
+    def _loop() -> None:
+        while True:
+            try:
+                client.metrics_hub.publish(worker_id, metrics.export_state())
+            except Exception:
+                pass
+            time.sleep(interval)
+
+    thread = threading.Thread(target=_loop, name="metrics-publisher", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,21 @@
+"""요청 스케줄링(디스패치 큐, 적응형 동시성, 테넌트 한도, 프롬프트 라우팅, 캐스케이드) 계층 공개 심볼을 모아 제공한다."""
+
+from .cascade import CascadeAcceptanceCheck, load_verifier
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+from .dispatch_queue import DispatchQueue
+from .prompt_router import ContextWindowExceeded, PromptRouter, RouteDecision
+from .rate_limiter import RateDecision, RateLimitExceeded, TenantRateLimiter, TokenBucket
+
+__all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "CascadeAcceptanceCheck",
+    "ContextWindowExceeded",
+    "DispatchQueue",
+    "PromptRouter",
+    "RateDecision",
+    "RateLimitExceeded",
+    "RouteDecision",
+    "TenantRateLimiter",
+    "TokenBucket",
+    "load_verifier",
+]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import importlib
+import re
+from collections.abc import Callable
+
+from ..config import CascadeAcceptance, ConfigValidationError
+
+Verifier = Callable[[str, str], bool]
+"""`(프롬프트, 생성 텍스트)`를 받아 응답을 수용할지 반환하는 검증 함수."""
+
+
+def load_verifier(path: str) -> Verifier:
+    """`package.module:function` 경로의 검증 함수를 가져온다.
+
+    Raises:
+        ConfigValidationError: 모듈이나 함수를 찾을 수 없는 경우.
+    """
+    module_name, _, attribute = path.partition(":")
+    try:
+        verifier = getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError) as exc:
+        raise ConfigValidationError(f"캐스케이드 verifier를 불러올 수 없습니다: {path} ({exc})") from exc
+    if not callable(verifier):
+        raise ConfigValidationError(f"캐스케이드 verifier가 호출 가능한 객체가 아닙니다: {path}")
+    return verifier
+
+
+class CascadeAcceptanceCheck:
+    """캐스케이드 단계 응답이 수용 조건을 통과하는지 판정한다.
+
+    Rules:
+        - 길이 → 거절 패턴 → 평균 로그 확률 → 검증 함수 순으로 보고, 처음 실패한 조건 이름을 반환한다.
+        - 로그 확률 하한이 있는데 요청한 로그 확률이 응답에 없으면 수용하지 않는다(`logprob_missing`).
+          로그 확률을 요청하지 않은 단계(Ollama 등, `expect_logprob=False`)는 이 조건을 건너뛴다.
+        - 검증 함수가 예외를 내면 수용하지 않는다(`verifier_error`).
+    """
+
+    def __init__(self, acceptance: CascadeAcceptance, verifier: Verifier | None = None) -> None:
+        """수용 조건으로 초기화한다. `verifier`를 주면 설정의 `verifier` 경로 대신 사용한다."""
+        self.acceptance = acceptance
+        self._refusals = [re.compile(pattern, re.IGNORECASE) for pattern in acceptance.refusal_patterns]
+        if verifier is None and acceptance.verifier is not None:
+            verifier = load_verifier(acceptance.verifier)
+        self._verifier = verifier
+
+    def rejection(
+        self,
+        prompt: str,
+        text: str,
+        mean_logprob: float | None = None,
+        expect_logprob: bool = True,
+    ) -> str | None:
+        """수용하지 않는 이유(`length`/`refusal`/`logprob`/`logprob_missing`/`verifier`/`verifier_error`),
+        수용하면 `None`."""
+        if len(text.strip()) < self.acceptance.min_length:
+            return "length"
+        if any(pattern.search(text) for pattern in self._refusals):
+            return "refusal"
+        threshold = self.acceptance.min_mean_logprob
+        if threshold is not None and expect_logprob:
+            if mean_logprob is None:
+                return "logprob_missing"
+            if mean_logprob < threshold:
+                return "logprob"
+        if self._verifier is not None:
+            try:
+                if not self._verifier(prompt, text):
+                    return "verifier"
+            except Exception:
+                return "verifier_error"
+        return None
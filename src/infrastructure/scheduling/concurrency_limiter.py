@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from ..adapters import AdapterResponse, CancellationToken
+from ..config import ModelConcurrencyPolicy
+from ..observability import MetricsRegistry
+
+LatencySample = Callable[[AdapterResponse, float], float | None]
+"""`(응답, 경과 초)`에서 한도 조정에 쓸 지연 표본을 만드는 함수(예: 생성 토큰당 지연). `None`이면 표본에서 뺀다."""
+
+
+def _is_overload(response: AdapterResponse) -> bool:
+    """엔진 과부하 신호로 보는 실패(타임아웃, 연결 끊김, 5xx)인지 판단한다."""
+    if response.error_kind in ("timeout", "reset"):
+        return True
+    return response.error_kind == "http" and (response.status_code or 0) >= 500
+
+
+class AdaptiveConcurrencyLimiter:
+    """관측한 엔진 지연으로 동시 요청 수 상한을 조정하는 적응형 동시성 제한기.
+
+    Rules:
+        - 최근 지연은 짧은 창(`short_window`) 이동 평균이고, 기준 지연은 최근 `long_window`개 표본 동안의
+          최근 지연 최솟값이다. 상한을 올리며 지연이 서서히 커져도 기준이 따라 올라가지 않는다.
+        - `gradient`: `기울기 = clamp(tolerance × 기준 / 최근, 0.5, 1)`로
+          `새 상한 = 상한 × 기울기 + √상한`을 구하고 `smoothing` 비율로 반영한다.
+          지연이 기준 근처면 √상한만큼 늘고, 지연이 커질수록 줄어든다.
+        - `aimd`: 최근 지연이 `기준 × tolerance` 이하면 상한을 표본마다 `1/상한`(창마다 약 1)만큼 늘리고,
+          넘으면 `backoff_ratio`를 곱한다.
+        - 타임아웃/연결 끊김/5xx는 두 알고리즘 모두 `backoff_ratio`로 줄인다. 취소/4xx는 표본으로 쓰지 않는다.
+        - 상한을 다 쓰지 않는 동안(진행 중 요청 < 상한/2)에는 늘리지 않는다.
+
+    Notes:
+        Netflix concurrency-limits의 Gradient2/AIMD를 단순화한 것이다. LLM 생성 지연은 출력 길이에 비례하므로
+        `sample`로 생성 토큰당 지연처럼 길이에 무관한 표본을 넘기면 프롬프트 구성이 바뀌어도 안정적이다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        policy: ModelConcurrencyPolicy,
+        initial_limit: int,
+        metrics: MetricsRegistry | None = None,
+        sample: LatencySample | None = None,
+    ) -> None:
+        """정책과 시작 상한으로 초기화한다(`policy.initial_limit`이 있으면 그 값을 쓴다)."""
+        self.name = name
+        self.policy = policy
+        self.metrics = metrics
+        self.sample = sample
+        start = policy.initial_limit or initial_limit
+        self._limit = float(max(policy.min_limit, min(start, policy.max_limit)))
+        self._in_flight = 0
+        self._baseline: float | None = None
+        self._recent: float | None = None
+        self._window: deque[float] = deque(maxlen=policy.long_window)
+        self._samples = 0
+        self._drops = 0
+        self._history: deque[dict[str, Any]] = deque(maxlen=policy.history_size)
+        self._condition = threading.Condition()
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        """현재 정수 상한."""
+        return max(1, int(self._limit))
+
+    @property
+    def max_limit(self) -> int:
+        """정책이 허용하는 최대 상한(디스패치 실행 스레드 수를 잡는 데 쓴다)."""
+        return self.policy.max_limit
+
+    def acquire(self, token: CancellationToken | None = None) -> bool:
+        """진행 중 요청 수가 상한보다 작아질 때까지 기다렸다 슬롯을 잡는다(기다리는 중 취소되면 `False`)."""
+        with self._condition:
+            while self._in_flight >= self.limit:
+                if token is not None and token.cancelled:
+                    return False
+                self._condition.wait(timeout=0.05)
+            self._in_flight += 1
+            if self.metrics is not None:
+                self.metrics.set_gauge("concurrency_in_flight", self._in_flight, model=self.name)
+            return True
+
+    def release(self, response: AdapterResponse | None = None, elapsed: float | None = None) -> None:
+        """슬롯을 반납하고, 응답과 경과 시간이 있으면 표본으로 상한을 조정한다."""
+        with self._condition:
+            in_flight = self._in_flight
+            self._in_flight -= 1
+            if response is not None and elapsed is not None:
+                self._update(response, elapsed, in_flight)
+            if self.metrics is not None:
+                self.metrics.set_gauge("concurrency_in_flight", self._in_flight, model=self.name)
+            self._condition.notify_all()
+
+    def state(self, include_history: bool = False) -> dict[str, Any]:
+        """현재 상한/진행 중 요청/기준·최근 지연(과 선택적으로 변경 이력)을 반환한다."""
+        with self._condition:
+            state: dict[str, Any] = {
+                "algorithm": self.policy.algorithm,
+                "limit": self.limit,
+                "limit_exact": round(self._limit, 3),
+                "in_flight": self._in_flight,
+                "baseline_latency": self._baseline,
+                "recent_latency": self._recent,
+                "samples": self._samples,
+                "drops": self._drops,
+            }
+            if include_history:
+                state["history"] = list(self._history)
+            return state
+
+    def _update(self, response: AdapterResponse, elapsed: float, in_flight: int) -> None:
+        """표본 하나로 기준/최근 지연과 상한을 갱신한다(조건 변수 잠금 안에서 호출)."""
+        policy = self.policy
+        previous = self.limit
+        if not response.ok:
+            if not _is_overload(response):
+                return
+            self._drops += 1
+            if self.metrics is not None:
+                self.metrics.inc("concurrency_limit_drops_total", model=self.name)
+            self._limit = max(policy.min_limit, self._limit * policy.backoff_ratio)
+            self._record(previous, "drop", None)
+            return
+
+        latency = self.sample(response, elapsed) if self.sample is not None else elapsed
+        if latency is None:
+            return
+        self._samples += 1
+        if self._recent is None:
+            self._recent = latency
+        else:
+            self._recent += (latency - self._recent) / min(self._samples, policy.short_window)
+        self._window.append(self._recent)
+        self._baseline = min(self._window)
+        if self._samples < policy.short_window:
+            return
+
+        utilized = in_flight * 2 >= self._limit
+        if policy.algorithm == "aimd":
+            if self._recent > self._baseline * policy.tolerance:
+                self._limit *= policy.backoff_ratio
+            elif utilized:
+                self._limit += 1 / self._limit
+        else:
+            gradient = max(0.5, min(1.0, policy.tolerance * self._baseline / self._recent))
+            target = self._limit * gradient + math.sqrt(self._limit)
+            if not utilized:
+                target = min(target, self._limit)
+            self._limit = (1 - policy.smoothing) * self._limit + policy.smoothing * target
+        self._limit = max(policy.min_limit, min(policy.max_limit, self._limit))
+        self._record(previous, "latency", latency)
+
+    def _record(self, previous: int, reason: str, latency: float | None) -> None:
+        if self.limit == previous:
+            return
+        self._history.append(
+            {
+                "at": time.time(),
+                "limit": self.limit,
+                "previous": previous,
+                "reason": reason,
+                "latency": latency,
+                "baseline_latency": self._baseline,
+            }
+        )
+        self._publish()
+
+    def _publish(self) -> None:
+        if self.metrics is not None:
+            self.metrics.set_gauge("concurrency_limit", self.limit, model=self.name)
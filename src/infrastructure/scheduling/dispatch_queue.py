@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from ..adapters import AdapterResponse, CancellationToken, cancelled_response
+from ..observability import NOOP_SPAN, MetricsRegistry, SpanHandle, start_span
+from .concurrency_limiter import AdaptiveConcurrencyLimiter
+
+
+@dataclass(slots=True)
+class _Ticket:
+    """큐에 대기 중인 요청 하나."""
+
+    call: Callable[[], AdapterResponse]
+    token: CancellationToken | None
+    tenant: str
+    enqueued_at: float = field(default_factory=time.monotonic)
+    # 제출 스레드의 트레이스 컨텍스트를 실행 스레드에서 이어 쓰기 위한 사본
+    context: contextvars.Context = field(default_factory=contextvars.copy_context)
+    wait_span: SpanHandle = NOOP_SPAN
+    done: threading.Event = field(default_factory=threading.Event)
+    result: AdapterResponse | None = None
+    dispatched: bool = False
+    abandoned: bool = False
+
+
+class DispatchQueue:
+    """모델별 요청을 윈도우 단위로 묶어 엔진 병렬 슬롯 수에 맞춰 디스패치하는 큐.
+
+    Rules:
+        - 첫 요청이 도착하면 `max_wait_ms` 동안 또는 `max_batch_size`개가 찰 때까지 윈도우를 모은다.
+        - 윈도우의 요청들은 동시에 엔진으로 보내지되, 진행 중 요청 수는 `concurrency`를 넘지 않는다.
+        - 대기 중 취소된 요청은 엔진에 보내지 않고 건너뛴다.
+        - 윈도우에 들어갈 요청은 테넌트 간 가중 공정 큐(start-time fair queuing) 순서로 고른다.
+          요청의 시작 태그는 `max(가상 시각, 테넌트 직전 종료 태그)`, 종료 태그는 `시작 + cost / weight`이며,
+          시작 태그가 작은 요청부터 꺼낸다. 따라서 대량 요청을 쌓은 테넌트가 다른 테넌트를 굶기지 않는다.
+        - `limiter`가 주어지면 고정 `concurrency` 대신 적응형 제한기의 현재 상한으로 진행 중 요청 수를 제한하고,
+          요청마다 응답과 실행 시간을 제한기에 표본으로 넘긴다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_batch_size: int,
+        max_wait_ms: float,
+        concurrency: int,
+        metrics: MetricsRegistry,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+    ) -> None:
+        """큐와 디스패처 스레드, 동시 처리 슬롯을 초기화한다."""
+        self.name = name
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.concurrency = concurrency
+        self.metrics = metrics
+        self.limiter = limiter
+        self._heap: list[tuple[float, int, _Ticket]] = []
+        self._pending = 0
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._finish_tags: dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._slots = threading.Semaphore(concurrency)
+        workers = max(concurrency, limiter.max_limit) if limiter is not None else concurrency
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"dispatch-{name}")
+        self._dispatcher = threading.Thread(target=self._run, name=f"dispatcher-{name}", daemon=True)
+        self._dispatcher.start()
+
+    @property
+    def depth(self) -> int:
+        """현재 대기 중인 요청 수를 반환한다."""
+        with self._condition:
+            return self._pending
+
+    def submit(
+        self,
+        call: Callable[[], AdapterResponse],
+        token: CancellationToken | None = None,
+        *,
+        tenant: str = "anonymous",
+        weight: float = 1.0,
+        cost: float = 1.0,
+    ) -> AdapterResponse:
+        """요청을 큐에 넣고 처리 완료(또는 대기 중 취소)까지 블로킹한다.
+
+        Args:
+            tenant / weight: 공정 스케줄링 단위와 가중치.
+            cost: 요청 비용(추정 토큰 수 등). 가중치로 나눈 값만큼 테넌트의 가상 시각이 진행된다.
+        """
+        ticket = _Ticket(call=call, token=token, tenant=tenant)
+        ticket.wait_span = start_span("dispatch.queue_wait", queue=self.name, tenant=tenant)
+        with self._condition:
+            start = max(self._virtual_time, self._finish_tags.get(tenant, 0.0))
+            self._finish_tags[tenant] = start + max(cost, 1.0) / weight
+            heapq.heappush(self._heap, (start, next(self._sequence), ticket))
+            self._pending += 1
+            self.metrics.set_gauge("dispatch_queue_depth", self._pending, model=self.name)
+            self._condition.notify()
+
+        while not ticket.done.wait(timeout=0.05):
+            if token is not None and token.cancelled and self._abandon(ticket):
+                ticket.wait_span.set(cancelled=True)
+                ticket.wait_span.end()
+                self.metrics.inc("dispatch_cancelled_in_queue_total", model=self.name)
+                return cancelled_response(token)
+        assert ticket.result is not None
+        return ticket.result
+
+    def _abandon(self, ticket: _Ticket) -> bool:
+        """아직 디스패치되지 않은 요청을 큐에서 제거한다. 이미 실행 중이면 False."""
+        with self._condition:
+            if ticket.abandoned or ticket.dispatched:
+                return False
+            # 힙에서는 꺼낼 때 건너뛰도록 표시만 한다.
+            ticket.abandoned = True
+            self._pending -= 1
+            return True
+
+    def _pop_ticket(self) -> _Ticket | None:
+        """시작 태그가 가장 작은 대기 요청을 꺼낸다(취소 표시된 항목은 버린다)."""
+        while self._heap:
+            start, _, ticket = heapq.heappop(self._heap)
+            if ticket.abandoned:
+                continue
+            self._virtual_time = max(self._virtual_time, start)
+            ticket.dispatched = True
+            self._pending -= 1
+            return ticket
+        return None
+
+    def _next_window(self) -> list[_Ticket]:
+        """윈도우 조건(최대 대기/최대 배치)을 만족할 때까지 기다렸다가 요청 묶음을 꺼낸다."""
+        with self._condition:
+            while not self._pending:
+                self._condition.wait()
+            oldest = min(ticket.enqueued_at for _, _, ticket in self._heap if not ticket.abandoned)
+            deadline = oldest + self.max_wait
+            while self._pending < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(timeout=remaining)
+            window: list[_Ticket] = []
+            while len(window) < self.max_batch_size:
+                ticket = self._pop_ticket()
+                if ticket is None:
+                    break
+                window.append(ticket)
+            self.metrics.set_gauge("dispatch_queue_depth", self._pending, model=self.name)
+            return window
+
+    def _run(self) -> None:
+        """디스패처 루프: 윈도우를 꺼내 슬롯이 비는 대로 실행 스레드에 넘긴다."""
+        while True:
+            window = self._next_window()
+            if not window:
+                continue
+            self.metrics.observe("dispatch_window_size", len(window), model=self.name)
+            for ticket in window:
+                if self.limiter is not None:
+                    self.limiter.acquire()
+                else:
+                    self._slots.acquire()
+                ticket.wait_span.set(window_size=len(window))
+                ticket.wait_span.end()
+                waited = time.monotonic() - ticket.enqueued_at
+                self.metrics.observe("dispatch_queue_wait_seconds", waited, model=self.name)
+                self.metrics.observe("tenant_queue_wait_seconds", waited, tenant=ticket.tenant)
+                self._executor.submit(self._execute, ticket)
+
+    def _execute(self, ticket: _Ticket) -> None:
+        """요청 하나를 실행하고 슬롯을 반납한다."""
+        started = time.monotonic()
+        try:
+            if ticket.token is not None and ticket.token.cancelled:
+                ticket.result = cancelled_response(ticket.token)
+            else:
+                ticket.result = ticket.context.run(ticket.call)
+        except Exception as exc:
+            ticket.result = AdapterResponse(ok=False, error=str(exc), error_kind="unknown")
+        finally:
+            if self.limiter is not None:
+                self.limiter.release(ticket.result, time.monotonic() - started)
+            else:
+                self._slots.release()
+            ticket.done.set()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass
+
+from ..config import AppSettings, ConfigValidationError, ModelConfig
+from ..tokenization import TokenCounter
+
+
+class ContextWindowExceeded(Exception):
+    """프롬프트(와 요청한 `max_tokens`)가 모델 컨텍스트 창을 넘을 때 발생하는 예외."""
+
+    def __init__(self, model_id: str, required_tokens: int, limit: int) -> None:
+        super().__init__(
+            f"모델 {model_id}의 컨텍스트 창({limit} 토큰)을 초과했습니다. 추정 필요 토큰: {required_tokens}"
+        )
+        self.model_id = model_id
+        self.required_tokens = required_tokens
+        self.limit = limit
+
+
+@dataclass(slots=True)
+class RouteDecision:
+    """프롬프트 라우팅 결과.
+
+    Attributes:
+        group: 요청이 라우팅 그룹 이름으로 들어왔으면 그 이름.
+        prompt_tokens: 추정 프롬프트 토큰 수.
+        num_ctx: Ollama 요청에 적용할 자동 `num_ctx`(자동 조정하지 않으면 `None`).
+    """
+
+    model: ModelConfig
+    prompt_tokens: int
+    group: str | None = None
+    num_ctx: int | None = None
+
+
+class PromptRouter:
+    """엔진 호출 전에 프롬프트 토큰 수를 추정해 모델 선택, 컨텍스트 초과 거부, `num_ctx` 조정을 한다.
+
+    Rules:
+        - `model_id`가 모델 ID면 그 모델을 쓰고, 추정 프롬프트 토큰 + 요청 `max_tokens`가 컨텍스트 창을
+          넘으면 엔진/큐에 들어가기 전에 `ContextWindowExceeded`로 거부한다.
+        - Ollama 모델의 창은 실제로 적용될 `num_ctx`(요청 값, 없으면 모델 설정)다. 자동 조정 값은 필요 토큰
+          이상이므로 따로 검사하지 않는다. 어느 경우든 `max_model_len`이 있으면 그 값을 넘지 않는다.
+        - `model_id`가 라우팅 그룹 이름이면 그룹 모델을 설정 순서(빠른 모델 우선)대로 보며
+          `(프롬프트 + 생성 예약) × (1 + safety_margin)`이 창에 들어가는 첫 모델을 고른다.
+          들어가는 모델이 없으면 창이 가장 큰 모델로 위 검사를 적용한다.
+        - `auto_num_ctx`이고 Ollama 요청과 모델 설정(`parameters.num_ctx`) 모두에 `num_ctx`가 없으면 필요 토큰을
+          `num_ctx_min`부터 2의 거듭제곱으로 올림한 값(창 크기 상한)을 쓴다. Ollama는 `num_ctx`가 바뀌면 모델을
+          다시 적재하므로, 모델별로 지금까지 보낸 가장 큰 값보다 작게는 내리지 않는다(값은 커지기만 한다).
+    """
+
+    def __init__(self, settings: AppSettings, counter: TokenCounter) -> None:
+        """설정과 토큰 수 추정기로 초기화한다."""
+        self.settings = settings
+        self.config = settings.runtime.prompt_routing
+        self.counter = counter
+        self._num_ctx: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def route(
+        self,
+        model_id: str,
+        prompt: str,
+        max_tokens: int | None = None,
+        num_ctx: int | None = None,
+    ) -> RouteDecision:
+        """요청 모델(또는 그룹)과 프롬프트로 실제 사용할 모델과 `num_ctx`를 결정한다."""
+        prompt_tokens = self.counter.count(prompt)
+        completion = max_tokens if max_tokens is not None else self.config.reserve_completion_tokens
+        needed = math.ceil((prompt_tokens + completion) * (1 + self.config.safety_margin))
+
+        group = None
+        model = self.settings.get_model(model_id)
+        if model is None:
+            candidates = self.settings.model_group(model_id)
+            if not candidates:
+                raise ConfigValidationError(f"존재하지 않는 모델 ID입니다: {model_id}")
+            group = model_id
+            model = next(
+                (item for item in candidates if (self._window(item, num_ctx) or math.inf) >= needed),
+                max(candidates, key=lambda item: self._window(item, num_ctx) or math.inf),
+            )
+
+        window = self._window(model, num_ctx)
+        if window is not None and prompt_tokens + (max_tokens or 0) > window:
+            raise ContextWindowExceeded(model.id, prompt_tokens + (max_tokens or 0), window)
+
+        decision = RouteDecision(model=model, prompt_tokens=prompt_tokens, group=group)
+        explicit = num_ctx is not None or model.parameters.num_ctx is not None
+        if self.config.auto_num_ctx and model.engine == "ollama" and not explicit:
+            size = self.config.num_ctx_min
+            while size < needed:
+                size *= 2
+            with self._lock:
+                size = max(size, self._num_ctx.get(model.id, 0))
+                self._num_ctx[model.id] = size
+            decision.num_ctx = min(size, window) if window is not None else size
+        return decision
+
+    @staticmethod
+    def _window(model: ModelConfig, num_ctx: int | None) -> int | None:
+        """요청에 실제로 적용될 컨텍스트 창(자동 `num_ctx` 적용 전)을 반환한다. 알 수 없으면 `None`."""
+        limit = model.parameters.max_model_len
+        if model.engine == "ollama":
+            size = num_ctx if num_ctx is not None else model.parameters.num_ctx
+            if size is not None:
+                return min(size, limit) if limit else size
+        return model.context_window()
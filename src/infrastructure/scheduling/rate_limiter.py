@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from ..config import TenancyConfig, TenantConfig
+
+LimitKind = Literal["requests", "tokens"]
+"""요청을 거부한 한도 종류."""
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    """초당 `rate`만큼 보충되고 최대 `capacity`까지 적립되는 토큰 버킷.
+
+    Notes:
+        보충은 조회 시점에 경과 시간으로 한 번에 계산하므로(지연 보충) 호출당 O(1)이다.
+        사후 정산으로 잔량이 음수(부채)가 될 수 있으며, 부채는 보충으로 갚아진다.
+    """
+
+    rate: float
+    capacity: float
+    tokens: float = field(init=False)
+    updated_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self) -> None:
+        self.tokens = self.capacity
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """`amount`를 차감하려면 기다려야 하는 시간(초)을 반환한다(0이면 즉시 가능).
+
+        Notes:
+            버킷 용량보다 큰 요청은 버킷이 가득 찼을 때 허용하고 부채로 남긴다.
+        """
+        self._refill(now)
+        needed = min(amount, self.capacity)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.rate
+
+    def take(self, amount: float) -> None:
+        """토큰을 차감한다(`wait_time`으로 확인한 뒤 호출)."""
+        self.tokens -= amount
+
+    def adjust(self, delta: float) -> None:
+        """사후 정산: 양수면 환급, 음수면 추가 차감한다."""
+        self.tokens = min(self.capacity, self.tokens + delta)
+
+
+@dataclass(slots=True)
+class RateDecision:
+    """한도 검사 결과."""
+
+    allowed: bool
+    limit: LimitKind | None = None
+    retry_after: float = 0.0
+
+
+class RateLimitExceeded(Exception):
+    """테넌트 요청/토큰 한도 초과 시 발생하는 예외."""
+
+    def __init__(self, tenant_id: str, limit: LimitKind, retry_after: float) -> None:
+        super().__init__(f"테넌트 {tenant_id}의 {limit} 한도를 초과했습니다. {retry_after:.2f}초 후 재시도하세요.")
+        self.tenant_id = tenant_id
+        self.limit = limit
+        self.retry_after = retry_after
+
+
+@dataclass(slots=True)
+class _TenantState:
+    """테넌트별 버킷과 사용량 누계."""
+
+    requests: TokenBucket | None
+    tokens: TokenBucket | None
+    admitted: int = 0
+    rejected: int = 0
+    reserved_tokens: float = 0.0
+    consumed_tokens: float = 0.0
+
+
+class TenantRateLimiter:
+    """테넌트별 요청 수/토큰 소비 토큰 버킷 한도기.
+
+    Rules:
+        - `acquire`는 요청 버킷 1개와 토큰 버킷 추정치를 함께 검사하고, 둘 다 통과할 때만 차감한다.
+        - 토큰은 `max_tokens` 기반 추정치로 선차감하고, 응답 후 `settle`에서 실제 사용량으로 정산한다.
+        - 설정에 없는 테넌트 ID는 한도 없이 사용량만 집계한다.
+
+    Notes:
+        멀티 워커 모드에서는 슈퍼바이저 프로세스의 인스턴스 하나를 공유 프록시로 사용하므로
+        모든 워커가 같은 버킷을 본다. 모든 연산은 단일 락 아래 O(1)이다.
+    """
+
+    def __init__(self, tenancy: TenancyConfig) -> None:
+        """테넌시 설정으로 한도기를 초기화한다(버킷은 첫 요청 시 생성)."""
+        self.tenancy = tenancy
+        self._states: dict[str, _TenantState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _build_state(tenant: TenantConfig | None) -> _TenantState:
+        if tenant is None:
+            return _TenantState(requests=None, tokens=None)
+        requests = None
+        if tenant.requests_per_second is not None:
+            requests = TokenBucket(
+                rate=tenant.requests_per_second,
+                capacity=tenant.burst or max(1.0, tenant.requests_per_second),
+            )
+        tokens = None
+        if tenant.tokens_per_minute is not None:
+            tokens = TokenBucket(
+                rate=tenant.tokens_per_minute / 60,
+                capacity=tenant.token_burst or tenant.tokens_per_minute,
+            )
+        return _TenantState(requests=requests, tokens=tokens)
+
+    def _state(self, tenant_id: str) -> _TenantState:
+        state = self._states.get(tenant_id)
+        if state is None:
+            state = self._build_state(self.tenancy.get(tenant_id))
+            self._states[tenant_id] = state
+        return state
+
+    def acquire(self, tenant_id: str, estimated_tokens: float) -> RateDecision:
+        """요청 1건과 추정 토큰을 차감할 수 있는지 검사하고, 가능하면 차감한다."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._state(tenant_id)
+            request_wait = state.requests.wait_time(1, now) if state.requests is not None else 0.0
+            token_wait = state.tokens.wait_time(estimated_tokens, now) if state.tokens is not None else 0.0
+            if request_wait > 0 or token_wait > 0:
+                state.rejected += 1
+                limit: LimitKind = "requests" if request_wait >= token_wait else "tokens"
+                return RateDecision(allowed=False, limit=limit, retry_after=max(request_wait, token_wait))
+            if state.requests is not None:
+                state.requests.take(1)
+            if state.tokens is not None:
+                state.tokens.take(estimated_tokens)
+            state.admitted += 1
+            state.reserved_tokens += estimated_tokens
+            return RateDecision(allowed=True)
+
+    def settle(self, tenant_id: str, estimated_tokens: float, actual_tokens: float) -> None:
+        """선차감한 추정치를 실제 사용량으로 정산한다."""
+        with self._lock:
+            state = self._state(tenant_id)
+            if state.tokens is not None:
+                state.tokens.adjust(estimated_tokens - actual_tokens)
+            state.reserved_tokens -= estimated_tokens
+            state.consumed_tokens += actual_tokens
+
+    def usage(self) -> dict[str, dict[str, Any]]:
+        """테넌트별 사용량 누계와 현재 버킷 잔량을 반환한다."""
+        now = time.monotonic()
+        result: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for tenant_id, state in self._states.items():
+                for bucket in (state.requests, state.tokens):
+                    if bucket is not None:
+                        bucket._refill(now)
+                result[tenant_id] = {
+                    "admitted": state.admitted,
+                    "rejected": state.rejected,
+                    "reserved_tokens": state.reserved_tokens,
+                    "consumed_tokens": state.consumed_tokens,
+                    "request_tokens_available": state.requests.tokens if state.requests is not None else None,
+                    "token_budget_available": state.tokens.tokens if state.tokens is not None else None,
+                }
+        return result
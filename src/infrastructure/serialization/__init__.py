@@ -0,0 +1,6 @@
+"""JSON/벡터 직렬화 계층 공개 심볼을 모아 제공한다."""
+
+from .json_codec import JSON_BACKEND, dumps, loads
+from .vector_codec import VECTOR_FORMATS, float32_bytes, npy_bytes
+
+__all__ = ["JSON_BACKEND", "VECTOR_FORMATS", "dumps", "float32_bytes", "loads", "npy_bytes"]
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Literal
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgspec = None
+
+JsonBackend = Literal["orjson", "msgspec", "json"]
+
+if orjson is not None:
+    JSON_BACKEND: JsonBackend = "orjson"
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+else:
+    JSON_BACKEND = "json"
+"""설치 상태에 따라 선택된 JSON 백엔드(orjson > msgspec > 표준 json)."""
+
+if msgspec is not None:
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_decoder = msgspec.json.Decoder()
+
+
+def dumps(obj: Any) -> bytes:
+    """객체를 UTF-8 JSON 바이트로 직렬화한다.
+
+    Notes:
+        dataclass(slots 포함)는 orjson/msgspec에서 `asdict` 복사 없이 직접 직렬화된다.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    if msgspec is not None:
+        return _msgspec_encoder.encode(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """JSON 바이트(또는 문자열)를 역직렬화한다.
+
+    Notes:
+        바이트를 그대로 받으므로 호출 측에서 `.decode()`로 문자열 사본을 만들 필요가 없다.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return _msgspec_decoder.decode(data)
+    return json.loads(data)
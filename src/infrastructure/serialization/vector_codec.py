@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import sys
+from array import array
+
+VECTOR_FORMATS = ("json", "f32", "npy")
+"""임베딩 응답 형식: JSON 실수 배열, 리틀 엔디언 float32 원시 바이트, NumPy `.npy` 파일 바이트."""
+
+
+def float32_bytes(values: array) -> bytes:
+    """float32 연속 배열을 리틀 엔디언 원시 바이트로 변환한다."""
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped = array("f", values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def npy_bytes(values: array, shape: tuple[int, ...]) -> bytes:
+    """float32 연속 배열을 NumPy `.npy`(v1.0) 형식 바이트로 변환한다.
+
+    Notes:
+        NumPy 없이 헤더를 직접 작성하며, `numpy.load(io.BytesIO(data))`로 바로 읽을 수 있다.
+        헤더는 `.npy` 규격대로 64바이트 경계에 맞춰 공백으로 채운다.
+    """
+    rendered_shape = f"({shape[0]},)" if len(shape) == 1 else f"({', '.join(str(size) for size in shape)})"
+    header = f"{{'descr': '<f4', 'fortran_order': False, 'shape': {rendered_shape}, }}"
+    preamble = 10
+    padding = (64 - (preamble + len(header) + 1) % 64) % 64
+    header_bytes = (header + " " * padding + "\n").encode("latin1")
+    return b"\x93NUMPY\x01\x00" + len(header_bytes).to_bytes(2, "little") + header_bytes + float32_bytes(values)
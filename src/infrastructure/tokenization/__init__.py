@@ -0,0 +1,5 @@
+"""프롬프트 토큰 수 추정 계층 공개 심볼을 모아 제공한다."""
+
+from .token_counter import CharRatioTokenizer, TokenCounter, Tokenizer, TokenizersTokenizer
+
+__all__ = ["CharRatioTokenizer", "TokenCounter", "Tokenizer", "TokenizersTokenizer"]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Protocol
+
+from ..config import ConfigValidationError, PromptRoutingConfig
+
+try:
+    from tokenizers import Tokenizer as _HfTokenizer
+except ImportError:  # pragma: no cover - 선택 의존성
+    _HfTokenizer = None
+
+
+class Tokenizer(Protocol):
+    """프롬프트 토큰 수를 세는 토크나이저 인터페이스."""
+
+    def count(self, text: str) -> int:
+        """텍스트의 토큰 수를 반환한다."""
+        ...
+
+
+class CharRatioTokenizer:
+    """ASCII/비ASCII 문자 수 비율로 토큰 수를 근사하는 토크나이저.
+
+    Notes:
+        영문/코드는 대략 4자당 1토큰, 한글/한자 등 비ASCII 문자는 1~2자당 1토큰으로 잘리는 경향을
+        두 비율로 반영한다. ASCII 문자 수는 C 수준 인코딩 한 번으로 센다.
+    """
+
+    def __init__(self, ascii_chars_per_token: float = 4.0, other_chars_per_token: float = 1.5) -> None:
+        """문자 종류별 문자당 토큰 비율을 설정한다."""
+        self.ascii_chars_per_token = ascii_chars_per_token
+        self.other_chars_per_token = other_chars_per_token
+
+    def count(self, text: str) -> int:
+        if text.isascii():
+            return math.ceil(len(text) / self.ascii_chars_per_token)
+        ascii_chars = len(text.encode("ascii", "ignore"))
+        other_chars = len(text) - ascii_chars
+        return math.ceil(ascii_chars / self.ascii_chars_per_token + other_chars / self.other_chars_per_token)
+
+
+class TokenizersTokenizer:
+    """HF `tokenizers` 패키지로 정확한 토큰 수를 세는 토크나이저."""
+
+    def __init__(self, name_or_path: str) -> None:
+        """`tokenizer.json` 파일 경로 또는 허브 모델 이름으로 토크나이저를 불러온다."""
+        if _HfTokenizer is None:
+            raise ConfigValidationError("prompt_routing.tokenizer=tokenizers를 사용하려면 tokenizers 패키지가 필요합니다.")
+        if Path(name_or_path).is_file():
+            self._tokenizer = _HfTokenizer.from_file(name_or_path)
+        else:
+            self._tokenizer = _HfTokenizer.from_pretrained(name_or_path)
+
+    def count(self, text: str) -> int:
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+class TokenCounter:
+    """토크나이저 결과를 프롬프트별 LRU 캐시에 보관하는 토큰 수 추정기.
+
+    Notes:
+        캐시 키는 `(길이, str 해시)`다. 문자열 해시는 객체에 캐시되므로 조회 비용이 거의 없고,
+        드문 충돌은 추정치 오차로만 이어진다(요청 내용에는 영향이 없다).
+    """
+
+    def __init__(self, tokenizer: Tokenizer, cache_size: int = 4096) -> None:
+        """토크나이저와 캐시 크기를 설정한다."""
+        self.tokenizer = tokenizer
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[int, int], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: PromptRoutingConfig) -> "TokenCounter":
+        """`runtime.prompt_routing` 설정으로 토크나이저와 캐시를 구성한다."""
+        tokenizer: Tokenizer
+        if config.tokenizer == "tokenizers":
+            assert config.tokenizer_path is not None
+            tokenizer = TokenizersTokenizer(config.tokenizer_path)
+        else:
+            tokenizer = CharRatioTokenizer(config.ascii_chars_per_token, config.other_chars_per_token)
+        return cls(tokenizer, cache_size=config.cache_size)
+
+    def count(self, text: str) -> int:
+        """텍스트의 토큰 수를 반환한다(캐시 적중 시 토크나이저를 호출하지 않는다)."""
+        key = (len(text), hash(text))
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+        tokens = self.tokenizer.count(text)
+        with self._lock:
+            self._cache[key] = tokens
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return tokens
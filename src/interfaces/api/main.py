@@ -1,15 +1,43 @@
 from __future__ import annotations
 
+import asyncio
+import math
+import os
+import time
 from contextlib import asynccontextmanager
-from dataclasses import asdict, is_dataclass
 from pathlib import Path
+from collections.abc import AsyncIterator
 from typing import Any, Literal
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response, StreamingResponse
 from pydantic import BaseModel
-
-from src.application.use_cases import EngineSelectionUseCase, InferenceUseCase, ModelLifecycleUseCase
-from src.infrastructure import AppSettings, load_settings
+from starlette.concurrency import run_in_threadpool
+
+from src.application.use_cases import EngineSelectionUseCase, InferenceUseCase, JobUseCase, ModelLifecycleUseCase
+from src.infrastructure import (
+    AppSettings,
+    CancellationToken,
+    ConfigValidationError,
+    ContextWindowExceeded,
+    EngineAutoscaler,
+    FleetController,
+    MetricsRegistry,
+    RateLimitExceeded,
+    SamplingProfiler,
+    SharedStateClient,
+    TenantConfig,
+    Tracer,
+    TrafficRecorder,
+    connect_shared_state_from_env,
+    load_settings,
+    start_metrics_publisher,
+    start_span,
+)
+from src.infrastructure.jobs import FINISHED_STATUSES, JobStatus
+from src.infrastructure.serialization import dumps, float32_bytes, npy_bytes
+
+from .middleware import RouteTimingMiddleware, TracingMiddleware
 
 
 def _load_app_settings(config_path: str | Path = "config/models.yml") -> AppSettings:
@@ -18,12 +46,76 @@ def _load_app_settings(config_path: str | Path = "config/models.yml") -> AppSett
 
 
 def _to_jsonable(obj: Any) -> Any:
-    """dataclass(slots 포함) 객체를 JSON 직렬화 가능한 형태로 변환한다."""
-    if is_dataclass(obj):
-        return asdict(obj)
+    """DTO 객체를 JSON 직렬화 가능한 형태로 변환한다(`asdict` 재귀 복사 대신 `to_dict` 사용)."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
     return obj
 
 
+class FastJSONResponse(JSONResponse):
+    """orjson/msgspec 백엔드(미설치 시 표준 json)로 렌더링하는 기본 JSON 응답 클래스."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+async def _cancel_on_disconnect(request: Request, token: CancellationToken, interval: float = 0.25) -> None:
+    """클라이언트 연결 종료를 감시하다가 감지되면 추론 토큰을 취소한다."""
+    while not token.cancelled:
+        if await request.is_disconnected():
+            token.cancel("client_disconnected")
+            return
+        await asyncio.sleep(interval)
+
+
+def _api_key(request: Request) -> str | None:
+    """`X-API-Key` 또는 `Authorization: Bearer <key>` 헤더에서 API 키를 꺼낸다."""
+    api_key = request.headers.get("x-api-key")
+    if api_key:
+        return api_key
+    authorization = request.headers.get("authorization", "")
+    scheme, _, credentials = authorization.partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        return credentials.strip()
+    return None
+
+
+def _capture_inference(
+    container: "AppContainer",
+    request: "InferenceRequestBody",
+    tenant_id: str,
+    arrived_at: float,
+    started: float,
+    status: int,
+    result: Any,
+) -> None:
+    """처리한 `/inference` 요청 한 건을 트래픽 캡처에 추가한다(세션 요청은 재생할 수 없어 옵션에서 뺀다)."""
+    options: dict[str, Any] = {
+        key: value
+        for key in ("temperature", "top_p", "num_ctx", "max_tokens", "timeout", "stop", "max_time", "until")
+        if (value := getattr(request, key)) is not None
+    }
+    if request.raw:
+        options["raw"] = True
+    if not request.use_cache:
+        options["use_cache"] = False
+    completion_tokens = None
+    if result is not None and result.ok and result.output is not None:
+        completion_tokens = container.inference.result_usage(result).completion_tokens
+    container.capture.record(
+        ts=arrived_at,
+        model_id=request.model_id,
+        prompt=request.prompt,
+        options=options,
+        status=status,
+        ok=status == 200 and result is not None and result.ok,
+        latency=time.perf_counter() - started,
+        tenant=tenant_id,
+        completion_tokens=completion_tokens,
+    )
+
+
 class EngineStartRequest(BaseModel):
     """엔진 시작 요청 바디 모델."""
 
@@ -40,6 +132,48 @@ class InferenceRequestBody(BaseModel):
     num_ctx: int | None = None
     max_tokens: int | None = None
     timeout: int | None = None
+    # True면 엔진 응답 원본 바이트를 파싱/재인코딩 없이 그대로 반환한다.
+    raw: bool = False
+    # Ollama 세션: 이전 응답의 session.id를 보내면 서버에 보관된 context를 재사용한다.
+    session_id: str | None = None
+    keep_session: bool = False
+    # False면 의미 유사도 캐시를 조회/저장하지 않는다.
+    use_cache: bool = True
+    # 중지 문자열(엔진이 직접 멈춤), 생성 시간 예산(초, 넘으면 그때까지의 텍스트를 반환),
+    # 조기 종료 조건(첫 줄/첫 JSON 객체가 완성되면 생성을 끊음).
+    stop: list[str] | None = None
+    max_time: float | None = None
+    until: Literal["first_line", "json_object"] | None = None
+
+
+class EmbeddingRequestBody(BaseModel):
+    """임베딩 요청 바디 모델."""
+
+    model_id: str
+    input: str | list[str]
+    batch_size: int | None = None
+    concurrency: int | None = None
+    timeout: int | None = None
+    # json: 실수 배열 / f32: 리틀 엔디언 float32 원시 바이트 / npy: NumPy .npy 바이트
+    format: Literal["json", "f32", "npy"] = "json"
+
+
+class JobRequestBody(BaseModel):
+    """비동기 작업 요청 바디 모델(`prompt`는 단일 추론, `prompts`는 배치)."""
+
+    model_id: str
+    prompt: str | None = None
+    prompts: list[str] | None = None
+    temperature: float | None = None
+    top_p: float | None = None
+    num_ctx: int | None = None
+    max_tokens: int | None = None
+    # 추론 1건(배치는 항목 1건)의 제한 시간.
+    timeout: int | None = None
+    use_cache: bool = True
+    stop: list[str] | None = None
+    max_time: float | None = None
+    until: Literal["first_line", "json_object"] | None = None
 
 
 class ModelUnloadAllRequest(BaseModel):
@@ -49,19 +183,106 @@ class ModelUnloadAllRequest(BaseModel):
 
 
 class AppContainer:
-    """API 핸들러에서 사용할 유스케이스 컨테이너."""
+    """API 핸들러에서 사용할 유스케이스 컨테이너.
+
+    Notes:
+        `shared`가 주어지면(멀티 워커 모드) 엔진 제어, 모델 상주 상태, 세션 컨텍스트, 테넌트 한도는
+        슈퍼바이저 프로세스의 공유 객체를 사용하고, 메트릭은 주기적으로 집계기에 게시한다.
+    """
 
-    def __init__(self, settings: AppSettings) -> None:
+    def __init__(self, settings: AppSettings, shared: SharedStateClient | None = None) -> None:
         self.settings = settings
-        self.engine = EngineSelectionUseCase(settings)
-        self.model = ModelLifecycleUseCase(settings)
-        self.inference = InferenceUseCase(settings)
+        self.shared = shared
+        self.metrics = MetricsRegistry()
+        tracing = settings.runtime.tracing
+        self.tracer = Tracer(
+            sample_rate=tracing.sample_rate,
+            buffer_size=tracing.buffer_size,
+            export_path=tracing.export_path,
+        )
+        self.profiler = SamplingProfiler(interval=settings.runtime.profiling.interval_ms / 1000)
+        capture = settings.runtime.capture
+        self.capture = TrafficRecorder(capture) if capture.enabled else None
+        if shared is None:
+            self.engine = EngineSelectionUseCase(settings)
+            self.model = ModelLifecycleUseCase(settings, metrics=self.metrics)
+            self.inference = InferenceUseCase(settings, metrics=self.metrics)
+        else:
+            self.engine = shared.engines
+            self.model = ModelLifecycleUseCase(settings, residency=shared.residency, metrics=self.metrics)
+            self.inference = InferenceUseCase(
+                settings,
+                metrics=self.metrics,
+                context_store=shared.context_store,
+                rate_limiter=shared.rate_limiter,
+            )
+            start_metrics_publisher(shared, self.metrics)
+        # 멀티 워커 모드에서는 워커마다 같은 SQLite 파일을 열고, 작업 점유 트랜잭션으로 중복 실행을 막는다.
+        self.jobs = JobUseCase(settings, self.inference) if settings.runtime.jobs.enabled else None
+        fleet = settings.runtime.fleet
+        self.fleet = (
+            FleetController(fleet, on_pool=self.inference.apply_fleet_pool, metrics=self.metrics)
+            if fleet.enabled
+            else None
+        )
+        # 레플리카 프로세스는 한 프로세스만 관리해야 하므로 오토스케일러는 단일 워커 모드에서만 켠다.
+        self.autoscaler = (
+            EngineAutoscaler(
+                settings,
+                signals=self.inference.scaling_signal,
+                on_replicas=self.inference.apply_scaled_replicas,
+                metrics=self.metrics,
+            )
+            if settings.runtime.autoscale.enabled and shared is None
+            else None
+        )
+
+    def resolve_tenant(self, request: Request) -> TenantConfig:
+        """요청 헤더의 API 키로 테넌트를 식별한다. 식별에 실패하면 401을 발생시킨다."""
+        tenant = self.settings.tenancy.resolve(_api_key(request))
+        if tenant is None:
+            raise HTTPException(status_code=401, detail="유효한 API 키가 필요합니다.")
+        return tenant
+
+    def require_profiling(self) -> SamplingProfiler:
+        """프로파일링이 설정에서 꺼져 있으면 403을 발생시킨다."""
+        if not self.settings.runtime.profiling.enabled:
+            raise HTTPException(status_code=403, detail="runtime.profiling.enabled가 false입니다.")
+        return self.profiler
+
+    def require_jobs(self) -> JobUseCase:
+        """작업 큐가 설정에서 꺼져 있으면 404를 발생시킨다."""
+        if self.jobs is None:
+            raise HTTPException(status_code=404, detail="runtime.jobs.enabled가 false입니다.")
+        return self.jobs
+
+    def require_fleet(self) -> FleetController:
+        """플릿 컨트롤러가 설정에서 꺼져 있으면 404를 발생시킨다."""
+        if self.fleet is None:
+            raise HTTPException(status_code=404, detail="runtime.fleet.enabled가 false입니다.")
+        return self.fleet
+
+    def require_autoscaler(self) -> EngineAutoscaler:
+        """오토스케일러가 꺼져 있으면(설정 또는 멀티 워커 모드) 404를 발생시킨다."""
+        if self.autoscaler is None:
+            raise HTTPException(
+                status_code=404,
+                detail="runtime.autoscale.enabled가 false이거나 멀티 워커 모드입니다.",
+            )
+        return self.autoscaler
+
+    def metrics_snapshot(self) -> dict[str, Any]:
+        """메트릭 스냅샷을 반환한다(멀티 워커 모드에서는 전체 워커 병합 결과)."""
+        if self.shared is None:
+            return self.metrics.snapshot()
+        self.shared.metrics_hub.publish(os.getpid(), self.metrics.export_state())
+        return self.shared.metrics_hub.merged_snapshot()
 
 
 def create_app(config_path: str | Path = "config/models.yml") -> FastAPI:
     """FastAPI 애플리케이션을 생성한다."""
     settings = _load_app_settings(config_path)
-    container = AppContainer(settings)
+    container = AppContainer(settings, shared=connect_shared_state_from_env())
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
@@ -69,19 +290,116 @@ def create_app(config_path: str | Path = "config/models.yml") -> FastAPI:
         print("- /docs")
         print("- /redoc")
         print("- /openapi.json")
-        yield
+        health_monitor = app.state.container.inference.health_monitor
+        if app.state.container.settings.runtime.health.enabled:
+            health_monitor.start()
+        discovery = app.state.container.model.discovery
+        if app.state.container.settings.runtime.discovery.enabled:
+            discovery.start()
+        jobs = app.state.container.jobs
+        if jobs is not None:
+            jobs.start()
+        fleet = app.state.container.fleet
+        if fleet is not None:
+            fleet.start()
+        autoscaler = app.state.container.autoscaler
+        if autoscaler is not None:
+            autoscaler.start()
+        try:
+            yield
+        finally:
+            health_monitor.stop()
+            discovery.stop()
+            if fleet is not None:
+                fleet.stop()
+            if autoscaler is not None:
+                # 띄운 레플리카 프로세스를 함께 내린다.
+                await run_in_threadpool(autoscaler.stop)
+            if app.state.container.capture is not None:
+                app.state.container.capture.close()
+            if jobs is not None:
+                # 실행 중 작업은 중단 후 대기 상태로 돌려놓아 다음 기동 때 바로 이어서 처리한다.
+                await run_in_threadpool(jobs.stop)
 
     app = FastAPI(
         title="Local LLM Inference API",
         description="Ollama + vLLM 기반 로컬 추론 제어 API",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
     app.state.container = container
+    app.add_middleware(RouteTimingMiddleware, metrics=container.metrics)
+    app.add_middleware(TracingMiddleware, tracer=container.tracer)
 
     @app.get("/health")
-    def health(engine: Literal["ollama", "vllm"] | None = None) -> dict[str, dict[str, Any]]:
-        return app.state.container.inference.health(engine=engine)
+    async def health(engine: Literal["ollama", "vllm"] | None = None) -> dict[str, dict[str, Any]]:
+        inference = app.state.container.inference
+        if inference.health_monitor.running:
+            # 캐시만 읽으므로 스레드풀을 거치지 않고 이벤트 루프에서 바로 응답한다.
+            return inference.health(engine=engine)
+        return await run_in_threadpool(inference.health, engine=engine)
+
+    @app.get("/metrics")
+    def metrics() -> dict[str, Any]:
+        snapshot = app.state.container.metrics_snapshot()
+        snapshot["circuits"] = app.state.container.inference.invoker.circuit_states()
+        cascades = app.state.container.inference.cascade_stats()
+        if cascades:
+            snapshot["cascades"] = cascades
+        concurrency = app.state.container.inference.concurrency_states()
+        if concurrency:
+            snapshot["concurrency"] = concurrency
+        semantic_cache = app.state.container.inference.semantic_cache
+        if semantic_cache is not None:
+            snapshot["semantic_cache"] = semantic_cache.stats()
+        if app.state.container.jobs is not None:
+            snapshot["jobs"] = app.state.container.jobs.stats()
+        return snapshot
+
+    @app.get("/debug/traces")
+    def debug_traces(limit: int = 50, trace_id: str | None = None) -> list[dict[str, Any]]:
+        return app.state.container.tracer.recent(limit=limit, trace_id=trace_id)
+
+    @app.get("/debug/concurrency")
+    def debug_concurrency() -> dict[str, dict[str, Any]]:
+        return app.state.container.inference.concurrency_states(include_history=True)
+
+    @app.post("/debug/profile/start")
+    def start_profile(seconds: float = 30.0, include_idle: bool = False) -> dict[str, Any]:
+        profiler = app.state.container.require_profiling()
+        max_seconds = app.state.container.settings.runtime.profiling.max_seconds
+        if not 0 < seconds <= max_seconds:
+            raise HTTPException(status_code=400, detail=f"seconds는 0보다 크고 {max_seconds} 이하여야 합니다.")
+        try:
+            return profiler.start(seconds, include_idle=include_idle)
+        except RuntimeError as exc:
+            raise HTTPException(status_code=409, detail=str(exc)) from exc
+
+    @app.post("/debug/profile/stop")
+    def stop_profile() -> dict[str, Any]:
+        return app.state.container.require_profiling().stop()
+
+    @app.get("/debug/profile")
+    def profile_status() -> dict[str, Any]:
+        return app.state.container.require_profiling().status()
+
+    @app.get("/debug/profile/flamegraph")
+    def profile_flamegraph() -> Response:
+        collapsed = app.state.container.require_profiling().collapsed()
+        return PlainTextResponse(
+            collapsed,
+            headers={"Content-Disposition": f'attachment; filename="profile-{os.getpid()}.collapsed"'},
+        )
+
+    @app.get("/tenants/usage")
+    def tenant_usage() -> dict[str, dict[str, Any]]:
+        return app.state.container.inference.rate_limiter.usage()
+
+    @app.delete("/sessions/{session_id}")
+    def delete_session(session_id: str) -> dict[str, Any]:
+        app.state.container.inference.context_store.discard(session_id)
+        return {"ok": True, "session_id": session_id}
 
     @app.post("/engines/start")
     def start_engines(request: EngineStartRequest) -> list[dict[str, Any]]:
@@ -104,8 +422,34 @@ def create_app(config_path: str | Path = "config/models.yml") -> FastAPI:
         return {"ok": True}
 
     @app.get("/models")
-    def list_models(engine: Literal["ollama", "vllm"] | None = None) -> list[dict[str, Any]]:
-        return app.state.container.model.list(engine=engine)
+    def list_models(
+        engine: Literal["ollama", "vllm"] | None = None,
+        include_unconfigured: bool = True,
+    ) -> list[dict[str, Any]]:
+        return app.state.container.model.list(engine=engine, include_unconfigured=include_unconfigured)
+
+    @app.get("/models/discovery")
+    def model_discovery(since: float | None = None) -> dict[str, Any]:
+        return app.state.container.model.discovery_status(since=since)
+
+    @app.get("/fleet")
+    def fleet_status() -> dict[str, Any]:
+        return app.state.container.require_fleet().status()
+
+    @app.get("/fleet/plan")
+    def fleet_plan() -> list[dict[str, Any]]:
+        fleet = app.state.container.require_fleet()
+        fleet.refresh()
+        return [action.to_dict() for action in fleet.plan()]
+
+    @app.post("/fleet/rebalance")
+    def fleet_rebalance() -> dict[str, Any]:
+        fleet = app.state.container.require_fleet()
+        return {"actions": fleet.rebalance(), "pool": fleet.pool.to_dict()}
+
+    @app.get("/autoscale")
+    def autoscale_status() -> dict[str, Any]:
+        return app.state.container.require_autoscaler().status()
 
     @app.post("/models/{model_id}/load")
     def load_model(model_id: str) -> dict[str, Any]:
@@ -140,20 +484,197 @@ def create_app(config_path: str | Path = "config/models.yml") -> FastAPI:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     @app.post("/inference")
-    def infer(request: InferenceRequestBody) -> dict[str, Any]:
+    async def infer(request: InferenceRequestBody, http_request: Request) -> Response:
+        tenant = app.state.container.resolve_tenant(http_request)
+        # 요청 timeout을 데드라인으로 삼고, 클라이언트가 끊으면 엔진 연결도 끊어 생성을 중단한다.
+        token = CancellationToken(timeout=request.timeout)
+        watcher = asyncio.create_task(_cancel_on_disconnect(http_request, token))
+        # 루트 span 시작부터 이 span 시작까지의 간격이 바디 파싱/라우팅 시간이다.
+        span = start_span("api.inference", model_id=request.model_id, tenant=tenant.id)
+        capture = app.state.container.capture
+        captured = capture is not None and capture.should_sample()
+        arrived_at, started = time.time(), time.perf_counter()
+        status, result = 500, None
         try:
-            result = app.state.container.inference.generate(
-                model_id=request.model_id,
+            with span:
+                result = await run_in_threadpool(
+                    app.state.container.inference.generate,
+                    model_id=request.model_id,
+                    prompt=request.prompt,
+                    cancel_token=token,
+                    temperature=request.temperature,
+                    top_p=request.top_p,
+                    num_ctx=request.num_ctx,
+                    max_tokens=request.max_tokens,
+                    timeout=request.timeout,
+                    raw_response=request.raw,
+                    session_id=request.session_id,
+                    keep_session=request.keep_session,
+                    tenant_id=tenant.id,
+                    use_cache=request.use_cache,
+                    stop=request.stop,
+                    max_time=request.max_time,
+                    until=request.until,
+                )
+            status = 200
+        except RateLimitExceeded as exc:
+            status = 429
+            raise HTTPException(
+                status_code=429,
+                detail=str(exc),
+                headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+            ) from exc
+        except ContextWindowExceeded as exc:
+            status = 413
+            raise HTTPException(status_code=413, detail=str(exc)) from exc
+        except Exception as exc:
+            status = 400
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        finally:
+            watcher.cancel()
+            token.close()
+            if captured:
+                _capture_inference(app.state.container, request, tenant.id, arrived_at, started, status, result)
+
+        # 응답 모델 검증/jsonable_encoder 단계를 거치지 않도록 Response를 직접 반환한다.
+        with start_span("api.encode"):
+            if result.raw_output is not None:
+                return Response(
+                    content=result.raw_output,
+                    media_type="application/json",
+                    headers={"X-Model-Id": result.model_id, "X-Engine": result.engine},
+                )
+            return FastJSONResponse(result.to_dict())
+
+    @app.post("/jobs", status_code=202)
+    def submit_job(request: JobRequestBody, http_request: Request) -> dict[str, Any]:
+        jobs = app.state.container.require_jobs()
+        tenant = app.state.container.resolve_tenant(http_request)
+        try:
+            record = jobs.submit(
+                request.model_id,
                 prompt=request.prompt,
+                prompts=request.prompts,
+                tenant_id=tenant.id,
                 temperature=request.temperature,
                 top_p=request.top_p,
                 num_ctx=request.num_ctx,
                 max_tokens=request.max_tokens,
                 timeout=request.timeout,
+                use_cache=request.use_cache,
+                stop=request.stop,
+                max_time=request.max_time,
+                until=request.until,
             )
-            return _to_jsonable(result)
+        except ConfigValidationError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        return record.to_dict()
+
+    @app.get("/jobs")
+    def list_jobs(status: JobStatus | None = None, limit: int = 50) -> list[dict[str, Any]]:
+        return [record.to_dict() for record in app.state.container.require_jobs().list(status=status, limit=limit)]
+
+    @app.get("/jobs/{job_id}")
+    def get_job(job_id: str, items_offset: int = 0, items_limit: int = 100) -> dict[str, Any]:
+        jobs = app.state.container.require_jobs()
+        record = jobs.get(job_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+        result = record.to_dict()
+        if record.kind == "batch":
+            result["items"] = jobs.items(job_id, offset=items_offset, limit=items_limit)
+        return result
+
+    @app.get("/jobs/{job_id}/stream")
+    async def stream_job(job_id: str, offset: int = 0, interval: float = 0.25) -> Response:
+        jobs = app.state.container.require_jobs()
+        if await run_in_threadpool(jobs.store.read_partial, job_id, offset) is None:
+            raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+        interval = min(max(interval, 0.05), 5.0)
+
+        async def events() -> AsyncIterator[bytes]:
+            # 저장소를 폴링해 부분 출력 증분(partial), 진행률(progress), 재시도로 인한 초기화(reset),
+            # 최종 기록(done)을 SSE로 보낸다. 연결이 끊겨도 작업은 계속 실행된다.
+            position = offset
+            attempts = None
+            completed = None
+            while True:
+                state = await run_in_threadpool(jobs.store.read_partial, job_id, position)
+                if state is None:
+                    return
+                if attempts is not None and state["attempts"] != attempts and position:
+                    position = 0
+                    yield b"event: reset\ndata: {}\n\n"
+                    continue
+                attempts = state["attempts"]
+                if state["text"]:
+                    position += len(state["text"])
+                    yield b"event: partial\ndata: " + dumps({"text": state["text"], "offset": position}) + b"\n\n"
+                if state["completed"] != completed:
+                    completed = state["completed"]
+                    progress = {"completed": completed, "total": state["total"], "status": state["status"]}
+                    yield b"event: progress\ndata: " + dumps(progress) + b"\n\n"
+                if state["status"] in FINISHED_STATUSES:
+                    record = await run_in_threadpool(jobs.get, job_id)
+                    if record is not None:
+                        yield b"event: done\ndata: " + dumps(record.to_dict()) + b"\n\n"
+                    return
+                await asyncio.sleep(interval)
+
+        return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+    @app.delete("/jobs/{job_id}")
+    def cancel_job(job_id: str) -> dict[str, Any]:
+        record = app.state.container.require_jobs().cancel(job_id)
+        if record is None:
+            raise HTTPException(status_code=404, detail=f"작업을 찾을 수 없습니다: {job_id}")
+        return record.to_dict()
+
+    @app.post("/embeddings")
+    async def embeddings(request: EmbeddingRequestBody, http_request: Request) -> Response:
+        tenant = app.state.container.resolve_tenant(http_request)
+        texts = [request.input] if isinstance(request.input, str) else request.input
+        token = CancellationToken(timeout=request.timeout)
+        watcher = asyncio.create_task(_cancel_on_disconnect(http_request, token))
+        try:
+            result = await run_in_threadpool(
+                app.state.container.inference.embed,
+                model_id=request.model_id,
+                texts=texts,
+                cancel_token=token,
+                batch_size=request.batch_size,
+                concurrency=request.concurrency,
+                timeout=request.timeout,
+                tenant_id=tenant.id,
+            )
+        except RateLimitExceeded as exc:
+            raise HTTPException(
+                status_code=429,
+                detail=str(exc),
+                headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+            ) from exc
         except Exception as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
+        finally:
+            watcher.cancel()
+            token.close()
+
+        if not result.ok or request.format == "json":
+            return FastJSONResponse(result.to_dict())
+        # 바이너리 형식은 벡터를 JSON 실수 문자열로 바꾸지 않고 float32 버퍼를 그대로 보낸다.
+        shape = (result.count, result.dimension)
+        content = npy_bytes(result.vectors, shape) if request.format == "npy" else float32_bytes(result.vectors)
+        return Response(
+            content=content,
+            media_type="application/octet-stream",
+            headers={
+                "X-Model-Id": result.model_id,
+                "X-Engine": result.engine,
+                "X-Embedding-Shape": f"{result.count},{result.dimension}",
+                "X-Embedding-Dtype": "<f4",
+                "X-Vectors-Per-Second": f"{result.vectors_per_second or 0:.1f}",
+            },
+        )
 
     return app
 
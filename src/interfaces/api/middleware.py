@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from src.infrastructure import MetricsRegistry, Tracer
+from src.infrastructure.observability import parse_traceparent
+
+Scope = dict[str, Any]
+Message = dict[str, Any]
+
+
+class TracingMiddleware:
+    """요청마다 샘플링 여부를 정하고, 샘플링된 요청을 루트 span으로 감싸는 순수 ASGI 미들웨어.
+
+    Rules:
+        - `traceparent` 헤더가 있으면 그 trace_id를 이어 쓰고, sampled 플래그가 켜져 있으면 항상 기록한다.
+        - 샘플링된 요청의 응답에는 `X-Trace-Id` 헤더를 붙인다.
+
+    Notes:
+        샘플링되지 않은 요청은 헤더 조회와 난수 1회 외에 추가 작업 없이 그대로 다음 앱으로 넘긴다.
+    """
+
+    def __init__(self, app: Any, tracer: Tracer) -> None:
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope.get("headers", ()):
+            if name == b"traceparent":
+                parent = parse_traceparent(value.decode("latin1"))
+                break
+        if not self.tracer.should_sample(forced=parent is not None and parent[2]):
+            await self.app(scope, receive, send)
+            return
+
+        root = self.tracer.start_trace(
+            f"{scope['method']} {scope['path']}",
+            trace_id=parent[0] if parent else None,
+            parent_id=parent[1] if parent else None,
+        )
+        root.set(**{"http.method": scope["method"], "http.target": scope["path"]})
+        trace_header = (b"x-trace-id", root.trace.trace_id.encode("ascii"))
+
+        async def send_with_trace(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                root.set(**{"http.status_code": message["status"]})
+                message["headers"] = [*message.get("headers", ()), trace_header]
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                root.event("response_sent")
+            await send(message)
+
+        with root:
+            await self.app(scope, receive, send_with_trace)
+
+
+class RouteTimingMiddleware:
+    """라우트별 처리 시간(wall)과 프로세스 CPU 시간을 메트릭으로 남기는 순수 ASGI 미들웨어.
+
+    Notes:
+        - 라우트 라벨은 경로 템플릿(예: `/models/{model_id}/load`)을 사용해 라벨 수가 늘지 않게 한다.
+        - CPU 시간은 요청 구간의 `time.process_time()` 차이다. 동시 요청 구간이 겹치면 중복 집계되므로
+          부하 중에는 상한값으로 보고, 라우트 간 비교나 `/debug/profile`로 원인을 좁힐 때 사용한다.
+    """
+
+    def __init__(self, app: Any, metrics: MetricsRegistry) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            wall = time.perf_counter() - started
+            cpu = time.process_time() - cpu_started
+            route = getattr(scope.get("route"), "path", None)
+            if route is None:
+                route = getattr(scope.get("endpoint"), "__name__", "unmatched")
+            labels = {"route": route, "method": scope["method"]}
+            self.metrics.observe("route_wall_seconds", wall, **labels)
+            self.metrics.inc("route_cpu_seconds_total", cpu, **labels)
+            self.metrics.inc("route_requests_total", **labels)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from src.application.use_cases import EngineSelectionUseCase
+from src.infrastructure import (
+    MetricsHub,
+    OllamaContextStore,
+    TenantRateLimiter,
+    load_settings,
+    serve_shared_state,
+)
+
+
+def run_multi_worker(host: str, port: int, workers: int, config_path: str | Path = "config/models.yml") -> None:
+    """슈퍼바이저 프로세스로 동작하며 N개의 API 워커를 실행한다.
+
+    Notes:
+        - 엔진 프로세스 소유권(`EngineSelectionUseCase`)과 세션 컨텍스트/모델 상주 상태/메트릭 집계기/테넌트 한도기는
+          이 프로세스에 두고, 유닉스 소켓 기반 매니저로 워커에 노출한다.
+        - 워커는 환경 변수로 접속 정보를 받아 `create_app`에서 공유 객체에 연결한다.
+    """
+    from uvicorn import run
+
+    settings = load_settings(config_path)
+    store_config = settings.runtime.context_store
+    server = serve_shared_state(
+        engines=EngineSelectionUseCase(settings),
+        context_store=OllamaContextStore(
+            max_sessions=store_config.max_sessions,
+            max_bytes=store_config.max_bytes,
+        ),
+        metrics_hub=MetricsHub(),
+        rate_limiter=TenantRateLimiter(settings.tenancy),
+    )
+    os.environ.update(server.export_env())
+    print(f"[SUPERVISOR] 공유 상태 서버: {server.address} (workers={workers})")
+
+    try:
+        run("src.interfaces.api.main:app", host=host, port=port, workers=workers)
+    finally:
+        if os.path.exists(server.address):
+            os.unlink(server.address)
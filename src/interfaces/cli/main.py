@@ -1,14 +1,39 @@
 from __future__ import annotations
 
 import argparse
+import http.client
 import json
+import sys
+import threading
 import time
-from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any
-
-from src.application.use_cases import EngineSelectionUseCase, InferenceUseCase, ModelLifecycleUseCase
-from src.infrastructure import AppSettings, load_settings
+from urllib.parse import urlsplit
+
+from src.application.use_cases import (
+    DatasetRunUseCase,
+    EngineSelectionUseCase,
+    EngineTuneUseCase,
+    InferenceUseCase,
+    ModelLifecycleUseCase,
+    ReplayOutcome,
+    ReplaySender,
+    ReplayUseCase,
+    synthetic_workload,
+)
+from src.domain import EARLY_STOP_CONDITIONS
+from src.infrastructure import (
+    AppSettings,
+    ConfigValidationError,
+    EndpointConfig,
+    FakeEngineServer,
+    ProcessEngineDriver,
+    SimulatedEngineDriver,
+    load_settings,
+    read_capture,
+    run_with_cprofile,
+)
+from src.infrastructure.serialization import dumps, loads, npy_bytes
 
 
 def _load_app_settings(config_path: str) -> AppSettings:
@@ -22,9 +47,10 @@ def _print_json(data: Any) -> None:
 
 
 def _to_jsonable(obj: Any) -> Any:
-    """dataclass(slots 포함) 객체를 JSON 직렬화 가능한 형태로 변환한다."""
-    if is_dataclass(obj):
-        return asdict(obj)
+    """DTO 객체를 JSON 직렬화 가능한 형태로 변환한다(`asdict` 재귀 복사 대신 `to_dict` 사용)."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
     return obj
 
 
@@ -35,10 +61,29 @@ def _parse_engines(raw: str | None) -> list[str] | None:
     return [engine.strip() for engine in raw.split(",") if engine.strip()]
 
 
+def _parse_size(raw: str) -> int:
+    """`512M`, `8G` 같은 크기 문자열을 바이트 수로 변환한다(접미사 없으면 바이트)."""
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    text = raw.strip().upper().removesuffix("B").removesuffix("I")
+    try:
+        if text and text[-1] in units:
+            return int(float(text[:-1]) * units[text[-1]])
+        return int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"크기 형식이 올바르지 않습니다: {raw} (예: 8G, 512M)") from None
+
+
 def build_parser() -> argparse.ArgumentParser:
     """CLI 인자 파서를 구성한다."""
     parser = argparse.ArgumentParser(description="로컬 LLM 추론 서버 제어 CLI")
     parser.add_argument("--config", default="config/models.yml", help="설정 파일 경로")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cli.pstats",
+        metavar="PATH",
+        help="명령을 cProfile로 실행해 pstats 파일(기본 cli.pstats)을 저장하고 누적 시간 상위 함수를 stderr로 출력",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -71,6 +116,18 @@ def build_parser() -> argparse.ArgumentParser:
 
     subparsers.add_parser("apply", help="YAML 정책 기준 모델 동기화 실행")
 
+    prewarm_parser = subparsers.add_parser("prewarm", help="모델 가중치 파일을 페이지 캐시에 미리 읽기")
+    prewarm_parser.add_argument("model_id", help="프리웜할 모델 ID")
+    prewarm_parser.add_argument(
+        "--path",
+        action="append",
+        default=[],
+        help="가중치 파일/디렉터리 직접 지정(반복 가능, 생략 시 설정과 엔진 저장소에서 탐색)",
+    )
+    prewarm_parser.add_argument("--concurrency", type=int, help="동시 읽기 구간 수(기본: runtime.prewarm.concurrency)")
+    prewarm_parser.add_argument("--max-bytes", type=_parse_size, help="디스크에서 읽을 최대 바이트(예: 8G, 512M)")
+    prewarm_parser.add_argument("--evict", action="store_true", help="읽기 전에 페이지 캐시에서 내려 콜드 읽기를 측정")
+
     infer_parser = subparsers.add_parser("infer", help="단일 추론 요청")
     infer_parser.add_argument("--model-id", required=True, help="추론에 사용할 모델 ID")
     infer_parser.add_argument("--prompt", required=True, help="사용자 프롬프트")
@@ -79,15 +136,196 @@ def build_parser() -> argparse.ArgumentParser:
     infer_parser.add_argument("--num-ctx", type=int)
     infer_parser.add_argument("--max-tokens", type=int)
     infer_parser.add_argument("--timeout", type=int, help="추론 요청 타임아웃(초)")
+    infer_parser.add_argument("--raw", action="store_true", help="엔진 응답 원본을 파싱 없이 출력")
+    infer_parser.add_argument("--stop", action="append", help="중지 문자열(반복 지정 가능)")
+    infer_parser.add_argument("--max-time", type=float, help="생성 시간 예산(초). 넘으면 그때까지의 텍스트를 반환")
+    infer_parser.add_argument(
+        "--until",
+        choices=sorted(EARLY_STOP_CONDITIONS),
+        help="조기 종료 조건(first_line: 첫 줄, json_object: 첫 JSON 객체가 완성되면 생성 중단)",
+    )
+
+    embed_parser = subparsers.add_parser("embed", help="텍스트 임베딩 계산(배치/병렬)")
+    embed_parser.add_argument("--model-id", required=True, help="임베딩에 사용할 모델 ID")
+    embed_parser.add_argument("--text", action="append", default=[], help="임베딩할 텍스트(반복 지정 가능)")
+    embed_parser.add_argument("--input-file", help="한 줄에 텍스트 하나인 입력 파일")
+    embed_parser.add_argument("--batch-size", type=int, default=32, help="엔진 요청 1건당 텍스트 수")
+    embed_parser.add_argument("--concurrency", type=int, help="동시 배치 요청 수")
+    embed_parser.add_argument("--timeout", type=int, help="전체 요청 타임아웃(초)")
+    embed_parser.add_argument("--output", help="결과를 NumPy .npy 파일로 저장할 경로(생략 시 JSON 출력)")
+
+    dataset_parser = subparsers.add_parser("run-dataset", help="JSONL 데이터셋 대량 추론(체크포인트 재개)")
+    dataset_parser.add_argument("input", help="입력 JSONL(줄마다 prompt 필드가 있는 객체 또는 문자열)")
+    dataset_parser.add_argument("--output", required=True, help="결과 JSONL 경로(체크포인트는 <output>.checkpoint.json)")
+    dataset_parser.add_argument("--model-id", required=True, help="기본 모델 ID(행의 model_id가 우선)")
+    dataset_parser.add_argument("--prompt-field", default="prompt", help="프롬프트 필드 이름")
+    dataset_parser.add_argument("--id-field", default="id", help="행 ID 필드 이름(없으면 줄 번호)")
+    dataset_parser.add_argument("--temperature", type=float)
+    dataset_parser.add_argument("--top-p", type=float)
+    dataset_parser.add_argument("--num-ctx", type=int)
+    dataset_parser.add_argument("--max-tokens", type=int)
+    dataset_parser.add_argument("--timeout", type=int, help="행 1건의 추론 타임아웃(초)")
+    dataset_parser.add_argument("--concurrency", type=int, help="시작 동시성(처리량을 보며 자동 조정)")
+    dataset_parser.add_argument("--min-concurrency", type=int, default=1)
+    dataset_parser.add_argument("--max-concurrency", type=int, default=32)
+    dataset_parser.add_argument("--dedupe-cache", type=int, default=10000, help="중복 판정에 보관할 최근 결과 수")
+    dataset_parser.add_argument("--checkpoint-seconds", type=float, default=5.0, help="체크포인트 저장 간격(초)")
+    dataset_parser.add_argument("--limit", type=int, help="이번 실행에서 처리할 최대 행 수")
+    dataset_parser.add_argument("--restart", action="store_true", help="체크포인트/기존 출력을 지우고 처음부터 실행")
+    dataset_parser.add_argument("--quiet", action="store_true", help="진행 상황 출력 생략")
+
+    replay_parser = subparsers.add_parser("replay", help="캡처한 /inference 트래픽 재생 벤치마크")
+    replay_parser.add_argument("capture", help="캡처 파일 또는 디렉터리(runtime.capture.dir)")
+    replay_parser.add_argument(
+        "--target",
+        choices=("local", "api"),
+        default="local",
+        help="local: 설정의 엔진으로 직접 호출 / api: 실행 중인 API 서버로 전송",
+    )
+    replay_parser.add_argument("--url", default="http://127.0.0.1:8000", help="--target api의 서버 주소")
+    replay_parser.add_argument("--api-key", help="--target api 요청에 붙일 API 키")
+    timing_group = replay_parser.add_mutually_exclusive_group()
+    timing_group.add_argument("--speed", type=float, default=1.0, help="원래 도착 간격 대비 재생 속도 배율")
+    timing_group.add_argument("--max-throughput", action="store_true", help="도착 간격을 무시하고 최대한 빨리 전송")
+    replay_parser.add_argument("--concurrency", type=int, default=64, help="동시 요청 수 상한")
+    replay_parser.add_argument("--limit", type=int, help="앞에서부터 재생할 최대 요청 수")
+    replay_parser.add_argument("--model-id", help="모든 요청을 이 모델로 재생")
+    replay_parser.add_argument("--report", help="재생 보고서를 JSON으로 저장할 경로")
+    replay_parser.add_argument("--compare", help="비교할 이전 재생 보고서(JSON) 경로")
+    replay_parser.add_argument(
+        "--fake-engine",
+        action="store_true",
+        help="가짜 엔진을 띄워 두 엔진 엔드포인트를 대체(--target local 전용, 오프라인 회귀 테스트용)",
+    )
+    replay_parser.add_argument("--fake-latency", type=float, default=0.02, help="가짜 엔진 기본 지연(초)")
+    replay_parser.add_argument("--fake-token-latency", type=float, default=0.002, help="가짜 엔진 토큰당 지연(초)")
+    replay_parser.add_argument("--quiet", action="store_true", help="진행 상황 출력 생략")
+
+    tune_parser = subparsers.add_parser("tune", help="엔진 기동 파라미터 자동 튜닝(처리량/p99 측정)")
+    tune_parser.add_argument("model_id", help="튜닝할 모델 ID")
+    tune_parser.add_argument("--capture", help="작업 부하로 쓸 캡처 파일/디렉터리(없으면 합성 부하)")
+    tune_parser.add_argument("--limit", type=int, help="캡처에서 사용할 최대 요청 수")
+    tune_parser.add_argument("--requests", type=int, default=64, help="합성 부하 요청 수")
+    tune_parser.add_argument("--prompt-chars", type=int, default=800, help="합성 부하 프롬프트 길이(문자)")
+    tune_parser.add_argument("--max-tokens", type=int, default=128, help="합성 부하 최대 생성 토큰")
+    tune_parser.add_argument("--speed", type=float, help="캡처 도착 간격 대비 재생 속도(생략 시 최대 처리량)")
+    tune_parser.add_argument("--concurrency", type=int, default=64, help="부하 동시 요청 수 상한")
+    tune_parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2",
+        help="파라미터 후보 값 지정(반복 가능, 예: max_num_seqs=64,128,256)",
+    )
+    tune_parser.add_argument("--max-p99-ms", type=float, help="허용 p99 지연(ms). 넘는 조합은 제외")
+    tune_parser.add_argument("--max-error-rate", type=float, default=0.01, help="허용 오류율")
+    tune_parser.add_argument("--warmup", type=int, default=2, help="측정 전 워밍업 요청 수")
+    tune_parser.add_argument("--rounds", type=int, default=2, help="좌표 하강 최대 반복 횟수")
+    tune_parser.add_argument("--startup-timeout", type=float, default=900.0, help="엔진 준비 대기 시간(초)")
+    tune_parser.add_argument("--simulate", action="store_true", help="실제 엔진 대신 시뮬레이션 엔진으로 탐색")
+    tune_parser.add_argument("--output", help="최적 설정 YAML 조각을 저장할 경로")
+    tune_parser.add_argument("--report", help="전체 시도 결과를 JSON으로 저장할 경로")
 
     return parser
 
 
+def _parse_search_space(raw: list[str]) -> dict[str, list[Any]]:
+    """`NAME=V1,V2` 목록을 파라미터별 후보 값 dict로 변환한다(정수/실수로 해석)."""
+    space: dict[str, list[Any]] = {}
+    for item in raw:
+        name, _, values = item.partition("=")
+        if not name or not values:
+            raise ValueError(f"--param 형식이 올바르지 않습니다: {item} (예: max_num_seqs=64,128)")
+        space[name.strip()] = [float(value) if "." in value else int(value) for value in values.split(",")]
+    return space
+
+
+def _print_trial(trial: dict[str, Any]) -> None:
+    """튜닝 시도 하나의 결과를 stderr 한 줄로 출력한다."""
+    if not trial["ok"]:
+        print(f"[TUNE] {trial['parameters']} 실패: {trial['error']}", file=sys.stderr, flush=True)
+        return
+    print(
+        f"[TUNE] {trial['parameters']} tokens/s={trial['tokens_per_second']:.1f} "
+        f"p99={trial['p99_ms']:.1f}ms errors={trial['error_rate']:.2%} feasible={trial['feasible']}",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def _api_sender(url: str, api_key: str | None) -> ReplaySender:
+    """실행 중인 API 서버의 `/inference`로 보내는 재생 전송 함수를 만든다(스레드마다 연결 재사용)."""
+    parts = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    local = threading.local()
+    headers = {"Content-Type": "application/json"}
+    if api_key:
+        headers["X-API-Key"] = api_key
+
+    def send(model_id: str, prompt: str, options: dict[str, Any]) -> ReplayOutcome:
+        body = dumps({"model_id": model_id, "prompt": prompt, **options})
+        connection = getattr(local, "connection", None)
+        if connection is None:
+            timeout = float(options["timeout"]) + 5 if options.get("timeout") else None
+            connection = local.connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+        try:
+            connection.request("POST", f"{parts.path.rstrip('/')}/inference", body=body, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException) as exc:
+            connection.close()
+            local.connection = None
+            return ReplayOutcome(0, False, error=str(exc))
+        if response.status != 200:
+            return ReplayOutcome(response.status, False, error=data[:200].decode("utf-8", "replace"))
+        if options.get("raw"):
+            return ReplayOutcome(200, True)
+        payload = loads(data)
+        output = payload.get("output") or {}
+        usage = output.get("usage") or {}
+        tokens = output.get("eval_count") or usage.get("completion_tokens") or 0
+        return ReplayOutcome(200, bool(payload.get("ok")), completion_tokens=int(tokens), error=payload.get("error"))
+
+    return send
+
+
+def _print_replay_progress(progress: dict[str, Any]) -> None:
+    """재생 진행 상황을 stderr 한 줄로 갱신한다."""
+    print(
+        f"\r[REPLAY] sent={progress['sent']}/{progress['total']} ok={progress['ok']} failed={progress['failed']}",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def _print_progress(progress: dict[str, Any]) -> None:
+    """데이터셋 실행 진행 상황을 stderr 한 줄로 갱신한다."""
+    print(
+        f"\r[RUN] rows={progress['rows_done']} ok={progress['ok']} failed={progress['failed']} "
+        f"dup={progress['duplicates']} rows/s={progress['rows_per_second']:.1f} "
+        f"tokens/s={progress['tokens_per_second']:.1f} in_flight={progress['in_flight']} "
+        f"concurrency={progress['concurrency']}",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
 def main() -> None:
     """CLI 명령을 실행한다."""
     parser = build_parser()
     args = parser.parse_args()
+    if args.profile is None:
+        _run(parser, args)
+        return
+    _, summary = run_with_cprofile(lambda: _run(parser, args), args.profile)
+    print(summary, file=sys.stderr)
+    print(f"[PROFILE] pstats 저장: {args.profile} (python -m pstats {args.profile})", file=sys.stderr)
 
+
+def _run(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """파싱된 인자에 해당하는 명령을 실행한다."""
     settings = _load_app_settings(args.config)
     engine_use_case = EngineSelectionUseCase(settings)
     model_use_case = ModelLifecycleUseCase(settings)
@@ -157,6 +395,21 @@ def main() -> None:
         _print_json([_to_jsonable(item) for item in result])
         return
 
+    if args.command == "prewarm":
+        try:
+            report = model_use_case.prewarm(
+                args.model_id,
+                paths=args.path,
+                concurrency=args.concurrency,
+                max_bytes=args.max_bytes,
+                evict=args.evict,
+            )
+        except ConfigValidationError as exc:
+            parser.error(str(exc))
+        print(f"[PREWARM] {report.summary()}", file=sys.stderr)
+        _print_json(report.to_dict())
+        return
+
     if args.command == "infer":
         result = inference_use_case.generate(
             model_id=args.model_id,
@@ -166,10 +419,147 @@ def main() -> None:
             num_ctx=args.num_ctx,
             max_tokens=args.max_tokens,
             timeout=args.timeout,
+            raw_response=args.raw,
+            stop=args.stop,
+            max_time=args.max_time,
+            until=args.until,
         )
+        if result.raw_output is not None:
+            print(result.raw_output.decode("utf-8"))
+            return
         _print_json(_to_jsonable(result))
         return
 
+    if args.command == "embed":
+        texts = list(args.text)
+        if args.input_file:
+            lines = Path(args.input_file).read_text(encoding="utf-8").splitlines()
+            texts.extend(line for line in lines if line.strip())
+        if not texts:
+            parser.error("embed 명령은 --text 또는 --input-file 이 필요합니다.")
+        result = inference_use_case.embed(
+            model_id=args.model_id,
+            texts=texts,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+        )
+        if args.output and result.ok:
+            Path(args.output).write_bytes(npy_bytes(result.vectors, (result.count, result.dimension)))
+            _print_json({**result.to_dict(include_vectors=False), "output": args.output})
+            return
+        _print_json(result.to_dict())
+        return
+
+    if args.command == "run-dataset":
+        result = DatasetRunUseCase(inference_use_case).run(
+            args.input,
+            args.output,
+            model_id=args.model_id,
+            options={
+                "temperature": args.temperature,
+                "top_p": args.top_p,
+                "num_ctx": args.num_ctx,
+                "max_tokens": args.max_tokens,
+                "timeout": args.timeout,
+            },
+            prompt_field=args.prompt_field,
+            id_field=args.id_field,
+            concurrency=args.concurrency,
+            min_concurrency=args.min_concurrency,
+            max_concurrency=args.max_concurrency,
+            dedupe_cache=args.dedupe_cache,
+            checkpoint_seconds=args.checkpoint_seconds,
+            restart=args.restart,
+            limit=args.limit,
+            on_progress=None if args.quiet else _print_progress,
+        )
+        if not args.quiet:
+            print(file=sys.stderr)
+        _print_json(result.to_dict())
+        return
+
+    if args.command == "replay":
+        if args.fake_engine and args.target != "local":
+            parser.error("--fake-engine은 --target local에서만 쓸 수 있습니다.")
+        fake_engine = None
+        if args.fake_engine:
+            fake_engine = FakeEngineServer(base_latency=args.fake_latency, token_latency=args.fake_token_latency)
+            fake_engine.start()
+            endpoint = EndpointConfig(host=fake_engine.host, port=fake_engine.port)
+            settings.runtime.endpoints = {"ollama": endpoint, "vllm": endpoint}
+            inference_use_case = InferenceUseCase(settings)
+        if args.target == "api":
+            replay = ReplayUseCase(_api_sender(args.url, args.api_key), target=args.url)
+        else:
+            sender = ReplayUseCase.local_sender(inference_use_case)
+            replay = ReplayUseCase(sender, target="fake-engine" if fake_engine is not None else "local")
+        baseline = loads(Path(args.compare).read_bytes()) if args.compare else None
+        try:
+            report = replay.run(
+                args.capture,
+                speed=None if args.max_throughput else args.speed,
+                concurrency=args.concurrency,
+                limit=args.limit,
+                model_id=args.model_id,
+                baseline=baseline,
+                on_progress=None if args.quiet else _print_replay_progress,
+            )
+        finally:
+            if fake_engine is not None:
+                fake_engine.stop()
+        if not args.quiet:
+            print(file=sys.stderr)
+        if args.report:
+            Path(args.report).write_bytes(dumps(report.to_dict()))
+        _print_json(report.to_dict())
+        return
+
+    if args.command == "tune":
+        model = settings.get_model(args.model_id)
+        if model is None:
+            parser.error(f"모델을 찾을 수 없습니다: {args.model_id}")
+        try:
+            search_space = _parse_search_space(args.param)
+        except ValueError as exc:
+            parser.error(str(exc))
+        if args.capture:
+            records = read_capture(args.capture)
+            if args.limit is not None:
+                records = records[: args.limit]
+            workload = f"capture {args.capture}"
+        else:
+            records = synthetic_workload(model.id, args.requests, args.prompt_chars, args.max_tokens)
+            workload = f"synthetic {args.requests}x{args.prompt_chars}chars/{args.max_tokens}tokens"
+        if args.simulate:
+            driver = SimulatedEngineDriver(model.engine)
+        else:
+            driver = ProcessEngineDriver(settings, model, startup_timeout=args.startup_timeout)
+        result = EngineTuneUseCase(settings, driver).run(
+            model.id,
+            records,
+            workload=workload,
+            search_space=search_space,
+            speed=args.speed,
+            concurrency=args.concurrency,
+            max_p99_ms=args.max_p99_ms,
+            max_error_rate=args.max_error_rate,
+            warmup=args.warmup,
+            rounds=args.rounds,
+            on_trial=_print_trial,
+        )
+        snippet = result.yaml_snippet()
+        if args.report:
+            Path(args.report).write_bytes(dumps(result.to_dict()))
+        if snippet is None:
+            print("[TUNE] 제약을 만족한 조합이 없습니다(시도별 error와 --max-p99-ms/--max-error-rate 확인).", file=sys.stderr)
+            _print_json(result.to_dict())
+            return
+        if args.output:
+            Path(args.output).write_text(snippet, encoding="utf-8")
+        print(snippet, end="")
+        return
+
 
 if __name__ == "__main__":
     main()
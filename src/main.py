@@ -8,7 +8,7 @@ import sys
 def main() -> None:
     """애플리케이션 실행 모드를 선택한다."""
     parser = argparse.ArgumentParser(description="Local LLM Inference 실행 진입점")
-    parser.add_argument("mode", choices=["cli", "api"], help="실행 모드")
+    parser.add_argument("mode", choices=["cli", "api", "agent"], help="실행 모드")
     parser.add_argument("args", nargs=argparse.REMAINDER, help="하위 모드 인자")
     parsed = parser.parse_args()
 
@@ -19,7 +19,18 @@ def main() -> None:
         cli_main()
         return
 
-    from uvicorn import run
+    if parsed.mode == "agent":
+        _run_agent(parsed.args)
+        return
+
+    api_parser = argparse.ArgumentParser(prog="local-llm-api", description="API 서버 실행 옵션")
+    api_parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("LOCAL_LLM_API_WORKERS", "1")),
+        help="API 워커 프로세스 수 (2 이상이면 슈퍼바이저 + 공유 상태 모드)",
+    )
+    api_args = api_parser.parse_args(parsed.args)
 
     host = "0.0.0.0"
     port = int(os.getenv("LOCAL_LLM_API_PORT", "18080"))
@@ -27,8 +38,63 @@ def main() -> None:
     print(f"- http://127.0.0.1:{port}/docs")
     print(f"- http://127.0.0.1:{port}/redoc")
     print(f"- http://127.0.0.1:{port}/openapi.json")
+
+    if api_args.workers > 1:
+        from src.interfaces.api.supervisor import run_multi_worker
+
+        run_multi_worker(host=host, port=port, workers=api_args.workers)
+        return
+
+    from uvicorn import run
+
     run("src.interfaces.api.main:app", host=host, port=port, reload=False)
 
 
+def _run_agent(argv: list[str]) -> None:
+    """이 호스트의 엔진을 플릿 컨트롤러가 원격으로 제어하도록 노드 에이전트를 실행한다."""
+    agent_parser = argparse.ArgumentParser(prog="local-llm-agent", description="노드 에이전트 실행 옵션")
+    agent_parser.add_argument("--config", default="config/models.yml", help="설정 파일 경로")
+    agent_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="에이전트 바인드 주소(루프백이 아니면 --token 필요)",
+    )
+    agent_parser.add_argument("--port", type=int, default=int(os.getenv("LOCAL_LLM_AGENT_PORT", "19090")))
+    agent_parser.add_argument("--name", help="노드 이름(기본: 호스트 이름)")
+    agent_parser.add_argument(
+        "--token",
+        default=os.getenv("LOCAL_LLM_AGENT_TOKEN"),
+        help="요청에 요구할 Bearer 토큰(runtime.fleet.token과 같아야 한다)",
+    )
+    agent_parser.add_argument("--engine-host", help="엔진 바인드 주소(원격 컨트롤러가 접근하려면 0.0.0.0)")
+    agent_parser.add_argument("--ollama-port", type=int, help="Ollama 포트 재정의")
+    agent_parser.add_argument("--vllm-port", type=int, help="vLLM 포트 재정의")
+    agent_parser.add_argument("--startup-timeout", type=float, default=900.0, help="엔진 준비 대기 시간(초)")
+    agent_parser.add_argument("--simulate", action="store_true", help="실제 엔진 대신 가짜 엔진 서버를 띄운다(시험용)")
+    args = agent_parser.parse_args(argv)
+
+    from src.infrastructure import ConfigValidationError, EngineType, NodeAgent, NodeAgentServer, load_settings
+
+    ports: dict[EngineType, int] = {}
+    if args.ollama_port:
+        ports["ollama"] = args.ollama_port
+    if args.vllm_port:
+        ports["vllm"] = args.vllm_port
+    agent = NodeAgent(
+        load_settings(args.config),
+        name=args.name,
+        simulate=args.simulate,
+        startup_timeout=args.startup_timeout,
+        engine_host=args.engine_host,
+        ports=ports,
+    )
+    try:
+        server = NodeAgentServer(agent, host=args.host, port=args.port, token=args.token)
+    except ConfigValidationError as exc:
+        agent_parser.error(str(exc))
+    print(f"[AGENT] {agent.name} 노드 에이전트: http://{args.host}:{server.port} (simulate={args.simulate})")
+    server.serve_forever()
+
+
 if __name__ == "__main__":
     main()
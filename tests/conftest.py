@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.infrastructure import AppSettings, FakeEngineServer, load_settings  # noqa: E402
+
+SettingsFactory = Callable[..., AppSettings]
+
+
+@pytest.fixture
+def fake_engine() -> Iterator[FakeEngineServer]:
+    """Ollama/vLLM 경로를 모두 제공하는 빠른 가짜 엔진."""
+    server = FakeEngineServer(base_latency=0.005, token_latency=0.0005, default_tokens=8).start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+@pytest.fixture
+def make_settings(tmp_path: Path) -> SettingsFactory:
+    """`fake-ollama`/`fake-vllm` 두 모델을 둔 설정 파일을 만들어 `load_settings`로 읽는 팩토리.
+
+    Args:
+        port: 두 엔진 엔드포인트가 가리킬 포트(보통 `fake_engine.port`).
+        runtime: `runtime` 섹션에 덮어쓸 항목.
+        models: 기본 모델 대신 쓸 `models` 섹션.
+        cascades: `cascades` 섹션.
+    """
+
+    def make(
+        port: int = 1,
+        runtime: dict[str, Any] | None = None,
+        models: list[dict[str, Any]] | None = None,
+        cascades: list[dict[str, Any]] | None = None,
+    ) -> AppSettings:
+        endpoint = {"host": "127.0.0.1", "port": port}
+        data = {
+            "runtime": {
+                "python_version": "3.12",
+                "endpoints": {"ollama": endpoint, "vllm": endpoint},
+                **(runtime or {}),
+            },
+            "models": models
+            or [
+                {"id": "fake-ollama", "engine": "ollama", "ollama_model": "fake:latest"},
+                {"id": "fake-vllm", "engine": "vllm", "vllm_model": "fake/model"},
+            ],
+            "cascades": cascades or [],
+        }
+        path = tmp_path / "models.yml"
+        path.write_text(yaml.safe_dump(data, allow_unicode=True), encoding="utf-8")
+        return load_settings(path)
+
+    return make
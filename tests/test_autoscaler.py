@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import socket
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from src.infrastructure import ConfigValidationError, EngineAutoscaler, ScalingSignal
+
+
+@pytest.fixture
+def occupied_port() -> Iterator[int]:
+    """다른 프로세스가 이미 리스닝 중인 포트."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        yield sock.getsockname()[1]
+
+
+def _settings(make_settings, port_start: int, gpu_memory: float | None = 0.5, budget: float | None = 1.0):
+    policy: dict[str, Any] = {"max_replicas": 3, "target_load": 1, "scale_up_after": 0, "cold_start": 0}
+    if gpu_memory is not None:
+        policy["gpu_memory"] = gpu_memory
+    autoscale: dict[str, Any] = {"enabled": True, "simulate": True, "port_start": port_start}
+    autoscale["port_end"] = port_start + 2
+    if budget is not None:
+        autoscale["gpu_memory_budget"] = budget
+    return make_settings(
+        runtime={"autoscale": autoscale},
+        models=[{"id": "fake-ollama", "engine": "ollama", "ollama_model": "fake:latest", "autoscale": policy}],
+    )
+
+
+def test_ollama_autoscale_requires_gpu_memory_when_budget_is_set(make_settings) -> None:
+    with pytest.raises(ConfigValidationError, match="gpu_memory"):
+        _settings(make_settings, 29000, gpu_memory=None)
+
+    assert _settings(make_settings, 29000, gpu_memory=None, budget=None).runtime.autoscale.gpu_memory_budget is None
+
+
+def test_scale_up_skips_open_ports_and_stops_at_gpu_memory_budget(make_settings, occupied_port: int) -> None:
+    settings = _settings(make_settings, occupied_port)
+    autoscaler = EngineAutoscaler(settings, lambda model_id: ScalingSignal(in_flight=10, latency_p50=1.0))
+    try:
+        events = [event for _ in range(3) for event in autoscaler.tick()]
+    finally:
+        autoscaler.stop()
+
+    assert [(event["action"], event.get("port"), event.get("reason")) for event in events] == [
+        ("scale_up", occupied_port + 1, None),
+        ("scale_up", occupied_port + 2, None),
+        ("scale_up_blocked", None, "gpu_memory_budget"),
+    ]
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import pytest
+
+from src.application.use_cases import InferenceUseCase
+from src.infrastructure import FakeEngineServer, HashEmbedder, MetricsRegistry, SemanticCache
+
+pytest.importorskip("numpy")
+
+PROMPT = "Summarize the release notes for the scheduler."
+CASCADE = {
+    "name": "quick",
+    "models": ["fake-vllm", "fake-ollama"],
+    "acceptance": {"min_length": 1, "min_mean_logprob": -1.0},
+}
+
+
+@pytest.fixture
+def inference(fake_engine: FakeEngineServer, make_settings) -> InferenceUseCase:
+    settings = make_settings(fake_engine.port, runtime={"semantic_cache": {"enabled": True}}, cascades=[CASCADE])
+    metrics = MetricsRegistry()
+    cache = SemanticCache(settings.runtime.semantic_cache, HashEmbedder(dimension=64), metrics)
+    return InferenceUseCase(settings, metrics=metrics, semantic_cache=cache)
+
+
+def _logprobs(result) -> list:
+    return [choice.get("logprobs") for choice in result.output["choices"]]
+
+
+def test_repeated_cascade_request_is_accepted_by_first_step_from_cache(inference: InferenceUseCase) -> None:
+    # 로그 확률 없이 같은 모델을 먼저 호출해 캐시를 채워도 캐스케이드 단계와 섞이지 않는다.
+    plain = inference.generate("fake-vllm", PROMPT)
+    assert plain.ok and _logprobs(plain) == [None]
+
+    results = [inference.generate("quick", PROMPT) for _ in range(3)]
+
+    for index, result in enumerate(results):
+        assert result.ok and result.model_id == "fake-vllm"
+        assert [step["rejected"] for step in result.output["cascade"]["steps"]] == [None]
+        assert _logprobs(result) == [None]
+        assert ("cache" in result.output) is (index > 0)
+    assert inference.cascade_stats()["quick"]["escalated"] == 0
+
+    # 캐스케이드가 응답에서 지운 로그 확률은 캐시 항목에는 남아 있다.
+    cached = inference.generate("fake-vllm", PROMPT, logprobs=True)
+    assert cached.output["cache"]["hit"] is True
+    assert _logprobs(cached)[0]["content"]
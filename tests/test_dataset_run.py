@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.application.use_cases import DatasetRunUseCase, InferenceUseCase
+from src.infrastructure import ConfigValidationError, FakeEngineServer
+
+
+def _write_input(path: Path) -> list[int]:
+    """입력 JSONL을 쓰고 결과가 기록되어야 하는(빈 줄이 아닌) 줄 번호를 반환한다."""
+    lines = [
+        json.dumps({"id": "a", "prompt": "alpha"}),
+        json.dumps({"id": "b", "prompt": "beta"}),
+        json.dumps({"id": "c", "prompt": "alpha"}),
+        '{"id": "d", "prompt": ',
+        "",
+        json.dumps("plain string prompt"),
+        json.dumps({"id": "f", "prompt": "gamma", "max_tokens": 3}),
+        json.dumps({"id": "g"}),
+    ]
+    lines += [json.dumps({"id": f"n{index}", "prompt": f"prompt {index}"}) for index in range(8)]
+    lines += [json.dumps({"id": "late-1", "prompt": "late"}), json.dumps({"id": "late-2", "prompt": "late"})]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return [index for index, line in enumerate(lines) if line]
+
+
+def _read_output(path: Path) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in path.read_bytes().splitlines()]
+
+
+@pytest.fixture
+def runner(fake_engine: FakeEngineServer, make_settings) -> DatasetRunUseCase:
+    return DatasetRunUseCase(InferenceUseCase(make_settings(fake_engine.port)))
+
+
+def _run(runner: DatasetRunUseCase, source: Path, output: Path, **kwargs: Any):
+    return runner.run(
+        source,
+        output,
+        "fake-ollama",
+        options={"max_tokens": 4},
+        concurrency=1,
+        min_concurrency=1,
+        max_concurrency=1,
+        checkpoint_seconds=0.0,
+        **kwargs,
+    )
+
+
+def test_dataset_run_resumes_after_interrupt_without_duplicate_rows(tmp_path: Path, runner: DatasetRunUseCase) -> None:
+    source = tmp_path / "input.jsonl"
+    output = tmp_path / "out" / "results.jsonl"
+    expected_lines = _write_input(source)
+
+    def interrupt(progress: dict[str, Any]) -> None:
+        if progress["rows_done"] >= 4:
+            raise KeyboardInterrupt
+
+    first = _run(runner, source, output, on_progress=interrupt, progress_seconds=0.0)
+    assert first.interrupted is True
+    assert 4 <= first.rows_done < len(expected_lines)
+
+    checkpoint = json.loads(runner.checkpoint_path(output).read_bytes())
+    assert checkpoint["output_size"] == output.stat().st_size
+    committed = output.read_bytes()
+    # 체크포인트 이후 기록 도중 죽은 것처럼 잘린 줄을 덧붙인다.
+    with output.open("ab") as handle:
+        handle.write(b'{"line": 999, "id": "torn", "ok": tr')
+
+    second = _run(runner, source, output)
+
+    assert second.interrupted is False
+    assert second.rows_done == len(expected_lines)
+    assert second.rows_this_run == len(expected_lines) - first.rows_done
+    data = output.read_bytes()
+    assert data.startswith(committed) and b"torn" not in data
+    rows = _read_output(output)
+    written = [row["line"] for row in rows]
+    assert len(written) == len(set(written))
+    assert sorted(written) == expected_lines
+
+    by_id = {row["id"]: row for row in rows}
+    assert by_id["a"]["ok"] and by_id["c"]["duplicate_of"] == "a"
+    assert by_id["c"]["text"] == by_id["a"]["text"]
+    assert by_id["late-2"]["duplicate_of"] == "late-1"
+    assert "duplicate_of" not in by_id["b"]
+    assert by_id[3] == {"line": 3, "id": 3, "ok": False, "error": by_id[3]["error"]}
+    assert by_id[3]["error"].startswith("JSON 파싱 실패")
+    assert by_id[7]["ok"] is False and "prompt" in by_id[7]["error"]
+    assert by_id[5]["ok"] is True
+    assert by_id["f"]["usage"]["completion_tokens"] == 3
+
+
+def test_dataset_run_refuses_existing_output_without_checkpoint(tmp_path: Path, runner: DatasetRunUseCase) -> None:
+    source = tmp_path / "input.jsonl"
+    output = tmp_path / "results.jsonl"
+    expected_lines = _write_input(source)
+    output.write_text('{"line": 0}\n', encoding="utf-8")
+
+    with pytest.raises(ConfigValidationError):
+        _run(runner, source, output)
+
+    result = _run(runner, source, output, restart=True, limit=3)
+    assert (result.rows_done, result.duplicates) == (3, 1)
+    assert sorted(row["line"] for row in _read_output(output)) == expected_lines[:3]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import Any
+
+from src.application.use_cases import EngineTuneUseCase, synthetic_workload
+from src.infrastructure import SimulatedEngineDriver
+
+SEARCH_SPACE: dict[str, list[Any]] = {
+    "max_num_seqs": [1, 4],
+    "max_num_batched_tokens": [2048],
+    "gpu_memory_utilization": [0.8, 0.85, 0.95],
+}
+
+
+def _run(make_settings, records: list[dict[str, Any]], **kwargs: Any):
+    driver = SimulatedEngineDriver("vllm", base_latency=0.002, token_latency=0.001, oom_above=0.9)
+    tuner = EngineTuneUseCase(make_settings(), driver)
+    return tuner.run(
+        "fake-vllm",
+        records,
+        workload="synthetic",
+        search_space=SEARCH_SPACE,
+        concurrency=4,
+        warmup=1,
+        **kwargs,
+    )
+
+
+def _throughput(trial: dict[str, Any]) -> float:
+    return trial["tokens_per_second"] or trial["requests_per_second"]
+
+
+def test_tune_records_oom_trials_and_picks_best_feasible_candidate(make_settings) -> None:
+    records = synthetic_workload("fake-vllm", 8, prompt_chars=200, max_tokens=4)
+
+    result = _run(make_settings, records, max_error_rate=0.0)
+
+    assert result.initial_parameters == {
+        "max_num_seqs": 4,
+        "max_num_batched_tokens": 2048,
+        "gpu_memory_utilization": 0.85,
+    }
+    oom = [trial for trial in result.trials if trial["parameters"]["gpu_memory_utilization"] == 0.95]
+    assert oom
+    for trial in oom:
+        assert trial["ok"] is False and trial["feasible"] is False
+        assert "메모리 부족" in trial["error"]
+
+    keys = [tuple(sorted(trial["parameters"].items())) for trial in result.trials]
+    assert len(keys) == len(set(keys))
+
+    best = result.best
+    assert best is not None and best in result.trials
+    assert best["feasible"] and best["error_rate"] <= result.max_error_rate
+    assert best["parameters"]["gpu_memory_utilization"] != 0.95
+    feasible = [trial for trial in result.trials if trial["feasible"]]
+    assert _throughput(best) == max(_throughput(trial) for trial in feasible)
+
+    snippet = result.yaml_snippet()
+    assert snippet is not None and 'id: "fake-vllm"' in snippet
+
+
+def test_tune_excludes_candidates_over_max_error_rate(make_settings) -> None:
+    records = synthetic_workload("fake-vllm", 8, prompt_chars=200, max_tokens=4)
+    # 절반은 타임아웃으로 실패시켜 오류율 0.5를 만든다(워밍업에 쓰는 첫 기록은 정상).
+    for record in records[1::2]:
+        record["options"] = {**record["options"], "timeout": 0.0005}
+
+    strict = _run(make_settings, records, max_error_rate=0.1)
+    assert strict.best is None
+    assert strict.yaml_snippet() is None
+    measured = [trial for trial in strict.trials if trial["ok"]]
+    assert measured and all(trial["error_rate"] == 0.5 and not trial["feasible"] for trial in measured)
+
+    lenient = _run(make_settings, records, max_error_rate=0.5)
+    assert lenient.best is not None
+    assert lenient.best["error_rate"] <= 0.5
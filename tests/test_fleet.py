@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterator
+from http.client import HTTPConnection
+
+import pytest
+
+from src.infrastructure import (
+    AppSettings,
+    ConfigValidationError,
+    EngineDriver,
+    EngineType,
+    FleetConfig,
+    FleetController,
+    FleetNodeConfig,
+    ModelConfig,
+    NodeAgent,
+    NodeAgentClient,
+    NodeAgentServer,
+    SimulatedEngineDriver,
+)
+
+TOKEN = "fleet-secret"
+MODELS = [
+    {"id": "fake-ollama", "engine": "ollama", "ollama_model": "fake:latest"},
+    {"id": "vllm-a", "engine": "vllm", "vllm_model": "fake/a"},
+    {"id": "vllm-b", "engine": "vllm", "vllm_model": "fake/b"},
+    {"id": "vllm-c", "engine": "vllm", "vllm_model": "fake/c"},
+    {"id": "vllm-oom", "engine": "vllm", "vllm_model": "fake/oom"},
+]
+
+
+class _OomAgent(NodeAgent):
+    """`vllm-oom` 모델 기동이 메모리 부족으로 실패하는 시뮬레이션 에이전트."""
+
+    def _driver(self, engine: EngineType, model: ModelConfig) -> EngineDriver:
+        if model.id == "vllm-oom":
+            return SimulatedEngineDriver(engine, oom_above=0.5)
+        return super()._driver(engine, model)
+
+
+@pytest.fixture
+def settings(make_settings) -> AppSettings:
+    return make_settings(models=MODELS)
+
+
+@pytest.fixture
+def agents(settings: AppSettings) -> Iterator[dict[str, NodeAgentServer]]:
+    servers = {
+        name: NodeAgentServer(_OomAgent(settings, name=name, simulate=True), port=0, token=TOKEN).start()
+        for name in ("node-a", "node-b")
+    }
+    try:
+        yield servers
+    finally:
+        for server in servers.values():
+            server.stop()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _controller(
+    agents: dict[str, NodeAgentServer],
+    placements: dict[str, int],
+    engines: list[EngineType] | None = None,
+    clock: Callable[[], float] = time.time,
+) -> FleetController:
+    nodes = [
+        FleetNodeConfig(name=name, host="127.0.0.1", port=server.port, engines=list(engines or ["ollama", "vllm"]))
+        for name, server in agents.items()
+    ]
+    config = FleetConfig(enabled=True, nodes=nodes, placements=placements, token=TOKEN, restart_backoff=60.0)
+    return FleetController(config, clock=clock)
+
+
+def _settle(controller: FleetController, timeout: float = 5.0) -> dict[str, dict[str, dict]]:
+    """기동 중인 엔진이 없을 때까지 상태를 다시 조회하고 노드별 엔진 상태를 반환한다."""
+    deadline = time.monotonic() + timeout
+    while True:
+        controller.refresh()
+        engines = {node["name"]: node.get("engines") or {} for node in controller.status()["nodes"]}
+        states = [item["state"] for items in engines.values() for item in items.values()]
+        if "starting" not in states or time.monotonic() > deadline:
+            return engines
+        time.sleep(0.02)
+
+
+def _summary(performed: list[dict]) -> list[tuple]:
+    keys = ("node", "action", "engine", "model_id", "reason")
+    return sorted(tuple(item[key] for key in keys) for item in performed)
+
+
+def test_rebalance_places_models_and_builds_pool(agents: dict[str, NodeAgentServer]) -> None:
+    controller = _controller(agents, {"vllm-a": 1})
+
+    performed = controller.rebalance()
+
+    assert _summary(performed) == [
+        ("node-a", "start", "ollama", None, "node_engines"),
+        ("node-a", "start", "vllm", "vllm-a", "place"),
+        ("node-b", "start", "ollama", None, "node_engines"),
+    ]
+    assert all(item["ok"] for item in performed)
+    engines = _settle(controller)
+    assert engines["node-a"]["vllm"]["model_id"] == "vllm-a"
+    assert engines["node-b"]["vllm"]["state"] == "stopped"
+    pool = controller.pool.to_dict()
+    assert len(pool["engines"]["ollama"]) == 2
+    assert pool["models"] == {"vllm-a": [f"127.0.0.1:{engines['node-a']['vllm']['port']}"]}
+    # 같은 상태에서 다시 재배치하면 할 일이 없다.
+    assert controller.rebalance() == []
+
+
+def test_rebalance_stops_over_placed_and_moves_unplaced_models(agents: dict[str, NodeAgentServer]) -> None:
+    controller = _controller(agents, {"vllm-a": 1}, engines=["vllm"])
+    for server in agents.values():
+        server.agent.start("vllm", "vllm-a")
+    _settle(controller)
+
+    performed = controller.rebalance()
+    assert _summary(performed) == [("node-b", "stop", "vllm", "vllm-a", "over_placed")]
+    engines = _settle(controller)
+    assert engines["node-b"]["vllm"]["state"] == "stopped"
+
+    # node-b가 배치 대상이 아닌 vllm-c를 서빙하고 빈 노드가 없으면 vllm-b를 위해 node-b를 옮긴다.
+    agents["node-b"].agent.start("vllm", "vllm-c")
+    _settle(controller)
+    controller.config.placements = {"vllm-a": 1, "vllm-b": 1}
+    performed = controller.rebalance()
+    assert _summary(performed) == [("node-b", "start", "vllm", "vllm-b", "move")]
+    engines = _settle(controller)
+    assert engines["node-b"]["vllm"]["model_id"] == "vllm-b"
+    assert sorted(controller.pool.models) == ["vllm-a", "vllm-b"]
+
+
+def test_failed_start_waits_for_restart_backoff(agents: dict[str, NodeAgentServer]) -> None:
+    clock = _Clock()
+    controller = _controller({"node-a": agents["node-a"]}, {"vllm-oom": 1}, engines=["vllm"], clock=clock)
+
+    performed = controller.rebalance()
+    assert _summary(performed) == [("node-a", "start", "vllm", "vllm-oom", "place")]
+    engines = _settle(controller)
+    assert engines["node-a"]["vllm"]["state"] == "failed"
+    assert "메모리 부족" in engines["node-a"]["vllm"]["error"]
+
+    clock.now += 30
+    assert [(action.action, action.reason) for action in controller.plan()] == [("unplaced", "no_free_node")]
+
+    clock.now += 31
+    assert [(action.node, action.action, action.reason) for action in controller.plan()] == [
+        ("node-a", "start", "place")
+    ]
+
+
+@pytest.mark.parametrize("token", [None, "wrong-token"])
+def test_agent_rejects_missing_or_wrong_token(agents: dict[str, NodeAgentServer], token: str | None) -> None:
+    server = agents["node-a"]
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    for method, path in (("GET", "/status"), ("POST", "/engines/vllm/start")):
+        connection = HTTPConnection("127.0.0.1", server.port, timeout=5)
+        try:
+            connection.request(method, path, body=b"{}" if method == "POST" else None, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        finally:
+            connection.close()
+        assert response.status == 401
+
+    with pytest.raises(RuntimeError, match="401"):
+        NodeAgentClient("127.0.0.1", server.port, token=token).start("vllm", "vllm-a")
+    assert server.agent.status()["engines"]["vllm"]["state"] == "stopped"
+    assert NodeAgentClient("127.0.0.1", server.port, token=TOKEN).health()["ok"] is True
+
+
+def test_agent_refuses_non_loopback_bind_without_token(settings: AppSettings) -> None:
+    with pytest.raises(ConfigValidationError):
+        NodeAgentServer(NodeAgent(settings, simulate=True), host="0.0.0.0", port=0)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.application.use_cases import InferenceUseCase, JobUseCase
+from src.infrastructure import FakeEngineServer, SqliteJobStore
+
+LEASE = 0.05
+
+
+def _expire() -> None:
+    time.sleep(LEASE * 2)
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    return tmp_path / "jobs.sqlite3"
+
+
+def test_expired_running_job_is_claimed_again_after_restart(db_path: Path) -> None:
+    store = SqliteJobStore(db_path, lease_seconds=LEASE, max_attempts=3)
+    job = store.enqueue("inference", {"model_id": "fake-ollama", "prompt": "hi", "options": {}})
+    claimed = store.claim("worker-1")
+    assert claimed is not None and claimed.id == job.id
+    assert (claimed.status, claimed.attempts) == ("running", 1)
+    assert store.append_partial(job.id, "worker-1", "partial output")
+    assert store.claim("worker-2") is None
+    # 프로세스가 죽은 것처럼 점유를 연장하지 않고 닫은 뒤 같은 파일을 다시 연다.
+    store.close()
+    _expire()
+
+    store = SqliteJobStore(db_path, lease_seconds=LEASE, max_attempts=3)
+    resumed = store.claim("worker-2")
+
+    assert resumed is not None and resumed.id == job.id
+    assert (resumed.status, resumed.attempts, resumed.partial) == ("running", 2, "")
+    assert resumed.started_at == claimed.started_at
+    store.close()
+
+
+def test_job_fails_after_max_attempts(db_path: Path) -> None:
+    store = SqliteJobStore(db_path, lease_seconds=LEASE, max_attempts=2)
+    job = store.enqueue("inference", {"model_id": "fake-ollama", "prompt": "hi", "options": {}})
+    for worker in ("worker-1", "worker-2"):
+        claimed = store.claim(worker)
+        assert claimed is not None and claimed.id == job.id
+        _expire()
+
+    assert store.claim("worker-3") is None
+    failed = store.get(job.id)
+    assert failed is not None
+    assert (failed.status, failed.attempts) == ("failed", 2)
+    assert failed.error is not None and "2번" in failed.error
+    assert failed.finished_at is not None
+
+
+def test_release_requeues_without_spending_an_attempt(db_path: Path) -> None:
+    store = SqliteJobStore(db_path, lease_seconds=60, max_attempts=1)
+    job = store.enqueue("inference", {"model_id": "fake-ollama", "prompt": "hi", "options": {}})
+    assert store.claim("worker-1") is not None
+
+    assert store.release(job.id, "worker-1", delay=0.0, error="rate limited")
+    released = store.get(job.id)
+    assert released is not None and (released.status, released.attempts) == ("queued", 0)
+
+    assert store.release(job.id, "worker-1", delay=0.0) is False
+    again = store.claim("worker-2")
+    assert again is not None and again.attempts == 1
+
+
+def test_late_writes_from_worker_that_lost_the_lease_are_ignored(db_path: Path) -> None:
+    store = SqliteJobStore(db_path, lease_seconds=LEASE, max_attempts=3)
+    job = store.enqueue("batch", {"model_id": "fake-ollama", "prompts": ["a", "b"], "options": {}}, total=2)
+    assert store.claim("worker-1") is not None
+    _expire()
+    assert store.claim("worker-2") is not None
+
+    assert store.renew(job.id, "worker-1") is False
+    assert store.append_partial(job.id, "worker-1", "late") is False
+    assert store.add_item(job.id, "worker-1", 0, True, {"text": "late"}) is False
+    assert store.complete(job.id, "worker-1", {"total": 2}) is False
+    assert store.fail(job.id, "worker-1", "late failure") is False
+
+    current = store.get(job.id)
+    assert current is not None and current.status == "running" and current.completed == 0
+    assert store.items(job.id) == []
+    assert store.add_item(job.id, "worker-2", 0, True, {"text": "a"})
+    assert store.complete(job.id, "worker-2", {"total": 2})
+    assert store.get(job.id).status == "succeeded"
+
+
+def test_resumed_batch_job_skips_done_items(
+    db_path: Path,
+    fake_engine: FakeEngineServer,
+    make_settings,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = SqliteJobStore(db_path, lease_seconds=LEASE, max_attempts=3)
+    prompts = ["first", "second", "third", "fourth"]
+    job = store.enqueue("batch", {"model_id": "fake-ollama", "prompts": prompts, "options": {}}, total=len(prompts))
+    # 첫 워커가 두 항목을 기록한 뒤 죽었다.
+    assert store.claim("worker-1") is not None
+    for index in (0, 1):
+        assert store.add_item(job.id, "worker-1", index, True, {"marker": "worker-1"})
+    _expire()
+
+    inference = InferenceUseCase(make_settings(fake_engine.port))
+    sent: list[str] = []
+    generate = inference.generate
+
+    def recording_generate(model_id: str, prompt: str, **kwargs: Any):
+        sent.append(prompt)
+        return generate(model_id, prompt, **kwargs)
+
+    monkeypatch.setattr(inference, "generate", recording_generate)
+    jobs = JobUseCase(inference.settings, inference, store=store)
+    resumed = store.claim("worker-2")
+    assert resumed is not None and resumed.id == job.id
+    assert store.done_items(job.id) == {0, 1}
+
+    jobs._run(resumed, "worker-2")
+
+    assert sent == ["third", "fourth"]
+    finished = store.get(job.id)
+    assert finished is not None
+    assert (finished.status, finished.completed, finished.attempts) == ("succeeded", 4, 2)
+    assert finished.result == {"total": 4, "completed": 4, "failed": 0}
+    items = store.items(job.id)
+    assert [item["index"] for item in items] == [0, 1, 2, 3]
+    assert [item["result"].get("marker") for item in items[:2]] == ["worker-1", "worker-1"]
+    assert all(item["ok"] for item in items)
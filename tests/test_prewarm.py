@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure import (
+    ConfigValidationError,
+    PageCachePrewarmer,
+    evict_page_cache,
+    expand_weight_paths,
+    resolve_weight_files,
+)
+from src.infrastructure.runtime import prewarm
+
+MIB = 1024 * 1024
+
+
+@pytest.fixture
+def weights(tmp_path: Path) -> Path:
+    path = tmp_path / "model.safetensors"
+    path.write_bytes(bytes(range(256)) * (8 * MIB // 256))
+    return path
+
+
+def _prewarmer(max_bytes: int | None = None) -> PageCachePrewarmer:
+    return PageCachePrewarmer(concurrency=3, max_bytes=max_bytes, segment_bytes=MIB, chunk_bytes=256 * 1024)
+
+
+def test_max_bytes_splits_read_and_skipped_bytes(weights: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # 상주량을 알 수 없는 플랫폼처럼 다뤄 캐시 상태와 무관하게 모든 구간을 예산 대상으로 만든다.
+    monkeypatch.setattr(prewarm, "resident_pages", lambda path: None)
+    budget = 3 * MIB + MIB // 2
+
+    report = _prewarmer(max_bytes=budget).prewarm([weights], model_id="dummy")
+
+    assert report.total_bytes == 8 * MIB
+    assert report.read_bytes == budget
+    assert report.skipped_bytes == 8 * MIB - budget
+    assert report.resident_bytes is None
+    assert report.files[0].error is None
+    assert report.to_dict()["max_bytes"] == budget
+
+
+def test_second_prewarm_reads_nothing_when_pages_are_resident(weights: Path) -> None:
+    if prewarm.resident_pages(weights) is None:
+        pytest.skip("mincore를 쓸 수 없는 플랫폼")
+    evict_page_cache([weights])
+
+    first = _prewarmer().prewarm([weights])
+    assert first.read_bytes + (first.resident_bytes or 0) >= weights.stat().st_size
+    assert first.files[0].resident_after == weights.stat().st_size
+
+    second = _prewarmer().prewarm([weights])
+    assert second.read_bytes == 0
+    assert second.skipped_bytes == 0
+    assert second.resident_bytes == weights.stat().st_size
+
+
+def test_expand_weight_paths_dedupes_symlinks(tmp_path: Path) -> None:
+    model_dir = tmp_path / "model"
+    (model_dir / "sub").mkdir(parents=True)
+    shard = model_dir / "model-00001.safetensors"
+    shard.write_bytes(b"weights")
+    (model_dir / "sub" / "model-00002.bin").write_bytes(b"weights")
+    (model_dir / "config.json").write_text("{}", encoding="utf-8")
+    (model_dir / "alias.safetensors").symlink_to(shard)
+    (tmp_path / "outside.safetensors").symlink_to(shard)
+
+    files = expand_weight_paths([model_dir, tmp_path / "outside.safetensors", shard, tmp_path / "missing.gguf"])
+
+    assert files == [shard.resolve(), (model_dir / "sub" / "model-00002.bin").resolve()]
+
+
+def test_resolve_weight_files_reads_ollama_manifest_and_blobs(tmp_path: Path, make_settings) -> None:
+    root = tmp_path / "ollama"
+    manifest = root / "manifests" / "registry.ollama.ai" / "library" / "qwen3" / "32b"
+    manifest.parent.mkdir(parents=True)
+    layers = [
+        {"mediaType": "application/vnd.ollama.image.model", "digest": "sha256:aaa"},
+        {"mediaType": "application/vnd.ollama.image.projector", "digest": "sha256:bbb"},
+        {"mediaType": "application/vnd.ollama.image.template", "digest": "sha256:ccc"},
+    ]
+    manifest.write_text(json.dumps({"layers": layers}), encoding="utf-8")
+    (root / "blobs").mkdir()
+    for digest in ("aaa", "bbb", "ccc"):
+        (root / "blobs" / f"sha256-{digest}").write_bytes(b"blob")
+    settings = make_settings(
+        runtime={"prewarm": {"ollama_models_dir": str(root)}},
+        models=[
+            {"id": "qwen", "engine": "ollama", "ollama_model": "qwen3:32b"},
+            {"id": "missing", "engine": "ollama", "ollama_model": "qwen3:8b"},
+        ],
+    )
+
+    files = resolve_weight_files(settings, settings.get_model("qwen"))
+
+    assert files == [(root / "blobs" / "sha256-aaa").resolve(), (root / "blobs" / "sha256-bbb").resolve()]
+    with pytest.raises(ConfigValidationError):
+        resolve_weight_files(settings, settings.get_model("missing"))
+
+
+def test_resolve_weight_files_uses_huggingface_snapshot_ref(tmp_path: Path, make_settings) -> None:
+    repo = tmp_path / "hub" / "models--Org--Model"
+    blob = repo / "blobs" / "0123"
+    blob.parent.mkdir(parents=True)
+    blob.write_bytes(b"weights")
+    for revision in ("old", "main-rev"):
+        snapshot = repo / "snapshots" / revision
+        snapshot.mkdir(parents=True)
+        (snapshot / "model.safetensors").symlink_to(blob)
+    (repo / "refs").mkdir()
+    (repo / "refs" / "main").write_text("main-rev\n", encoding="utf-8")
+    settings = make_settings(
+        runtime={"prewarm": {"hf_cache_dir": str(tmp_path / "hub")}},
+        models=[{"id": "hf", "engine": "vllm", "vllm_model": "Org/Model"}],
+    )
+
+    assert resolve_weight_files(settings, settings.get_model("hf")) == [blob.resolve()]
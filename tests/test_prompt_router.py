@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+
+from src.infrastructure import AppSettings, ContextWindowExceeded, PromptRouter, TokenCounter
+
+MODELS = [
+    {
+        "id": "fast-vllm",
+        "engine": "vllm",
+        "vllm_model": "fake/small",
+        "tags": ["group:chat"],
+        "parameters": {"max_model_len": 8192},
+    },
+    {
+        "id": "big-ollama",
+        "engine": "ollama",
+        "ollama_model": "fake:32b",
+        "tags": ["group:chat"],
+        "parameters": {"num_ctx": 8192},
+    },
+    {"id": "auto-ollama", "engine": "ollama", "ollama_model": "fake:8b", "parameters": {"max_model_len": 32768}},
+]
+
+
+def _router(make_settings, auto_num_ctx: bool = False) -> PromptRouter:
+    settings: AppSettings = make_settings(
+        runtime={"prompt_routing": {"auto_num_ctx": auto_num_ctx, "reserve_completion_tokens": 512}},
+        models=MODELS,
+    )
+    return PromptRouter(settings, TokenCounter.from_config(settings.runtime.prompt_routing))
+
+
+def _prompt(tokens: int) -> str:
+    # char_ratio 토크나이저는 ASCII 4자를 1토큰으로 본다.
+    return "abcd" * tokens
+
+
+def test_ollama_window_follows_request_num_ctx(make_settings) -> None:
+    router = _router(make_settings)
+
+    with pytest.raises(ContextWindowExceeded) as excinfo:
+        router.route("big-ollama", _prompt(10_000))
+    assert excinfo.value.limit == 8192
+    assert router.route("big-ollama", _prompt(10_000), num_ctx=32768).model.id == "big-ollama"
+
+    with pytest.raises(ContextWindowExceeded) as excinfo:
+        router.route("big-ollama", _prompt(2_500), num_ctx=1024)
+    assert excinfo.value.limit == 1024
+
+
+def test_request_num_ctx_is_capped_by_max_model_len(make_settings) -> None:
+    router = _router(make_settings)
+
+    with pytest.raises(ContextWindowExceeded) as excinfo:
+        router.route("auto-ollama", _prompt(40_000), num_ctx=65536)
+    assert excinfo.value.limit == 32768
+
+
+def test_group_prefers_first_model_that_fits(make_settings) -> None:
+    router = _router(make_settings)
+
+    assert router.route("chat", "hi").model.id == "fast-vllm"
+    assert router.route("chat", _prompt(9_000), num_ctx=16384).model.id == "big-ollama"
+
+
+def test_auto_num_ctx_only_grows(make_settings) -> None:
+    router = _router(make_settings, auto_num_ctx=True)
+
+    assert router.route("auto-ollama", "hi").num_ctx == 2048
+    assert router.route("auto-ollama", _prompt(3_000)).num_ctx == 4096
+    assert router.route("auto-ollama", "hi").num_ctx == 4096
+    assert router.route("auto-ollama", "hi", num_ctx=1024).num_ctx is None
+    assert router.route("big-ollama", "hi").num_ctx is None
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.application.use_cases import InferenceUseCase, ReplayUseCase
+from src.application.use_cases.replay_use_case import compare_reports
+from src.infrastructure import CaptureConfig, FakeEngineServer, TrafficRecorder, read_capture
+
+LATENCY_KEYS = {"p50", "p90", "p99", "mean", "max"}
+
+
+def _record_capture(directory: Path) -> None:
+    """`fake-ollama` 5건, `fake-vllm` 2건, 없는 모델 1건을 20ms 간격으로 캡처한다."""
+    recorder = TrafficRecorder(CaptureConfig(enabled=True, dir=str(directory)))
+    models = ["fake-ollama"] * 5 + ["fake-vllm"] * 2 + ["missing-model"]
+    for index, model_id in enumerate(models):
+        recorder.record(
+            ts=1_700_000_000.0 + index * 0.02,
+            model_id=model_id,
+            prompt=f"prompt {index} " * 10,
+            options={"max_tokens": 4, "use_cache": False},
+            status=200,
+            ok=True,
+            latency=0.05,
+            completion_tokens=4,
+        )
+    recorder.close()
+
+
+@pytest.fixture
+def replay(fake_engine: FakeEngineServer, make_settings) -> ReplayUseCase:
+    inference = InferenceUseCase(make_settings(fake_engine.port))
+    return ReplayUseCase(ReplayUseCase.local_sender(inference), target="fake-engine")
+
+
+def _assert_latency(summary: dict[str, float]) -> None:
+    assert set(summary) == LATENCY_KEYS
+    assert 0 < summary["p50"] <= summary["p90"] <= summary["p99"] <= summary["max"]
+
+
+def test_replay_capture_against_fake_engine_in_timed_and_throughput_modes(
+    tmp_path: Path,
+    replay: ReplayUseCase,
+) -> None:
+    capture = tmp_path / "capture"
+    _record_capture(capture)
+    assert len(read_capture(capture)) == 8
+
+    timed = replay.run(capture, speed=2.0, concurrency=4)
+    assert timed.mode == "timed"
+    assert (timed.requests, timed.ok, timed.failed) == (8, 7, 1)
+    assert timed.status_counts == {"200": 7, "400": 1}
+    assert timed.completion_tokens == 7 * 4
+    assert timed.models["fake-ollama"]["requests"] == 5
+    assert timed.models["fake-vllm"]["requests"] == 2
+    assert timed.models["missing-model"] == {"requests": 1, "failed": 1, "latency": {}}
+    _assert_latency(timed.latency)
+    assert timed.captured_latency["p50"] == pytest.approx(50.0)
+    assert set(timed.schedule_lag) == LATENCY_KEYS
+    # 7건 × 20ms 간격을 2배속으로 재생하므로 최소 70ms가 걸린다.
+    assert timed.elapsed_seconds >= 0.07
+
+    throughput = replay.run(capture, speed=None, concurrency=8, baseline=timed.to_dict())
+    assert throughput.mode == "throughput"
+    assert (throughput.requests, throughput.ok, throughput.failed) == (8, 7, 1)
+    assert throughput.schedule_lag == {}
+    _assert_latency(throughput.latency)
+
+    comparison = throughput.comparison
+    assert comparison is not None
+    assert {"latency.p50", "latency.p90", "latency.p99", "latency.mean", "requests_per_second"} <= set(comparison)
+    p50 = comparison["latency.p50"]
+    assert p50["baseline"] == timed.latency["p50"]
+    assert p50["current"] == throughput.latency["p50"]
+    assert p50["delta"] == pytest.approx(throughput.latency["p50"] - timed.latency["p50"], abs=1e-6)
+    assert comparison["error_rate"]["delta"] == 0
+
+
+def test_replay_limit_and_model_override(tmp_path: Path, replay: ReplayUseCase) -> None:
+    capture = tmp_path / "capture"
+    _record_capture(capture)
+
+    report = replay.run(capture, speed=None, concurrency=2, limit=3, model_id="fake-vllm")
+
+    assert (report.requests, report.ok) == (3, 3)
+    assert list(report.models) == ["fake-vllm"]
+
+
+def test_compare_reports_skips_missing_metrics_and_zero_baselines() -> None:
+    baseline = {"latency": {"p50": 100.0, "p90": 200.0}, "requests_per_second": 0.0, "error_rate": 0.1}
+    current = {"latency": {"p50": 150.0}, "requests_per_second": 5.0, "error_rate": 0.05}
+
+    comparison = compare_reports(current, baseline)
+
+    assert set(comparison) == {"latency.p50", "requests_per_second", "error_rate"}
+    assert comparison["latency.p50"] == {"baseline": 100.0, "current": 150.0, "delta": 50.0, "delta_pct": 50.0}
+    assert comparison["requests_per_second"]["delta_pct"] is None
+    assert comparison["error_rate"]["delta_pct"] == pytest.approx(-50.0)
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src.application.use_cases import InferenceUseCase
+from src.infrastructure import (
+    FakeEngineServer,
+    HashEmbedder,
+    MetricsRegistry,
+    SemanticCache,
+    SemanticCacheConfig,
+    VectorIndex,
+)
+
+np = pytest.importorskip("numpy")
+
+KEY = "0.7|0.9|None|None"
+PROMPT = "How do I rotate the API keys for the batch tenant?"
+NEAR = "How do I rotate API keys for the batch tenant?"
+
+
+def _cache(threshold: float = 0.95, **config: Any) -> tuple[SemanticCache, MetricsRegistry]:
+    metrics = MetricsRegistry()
+    settings = SemanticCacheConfig.from_dict({"enabled": True, "threshold": threshold, **config})
+    return SemanticCache(settings, HashEmbedder(dimension=settings.hash_dimension), metrics), metrics
+
+
+def _similarity(left: str, right: str) -> float:
+    embedder = HashEmbedder()
+    a, b = (np.asarray(embedder.embed(text), dtype=np.float32) for text in (left, right))
+    return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+def _store(cache: SemanticCache, prompt: str, key: str = KEY, payload: dict[str, Any] | None = None) -> None:
+    hit, vector = cache.lookup("model", key, prompt)
+    assert hit is None and vector is not None
+    cache.store("model", key, vector, payload or {"response": prompt})
+
+
+def test_hit_at_threshold_and_miss_just_below() -> None:
+    similarity = _similarity(PROMPT, NEAR)
+    assert 0.5 < similarity < 0.999
+
+    hits, _ = _cache(threshold=similarity - 1e-4)
+    _store(hits, PROMPT)
+    hit, _ = hits.lookup("model", KEY, NEAR)
+    assert hit is not None and hit.payload == {"response": PROMPT}
+    assert hit.similarity == pytest.approx(similarity, abs=1e-5)
+
+    misses, _ = _cache(threshold=similarity + 1e-4)
+    _store(misses, PROMPT)
+    assert misses.lookup("model", KEY, NEAR)[0] is None
+    assert misses.lookup("model", KEY, PROMPT)[0] is not None
+
+
+def test_entries_are_not_shared_across_option_keys_or_models() -> None:
+    cache, _ = _cache()
+    _store(cache, PROMPT, payload={"response": "default options"})
+
+    assert cache.lookup("model", "0.0|0.9|None|None", PROMPT)[0] is None
+    assert cache.lookup("other-model", KEY, PROMPT)[0] is None
+    hit, _ = cache.lookup("model", KEY, PROMPT.upper())
+    assert hit is not None and hit.payload == {"response": "default options"}
+
+
+def test_ring_buffer_eviction_removes_slots_from_lsh_buckets() -> None:
+    embedder = HashEmbedder(dimension=64)
+    index = VectorIndex(dimension=64, capacity=4, lsh_bits=2, lsh_tables=3, exact_search_below=0)
+    prompts = [f"prompt number {number} about topic {number * 7}" for number in range(10)]
+    vectors = []
+    for number, prompt in enumerate(prompts):
+        vector = np.asarray(embedder.embed(prompt), dtype=np.float32)
+        vectors.append(vector / np.linalg.norm(vector))
+        index.add(vectors[-1], f"key-{number}", {"number": number})
+
+    assert len(index) == 4
+    for buckets in index._buckets:
+        slots = sorted(slot for bucket in buckets.values() for slot in bucket)
+        assert slots == [0, 1, 2, 3]
+    for number, vector in enumerate(vectors):
+        match = index.search(vector, f"key-{number}")
+        if number < len(prompts) - 4:
+            assert match is None
+        else:
+            assert match is not None and match[0] == {"number": number}
+
+
+def test_inference_marks_cache_hits_and_records_metrics(fake_engine: FakeEngineServer, make_settings) -> None:
+    settings = make_settings(fake_engine.port, runtime={"semantic_cache": {"enabled": True, "threshold": 0.8}})
+    inference = InferenceUseCase(settings)
+    assert inference.semantic_cache is not None
+
+    first = inference.generate("fake-ollama", PROMPT)
+    second = inference.generate("fake-ollama", NEAR)
+    other_options = inference.generate("fake-ollama", PROMPT, max_tokens=3)
+    bypassed = inference.generate("fake-ollama", PROMPT, use_cache=False)
+
+    assert first.ok and "cache" not in first.output
+    assert second.output["cache"]["hit"] is True
+    assert second.output["cache"]["similarity"] == pytest.approx(_similarity(PROMPT, NEAR), abs=1e-5)
+    assert inference.result_text(second) == inference.result_text(first)
+    assert "cache" not in other_options.output
+    assert "cache" not in bypassed.output
+
+    stats = inference.semantic_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+    assert stats["entries"] == {"fake-ollama": 2}
+    metrics = inference.metrics
+    assert metrics.counter_value("semantic_cache_lookups_total", model="fake-ollama", hit=True) == 1
+    assert metrics.counter_value("semantic_cache_lookups_total", model="fake-ollama", hit=False) == 2
+    latency = metrics.snapshot()["summaries"]['semantic_cache_lookup_seconds{model="fake-ollama"}']
+    assert latency["count"] == 3 and latency["max"] > 0